@@ -32,11 +32,12 @@ from google.cloud.bigquery._helpers import StructQueryParameter
 from google.cloud.bigquery.client import Client
 from google.cloud.bigquery.dataset import AccessGrant
 from google.cloud.bigquery.dataset import Dataset
+from google.cloud.bigquery.inserter import TableInserter
 from google.cloud.bigquery.schema import SchemaField
 from google.cloud.bigquery.table import Table
 
 __all__ = [
     '__version__', 'AccessGrant', 'ArrayQueryParameter', 'Client',
     'Dataset', 'ScalarQueryParameter', 'SchemaField', 'StructQueryParameter',
-    'Table',
+    'Table', 'TableInserter',
 ]
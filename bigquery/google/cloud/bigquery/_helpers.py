@@ -26,6 +26,11 @@ from google.cloud._helpers import _RFC3339_NO_FRACTION
 from google.cloud._helpers import _time_from_iso8601_time_naive
 from google.cloud._helpers import _to_bytes
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
 _RFC3339_MICROS_NO_ZULU = '%Y-%m-%dT%H:%M:%S.%f'
 
 
@@ -49,7 +54,12 @@ def _float_from_json(value, field):
 def _bool_from_json(value, field):
     """Coerce 'value' to a bool, if set or not nullable."""
     if _not_null(value, field):
-        return value.lower() in ['t', 'true', '1']
+        return _bool_from_json_value(value)
+
+
+def _bool_from_json_value(value):
+    """Coerce a non-null 'value' to a bool."""
+    return value.lower() in ['t', 'true', '1']
 
 
 def _string_from_json(value, _):
@@ -60,14 +70,24 @@ def _string_from_json(value, _):
 def _bytes_from_json(value, field):
     """Base64-decode value"""
     if _not_null(value, field):
-        return base64.standard_b64decode(_to_bytes(value))
+        return _bytes_from_json_value(value)
+
+
+def _bytes_from_json_value(value):
+    """Base64-decode a non-null value"""
+    return base64.standard_b64decode(_to_bytes(value))
 
 
 def _timestamp_from_json(value, field):
     """Coerce 'value' to a datetime, if set or not nullable."""
     if _not_null(value, field):
-        # value will be a float in seconds, to microsecond precision, in UTC.
-        return _datetime_from_microseconds(1e6 * float(value))
+        return _timestamp_from_json_value(value)
+
+
+def _timestamp_from_json_value(value):
+    """Coerce a non-null 'value' to a datetime."""
+    # value will be a float in seconds, to microsecond precision, in UTC.
+    return _datetime_from_microseconds(1e6 * float(value))
 
 
 def _datetime_from_json(value, field):
@@ -83,16 +103,28 @@ def _datetime_from_json(value, field):
         :data:`None`).
     """
     if _not_null(value, field):
-        if '.' in value:
-            # YYYY-MM-DDTHH:MM:SS.ffffff
-            return datetime.datetime.strptime(value, _RFC3339_MICROS_NO_ZULU)
-        else:
-            # YYYY-MM-DDTHH:MM:SS
-            return datetime.datetime.strptime(value, _RFC3339_NO_FRACTION)
+        return _datetime_from_json_value(value)
     else:
         return None
 
 
+def _datetime_from_json_value(value):
+    """Coerce a non-null 'value' to a datetime.
+
+    Args:
+        value (str): The timestamp.
+
+    Returns:
+        datetime.datetime: The parsed datetime object from ``value``.
+    """
+    if '.' in value:
+        # YYYY-MM-DDTHH:MM:SS.ffffff
+        return datetime.datetime.strptime(value, _RFC3339_MICROS_NO_ZULU)
+    else:
+        # YYYY-MM-DDTHH:MM:SS
+        return datetime.datetime.strptime(value, _RFC3339_NO_FRACTION)
+
+
 def _date_from_json(value, field):
     """Coerce 'value' to a datetime date, if set or not nullable"""
     if _not_null(value, field):
@@ -139,11 +171,139 @@ _CELLDATA_FROM_JSON = {
 }
 
 
+# Converters for non-null cell values, used by compiled row decoders.
+# ``None`` marks values used as-is.
+_CELL_VALUE_FROM_JSON = {
+    'INTEGER': int,
+    'INT64': int,
+    'FLOAT': float,
+    'FLOAT64': float,
+    'BOOLEAN': _bool_from_json_value,
+    'BOOL': _bool_from_json_value,
+    'STRING': None,
+    'BYTES': _bytes_from_json_value,
+    'TIMESTAMP': _timestamp_from_json_value,
+    'DATETIME': _datetime_from_json_value,
+    'DATE': _date_from_iso8601_date,
+    'TIME': _time_from_iso8601_time_naive,
+}
+
+
+def _identity(value):
+    """Return 'value' unchanged."""
+    return value
+
+
+def _record_decoder(fields):
+    """Build a function converting a non-null JSON record to a mapping.
+
+    :type fields: sequence
+    :param fields: The :class:`~google.cloud.bigquery.schema.SchemaField`
+                   instances of the record's subfields.
+
+    :rtype: callable
+    :returns: A function taking the record's JSON value.
+    """
+    names = tuple(field.name for field in fields)
+    decoders = tuple(_cell_decoder(field) for field in fields)
+
+    def decode(value):
+        return {
+            name: decoder(cell['v'])
+            for name, decoder, cell in zip(names, decoders, value['f'])}
+
+    return decode
+
+
+def _cell_decoder(field):
+    """Build a function converting the JSON value of one cell of 'field'.
+
+    The type lookup and mode checks are done here, once, rather than for
+    each cell.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field describing the cell.
+
+    :rtype: callable
+    :returns: A function taking the cell's JSON value (``cell['v']``).
+    """
+    if field.field_type == 'RECORD':
+        convert = _record_decoder(field.fields)
+    elif field.field_type in _CELL_VALUE_FROM_JSON:
+        convert = _CELL_VALUE_FROM_JSON[field.field_type] or _identity
+    else:
+        def convert(value):
+            """Fail on use: a schema alone need not be decodable."""
+            raise KeyError(field.field_type)
+
+    if field.mode == 'REPEATED':
+        if convert is _identity:
+            return lambda value: [item['v'] for item in value]
+        return lambda value: [convert(item['v']) for item in value]
+
+    if field.mode == 'NULLABLE' and convert is not _identity:
+        return lambda value: None if value is None else convert(value)
+
+    return convert
+
+
+class _RowDecoder(object):
+    """Convert JSON rows of a given schema to tuples of native values.
+
+    Built once per schema, and re-used for every row fetched with it.
+
+    :type schema: sequence
+    :param schema: The :class:`~google.cloud.bigquery.schema.SchemaField`
+                   instances describing the rows.
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+        self._decoders = tuple(_cell_decoder(field) for field in schema)
+
+    def matches(self, schema):
+        """Check whether this decoder can decode rows of 'schema'.
+
+        A schema equal to (but not the same object as) the decoder's one
+        becomes the decoder's schema, so that the next check is cheap.
+
+        :type schema: sequence
+        :param schema: The schema to check.
+
+        :rtype: bool
+        :returns: True if 'schema' is the same as the decoder's schema.
+        """
+        if schema is self.schema:
+            return True
+        if list(schema) == list(self.schema):
+            self.schema = schema
+            return True
+        return False
+
+    def __call__(self, row):
+        """Convert a JSON row.
+
+        Note:  ``row['f']`` and the schema are presumed to be of the same
+        length.
+
+        :type row: dict
+        :param row: A JSON response row to be converted.
+
+        :rtype: tuple
+        :returns: A tuple of data converted to native types.
+        """
+        return tuple([
+            decoder(cell['v'])
+            for decoder, cell in zip(self._decoders, row['f'])])
+
+
 def _row_from_json(row, schema):
     """Convert JSON row data to row with appropriate types.
 
     Note:  ``row['f']`` and ``schema`` are presumed to be of the same length.
 
+    To convert many rows, build a :class:`_RowDecoder` once instead.
+
     :type row: dict
     :param row: A JSON response row to be converted.
 
@@ -154,21 +314,189 @@ def _row_from_json(row, schema):
     :rtype: tuple
     :returns: A tuple of data converted to native types.
     """
-    row_data = []
-    for field, cell in zip(schema, row['f']):
-        converter = _CELLDATA_FROM_JSON[field.field_type]
-        if field.mode == 'REPEATED':
-            row_data.append([converter(item['v'], field)
-                             for item in cell['v']])
-        else:
-            row_data.append(converter(cell['v'], field))
-
-    return tuple(row_data)
+    return _RowDecoder(schema)(row)
 
 
 def _rows_from_json(rows, schema):
     """Convert JSON row data to rows with appropriate types."""
-    return [_row_from_json(row, schema) for row in rows]
+    decoder = _RowDecoder(schema)
+    return [decoder(row) for row in rows]
+
+
+def _numpy_int_column(values):
+    """Parse non-null INTEGER JSON values (strings) into an array."""
+    return numpy.array(values).astype(numpy.int64)
+
+
+def _numpy_float_column(values):
+    """Parse non-null FLOAT JSON values (strings) into an array."""
+    return numpy.array(values).astype(numpy.float64)
+
+
+def _numpy_bool_column(values):
+    """Parse non-null BOOLEAN JSON values (strings) into an array."""
+    lowered = numpy.char.lower(numpy.array(values))
+    return numpy.in1d(lowered, ['t', 'true', '1'])
+
+
+def _numpy_timestamp_column(values):
+    """Parse non-null TIMESTAMP JSON values (seconds) into an array."""
+    micros = numpy.array(values).astype(numpy.float64) * 1e6
+    return micros.round().astype(numpy.int64).astype('datetime64[us]')
+
+
+def _numpy_datetime_column(values):
+    """Parse non-null DATETIME JSON values (ISO 8601) into an array."""
+    return numpy.array(values, dtype='datetime64[us]')
+
+
+def _numpy_date_column(values):
+    """Parse non-null DATE JSON values (ISO 8601) into an array."""
+    return numpy.array(values, dtype='datetime64[D]')
+
+
+# Vectorized parsers for scalar columns, with the JSON value substituted
+# for nulls (which are masked) and the dtype of an empty column.
+_NUMPY_COLUMN_FROM_JSON = {
+    'INTEGER': (_numpy_int_column, '0', 'int64'),
+    'INT64': (_numpy_int_column, '0', 'int64'),
+    'FLOAT': (_numpy_float_column, '0', 'float64'),
+    'FLOAT64': (_numpy_float_column, '0', 'float64'),
+    'BOOLEAN': (_numpy_bool_column, 'false', 'bool'),
+    'BOOL': (_numpy_bool_column, 'false', 'bool'),
+    'TIMESTAMP': (_numpy_timestamp_column, '0', 'datetime64[us]'),
+    'DATETIME': (
+        _numpy_datetime_column, '1970-01-01T00:00:00', 'datetime64[us]'),
+    'DATE': (_numpy_date_column, '1970-01-01', 'datetime64[D]'),
+}
+
+
+def _column_from_json(values, field):
+    """Convert the JSON values of one column to a masked NumPy array.
+
+    INTEGER, FLOAT, BOOLEAN, TIMESTAMP, DATETIME and DATE columns are
+    parsed in bulk into arrays of the matching dtype (TIMESTAMP values as
+    UTC); other columns hold the same Python objects as rows would.
+
+    :type values: list
+    :param values: The JSON cell values (``cell['v']``) of the column.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field describing the column.
+
+    :rtype: :class:`numpy.ma.MaskedArray`
+    :returns: The column, with null values masked.
+    """
+    mask = numpy.fromiter(
+        (value is None for value in values), dtype=bool, count=len(values))
+
+    parser = None
+    if field.mode != 'REPEATED':
+        parser = _NUMPY_COLUMN_FROM_JSON.get(field.field_type)
+
+    if parser is None:
+        decoder = _cell_decoder(field)
+        data = numpy.empty(len(values), dtype=object)
+        for index, value in enumerate(values):
+            data[index] = decoder(value)
+    else:
+        parse, null_value, dtype = parser
+        if not values:
+            data = numpy.empty(0, dtype=dtype)
+        else:
+            if mask.any():
+                values = [
+                    null_value if value is None else value
+                    for value in values]
+            data = parse(values)
+
+    return numpy.ma.MaskedArray(data, mask=mask)
+
+
+def _columns_from_json(rows, schema):
+    """Convert JSON rows to one masked NumPy array per field.
+
+    Rows are never converted to tuples.
+
+    :type rows: list
+    :param rows: The JSON response rows.
+
+    :type schema: sequence
+    :param schema: The :class:`~google.cloud.bigquery.schema.SchemaField`
+                   instances describing the rows.
+
+    :rtype: :class:`collections.OrderedDict`
+    :returns: Columns (see :func:`_column_from_json`) keyed by field name,
+              in schema order.
+    """
+    columns = OrderedDict()
+    for index, field in enumerate(schema):
+        values = [row['f'][index]['v'] for row in rows]
+        columns[field.name] = _column_from_json(values, field)
+    return columns
+
+
+def _column_from_values(values, field):
+    """Convert the decoded values of one column to a masked NumPy array.
+
+    Columns have the same dtypes as those built by :func:`_column_from_json`.
+
+    :type values: list
+    :param values: The values of the column, as in row tuples.
+
+    :type field: :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param field: The field describing the column.
+
+    :rtype: :class:`numpy.ma.MaskedArray`
+    :returns: The column, with null values masked.
+    """
+    mask = numpy.fromiter(
+        (value is None for value in values), dtype=bool, count=len(values))
+
+    parser = None
+    if field.mode != 'REPEATED':
+        parser = _NUMPY_COLUMN_FROM_JSON.get(field.field_type)
+
+    if parser is None:
+        data = numpy.empty(len(values), dtype=object)
+        for index, value in enumerate(values):
+            data[index] = value
+    else:
+        _, _, dtype = parser
+        if field.field_type == 'TIMESTAMP':
+            # NumPy has no time zones: the UTC time is stored.
+            values = [
+                None if value is None
+                else value.replace(tzinfo=None) - value.utcoffset()
+                for value in values]
+        # Masked nulls: ``None`` is NaT in time columns.
+        null_value = None if dtype.startswith('datetime64') else 0
+        data = numpy.array(
+            [null_value if value is None else value for value in values],
+            dtype=dtype)
+
+    return numpy.ma.MaskedArray(data, mask=mask)
+
+
+def _columns_from_rows(rows, schema):
+    """Convert row tuples to one masked NumPy array per field.
+
+    :type rows: list of tuples
+    :param rows: The decoded rows.
+
+    :type schema: sequence
+    :param schema: The :class:`~google.cloud.bigquery.schema.SchemaField`
+                   instances describing the rows.
+
+    :rtype: :class:`collections.OrderedDict`
+    :returns: Columns (see :func:`_column_from_values`) keyed by field name,
+              in schema order.
+    """
+    columns = OrderedDict()
+    for index, field in enumerate(schema):
+        values = [row[index] for row in rows]
+        columns[field.name] = _column_from_values(values, field)
+    return columns
 
 
 def _int_to_json(value):
@@ -258,6 +586,28 @@ _SCALAR_VALUE_TO_JSON_ROW = {
 }
 
 
+def _row_to_json(schema, row):
+    """Convert a row tuple to the JSON mapping sent by ``insertAll``.
+
+    :type schema: sequence
+    :param schema: The :class:`~google.cloud.bigquery.schema.SchemaField`
+                   instances describing the row.
+
+    :type row: tuple
+    :param row: The row's values, in the order of ``schema``.
+
+    :rtype: dict
+    :returns: The row's JSON-compatible values, keyed by field name.
+    """
+    row_info = {}
+    for field, value in zip(schema, row):
+        converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
+        if converter is not None:  # STRING doesn't need converting
+            value = converter(value)
+        row_info[field.name] = value
+    return row_info
+
+
 # Converters used for scalar values marshalled as query parameters.
 _SCALAR_VALUE_TO_JSON_PARAM = _SCALAR_VALUE_TO_JSON_ROW.copy()
 _SCALAR_VALUE_TO_JSON_PARAM['TIMESTAMP'] = _timestamp_to_json_parameter
@@ -700,6 +1050,9 @@ def _item_to_row(iterator, resource):
         added to the iterator after being created, which
         should be done by the caller.
 
+    The :class:`_RowDecoder` built for the schema is kept on the iterator,
+    and re-used for later rows (and pages) with the same schema.
+
     :type iterator: :class:`~google.api.core.page_iterator.Iterator`
     :param iterator: The iterator that is currently in use.
 
@@ -709,7 +1062,10 @@ def _item_to_row(iterator, resource):
     :rtype: tuple
     :returns: The next row in the page.
     """
-    return _row_from_json(resource, iterator.schema)
+    decoder = iterator.__dict__.get('_row_decoder')
+    if decoder is None or not decoder.matches(iterator.schema):
+        decoder = iterator._row_decoder = _RowDecoder(iterator.schema)
+    return decoder(resource)
 
 
 # pylint: disable=unused-argument
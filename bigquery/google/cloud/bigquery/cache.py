@@ -0,0 +1,375 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side cache of query results.
+
+A :class:`QueryCache` passed to :class:`~google.cloud.bigquery.client.Client`
+is used by :meth:`~google.cloud.bigquery.query.QueryResults.run` and by the
+DB-API :class:`~google.cloud.bigquery.dbapi.Cursor`, to answer repeated
+queries without running them again::
+
+    >>> from google.cloud import bigquery
+    >>> from google.cloud.bigquery.cache import QueryCache
+    >>> client = bigquery.Client(query_cache=QueryCache(ttl=60))
+
+Unlike BigQuery's own cache of query results, entries are not invalidated
+when a query is non-deterministic (e.g. uses ``CURRENT_TIMESTAMP()``);
+only cache the results of clients running queries which can be served
+from stale data.
+"""
+
+import collections
+import json
+import re
+import threading
+import time
+
+import six
+
+from google.cloud.exceptions import NotFound
+
+
+_DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MB
+_DEFAULT_TTL = 300.0  # seconds
+_DEFAULT_CHECK_INTERVAL = 30.0  # seconds
+_TABLE_PATH_TEMPLATE = '/projects/%s/datasets/%s/tables/%s'
+
+# Literals, quoted identifiers and comments, kept verbatim when normalizing
+# a query; or runs of whitespace, collapsed.
+_QUERY_TOKEN_RE = re.compile(r"""
+    (
+        '''(?:\\.|[^\\])*?'''
+      | \"\"\"(?:\\.|[^\\])*?\"\"\"
+      | '(?:\\.|[^'\\])*'
+      | "(?:\\.|[^"\\])*"
+      | `(?:\\.|[^`\\])*`
+      | (?:--|\#)[^\n]*
+      | /\*.*?\*/
+    )
+  | (\s+)
+""", re.VERBOSE | re.DOTALL)
+
+# Approximate sizes of the values of cached rows, in bytes.
+_SCALAR_SIZE = 16
+_CONTAINER_SIZE = 64
+
+CachedResult = collections.namedtuple(
+    'CachedResult', ['schema', 'rows', 'total_rows'])
+"""A cached query result.
+
+:type schema: list of :class:`~google.cloud.bigquery.schema.SchemaField`
+:param schema: The schema of the rows.
+
+:type rows: tuple of tuples
+:param rows: All the rows of the result.
+
+:type total_rows: int
+:param total_rows: The number of rows.
+"""
+
+_Entry = collections.namedtuple(
+    '_Entry', ['result', 'size', 'expires', 'tables', 'snapshot_millis',
+               'checked'])
+
+
+class QueryCache(object):
+    """A thread-safe cache of query results, with TTL and LRU eviction.
+
+    Entries are keyed by :meth:`make_key`.  The least recently used entries
+    are evicted once the (estimated) size of the cached rows exceeds
+    ``max_bytes``, and entries expire ``ttl`` seconds after being stored.
+
+    If ``check_tables`` is true, the ``lastModifiedTime`` of the tables
+    read by the query is checked (one ``tables.get`` request per table)
+    before an entry is used, at most once every ``check_interval``
+    seconds; entries are dropped once a table changes after the query.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) The maximum size of the cached rows.
+
+    :type ttl: float
+    :param ttl: (Optional) The number of seconds an entry can be used.
+
+    :type check_tables: bool
+    :param check_tables: (Optional) Whether to check that the tables read by
+                         a query did not change.
+
+    :type check_interval: float
+    :param check_interval: (Optional) The number of seconds during which an
+                           entry is used without checking its tables again.
+    """
+
+    def __init__(self, max_bytes=_DEFAULT_MAX_BYTES, ttl=_DEFAULT_TTL,
+                 check_tables=True, check_interval=_DEFAULT_CHECK_INTERVAL):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.check_tables = check_tables
+        self.check_interval = check_interval
+        self._entries = collections.OrderedDict()
+        self._num_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def num_bytes(self):
+        """The estimated size of the cached rows.
+
+        :rtype: int
+        :returns: The size, in bytes.
+        """
+        return self._num_bytes
+
+    @staticmethod
+    def make_key(query, query_parameters=(), options=None):
+        """Build the cache key of a query.
+
+        Runs of whitespace outside of literals, quoted identifiers and
+        comments are collapsed, so that queries differing only in their
+        formatting share results.
+
+        :type query: str
+        :param query: The SQL query.
+
+        :type query_parameters: sequence
+        :param query_parameters: (Optional) The
+            :class:`~google.cloud.bigquery._helpers.AbstractQueryParameter`
+            instances of the query.
+
+        :type options: dict
+        :param options: (Optional) Other JSON-compatible settings affecting
+                        the result, e.g. ``useLegacySql``.
+
+        :rtype: tuple
+        :returns: The key.
+        """
+        parameters = [
+            parameter.to_api_repr() for parameter in query_parameters]
+        return (
+            _normalize_query(query),
+            json.dumps(parameters, sort_keys=True, default=str),
+            json.dumps(options or {}, sort_keys=True, default=str),
+        )
+
+    def get(self, key, client):
+        """Look up a query result.
+
+        :type key: tuple
+        :param key: The key of the query (see :meth:`make_key`).
+
+        :type client: :class:`~google.cloud.bigquery.client.Client`
+        :param client: The client used to check the query's tables.
+
+        :rtype: :class:`CachedResult` or ``NoneType``
+        :returns: The cached result, or None if there is no usable entry.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry.expires > now:
+                # Re-insert as the most recently used entry.
+                self._entries[key] = entry
+            elif entry is not None:
+                self._num_bytes -= entry.size
+                entry = None
+
+        if entry is not None and self._needs_check(entry, now):
+            if not _tables_unchanged(
+                    client, entry.tables, entry.snapshot_millis):
+                self.discard(key)
+                entry = None
+            else:
+                with self._lock:
+                    if self._entries.get(key) is entry:
+                        self._entries[key] = entry._replace(checked=now)
+
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry.result
+
+    def put(self, key, schema, rows, tables=(), snapshot_millis=None):
+        """Store a query result.
+
+        Results larger than ``max_bytes`` are not stored.
+
+        :type key: tuple
+        :param key: The key of the query (see :meth:`make_key`).
+
+        :type schema: list of
+                      :class:`~google.cloud.bigquery.schema.SchemaField`
+        :param schema: The schema of the rows.
+
+        :type rows: list of tuples
+        :param rows: All the rows of the result.
+
+        :type tables: sequence of tuples
+        :param tables: (Optional) The (project, dataset, table) names of the
+                       tables read by the query.
+
+        :type snapshot_millis: float
+        :param snapshot_millis: (Optional) The time at which the query read
+                                the tables, in milliseconds since the epoch.
+                                Defaults to now.
+
+        :rtype: bool
+        :returns: True if the result was stored.
+        """
+        rows = tuple(rows)
+        size = sum(_estimate_size(row) for row in rows)
+        if size > self.max_bytes:
+            return False
+
+        now = time.time()
+        if snapshot_millis is None:
+            snapshot_millis = now * 1000.0
+        entry = _Entry(
+            CachedResult(list(schema), rows, len(rows)), size,
+            now + self.ttl, tuple(tables), snapshot_millis, now)
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._num_bytes -= previous.size
+            self._entries[key] = entry
+            self._num_bytes += size
+            while self._num_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._num_bytes -= evicted.size
+        return True
+
+    def discard(self, key):
+        """Drop the entry of a query, if any.
+
+        :type key: tuple
+        :param key: The key of the query (see :meth:`make_key`).
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._num_bytes -= entry.size
+
+    def clear(self):
+        """Drop all the entries."""
+        with self._lock:
+            self._entries.clear()
+            self._num_bytes = 0
+
+    def _needs_check(self, entry, now):
+        """Check whether the tables of an entry must be checked.
+
+        :type entry: :class:`_Entry`
+        :param entry: The entry about to be used.
+
+        :type now: float
+        :param now: The current time.
+
+        :rtype: bool
+        :returns: True if the entry's tables were not checked recently.
+        """
+        return (self.check_tables and len(entry.tables) > 0 and
+                now - entry.checked >= self.check_interval)
+
+
+def _normalize_query(query):
+    """Collapse the whitespace of a query, outside of literals.
+
+    Runs of whitespace containing a newline become a newline (which may end
+    a comment); other runs become a space.
+
+    :type query: str
+    :param query: The SQL query.
+
+    :rtype: str
+    :returns: The normalized query.
+    """
+    def replace(match):
+        verbatim, whitespace = match.groups()
+        if verbatim is not None:
+            return verbatim
+        return '\n' if '\n' in whitespace else ' '
+
+    return _QUERY_TOKEN_RE.sub(replace, query).strip()
+
+
+def _estimate_size(value):
+    """Estimate the memory used by a (decoded) row value.
+
+    :type value: object
+    :param value: A row, or a value of a row.
+
+    :rtype: int
+    :returns: The approximate size, in bytes.
+    """
+    if isinstance(value, (six.binary_type, six.text_type)):
+        return _SCALAR_SIZE + len(value)
+    if isinstance(value, (list, tuple)):
+        return _CONTAINER_SIZE + sum(_estimate_size(item) for item in value)
+    if isinstance(value, dict):
+        return _CONTAINER_SIZE + sum(
+            _estimate_size(key) + _estimate_size(item)
+            for key, item in six.iteritems(value))
+    return _SCALAR_SIZE
+
+
+def _referenced_tables(job_resource):
+    """Get the tables read by a query job, and when it started.
+
+    :type job_resource: dict
+    :param job_resource: The properties of a completed query job.
+
+    :rtype: tuple
+    :returns: The (project, dataset, table) names of the tables, and the
+              job's creation time in milliseconds (or None).
+    """
+    statistics = job_resource.get('statistics', {})
+    tables = tuple(
+        (table['projectId'], table['datasetId'], table['tableId'])
+        for table in statistics.get('query', {}).get('referencedTables', ()))
+    snapshot_millis = statistics.get('creationTime')
+    if snapshot_millis is not None:
+        snapshot_millis = float(snapshot_millis)
+    return tables, snapshot_millis
+
+
+def _tables_unchanged(client, tables, snapshot_millis):
+    """Check that tables were not modified since a query read them.
+
+    :type client: :class:`~google.cloud.bigquery.client.Client`
+    :param client: The client used to get the tables.
+
+    :type tables: sequence of tuples
+    :param tables: The (project, dataset, table) names of the tables.
+
+    :type snapshot_millis: float
+    :param snapshot_millis: The time at which the query read the tables.
+
+    :rtype: bool
+    :returns: False if a table was modified (or deleted) since.
+    """
+    for table in tables:
+        try:
+            resource = client._connection.api_request(
+                method='GET', path=_TABLE_PATH_TEMPLATE % table,
+                query_params={'fields': 'lastModifiedTime'})
+        except NotFound:
+            return False
+        if float(resource.get('lastModifiedTime', 0)) > snapshot_millis:
+            return False
+    return True
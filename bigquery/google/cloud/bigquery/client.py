@@ -71,16 +71,31 @@ class Client(ClientWithProject):
                   ``credentials`` for the current object.
                   This parameter should be considered private, and could
                   change in the future.
+
+    :type query_cache: :class:`~google.cloud.bigquery.cache.QueryCache`
+    :param query_cache: (Optional) A cache of query results, used by
+                        :meth:`~google.cloud.bigquery.query.QueryResults.run`
+                        and the DB-API.  If not passed, results are not
+                        cached.
+
+    :type transport_config: :class:`~google.cloud._http.TransportConfig`
+    :param transport_config: (Optional) Connection pool settings for the
+                             HTTP object created when ``_http`` is not
+                             passed. Clients given the same instance share
+                             its connection pools.
     """
 
     SCOPE = ('https://www.googleapis.com/auth/bigquery',
              'https://www.googleapis.com/auth/cloud-platform')
     """The scopes required for authenticating as a BigQuery consumer."""
 
-    def __init__(self, project=None, credentials=None, _http=None):
+    def __init__(self, project=None, credentials=None, _http=None,
+                 query_cache=None, transport_config=None):
         super(Client, self).__init__(
-            project=project, credentials=credentials, _http=_http)
+            project=project, credentials=credentials, _http=_http,
+            transport_config=transport_config)
         self._connection = Connection(self)
+        self.query_cache = query_cache
 
     def list_projects(self, max_results=None, page_token=None):
         """List projects for the project associated with this client.
@@ -162,7 +177,8 @@ class Client(ClientWithProject):
         """
         return Dataset(dataset_name, client=self, project=project)
 
-    def _get_query_results(self, job_id, project=None, timeout_ms=None):
+    def _get_query_results(self, job_id, project=None, timeout_ms=None,
+                           max_results=0):
         """Get the query results object for a query job.
 
         :type job_id: str
@@ -178,11 +194,20 @@ class Client(ClientWithProject):
             (Optional) number of milliseconds the the API call should wait for
             the query to complete before the request times out.
 
+        :type max_results: int
+        :param max_results:
+            (Optional) maximum number of rows to return with the results, if
+            the query is complete.  Defaults to no rows; if ``None``, the
+            first page of rows is returned.
+
         :rtype: :class:`google.cloud.bigquery.query.QueryResults`
         :returns: a new ``QueryResults`` instance
         """
 
-        extra_params = {'maxResults': 0}
+        extra_params = {}
+
+        if max_results is not None:
+            extra_params['maxResults'] = max_results
 
         if project is None:
             project = self.project
@@ -15,10 +15,11 @@
 """Cursor for the Google BigQuery DB-API."""
 
 import collections
+import itertools
+import re
 import uuid
 
-import six
-
+from google.cloud.bigquery import cache as cache_module
 from google.cloud.bigquery.dbapi import _helpers
 from google.cloud.bigquery.dbapi import exceptions
 import google.cloud.exceptions
@@ -34,6 +35,24 @@ Column = collections.namedtuple(
         'scale', 'null_ok',
     ])
 
+# The number of pages of rows requested ahead of the rows being fetched.
+_PREFETCH_PAGES = 1
+
+# The maximum number of sets of parameters inserted by a single statement
+# in ``executemany()``.
+_EXECUTEMANY_BATCH_SIZE = 500
+
+# The maximum number of query parameters of a single statement.
+_MAX_QUERY_PARAMETERS = 10000
+
+# An ``INSERT ... VALUES (...)`` statement whose values are all parameters,
+# which ``executemany()`` expands into multi-row inserts.
+_INSERT_VALUES_RE = re.compile(
+    r'^(\s*INSERT\b.+\bVALUES\s*)'
+    r'(\(\s*(?:%s|%\([^)]+\)s)\s*(?:,\s*(?:%s|%\([^)]+\)s)\s*)*\))'
+    r'(\s*;?\s*)$',
+    re.IGNORECASE | re.DOTALL)
+
 
 class Cursor(object):
     """DB-API Cursor to Google BigQuery.
@@ -53,9 +72,24 @@ class Cursor(object):
         self.arraysize = 1
         self._query_data = None
         self._query_results = None
+        self._cache_entry = None
+        self._page = ()
+        self._page_offset = 0
 
     def close(self):
-        """No-op."""
+        """Stop fetching the results of the last ``execute*()`` call."""
+        self._stop_fetching()
+        self._query_results = None
+        self._cache_entry = None
+
+    def _stop_fetching(self):
+        """Drop the fetched rows, stopping any background page requests."""
+        close = getattr(self._query_data, 'close', None)
+        if close is not None:
+            close()
+        self._query_data = None
+        self._page = ()
+        self._page_offset = 0
 
     def _set_description(self, schema):
         """Set description from schema.
@@ -132,12 +166,6 @@ class Cursor(object):
         :param job_id: (Optional) The job_id to use. If not set, a job ID
             is generated at random.
         """
-        self._query_data = None
-        self._query_results = None
-        client = self.connection._client
-        if job_id is None:
-            job_id = str(uuid.uuid4())
-
         # The DB-API uses the pyformat formatting, since the way BigQuery does
         # query parameters was not one of the standard options. Convert both
         # the query and the parameters to the format expected by the client
@@ -145,6 +173,40 @@ class Cursor(object):
         formatted_operation = _format_operation(
             operation, parameters=parameters)
         query_parameters = _helpers.to_query_parameters(parameters)
+        self._execute(formatted_operation, query_parameters, job_id=job_id)
+
+    def _execute(self, formatted_operation, query_parameters, job_id=None):
+        """Execute a formatted query, and prepare to fetch its results.
+
+        :type formatted_operation: str
+        :param formatted_operation: A Google BigQuery query string, using
+                                    BigQuery's parameter syntax.
+
+        :type query_parameters:
+            List[google.cloud.bigquery._helpers.AbstractQueryParameter]
+        :param query_parameters: The parameters of the query.
+
+        :type job_id: str
+        :param job_id: (Optional) The job_id to use. If not set, a job ID
+            is generated at random.
+        """
+        self.close()
+        client = self.connection._client
+        if job_id is None:
+            job_id = str(uuid.uuid4())
+
+        cache = client.query_cache
+        if cache is not None:
+            cache_key = cache.make_key(
+                formatted_operation, query_parameters,
+                {'useLegacySql': False})
+            cached = cache.get(cache_key, client)
+            if cached is not None:
+                self._query_data = iter(())
+                self._page = cached.rows
+                self.rowcount = cached.total_rows
+                self._set_description(cached.schema)
+                return
 
         query_job = client.run_async_query(
             job_id,
@@ -163,33 +225,106 @@ class Cursor(object):
         self._set_rowcount(query_results)
         self._set_description(query_results.schema)
 
+        if cache is not None and query_results.num_dml_affected_rows is None:
+            tables, snapshot_millis = cache_module._referenced_tables(
+                query_job._properties)
+            self._cache_entry = (
+                cache, cache_key, query_results.schema, tables,
+                snapshot_millis)
+
     def executemany(self, operation, seq_of_parameters):
         """Prepare and execute a database operation multiple times.
 
+        An ``INSERT ... VALUES (...)`` statement whose values are all
+        parameters is executed as multi-row inserts, inserting up to 500
+        sets of parameters per query job (fewer for wide rows, so that no
+        query has more than 10,000 parameters). Other statements are
+        executed once per set of parameters.
+
         :type operation: str
         :param operation: A Google BigQuery query string.
 
         :type seq_of_parameters: Sequence[Mapping[str, Any] or Sequence[Any]]
         :param parameters: Sequence of many sets of parameter values.
         """
-        for parameters in seq_of_parameters:
-            self.execute(operation, parameters)
+        match = _INSERT_VALUES_RE.match(operation)
+        if match is None or '%' in match.group(1) + match.group(3):
+            for parameters in seq_of_parameters:
+                self.execute(operation, parameters)
+            return
+
+        prefix, values, suffix = match.groups()
+        # Each placeholder of the row is a separate query parameter.
+        batch_size = max(1, min(
+            _EXECUTEMANY_BATCH_SIZE,
+            _MAX_QUERY_PARAMETERS // values.count('%')))
+        seq_of_parameters = iter(seq_of_parameters)
+        rowcount = None
+        while True:
+            batch = list(itertools.islice(seq_of_parameters, batch_size))
+            if not batch:
+                break
+
+            formatted_values = []
+            query_values = []
+            for parameters in batch:
+                formatted, ordered = _format_operation_positional(
+                    values, parameters)
+                formatted_values.append(formatted)
+                query_values.extend(ordered)
+
+            self._execute(
+                prefix + ', '.join(formatted_values) + suffix,
+                _helpers.to_query_parameters_list(query_values))
+            rowcount = (rowcount or 0) + max(self.rowcount, 0)
 
-    def _try_fetch(self, size=None):
+        if rowcount is not None:
+            self.rowcount = rowcount
+
+    def _try_fetch(self, page_size=None):
         """Try to start fetching data, if not yet started.
 
         Mutates self to indicate that iteration has started.
+
+        :type page_size: int
+        :param page_size: (Optional) The number of rows to request per page.
+                          Defaults to the service's page size.
         """
-        if self._query_results is None:
+        if self._query_data is None and self._query_results is None:
             raise exceptions.InterfaceError(
                 'No query results: execute() must be called before fetch.')
 
-        if size is None:
-            size = self.arraysize
-
         if self._query_data is None:
-            self._query_data = iter(
-                self._query_results.fetch_data(max_results=size))
+            self._query_data = _iter_pages(self._query_results, page_size)
+            if self._cache_entry is not None:
+                self._query_data = _cache_pages(
+                    self._query_data, *self._cache_entry)
+
+    def _take_rows(self, size=None):
+        """Take rows from the fetched pages, fetching pages as needed.
+
+        :type size: int
+        :param size: (Optional) The maximum number of rows to take. Defaults
+                     to all the remaining rows.
+
+        :rtype: List[tuple]
+        :returns: The rows.
+        """
+        rows = []
+        while size is None or len(rows) < size:
+            if self._page_offset >= len(self._page):
+                page = next(self._query_data, None)
+                if page is None:
+                    break
+                self._page, self._page_offset = page, 0
+                continue
+
+            stop = len(self._page)
+            if size is not None:
+                stop = min(stop, self._page_offset + size - len(rows))
+            rows.extend(self._page[self._page_offset:stop])
+            self._page_offset = stop
+        return rows
 
     def fetchone(self):
         """Fetch a single row from the results of the last ``execute*()`` call.
@@ -201,19 +336,20 @@ class Cursor(object):
         :raises: :class:`~google.cloud.bigquery.dbapi.InterfaceError`
             if called before ``execute()``.
         """
-        self._try_fetch()
-        try:
-            return six.next(self._query_data)
-        except StopIteration:
-            return None
+        self._try_fetch(page_size=self.arraysize)
+        rows = self._take_rows(1)
+        if rows:
+            return rows[0]
+        return None
 
     def fetchmany(self, size=None):
         """Fetch multiple results from the last ``execute*()`` call.
 
         .. note::
-            The size parameter is not used for the request/response size.
-            Set the ``arraysize`` attribute before calling ``execute()`` to
-            set the batch size.
+            Rows are requested in pages of ``size`` rows, as of the first
+            ``fetchmany()`` (or of ``arraysize`` rows, as of the first
+            ``fetchone()``) following ``execute()``. The next page is
+            requested on a background thread while the current one is used.
 
         :type size: int
         :param size:
@@ -228,15 +364,8 @@ class Cursor(object):
         if size is None:
             size = self.arraysize
 
-        self._try_fetch(size=size)
-        rows = []
-
-        for row in self._query_data:
-            rows.append(row)
-            if len(rows) >= size:
-                break
-
-        return rows
+        self._try_fetch(page_size=size)
+        return self._take_rows(size)
 
     def fetchall(self):
         """Fetch all remaining results from the last ``execute*()`` call.
@@ -247,7 +376,7 @@ class Cursor(object):
             if called before ``execute()``.
         """
         self._try_fetch()
-        return [row for row in self._query_data]
+        return self._take_rows()
 
     def setinputsizes(self, sizes):
         """No-op."""
@@ -311,6 +440,50 @@ def _format_operation_dict(operation, parameters):
         raise exceptions.ProgrammingError(exc)
 
 
+class _PositionalPlaceholders(object):
+    """Maps parameter names to ``?``, recording the values used in order.
+
+    :type parameters: Mapping[str, Any]
+    :param parameters: Dictionary of parameter values.
+    """
+
+    def __init__(self, parameters):
+        self._parameters = parameters
+        self.values = []
+
+    def __getitem__(self, name):
+        self.values.append(self._parameters[name])
+        return '?'
+
+
+def _format_operation_positional(operation, parameters):
+    """Formats parameters in operation as positional parameters.
+
+    Both ``%s`` and ``%(namedparam)s`` are replaced by ``?``.
+
+    :type operation: str
+    :param operation: A Google BigQuery query string.
+
+    :type parameters: Mapping[str, Any] or Sequence[Any]
+    :param parameters: Parameter values.
+
+    :rtype: Tuple[str, List[Any]]
+    :returns: A formatted query string, and the values of its parameters in
+              the order they are used.
+    :raises: :class:`~google.cloud.bigquery.dbapi.ProgrammingError`
+        if a parameter used in the operation is not found in the
+        ``parameters`` argument.
+    """
+    if isinstance(parameters, collections.Mapping):
+        placeholders = _PositionalPlaceholders(parameters)
+        try:
+            return operation % placeholders, placeholders.values
+        except KeyError as exc:
+            raise exceptions.ProgrammingError(exc)
+
+    return _format_operation_list(operation, parameters), list(parameters)
+
+
 def _format_operation(operation, parameters=None):
     """Formats parameters in operation in way BigQuery expects.
 
@@ -333,3 +506,74 @@ def _format_operation(operation, parameters=None):
         return _format_operation_dict(operation, parameters)
 
     return _format_operation_list(operation, parameters)
+
+
+def _iter_pages(query_results, page_size=None):
+    """Yield the rows of a query, a page at a time.
+
+    The next page is requested on a background thread while the rows of the
+    current page are used.
+
+    :type query_results: :class:`~google.cloud.bigquery.query.QueryResults`
+    :param query_results: The results of a completed query.
+
+    :type page_size: int
+    :param page_size: (Optional) The number of rows to request per page.
+
+    :rtype: iterator
+    :returns: Lists of the rows of each page.
+    """
+    iterator = query_results.fetch_data(max_results=page_size)
+    iterator.prefetch = _PREFETCH_PAGES
+    pages = iterator.pages
+    try:
+        for page in pages:
+            yield list(page)
+    finally:
+        pages.close()
+
+
+def _cache_pages(pages, cache, key, schema, tables, snapshot_millis):
+    """Yield the pages of a query, storing its rows in a cache once all are
+    read.
+
+    Stops keeping the rows once they are too large to be cached.
+
+    :type pages: iterator
+    :param pages: Lists of the rows of the query.
+
+    :type cache: :class:`~google.cloud.bigquery.cache.QueryCache`
+    :param cache: The cache in which to store the rows.
+
+    :type key: tuple
+    :param key: The key of the query in the cache.
+
+    :type schema: list of :class:`~google.cloud.bigquery.schema.SchemaField`
+    :param schema: The schema of the rows.
+
+    :type tables: sequence of tuples
+    :param tables: The (project, dataset, table) names of the tables read by
+                   the query.
+
+    :type snapshot_millis: float
+    :param snapshot_millis: The time at which the query read the tables.
+
+    :rtype: iterator
+    :returns: The pages.
+    """
+    kept = []
+    num_bytes = 0
+    try:
+        for page in pages:
+            if kept is not None:
+                kept.extend(page)
+                num_bytes += sum(
+                    cache_module._estimate_size(row) for row in page)
+                if num_bytes > cache.max_bytes:
+                    kept = None
+            yield page
+    finally:
+        pages.close()
+
+    if kept is not None:
+        cache.put(key, schema, kept, tables, snapshot_millis)
@@ -0,0 +1,466 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Buffered streaming inserts into BigQuery tables.
+
+See
+https://cloud.google.com/bigquery/streaming-data-into-bigquery
+"""
+
+import collections
+from concurrent import futures
+import json
+import threading
+import time
+import uuid
+
+from google.cloud import exceptions
+from google.cloud.bigquery._helpers import _row_to_json
+from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
+
+
+_DEFAULT_MAX_ROWS = 500
+_DEFAULT_MAX_BYTES = 5 * 1024 * 1024  # 5 MB, half the request size limit.
+_DEFAULT_MAX_LATENCY = 1.0  # seconds
+_DEFAULT_MAX_CONCURRENT = 4
+_DEFAULT_MAX_RETRIES = 3
+_DEFAULT_RETRY_DELAY = 1.0  # seconds
+_NUM_LATENCIES = 100
+
+# Row error reasons for which the row itself is valid, and inserting it
+# again may succeed.  ``stopped`` rows were rejected only because another
+# row of the request was invalid.
+_RETRYABLE_REASONS = frozenset([
+    'backendError',
+    'internalError',
+    'rateLimitExceeded',
+    'stopped',
+    'timeout',
+])
+
+# Whole-request failures after which the rows are sent again.
+_RETRYABLE_EXCEPTIONS = (exceptions.ServerError, exceptions.TooManyRequests)
+
+_PendingRow = collections.namedtuple(
+    '_PendingRow', ['row', 'insert_id', 'info', 'size'])
+
+
+class TableInserter(object):
+    """Insert rows into a table in buffered, concurrent ``insertAll`` calls.
+
+    Rows passed to :meth:`insert` (from any number of threads) are
+    buffered, and the buffer is sent when it holds ``max_rows`` rows or
+    ``max_bytes`` bytes of JSON, or when its oldest row has waited
+    ``max_latency`` seconds.  Up to ``max_concurrent`` requests run at
+    once; :meth:`insert` blocks while ``2 * max_concurrent`` batches are
+    waiting to be sent.
+
+    Each row gets an ``insertId`` (a random UUID unless passed), so that
+    rows sent again are de-duplicated by the service.  Rows rejected with a
+    transient reason (see ``insertErrors``), and all the rows of requests
+    failing with a server error, are retried up to ``max_retries`` times;
+    other failures are returned by :meth:`flush`.
+
+    Can be used as a context manager, flushing and closing on exit.
+
+    :type table: :class:`~google.cloud.bigquery.table.Table`
+    :param table: The table to insert into.  Its schema must be set.
+
+    :type client: :class:`~google.cloud.bigquery.client.Client` or
+                  ``NoneType``
+    :param client: the client to use.  If not passed, falls back to the
+                   ``client`` stored on the table's dataset.
+
+    :type max_rows: int
+    :param max_rows: (Optional) The maximum number of rows per request.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) The maximum size of the rows of a request.
+                      A single row larger than this is sent on its own.
+
+    :type max_latency: float
+    :param max_latency: (Optional) The maximum number of seconds a row is
+                        buffered before being sent.  If ``None``, rows are
+                        only sent when a batch is full or on :meth:`flush`.
+
+    :type max_concurrent: int
+    :param max_concurrent: (Optional) The number of concurrent requests.
+
+    :type max_retries: int
+    :param max_retries: (Optional) The number of times a row is retried.
+
+    :type retry_delay: float
+    :param retry_delay: (Optional) The number of seconds to wait before the
+                        first retry of a batch; doubled for each retry.
+
+    :type skip_invalid_rows: bool
+    :param skip_invalid_rows: (Optional) skip rows w/ invalid data?
+
+    :type ignore_unknown_values: bool
+    :param ignore_unknown_values: (Optional) ignore columns beyond schema?
+
+    :type template_suffix: str
+    :param template_suffix:
+        (Optional) treat ``name`` as a template table and provide a suffix.
+        See :meth:`~google.cloud.bigquery.table.Table.insert_data`.
+
+    :raises: ValueError if table's schema is not set
+    """
+
+    def __init__(self, table, client=None,
+                 max_rows=_DEFAULT_MAX_ROWS,
+                 max_bytes=_DEFAULT_MAX_BYTES,
+                 max_latency=_DEFAULT_MAX_LATENCY,
+                 max_concurrent=_DEFAULT_MAX_CONCURRENT,
+                 max_retries=_DEFAULT_MAX_RETRIES,
+                 retry_delay=_DEFAULT_RETRY_DELAY,
+                 skip_invalid_rows=None,
+                 ignore_unknown_values=None,
+                 template_suffix=None):
+        if len(table.schema) == 0:
+            raise ValueError(_TABLE_HAS_NO_SCHEMA)
+
+        self._table = table
+        self._schema = table.schema
+        self._client = table._require_client(client)
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+        self._max_latency = max_latency
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._options = {}
+        if skip_invalid_rows is not None:
+            self._options['skipInvalidRows'] = skip_invalid_rows
+        if ignore_unknown_values is not None:
+            self._options['ignoreUnknownValues'] = ignore_unknown_values
+        if template_suffix is not None:
+            self._options['templateSuffix'] = template_suffix
+
+        self._lock = threading.Condition()
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._buffer_started = None
+        self._in_flight_rows = 0
+        self._errors = []
+        self._latencies = collections.deque(maxlen=_NUM_LATENCIES)
+        self._rows_inserted = 0
+        self._closed = False
+        self._slots = threading.BoundedSemaphore(2 * max_concurrent)
+        self._executor = futures.ThreadPoolExecutor(max_concurrent)
+        self._timer = None
+
+    @property
+    def backlog(self):
+        """The number of rows buffered or being sent.
+
+        :rtype: int
+        :returns: The number of rows not yet inserted (or failed).
+        """
+        with self._lock:
+            return len(self._buffer) + self._in_flight_rows
+
+    @property
+    def rows_inserted(self):
+        """The number of rows inserted so far.
+
+        :rtype: int
+        :returns: The number of rows accepted by the service.
+        """
+        return self._rows_inserted
+
+    @property
+    def flush_latencies(self):
+        """Durations of recently completed batches.
+
+        Each duration is measured from the time the batch's first row was
+        buffered until the batch was inserted (including retries).
+
+        :rtype: list of float
+        :returns: The durations, in seconds, of the last 100 batches,
+                  oldest first.
+        """
+        with self._lock:
+            return list(self._latencies)
+
+    def insert(self, row, row_id=None):
+        """Buffer a row, sending the buffer if it is full.
+
+        :type row: tuple
+        :param row: Row data to be inserted.  The tuple should contain data
+                    for each schema field on the table and in the same
+                    order as the schema fields.
+
+        :type row_id: str
+        :param row_id: (Optional) A unique id for the row, used by the
+                       service to de-duplicate it.  If not passed, a random
+                       one is generated.
+
+        :raises: ValueError if the inserter is closed.
+        """
+        if row_id is None:
+            row_id = str(uuid.uuid4())
+        info = {'json': _row_to_json(self._schema, row), 'insertId': row_id}
+        pending = _PendingRow(row, row_id, info, len(json.dumps(info)))
+
+        batches = []
+        with self._lock:
+            if self._closed:
+                raise ValueError('Inserter is closed.')
+            if (self._buffer and
+                    self._buffer_bytes + pending.size > self._max_bytes):
+                batches.append(self._take_batch())
+            self._buffer.append(pending)
+            self._buffer_bytes += pending.size
+            if len(self._buffer) == 1:
+                self._buffer_started = time.time()
+                self._start_timer()
+            if (len(self._buffer) >= self._max_rows or
+                    self._buffer_bytes >= self._max_bytes):
+                batches.append(self._take_batch())
+
+        for batch in batches:
+            self._send(*batch)
+
+    def insert_many(self, rows, row_ids=None):
+        """Buffer several rows.
+
+        :type rows: list of tuples
+        :param rows: Row data to be inserted.  See :meth:`insert`.
+
+        :type row_ids: list of str
+        :param row_ids: (Optional) Unique ids, one per row.
+        """
+        if row_ids is None:
+            row_ids = [None] * len(rows)
+        for row, row_id in zip(rows, row_ids):
+            self.insert(row, row_id=row_id)
+
+    def flush(self):
+        """Send the buffered rows, and wait for all batches to complete.
+
+        :rtype: list of mappings
+        :returns: One mapping per row which could not be inserted, since
+                  the last call:  the "row" and "row_id" keys identify the
+                  row, and the "errors" key contains a list of the mappings
+                  describing one or more problems with the row.
+        """
+        with self._lock:
+            batch = self._take_batch() if self._buffer else None
+        if batch is not None:
+            self._send(*batch)
+
+        with self._lock:
+            while self._in_flight_rows:
+                self._lock.wait()
+            errors, self._errors = self._errors, []
+        return errors
+
+    def close(self):
+        """Flush the buffered rows, and stop accepting new ones.
+
+        :rtype: list of mappings
+        :returns: The rows which could not be inserted (see :meth:`flush`).
+        """
+        with self._lock:
+            if self._closed:
+                return []
+            self._closed = True
+            self._lock.notify_all()
+        try:
+            return self.flush()
+        finally:
+            self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _start_timer(self):
+        """Start the thread flushing rows after ``max_latency``, if needed.
+
+        Must be called with the lock held.
+        """
+        if self._max_latency is None:
+            return
+        if self._timer is None:
+            self._timer = threading.Thread(target=self._flush_periodically)
+            self._timer.daemon = True
+            self._timer.start()
+        else:
+            self._lock.notify_all()
+
+    def _flush_periodically(self):
+        """Send the buffer once its oldest row is ``max_latency`` old.
+
+        Runs on the timer thread until the inserter is closed.
+        """
+        while True:
+            batch = None
+            with self._lock:
+                if self._closed:
+                    return
+                if not self._buffer:
+                    self._lock.wait()
+                    continue
+                age = time.time() - self._buffer_started
+                if age >= self._max_latency:
+                    batch = self._take_batch()
+                else:
+                    self._lock.wait(self._max_latency - age)
+
+            if batch is not None:
+                self._send(*batch)
+
+    def _take_batch(self):
+        """Empty the buffer.
+
+        Must be called with the lock held.
+
+        :rtype: tuple
+        :returns: The buffered rows and the time the first was buffered.
+        """
+        batch = (self._buffer, self._buffer_started)
+        self._in_flight_rows += len(self._buffer)
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._buffer_started = None
+        return batch
+
+    def _send(self, rows, started):
+        """Schedule a batch of rows, blocking while too many are pending.
+
+        :type rows: list
+        :param rows: The :class:`_PendingRow` instances to insert.
+
+        :type started: float
+        :param started: The time the first row was buffered.
+        """
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._insert_batch, rows, started)
+        except Exception:
+            # The rows were counted as in flight by ``_take_batch``, so
+            # ``flush`` would wait for them forever.
+            self._slots.release()
+            with self._lock:
+                self._in_flight_rows -= len(rows)
+                self._lock.notify_all()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+
+    def _insert_batch(self, rows, started):
+        """Insert a batch of rows, retrying rows which failed transiently.
+
+        Runs on a worker thread.
+
+        :type rows: list
+        :param rows: The :class:`_PendingRow` instances to insert.
+
+        :type started: float
+        :param started: The time the first row was buffered.
+        """
+        num_rows = len(rows)
+        errors = []
+        try:
+            self._insert_with_retries(rows, errors)
+        finally:
+            with self._lock:
+                self._in_flight_rows -= num_rows
+                self._rows_inserted += num_rows - len(errors)
+                self._errors.extend(errors)
+                self._latencies.append(time.time() - started)
+                self._lock.notify_all()
+
+    def _insert_with_retries(self, rows, errors):
+        """Send rows until inserted, failed, or out of retries.
+
+        :type rows: list
+        :param rows: The :class:`_PendingRow` instances to insert.
+
+        :type errors: list
+        :param errors: Collects the rows which could not be inserted (see
+                       :meth:`flush`).
+        """
+        attempt = 0
+        while rows:
+            retry = []
+            try:
+                response = self._client._connection.api_request(
+                    method='POST',
+                    path='%s/insertAll' % self._table.path,
+                    data=self._make_request(rows))
+            except Exception as exc:  # pylint: disable=broad-except
+                if (attempt < self._max_retries and
+                        isinstance(exc, _RETRYABLE_EXCEPTIONS)):
+                    retry = rows
+                else:
+                    row_errors = [{'reason': type(exc).__name__,
+                                   'message': str(exc)}]
+                    errors.extend(
+                        _row_error(pending, row_errors) for pending in rows)
+            else:
+                for error in response.get('insertErrors', ()):
+                    pending = rows[int(error['index'])]
+                    if (attempt < self._max_retries and
+                            _is_retryable(error['errors'])):
+                        retry.append(pending)
+                    else:
+                        errors.append(_row_error(pending, error['errors']))
+
+            rows = retry
+            if rows:
+                time.sleep(self._retry_delay * 2 ** attempt)
+                attempt += 1
+
+    def _make_request(self, rows):
+        """Build the body of an ``insertAll`` request.
+
+        :type rows: list
+        :param rows: The :class:`_PendingRow` instances to insert.
+
+        :rtype: dict
+        :returns: The request body.
+        """
+        data = {'rows': [pending.info for pending in rows]}
+        data.update(self._options)
+        return data
+
+
+def _is_retryable(errors):
+    """Check whether all the errors of a row are transient.
+
+    :type errors: list of mappings
+    :param errors: The row's ``insertErrors`` entries.
+
+    :rtype: bool
+    :returns: True if inserting the row again may succeed.
+    """
+    return all(error.get('reason') in _RETRYABLE_REASONS for error in errors)
+
+
+def _row_error(pending, errors):
+    """Describe a row which could not be inserted.
+
+    :type pending: :class:`_PendingRow`
+    :param pending: The row.
+
+    :type errors: list of mappings
+    :param errors: The problems with the row.
+
+    :rtype: dict
+    :returns: The mapping returned by :meth:`TableInserter.flush`.
+    """
+    return {'row': pending.row, 'row_id': pending.insert_id, 'errors': errors}
@@ -14,12 +14,16 @@
 
 """Define API Jobs."""
 
+import collections
+from concurrent import futures
 import threading
+import time
 
 import six
 from six.moves import http_client
 
 import google.api.core.future.polling
+import google.api.core.retry
 from google.cloud import exceptions
 from google.cloud.exceptions import NotFound
 from google.cloud._helpers import _datetime_from_microseconds
@@ -35,6 +39,39 @@ from google.cloud.bigquery._helpers import _TypedProperty
 
 _DONE_STATE = 'DONE'
 _STOPPED_REASON = 'stopped'
+_TIMEOUT_BUFFER_SECS = 0.1
+# getQueryResults holds each request for (at most) this long, returning
+# as soon as the query completes.
+_LONG_POLL_TIMEOUT_SECS = 10.0
+# Measures the time left before the deadline of a long-poll (Python 2.7
+# has no monotonic clock).
+_monotonic = getattr(time, 'monotonic', time.time)
+
+# Other jobs can only be polled with jobs.get: start with short delays,
+# so that short jobs are seen to complete quickly, and back off for long
+# ones.
+_POLL_RETRY = google.api.core.future.polling.DEFAULT_RETRY.with_delay(
+    initial=0.1, maximum=10.0, multiplier=1.5)
+
+# Queries are long-polled on the server, so delays between requests are
+# only needed if the service returns early; keep them short.
+_QUERY_POLL_RETRY = google.api.core.future.polling.DEFAULT_RETRY.with_delay(
+    initial=0.05, maximum=0.5, multiplier=1.5)
+
+# Delays between the rounds of polling of :func:`wait` / :func:`as_completed`.
+_WAIT_INITIAL_DELAY = 0.5
+_WAIT_MAXIMUM_DELAY = 10.0
+_WAIT_DELAY_MULTIPLIER = 1.5
+_LIST_PAGE_SIZE = 1000
+_ACTIVE_STATES = ('pending', 'running')
+
+FIRST_COMPLETED = futures.FIRST_COMPLETED
+FIRST_EXCEPTION = futures.FIRST_EXCEPTION
+ALL_COMPLETED = futures.ALL_COMPLETED
+
+DoneAndNotDoneJobs = collections.namedtuple(
+    'DoneAndNotDoneJobs', ['done', 'not_done'])
+"""The result of :func:`wait`: sets of completed and pending jobs."""
 
 _ERROR_REASON_TO_EXCEPTION = {
     'accessDenied': http_client.FORBIDDEN,
@@ -150,8 +187,10 @@ class _AsyncJob(google.api.core.future.polling.PollingFuture):
     :param client: A client which holds credentials and project configuration
                    for the dataset (which requires a project).
     """
+    _POLL_RETRY = _POLL_RETRY
+
     def __init__(self, name, client):
-        super(_AsyncJob, self).__init__()
+        super(_AsyncJob, self).__init__(retry=self._POLL_RETRY)
         self.name = name
         self._client = client
         self._properties = {}
@@ -1077,6 +1116,7 @@ class QueryJob(_AsyncJob):
     _JOB_TYPE = 'query'
     _UDF_KEY = 'userDefinedFunctionResources'
     _QUERY_PARAMETERS_KEY = 'queryParameters'
+    _POLL_RETRY = _QUERY_POLL_RETRY
 
     def __init__(self, name, query, client,
                  udf_resources=(), query_parameters=()):
@@ -1086,6 +1126,8 @@ class QueryJob(_AsyncJob):
         self.query_parameters = query_parameters
         self._configuration = _AsyncQueryConfiguration()
         self._query_results = None
+        self._first_page_response = None
+        self._done_deadline = None
 
     allow_large_results = _TypedProperty('allow_large_results', bool)
     """See
@@ -1298,16 +1340,45 @@ class QueryJob(_AsyncJob):
         # Do not refresh is the state is already done, as the job will not
         # change once complete.
         if self.state != _DONE_STATE:
-            self._query_results = self._client._get_query_results(self.name)
+            timeout_ms = None
+            if self._done_deadline is not None:
+                # Long-poll for what remains of the caller's timeout, leaving
+                # some time for the request itself.
+                remaining = self._done_deadline - _monotonic()
+                timeout = max(min(
+                    remaining - _TIMEOUT_BUFFER_SECS,
+                    _LONG_POLL_TIMEOUT_SECS), 0)
+                timeout_ms = int(timeout * 1000)
+
+            # The response completing the query also holds its first page of
+            # rows, used by :meth:`result`.
+            self._query_results = self._client._get_query_results(
+                self.name, timeout_ms=timeout_ms, max_results=None)
 
             # Only reload the job once we know the query is complete.
             # This will ensure that fields such as the destination table are
             # correctly populated.
             if self._query_results.complete:
+                self._first_page_response = dict(
+                    self._query_results._properties)
                 self.reload()
 
         return self.state == _DONE_STATE
 
+    def _blocking_poll(self, timeout=None):
+        """Long-poll the query results until the query completes.
+
+        :type timeout: int
+        :param timeout: How long to wait for the query to complete.  If
+                        ``None``, wait indefinitely.
+        """
+        if timeout is not None:
+            self._done_deadline = _monotonic() + timeout
+        try:
+            super(QueryJob, self)._blocking_poll(timeout=timeout)
+        finally:
+            self._done_deadline = None
+
     def result(self, timeout=None):
         """Start the job and wait for it to complete and get the result.
 
@@ -1316,7 +1387,7 @@ class QueryJob(_AsyncJob):
             How long to wait for job to complete before raising a
             :class:`TimeoutError`.
 
-        :rtype: :class:`~google.api.core.page_iterator.Iterator`
+        :rtype: :class:`~google.cloud.bigquery.table.RowIterator`
         :returns:
             Iterator of row data :class:`tuple`s. During each page, the
             iterator will have the ``total_rows`` attribute set, which counts
@@ -1330,4 +1401,206 @@ class QueryJob(_AsyncJob):
         """
         super(QueryJob, self).result(timeout=timeout)
         # Return an iterator instead of returning the job.
-        return self.query_results().fetch_data()
+        iterator = self.query_results().fetch_data()
+        # Don't fetch again the first page, received when polling.
+        iterator._first_page_response = self._first_page_response
+        return iterator
+
+
+class _JobPoller(object):
+    """Poll many jobs together, resolving each one's future as it ends.
+
+    Each round lists the active (pending or running) jobs of each project
+    in one paged ``jobs.list`` call; only the jobs missing from that list,
+    i.e. the ones which may have completed, are then reloaded one by one.
+    A project with a single job left is polled with a reload.
+
+    Jobs not yet begun are begun.
+
+    :type jobs: iterable
+    :param jobs: The :class:`_AsyncJob` instances to poll.
+    """
+
+    def __init__(self, jobs):
+        self.pending = []
+        for job in jobs:
+            if job.state is None and not job._result_set:
+                job.begin()
+            if job not in self.pending:
+                self.pending.append(job)
+
+    def poll(self):
+        """Refresh the pending jobs, unless some are already complete.
+
+        :rtype: list
+        :returns: The jobs which completed since the last call.
+        """
+        done = self._collect()
+        if not done and self.pending:
+            self._refresh()
+            done = self._collect()
+        return done
+
+    def _collect(self):
+        """Remove the complete jobs from the pending ones.
+
+        :rtype: list
+        :returns: The complete jobs, with their futures resolved.
+        """
+        done = []
+        for job in self.pending:
+            if job.state == _DONE_STATE:
+                job._set_future_result()
+            if job._result_set:
+                done.append(job)
+        self.pending = [job for job in self.pending if job not in done]
+        return done
+
+    def _refresh(self):
+        """Reload the pending jobs which may have completed."""
+        groups = collections.OrderedDict()
+        for job in self.pending:
+            key = (id(job._client), job.project)
+            groups.setdefault(key, []).append(job)
+
+        for jobs in groups.values():
+            if len(jobs) > 1:
+                active = _list_active_job_names(
+                    jobs[0]._client, jobs[0].project)
+                jobs = [job for job in jobs if job.name not in active]
+            for job in jobs:
+                job.reload()
+
+
+def _list_active_job_names(client, project):
+    """List the names of the pending and running jobs of a project.
+
+    :type client: :class:`~google.cloud.bigquery.client.Client`
+    :param client: The client used to list the jobs.
+
+    :type project: str
+    :param project: The project of the jobs.
+
+    :rtype: set
+    :returns: The names of the active jobs (started by the client's user).
+    """
+    path = '/projects/%s/jobs' % (project,)
+    names = set()
+    page_token = None
+    while True:
+        query_params = [('stateFilter', state) for state in _ACTIVE_STATES]
+        query_params.append(('projection', 'minimal'))
+        query_params.append(('maxResults', _LIST_PAGE_SIZE))
+        if page_token is not None:
+            query_params.append(('pageToken', page_token))
+
+        response = client._connection.api_request(
+            method='GET', path=path, query_params=query_params)
+        for resource in response.get('jobs', ()):
+            names.add(resource['jobReference']['jobId'])
+
+        page_token = response.get('nextPageToken')
+        if page_token is None:
+            return names
+
+
+def _iter_completed(jobs, timeout):
+    """Poll jobs in rounds, until all complete or ``timeout`` expires.
+
+    :type jobs: iterable
+    :param jobs: The :class:`_AsyncJob` instances to poll.
+
+    :type timeout: float
+    :param timeout: The number of seconds to wait.  If ``None``, wait
+                    indefinitely.
+
+    :rtype: iterator
+    :returns: Lists of the jobs which completed in each round.
+    :raises: :class:`concurrent.futures.TimeoutError` if jobs are still
+             pending when ``timeout`` expires.
+    """
+    poller = _JobPoller(jobs)
+    if timeout is not None:
+        deadline = time.time() + timeout
+    delays = google.api.core.retry.exponential_sleep_generator(
+        _WAIT_INITIAL_DELAY, _WAIT_MAXIMUM_DELAY, _WAIT_DELAY_MULTIPLIER)
+
+    while True:
+        done = poller.poll()
+        if done:
+            yield done
+        if not poller.pending:
+            return
+
+        delay = next(delays)
+        if timeout is not None:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise futures.TimeoutError(
+                    '%d job(s) did not complete within the timeout.' % (
+                        len(poller.pending),))
+            delay = min(delay, remaining)
+        time.sleep(delay)
+
+
+def wait(jobs, timeout=None, return_when=ALL_COMPLETED):
+    """Wait for several jobs to complete, polling them together.
+
+    Analogous to :func:`concurrent.futures.wait`:  rather than each job
+    polling on its own (as :meth:`_AsyncJob.result` does), all the jobs
+    are polled in shared rounds, and each job's future is resolved as it
+    completes.
+
+    :type jobs: iterable
+    :param jobs: The jobs to wait for.  Jobs not yet begun are begun.
+
+    :type timeout: float
+    :param timeout: (Optional) The number of seconds to wait.  If ``None``,
+                    wait indefinitely.
+
+    :type return_when: str
+    :param return_when: (Optional) When to return:  one of
+                        :data:`FIRST_COMPLETED`, :data:`FIRST_EXCEPTION`
+                        (i.e. when a job fails, or all complete) or
+                        :data:`ALL_COMPLETED`.
+
+    :rtype: :class:`DoneAndNotDoneJobs`
+    :returns: The sets of completed (``done``) and other (``not_done``)
+              jobs.
+    """
+    jobs = set(jobs)
+    done = set()
+    try:
+        for completed in _iter_completed(jobs, timeout):
+            done.update(completed)
+            if return_when == FIRST_COMPLETED:
+                break
+            if (return_when == FIRST_EXCEPTION and
+                    any(job._exception is not None for job in completed)):
+                break
+    except futures.TimeoutError:
+        pass
+    return DoneAndNotDoneJobs(done, jobs - done)
+
+
+def as_completed(jobs, timeout=None):
+    """Iterate over jobs as they complete, polling them together.
+
+    Analogous to :func:`concurrent.futures.as_completed`; see :func:`wait`.
+
+    :type jobs: iterable
+    :param jobs: The jobs to wait for.  Jobs not yet begun are begun.
+
+    :type timeout: float
+    :param timeout: (Optional) The number of seconds to wait.  If ``None``,
+                    wait indefinitely.
+
+    :rtype: iterator
+    :returns: The jobs, each one yielded once complete (its ``result()``
+              does not block).
+    :raises: :class:`concurrent.futures.TimeoutError` if jobs are still
+             pending when ``timeout`` expires.
+    """
+    for completed in _iter_completed(jobs, timeout):
+        for job in completed:
+            yield job
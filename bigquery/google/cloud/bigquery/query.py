@@ -14,13 +14,22 @@
 
 """Define API Queries."""
 
+import collections
+from concurrent import futures
+import itertools
+
 import six
 
 from google.api.core import page_iterator
+from google.cloud.bigquery._helpers import _RowDecoder
 from google.cloud.bigquery._helpers import _TypedProperty
+from google.cloud.bigquery._helpers import _columns_from_rows
 from google.cloud.bigquery._helpers import _rows_from_json
 from google.cloud.bigquery.dataset import Dataset
 from google.cloud.bigquery.job import QueryJob
+from google.cloud.bigquery.cache import _referenced_tables
+from google.cloud.bigquery.table import RowIterator
+from google.cloud.bigquery.table import _build_schema_resource
 from google.cloud.bigquery.table import _parse_schema_resource
 from google.cloud.bigquery._helpers import QueryParametersProperty
 from google.cloud.bigquery._helpers import UDFResourcesProperty
@@ -28,6 +37,10 @@ from google.cloud.bigquery._helpers import _item_to_row
 from google.cloud.bigquery._helpers import _rows_page_start
 
 
+_DEFAULT_MAX_WORKERS = 8
+_DEFAULT_ROWS_PER_REQUEST = 10000
+
+
 class _SyncQueryConfiguration(object):
     """User-settable configuration options for synchronous query jobs.
 
@@ -75,6 +88,7 @@ class QueryResults(object):
         self.udf_resources = udf_resources
         self.query_parameters = query_parameters
         self._job = None
+        self._cached_rows = None
 
     @classmethod
     def from_api_repr(cls, api_response, client):
@@ -259,6 +273,8 @@ class QueryResults(object):
         :rtype: list of tuples of row values, or ``NoneType``
         :returns: fields describing the schema (None until set by the server).
         """
+        if self._cached_rows is not None:
+            return list(self._cached_rows)
         return _rows_from_json(self._properties.get('rows', ()), self.schema)
 
     @property
@@ -321,6 +337,7 @@ class QueryResults(object):
         """
         self._properties.clear()
         self._properties.update(api_response)
+        self._cached_rows = None
 
     def _build_resource(self):
         """Generate a resource for :meth:`begin`."""
@@ -382,11 +399,76 @@ class QueryResults(object):
             raise ValueError("Query job is already running.")
 
         client = self._require_client(client)
+        resource = self._build_resource()
+        cache_key = self._cache_key(client.query_cache, resource)
+        if cache_key is not None:
+            cached = client.query_cache.get(cache_key, client)
+            if cached is not None:
+                self._set_cached_result(cached)
+                return
+
         path = '/projects/%s/queries' % (self.project,)
         api_response = client._connection.api_request(
-            method='POST', path=path, data=self._build_resource())
+            method='POST', path=path, data=resource)
         self._set_properties(api_response)
 
+        if (cache_key is not None and self.complete and
+                self.page_token is None and
+                self.num_dml_affected_rows is None):
+            self._cache_result(client, cache_key)
+
+    def _cache_key(self, cache, resource):
+        """Get the key of the query in a cache, if it can be cached.
+
+        :type cache: :class:`~google.cloud.bigquery.cache.QueryCache`
+        :param cache: The cache of the client, or None.
+
+        :type resource: dict
+        :param resource: The resource sent to run the query.
+
+        :rtype: tuple
+        :returns: The key, or None if the query is not to be cached.
+        """
+        if cache is None or self.dry_run or self.use_query_cache is False:
+            return None
+
+        options = dict(resource)
+        for name in ('query', self._QUERY_PARAMETERS_KEY, 'timeoutMs'):
+            options.pop(name, None)
+        return cache.make_key(self.query, self._query_parameters, options)
+
+    def _cache_result(self, client, cache_key):
+        """Store the rows of the (complete) query in the client's cache.
+
+        :type client: :class:`~google.cloud.bigquery.client.Client`
+        :param client: The client whose cache is used.
+
+        :type cache_key: tuple
+        :param cache_key: The key of the query.
+        """
+        cache = client.query_cache
+        tables, snapshot_millis = (), None
+        if cache.check_tables:
+            job_resource = client._connection.api_request(
+                method='GET',
+                path='/projects/%s/jobs/%s' % (self.project, self.name))
+            tables, snapshot_millis = _referenced_tables(job_resource)
+        cache.put(cache_key, self.schema, self.rows, tables, snapshot_millis)
+
+    def _set_cached_result(self, cached):
+        """Set the properties of a query from a cached result.
+
+        :type cached: :class:`~google.cloud.bigquery.cache.CachedResult`
+        :param cached: The result of the same query.
+        """
+        self._set_properties({
+            'jobComplete': True,
+            'cacheHit': True,
+            'totalRows': str(cached.total_rows),
+            'schema': {'fields': _build_schema_resource(cached.schema)},
+        })
+        self._cached_rows = cached.rows
+
     def fetch_data(self, max_results=None, page_token=None, start_index=None,
                    timeout_ms=None, client=None):
         """API call:  fetch a page of query result data via a GET request
@@ -420,18 +502,25 @@ class QueryResults(object):
         :param client: the client to use.  If not passed, falls back to the
                        ``client`` stored on the current dataset.
 
-        :rtype: :class:`~google.api.core.page_iterator.Iterator`
+        :rtype: :class:`~google.cloud.bigquery.table.RowIterator`
         :returns: Iterator of row data :class:`tuple`s. During each page, the
                   iterator will have the ``total_rows`` attribute set,
                   which counts the total number of rows **in the result
                   set** (this is distinct from the total number of rows in
-                  the current page: ``iterator.page.num_items``).
+                  the current page: ``iterator.page.num_items``).  If the
+                  result was served from the client's query cache, the
+                  rows are paged the same way, without requests.
         :raises: ValueError if the query has not yet been executed.
         """
+        client = self._require_client(client)
+        if self._cached_rows is not None:
+            return _CachedRowIterator(
+                client, self, page_token=page_token,
+                start_index=start_index, max_results=max_results)
+
         if self.name is None:
             raise ValueError("Query not yet executed:  call 'run()'")
 
-        client = self._require_client(client)
         params = {}
 
         if start_index is not None:
@@ -444,7 +533,7 @@ class QueryResults(object):
             params['maxResults'] = max_results
 
         path = '/projects/%s/queries/%s' % (self.project, self.name)
-        iterator = page_iterator.HTTPIterator(
+        iterator = RowIterator(
             client=client,
             api_request=client._connection.api_request,
             path=path,
@@ -457,6 +546,84 @@ class QueryResults(object):
         iterator.query_result = self
         return iterator
 
+    def fetch_data_parallel(self, max_workers=_DEFAULT_MAX_WORKERS,
+                            rows_per_request=_DEFAULT_ROWS_PER_REQUEST,
+                            ordered=True, timeout_ms=None, client=None):
+        """Fetch all result rows, requesting ranges of rows concurrently.
+
+        The first request reports the total number of rows; the remaining
+        rows are split into ranges of ``rows_per_request`` rows, which are
+        fetched via ``startIndex`` / ``maxResults`` on a pool of
+        ``max_workers`` threads.  At most ``2 * max_workers`` ranges are
+        fetched ahead of the rows being consumed.  If the result was served
+        from the client's query cache, its rows are returned without a
+        request.
+
+        See
+        https://cloud.google.com/bigquery/docs/reference/rest/v2/jobs/getQueryResults
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of concurrent requests.
+
+        :type rows_per_request: int
+        :param rows_per_request: (Optional) The number of rows requested by
+                                 each request.  The service may return
+                                 fewer, in which case the rest of the range
+                                 is requested again.
+
+        :type ordered: bool
+        :param ordered: (Optional) If true (the default), rows are returned
+                        in the order of the result set.  Otherwise, the rows
+                        of each range are returned as soon as that range is
+                        fetched.
+
+        :type timeout_ms: int
+        :param timeout_ms:
+            (Optional) How long the first request waits for the query to
+            complete, in milliseconds.
+
+        :type client: :class:`~google.cloud.bigquery.client.Client` or
+                      ``NoneType``
+        :param client: the client to use.  If not passed, falls back to the
+                       ``client`` stored on the current dataset.
+
+        :rtype: iterator
+        :returns: Iterator of row data :class:`tuple`s.
+        :raises: ValueError if the query has not yet been executed, or has
+                 not completed.
+        """
+        if self._cached_rows is not None:
+            return iter(self._cached_rows)
+
+        if self.name is None:
+            raise ValueError("Query not yet executed:  call 'run()'")
+
+        client = self._require_client(client)
+        params = {'maxResults': rows_per_request}
+        if timeout_ms is not None:
+            params['timeoutMs'] = timeout_ms
+
+        path = '/projects/%s/queries/%s' % (self.project, self.name)
+        response = client._connection.api_request(
+            method='GET', path=path, query_params=params)
+        self._set_properties(response)
+        if not self.complete:
+            raise ValueError('Query not yet complete', self.name)
+
+        decoder = _RowDecoder(self.schema)
+        first_rows = [decoder(row) for row in response.get('rows', ())]
+        ranges = [
+            (start, min(rows_per_request, self.total_rows - start))
+            for start in six.moves.range(
+                len(first_rows), self.total_rows, rows_per_request)
+        ]
+
+        def fetch_range(row_range):
+            return _fetch_row_range(client, path, row_range, decoder)
+
+        return _iter_parallel_rows(
+            first_rows, ranges, fetch_range, max_workers, ordered)
+
 
 def _rows_page_start_query(iterator, page, response):
     """Update query response when :class:`~google.cloud.iterator.Page` starts.
@@ -479,3 +646,169 @@ def _rows_page_start_query(iterator, page, response):
     iterator.query_result._set_properties(response)
     iterator.schema = iterator.query_result.schema
     _rows_page_start(iterator, page, response)
+
+
+def _fetch_row_range(client, path, row_range, decoder):
+    """Fetch a range of result rows, re-requesting any rows not returned.
+
+    :type client: :class:`~google.cloud.bigquery.client.Client`
+    :param client: The client used to make requests.
+
+    :type path: str
+    :param path: The path of the query results resource.
+
+    :type row_range: tuple
+    :param row_range: The (start index, number of rows) of the range.
+
+    :type decoder: :class:`~google.cloud.bigquery._helpers._RowDecoder`
+    :param decoder: Converts JSON rows to tuples.
+
+    :rtype: list
+    :returns: The row tuples of the range (fewer than requested if the
+              result set ends early).
+    """
+    start, num_rows = row_range
+    rows = []
+    while len(rows) < num_rows:
+        response = client._connection.api_request(
+            method='GET', path=path, query_params={
+                'startIndex': start + len(rows),
+                'maxResults': num_rows - len(rows),
+            })
+        batch = response.get('rows', ())
+        if not batch:
+            break
+        rows.extend(decoder(row) for row in batch)
+    return rows
+
+
+def _iter_parallel_rows(first_rows, ranges, fetch_range, max_workers,
+                        ordered):
+    """Yield rows of ranges fetched on a thread pool.
+
+    :type first_rows: list
+    :param first_rows: The rows already fetched, yielded first.
+
+    :type ranges: list
+    :param ranges: The (start index, number of rows) of the remaining ranges.
+
+    :type fetch_range: callable
+    :param fetch_range: Fetches the rows of one range.
+
+    :type max_workers: int
+    :param max_workers: The number of concurrent requests.
+
+    :type ordered: bool
+    :param ordered: If true, yield ranges in order; otherwise, as soon as
+                    they are fetched.
+
+    :rtype: iterator
+    :returns: Iterator of row data :class:`tuple`s.
+    """
+    for row in first_rows:
+        yield row
+
+    if not ranges:
+        return
+
+    ranges = iter(ranges)
+    executor = futures.ThreadPoolExecutor(max_workers)
+    pending = collections.deque(
+        executor.submit(fetch_range, row_range)
+        for row_range in itertools.islice(ranges, 2 * max_workers))
+    try:
+        while pending:
+            if ordered:
+                done = pending.popleft()
+            else:
+                done = next(iter(futures.wait(
+                    pending, return_when=futures.FIRST_COMPLETED)[0]))
+                pending.remove(done)
+            rows = done.result()
+
+            for row_range in itertools.islice(ranges, 1):
+                pending.append(executor.submit(fetch_range, row_range))
+
+            for row in rows:
+                yield row
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+class _CachedRowIterator(RowIterator):
+    """Iterator of the rows of a query result served from the query cache.
+
+    Pages the cached rows the way :meth:`QueryResults.fetch_data` pages rows
+    fetched from the API: ``max_results`` rows per page, starting at
+    ``start_index`` or at the position encoded in ``page_token``.
+
+    :type client: :class:`~google.cloud.bigquery.client.Client`
+    :param client: The client used to run the query.
+
+    :type query_result: :class:`QueryResults`
+    :param query_result: The query, whose result was cached.
+
+    :type page_token: str
+    :param page_token: (Optional) token returned with a previous page.
+
+    :type start_index: int
+    :param start_index: (Optional) zero-based index of the first row.
+
+    :type max_results: int
+    :param max_results: (Optional) maximum number of rows per page.
+    """
+
+    def __init__(self, client, query_result, page_token=None,
+                 start_index=None, max_results=None):
+        # Pages are served from the cache: nothing is ever requested.
+        super(_CachedRowIterator, self).__init__(
+            client=client,
+            api_request=None,
+            path=None,
+            item_to_value=page_iterator._item_to_value_identity,
+            items_key='rows',
+            page_token=page_token,
+            page_start=_rows_page_start,
+            next_token='pageToken')
+        self._rows = query_result._cached_rows
+        self._start_index = start_index or 0
+        self._page_size = max_results
+        self.query_result = query_result
+        self.schema = query_result.schema
+
+    def _get_next_page_response(self):
+        """Slice the next page out of the cached rows.
+
+        :rtype: dict
+        :returns: A response shaped like those of ``getQueryResults``, with
+                  row tuples as ``rows``.
+        """
+        if self.next_page_token is not None:
+            start = int(self.next_page_token)
+        else:
+            start = self._start_index
+        if self._page_size is None:
+            stop = len(self._rows)
+        else:
+            stop = start + self._page_size
+
+        response = {
+            'rows': self._rows[start:stop],
+            'totalRows': str(self.query_result.total_rows),
+        }
+        if stop < len(self._rows):
+            response['pageToken'] = str(stop)
+        return response
+
+    def _columns_from_page(self, items):
+        """Convert the row tuples of one page into columns.
+
+        :type items: list of tuple
+        :param items: The rows of the page.
+
+        :rtype: :class:`collections.OrderedDict`
+        :returns: Masked arrays keyed by field name, in schema order.
+        """
+        return _columns_from_rows(items, self.schema)
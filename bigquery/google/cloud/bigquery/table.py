@@ -14,10 +14,25 @@
 
 """Define API Datasets."""
 
+import collections
 import datetime
+import json
 import os
+import sys
+import threading
 
 import six
+from six.moves import queue
+
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
 
 from google import resumable_media
 from google.resumable_media.requests import MultipartUpload
@@ -28,9 +43,10 @@ from google.cloud import exceptions
 from google.cloud._helpers import _datetime_from_microseconds
 from google.cloud._helpers import _millis_from_datetime
 from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery._helpers import _columns_from_json
 from google.cloud.bigquery._helpers import _item_to_row
 from google.cloud.bigquery._helpers import _rows_page_start
-from google.cloud.bigquery._helpers import _SCALAR_VALUE_TO_JSON_ROW
+from google.cloud.bigquery._helpers import _row_to_json
 
 
 _TABLE_HAS_NO_SCHEMA = "Table has no schema:  call 'table.reload()'"
@@ -46,6 +62,12 @@ _READ_LESS_THAN_SIZE = (
     'Size {:d} was specified but the file-like object only had '
     '{:d} bytes remaining.')
 _DEFAULT_NUM_RETRIES = 6
+_NO_NUMPY_ERROR = 'NumPy must be installed to read rows as arrays.'
+_NO_PANDAS_ERROR = 'pandas must be installed to read rows as a DataFrame.'
+_ENCODED_BLOCK_SIZE = 65536  # 64 KB
+# The number of blocks of encoded rows held ahead of the upload.
+_MAX_ENCODED_BLOCKS = 32
+_ENCODER_POLL_INTERVAL = 0.1  # seconds
 
 
 class Table(object):
@@ -687,7 +709,8 @@ class Table(object):
         client = self._require_client(client)
         client._connection.api_request(method='DELETE', path=self.path)
 
-    def fetch_data(self, max_results=None, page_token=None, client=None):
+    def fetch_data(self, max_results=None, page_token=None, client=None,
+                   prefetch=0, stream=False):
         """API call:  fetch the table data via a GET request
 
         See
@@ -712,7 +735,18 @@ class Table(object):
         :param client: (Optional) The client to use.  If not passed, falls
                        back to the ``client`` stored on the current dataset.
 
-        :rtype: :class:`~google.api.core.page_iterator.Iterator`
+        :type prefetch: int
+        :param prefetch: (Optional) The number of pages to request ahead of
+                         the page being consumed, on a background thread.
+                         Defaults to 0 (each page is requested once the
+                         previous one is used up).
+
+        :type stream: bool
+        :param stream: (Optional) If True, decode each page's rows while the
+                       response downloads, so that the first rows of a large
+                       page are available sooner.
+
+        :rtype: :class:`~google.cloud.bigquery.table.RowIterator`
         :returns: Iterator of row data :class:`tuple`s. During each page, the
                   iterator will have the ``total_rows`` attribute set,
                   which counts the total number of rows **in the table**
@@ -729,7 +763,7 @@ class Table(object):
 
         client = self._require_client(client)
         path = '%s/data' % (self.path,)
-        iterator = page_iterator.HTTPIterator(
+        iterator = RowIterator(
             client=client,
             api_request=client._connection.api_request,
             path=path,
@@ -738,7 +772,9 @@ class Table(object):
             page_token=page_token,
             page_start=_rows_page_start,
             next_token='pageToken',
-            extra_params=params)
+            extra_params=params,
+            prefetch=prefetch,
+            stream=stream)
         iterator.schema = self._schema
         return iterator
 
@@ -825,15 +861,7 @@ class Table(object):
         data = {'rows': rows_info}
 
         for index, row in enumerate(rows):
-            row_info = {}
-
-            for field, value in zip(self._schema, row):
-                converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
-                if converter is not None:  # STRING doesn't need converting
-                    value = converter(value)
-                row_info[field.name] = value
-
-            info = {'json': row_info}
+            info = {'json': _row_to_json(self._schema, row)}
             if row_ids is not None:
                 info['insertId'] = row_ids[index]
 
@@ -1151,9 +1179,198 @@ class Table(object):
             return client.job_from_resource(created_json)
         except resumable_media.InvalidResponse as exc:
             raise exceptions.from_http_response(exc.response)
+
+    def load_from_rows(self,
+                       rows,
+                       num_retries=_DEFAULT_NUM_RETRIES,
+                       create_disposition=None,
+                       ignore_unknown_values=None,
+                       max_bad_records=None,
+                       write_disposition=None,
+                       client=None,
+                       job_name=None):
+        """Load rows into this table from an iterable, via a load job.
+
+        Rows are encoded as newline-delimited JSON using the table's schema,
+        on a background thread, while earlier rows are uploaded through a
+        resumable upload session; at most a few megabytes of encoded rows
+        are held in memory, however many rows are loaded.
+
+        Unlike :meth:`insert_data`, the rows are not available until the
+        load job completes, but loading is free of charge and much faster
+        for large numbers of rows.
+
+        :type rows: iterable of tuples
+        :param rows: Row data to be loaded. Each tuple should contain data
+                     for each schema field on the current table and in the
+                     same order as the schema fields.
+
+        :type num_retries: int
+        :param num_retries: Number of upload retries. Defaults to 6.
+
+        :type create_disposition: str
+        :param create_disposition: job configuration option; see
+                                   :meth:`google.cloud.bigquery.job.LoadJob`.
+
+        :type ignore_unknown_values: bool
+        :param ignore_unknown_values: job configuration option; see
+                                      :meth:`google.cloud.bigquery.job.LoadJob`.
+
+        :type max_bad_records: int
+        :param max_bad_records: job configuration option; see
+                                :meth:`google.cloud.bigquery.job.LoadJob`.
+
+        :type write_disposition: str
+        :param write_disposition: job configuration option; see
+                                  :meth:`google.cloud.bigquery.job.LoadJob`.
+
+        :type client: :class:`~google.cloud.bigquery.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current table.
+
+        :type job_name: str
+        :param job_name: Optional. The id of the job. Generated if not
+                         explicitly passed in.
+
+        :rtype: :class:`~google.cloud.bigquery.jobs.LoadTableFromStorageJob`
+        :returns: the job instance used to load the data (e.g., for
+                  querying status). Note that the job is already started:
+                  do not call ``job.begin()``.
+        :raises: ValueError if table's schema is not set
+        """
+        if len(self._schema) == 0:
+            raise ValueError(_TABLE_HAS_NO_SCHEMA)
+
+        client = self._require_client(client)
+        metadata = _get_upload_metadata(
+            'NEWLINE_DELIMITED_JSON', self._schema, self._dataset, self.name)
+        _configure_job_metadata(metadata, None, None, create_disposition,
+                                None, None, ignore_unknown_values,
+                                max_bad_records, None, None,
+                                write_disposition, job_name, None)
+
+        stream = _EncodedRowStream(rows, self._schema)
+        try:
+            response = self._do_resumable_upload(
+                client, stream, metadata, num_retries)
+            return client.job_from_resource(response.json())
+        except resumable_media.InvalidResponse as exc:
+            raise exceptions.from_http_response(exc.response)
+        finally:
+            stream.close()
     # pylint: enable=too-many-arguments,too-many-locals
 
 
+class RowIterator(page_iterator.HTTPIterator):
+    """Iterator of the rows of a table or of query results.
+
+    Iterating yields one :class:`tuple` per row. :meth:`to_arrays` and
+    :meth:`to_dataframe` instead decode each page directly into columns.
+
+    Takes the same arguments as
+    :class:`~google.api.core.page_iterator.HTTPIterator`. The ``schema``
+    attribute must be set (by the creator or by ``page_start``) before
+    rows are decoded.
+
+    If the ``_first_page_response`` attribute is set (e.g. to a response
+    already fetched while waiting for a query), it is used as the first
+    page instead of making a request.
+    """
+
+    schema = None
+    _first_page_response = None
+
+    def _get_next_page_response(self):
+        """Requests the next page, unless the first page is already known.
+
+        :rtype: dict
+        :returns: The parsed JSON response of the next page's contents.
+        """
+        if self._first_page_response is not None:
+            response, self._first_page_response = (
+                self._first_page_response, None)
+            return response
+        return super(RowIterator, self)._get_next_page_response()
+
+    def _column_pages(self):
+        """Decode each page into columns, without building row tuples.
+
+        :rtype: iterator
+        :returns: For each page, an ordered mapping of field names to
+                  masked arrays.
+        :raises: :exc:`ValueError` if the iterator has already been started.
+        """
+        # Hand out the raw JSON rows, decoded a column at a time below.
+        self._item_to_value = page_iterator._item_to_value_identity
+        for page in self.pages:
+            yield self._columns_from_page(list(page))
+
+    def _columns_from_page(self, items):
+        """Decode the items of one page into columns.
+
+        :type items: list of dict
+        :param items: The JSON rows of the page.
+
+        :rtype: :class:`collections.OrderedDict`
+        :returns: Masked arrays keyed by field name, in schema order.
+        """
+        return _columns_from_json(items, self.schema)
+
+    def to_arrays(self):
+        """Fetch all rows as one NumPy array per column.
+
+        INTEGER, FLOAT, BOOLEAN, TIMESTAMP, DATETIME and DATE columns have
+        ``int64``, ``float64``, ``bool`` and ``datetime64`` dtypes
+        (TIMESTAMP values are in UTC); other columns hold the same objects
+        as iterating over rows would. Null values are masked.
+
+        :rtype: :class:`collections.OrderedDict`
+        :returns: :class:`numpy.ma.MaskedArray` columns keyed by field name,
+                  in schema order.
+        :raises: :exc:`ValueError` if NumPy is not installed, or if the
+                 iterator has already been started.
+        """
+        if numpy is None:
+            raise ValueError(_NO_NUMPY_ERROR)
+
+        pages = list(self._column_pages())
+        columns = collections.OrderedDict()
+        for field in self.schema or ():
+            columns[field.name] = numpy.ma.concatenate(
+                [page[field.name] for page in pages])
+        return columns
+
+    def to_dataframe(self):
+        """Fetch all rows into a :class:`pandas.DataFrame`.
+
+        Columns are built as for :meth:`to_arrays`. Null values are ``NaN``
+        (or ``NaT``) in numeric and time columns (so INTEGER columns with
+        nulls have a ``float64`` dtype) and ``None`` in others. TIMESTAMP
+        columns are timezone-aware, in UTC.
+
+        :rtype: :class:`pandas.DataFrame`
+        :returns: One column per field, in schema order.
+        :raises: :exc:`ValueError` if pandas is not installed, or if the
+                 iterator has already been started.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+
+        arrays = self.to_arrays()
+        columns = collections.OrderedDict()
+        for field in self.schema or ():
+            array = arrays[field.name]
+            if array.dtype == object:
+                # Nulls are already None.
+                series = pandas.Series(array.data)
+            else:
+                series = pandas.Series(array)
+            if field.field_type == 'TIMESTAMP':
+                series = series.dt.tz_localize('UTC')
+            columns[field.name] = series
+        return pandas.DataFrame(columns, columns=list(columns))
+
+
 def _configure_job_metadata(metadata,  # pylint: disable=too-many-arguments
                             allow_jagged_rows,
                             allow_quoted_newlines,
@@ -1255,6 +1472,158 @@ def _build_schema_resource(fields):
 # pylint: enable=unused-argument
 
 
+class _EncodedRowStream(object):
+    """Binary stream of rows, encoded as newline-delimited JSON.
+
+    Rows are encoded on a background thread, into a bounded queue of blocks
+    of about ``block_size`` bytes, while the stream is read.  The data
+    returned by the last :meth:`read` is kept, so that it can be read again
+    after seeking back (e.g. to recover a resumable upload).
+
+    :type rows: iterable of tuples
+    :param rows: The rows to encode.
+
+    :type schema: list of :class:`SchemaField`
+    :param schema: The schema of the rows.
+
+    :type block_size: int
+    :param block_size: (Optional) The approximate size of encoded blocks.
+
+    :type max_blocks: int
+    :param max_blocks: (Optional) The number of blocks encoded ahead of the
+                       data being read.
+    """
+
+    def __init__(self, rows, schema, block_size=_ENCODED_BLOCK_SIZE,
+                 max_blocks=_MAX_ENCODED_BLOCKS):
+        self._blocks = queue.Queue(maxsize=max_blocks)
+        self._closed = threading.Event()
+        self._buffer = b''
+        self._exhausted = False
+        self._position = 0
+        self._last = b''
+        self._last_position = 0
+        self._thread = threading.Thread(
+            target=self._encode, args=(rows, schema, block_size))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _encode(self, rows, schema, block_size):
+        """Encode rows into blocks, until exhausted, failed or closed.
+
+        Runs on the background thread started by the constructor.
+
+        :type rows: iterable of tuples
+        :param rows: The rows to encode.
+
+        :type schema: list of :class:`SchemaField`
+        :param schema: The schema of the rows.
+
+        :type block_size: int
+        :param block_size: The approximate size of encoded blocks.
+        """
+        lines = []
+        size = 0
+        try:
+            for row in rows:
+                line = json.dumps(
+                    _row_to_json(schema, row), separators=(',', ':'))
+                lines.append(line.encode('utf-8') + b'\n')
+                size += len(lines[-1])
+                if size >= block_size:
+                    if not self._put((b''.join(lines), None)):
+                        return
+                    lines = []
+                    size = 0
+        except Exception:  # pylint: disable=broad-except
+            self._put((None, sys.exc_info()))
+            return
+
+        if lines and not self._put((b''.join(lines), None)):
+            return
+        self._put((None, None))
+
+    def _put(self, item):
+        """Queue an item for the reader, unless the stream is closed.
+
+        :type item: tuple
+        :param item: A block of encoded rows (or None, once exhausted), and
+                     the ``exc_info`` of the error while encoding (or None).
+
+        :rtype: bool
+        :returns: False if the stream was closed.
+        """
+        while not self._closed.is_set():
+            try:
+                self._blocks.put(item, timeout=_ENCODER_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def read(self, size=-1):
+        """Read encoded rows.
+
+        :type size: int
+        :param size: (Optional) The number of bytes to read.  Fewer bytes
+                     are returned only once all the rows are read.  Reads
+                     all the remaining rows if negative.
+
+        :rtype: bytes
+        :returns: The encoded rows.
+        :raises: Any error raised by the rows while being encoded.
+        """
+        chunks = [self._buffer]
+        num_bytes = len(self._buffer)
+        while (size < 0 or num_bytes < size) and not self._exhausted:
+            block, exc_info = self._blocks.get()
+            if exc_info is not None:
+                six.reraise(*exc_info)
+            if block is None:
+                self._exhausted = True
+            else:
+                chunks.append(block)
+                num_bytes += len(block)
+
+        data = b''.join(chunks)
+        if size < 0:
+            self._buffer = b''
+        else:
+            data, self._buffer = data[:size], data[size:]
+        self._last, self._last_position = data, self._position
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        """Get the position in the stream.
+
+        :rtype: int
+        :returns: The number of bytes read, less any seeked back over.
+        """
+        return self._position
+
+    def seek(self, position):
+        """Seek back to a position within the data of the last read.
+
+        :type position: int
+        :param position: The position in the stream.
+
+        :raises: :exc:`ValueError` if the data at ``position`` was not
+                 returned by the last :meth:`read`.
+        """
+        if not self._last_position <= position <= self._position:
+            raise ValueError(
+                'Cannot seek outside of the data of the last read.')
+        start = position - self._last_position
+        stop = self._position - self._last_position
+        self._buffer = self._last[start:stop] + self._buffer
+        self._position = position
+
+    def close(self):
+        """Stop encoding rows."""
+        self._closed.set()
+
+
 def _maybe_rewind(stream, rewind=False):
     """Rewind the stream if desired.
 
@@ -18,6 +18,11 @@ import unittest
 
 import mock
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
 
 class Test_not_null(unittest.TestCase):
 
@@ -412,6 +417,286 @@ class Test_row_from_json(unittest.TestCase):
             ],))
 
 
+class Test_RowDecoder(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery._helpers import _RowDecoder
+
+        return _RowDecoder
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_w_nullable_scalars(self):
+        import datetime
+        from google.cloud._helpers import UTC
+
+        schema = [
+            _Field('NULLABLE', 'int', 'INTEGER'),
+            _Field('NULLABLE', 'float', 'FLOAT'),
+            _Field('NULLABLE', 'bool', 'BOOLEAN'),
+            _Field('NULLABLE', 'string', 'STRING'),
+            _Field('NULLABLE', 'bytes', 'BYTES'),
+            _Field('NULLABLE', 'timestamp', 'TIMESTAMP'),
+            _Field('NULLABLE', 'datetime', 'DATETIME'),
+            _Field('NULLABLE', 'date', 'DATE'),
+            _Field('NULLABLE', 'time', 'TIME'),
+            _Field('NULLABLE', 'record', 'RECORD', fields=[
+                _Field('NULLABLE', 'sub', 'INTEGER')]),
+        ]
+        decoder = self._make_one(schema)
+        full = {'f': [
+            {'v': '1'}, {'v': '1.5'}, {'v': 'true'}, {'v': 'abc'},
+            {'v': 'YWJj'}, {'v': '1.0'}, {'v': '2017-08-01T12:30:00'},
+            {'v': '2017-08-01'}, {'v': '12:30:00'},
+            {'v': {'f': [{'v': None}]}},
+        ]}
+        empty = {'f': [{'v': None}] * len(schema)}
+
+        self.assertEqual(decoder(full), (
+            1, 1.5, True, 'abc', b'abc',
+            datetime.datetime(1970, 1, 1, 0, 0, 1, tzinfo=UTC),
+            datetime.datetime(2017, 8, 1, 12, 30),
+            datetime.date(2017, 8, 1), datetime.time(12, 30),
+            {'sub': None}))
+        self.assertEqual(decoder(empty), (None,) * len(schema))
+
+    def test_w_required_null(self):
+        decoder = self._make_one([_Field('REQUIRED', 'int', 'INTEGER')])
+
+        with self.assertRaises(TypeError):
+            decoder({'f': [{'v': None}]})
+
+    def test_w_unknown_type(self):
+        decoder = self._make_one([_Field('REQUIRED', 'x', 'UNKNOWN')])
+
+        with self.assertRaises(KeyError):
+            decoder({'f': [{'v': 'x'}]})
+
+    def test_w_repeated_string(self):
+        decoder = self._make_one([_Field('REPEATED', 'col', 'STRING')])
+
+        row = {'f': [{'v': [{'v': 'a'}, {'v': 'b'}]}]}
+        self.assertEqual(decoder(row), (['a', 'b'],))
+
+    def test_matches(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        schema = (SchemaField('a', 'INTEGER'),)
+        equal = [SchemaField('a', 'INTEGER')]
+        other = (SchemaField('a', 'STRING'),)
+        decoder = self._make_one(schema)
+
+        self.assertTrue(decoder.matches(schema))
+        self.assertFalse(decoder.matches(other))
+        self.assertIs(decoder.schema, schema)
+        self.assertTrue(decoder.matches(equal))
+        self.assertIs(decoder.schema, equal)
+
+
+class Test_item_to_row(unittest.TestCase):
+
+    def _call_fut(self, iterator, resource):
+        from google.cloud.bigquery._helpers import _item_to_row
+
+        return _item_to_row(iterator, resource)
+
+    def test_decoder_reused(self):
+        from google.cloud.bigquery import _helpers
+
+        schema = [_Field('REQUIRED', 'col', 'INTEGER')]
+        iterator = mock.Mock(schema=schema, spec=['schema'])
+
+        with mock.patch.object(
+                _helpers, '_RowDecoder',
+                wraps=_helpers._RowDecoder) as decoder_class:
+            self.assertEqual(self._call_fut(iterator, {'f': [{'v': '1'}]}),
+                             (1,))
+            self.assertEqual(self._call_fut(iterator, {'f': [{'v': '2'}]}),
+                             (2,))
+            # A new page re-sets an equal schema.
+            iterator.schema = list(schema)
+            self.assertEqual(self._call_fut(iterator, {'f': [{'v': '3'}]}),
+                             (3,))
+
+        decoder_class.assert_called_once_with(schema)
+
+    def test_schema_changed(self):
+        iterator = mock.Mock(
+            schema=[_Field('REQUIRED', 'col', 'INTEGER')], spec=['schema'])
+        self.assertEqual(self._call_fut(iterator, {'f': [{'v': '1'}]}), (1,))
+
+        iterator.schema = [_Field('REQUIRED', 'col', 'STRING')]
+
+        self.assertEqual(
+            self._call_fut(iterator, {'f': [{'v': '1'}]}), ('1',))
+
+
+@unittest.skipIf(numpy is None, 'Requires `numpy`')
+class Test_column_from_json(unittest.TestCase):
+
+    def _call_fut(self, values, field):
+        from google.cloud.bigquery._helpers import _column_from_json
+
+        return _column_from_json(values, field)
+
+    def test_w_integer(self):
+        column = self._call_fut(
+            ['1', None, '-3'], _Field('NULLABLE', 'x', 'INTEGER'))
+
+        self.assertEqual(column.dtype, numpy.int64)
+        self.assertEqual(column.tolist(), [1, None, -3])
+
+    def test_w_float_wo_nulls(self):
+        column = self._call_fut(
+            ['1.5', 'NaN', 'Infinity'], _Field('REQUIRED', 'x', 'FLOAT64'))
+
+        self.assertEqual(column.dtype, numpy.float64)
+        self.assertFalse(numpy.ma.getmaskarray(column).any())
+        self.assertEqual(column[0], 1.5)
+        self.assertTrue(numpy.isnan(column[1]))
+        self.assertTrue(numpy.isinf(column[2]))
+
+    def test_w_bool(self):
+        column = self._call_fut(
+            ['true', 'FALSE', None, '1'], _Field('NULLABLE', 'x', 'BOOL'))
+
+        self.assertEqual(column.dtype, numpy.bool_)
+        self.assertEqual(column.tolist(), [True, False, None, True])
+
+    def test_w_timestamp(self):
+        column = self._call_fut(
+            ['1.5', None], _Field('NULLABLE', 'x', 'TIMESTAMP'))
+
+        self.assertEqual(column.dtype, numpy.dtype('datetime64[us]'))
+        self.assertEqual(
+            column.data[0], numpy.datetime64('1970-01-01T00:00:01.500000'))
+        self.assertTrue(column.mask[1])
+
+    def test_w_datetime_and_date(self):
+        datetimes = self._call_fut(
+            ['2017-08-01T12:30:00.250000', '2017-08-01T12:30:00'],
+            _Field('NULLABLE', 'x', 'DATETIME'))
+        dates = self._call_fut(
+            [None, '2017-08-01'], _Field('NULLABLE', 'x', 'DATE'))
+
+        self.assertEqual(
+            datetimes.data[0], numpy.datetime64('2017-08-01T12:30:00.250'))
+        self.assertEqual(dates.dtype, numpy.dtype('datetime64[D]'))
+        self.assertEqual(dates.data[1], numpy.datetime64('2017-08-01'))
+        self.assertTrue(dates.mask[0])
+
+    def test_w_empty(self):
+        column = self._call_fut([], _Field('NULLABLE', 'x', 'DATE'))
+
+        self.assertEqual(column.dtype, numpy.dtype('datetime64[D]'))
+        self.assertEqual(len(column), 0)
+
+    def test_w_repeated_integer(self):
+        column = self._call_fut(
+            [[{'v': '1'}], []], _Field('REPEATED', 'x', 'INTEGER'))
+
+        self.assertEqual(column.dtype, object)
+        self.assertEqual(column.tolist(), [[1], []])
+
+    def test_w_record(self):
+        field = _Field('NULLABLE', 'x', 'RECORD', fields=[
+            _Field('NULLABLE', 'a', 'INTEGER')])
+
+        column = self._call_fut([{'f': [{'v': '1'}]}, None], field)
+
+        self.assertEqual(column.tolist(), [{'a': 1}, None])
+
+
+@unittest.skipIf(numpy is None, 'Requires `numpy`')
+class Test_columns_from_json(unittest.TestCase):
+
+    def _call_fut(self, rows, schema):
+        from google.cloud.bigquery._helpers import _columns_from_json
+
+        return _columns_from_json(rows, schema)
+
+    def test_it(self):
+        schema = [
+            _Field('REQUIRED', 'name', 'STRING'),
+            _Field('NULLABLE', 'age', 'INTEGER'),
+        ]
+        rows = [
+            {'f': [{'v': 'Phred'}, {'v': '32'}]},
+            {'f': [{'v': 'Bharney'}, {'v': None}]},
+        ]
+
+        columns = self._call_fut(rows, schema)
+
+        self.assertEqual(list(columns), ['name', 'age'])
+        self.assertEqual(columns['name'].tolist(), ['Phred', 'Bharney'])
+        self.assertEqual(columns['age'].tolist(), [32, None])
+
+
+@unittest.skipIf(numpy is None, 'Requires `numpy`')
+class Test_columns_from_rows(unittest.TestCase):
+
+    def _call_fut(self, rows, schema):
+        from google.cloud.bigquery._helpers import _columns_from_rows
+
+        return _columns_from_rows(rows, schema)
+
+    def test_matches_columns_from_json(self):
+        from google.cloud.bigquery._helpers import _columns_from_json
+        from google.cloud.bigquery._helpers import _rows_from_json
+
+        schema = [
+            _Field('REQUIRED', 'name', 'STRING'),
+            _Field('NULLABLE', 'age', 'INTEGER'),
+            _Field('NULLABLE', 'score', 'FLOAT'),
+            _Field('NULLABLE', 'alive', 'BOOLEAN'),
+            _Field('NULLABLE', 'seen', 'TIMESTAMP'),
+            _Field('NULLABLE', 'local', 'DATETIME'),
+            _Field('NULLABLE', 'born', 'DATE'),
+            _Field('REPEATED', 'ranks', 'INTEGER'),
+        ]
+        rows = [
+            {'f': [
+                {'v': 'Phred'}, {'v': '32'}, {'v': '1.5'}, {'v': 'true'},
+                {'v': '1.5'}, {'v': '2017-08-01T12:30:00.250000'},
+                {'v': '1985-02-01'}, {'v': [{'v': '1'}]},
+            ]},
+            {'f': [
+                {'v': 'Bharney'}, {'v': None}, {'v': None}, {'v': None},
+                {'v': None}, {'v': None}, {'v': None}, {'v': []},
+            ]},
+        ]
+
+        columns = self._call_fut(_rows_from_json(rows, schema), schema)
+
+        expected = _columns_from_json(rows, schema)
+        self.assertEqual(list(columns), list(expected))
+        for name, column in columns.items():
+            self.assertEqual(column.dtype, expected[name].dtype, name)
+            self.assertEqual(column.tolist(), expected[name].tolist(), name)
+
+    def test_w_offset_timestamp(self):
+        from google.cloud._helpers import _UTC
+
+        class _Offset(_UTC):
+            _utcoffset = datetime.timedelta(hours=2)
+
+        value = datetime.datetime(2017, 8, 1, 14, 30, tzinfo=_Offset())
+
+        columns = self._call_fut(
+            [(value,)], [_Field('NULLABLE', 'seen', 'TIMESTAMP')])
+
+        self.assertEqual(
+            columns['seen'].data[0], numpy.datetime64('2017-08-01T12:30'))
+
+    def test_w_empty(self):
+        columns = self._call_fut([], [_Field('NULLABLE', 'born', 'DATE')])
+
+        self.assertEqual(columns['born'].dtype, numpy.dtype('datetime64[D]'))
+        self.assertEqual(len(columns['born']), 0)
+
+
 class Test_rows_from_json(unittest.TestCase):
 
     def _call_fut(self, value, field):
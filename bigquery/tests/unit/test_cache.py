@@ -0,0 +1,274 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+_TABLE = ('project', 'dataset', 'table')
+_TABLE_PATH = '/projects/project/datasets/dataset/tables/table'
+
+
+class TestQueryCache(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.cache import QueryCache
+
+        return QueryCache
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _schema(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        return [SchemaField('name', 'STRING'), SchemaField('age', 'INTEGER')]
+
+    def test_ctor_defaults(self):
+        cache = self._make_one()
+
+        self.assertEqual(cache.max_bytes, 64 * 1024 * 1024)
+        self.assertEqual(cache.ttl, 300.0)
+        self.assertTrue(cache.check_tables)
+        self.assertEqual(cache.check_interval, 30.0)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.num_bytes, 0)
+
+    def test_make_key_normalizes_whitespace(self):
+        klass = self._get_target_class()
+
+        self.assertEqual(
+            klass.make_key('SELECT  a,\tb FROM t '),
+            klass.make_key(' SELECT a, b  FROM t'))
+        self.assertNotEqual(
+            klass.make_key("SELECT 'a  b'"),
+            klass.make_key("SELECT 'a b'"))
+        self.assertNotEqual(
+            klass.make_key('SELECT 1 -- a\n+ 2'),
+            klass.make_key('SELECT 1 -- a + 2'))
+
+    def test_make_key_w_parameters_and_options(self):
+        from google.cloud.bigquery._helpers import ScalarQueryParameter
+
+        klass = self._get_target_class()
+        first = ScalarQueryParameter('x', 'INT64', 1)
+        second = ScalarQueryParameter('x', 'INT64', 2)
+
+        self.assertEqual(
+            klass.make_key('SELECT @x', [first]),
+            klass.make_key('SELECT @x', [first]))
+        self.assertNotEqual(
+            klass.make_key('SELECT @x', [first]),
+            klass.make_key('SELECT @x', [second]))
+        self.assertNotEqual(
+            klass.make_key('SELECT 1', options={'useLegacySql': True}),
+            klass.make_key('SELECT 1', options={'useLegacySql': False}))
+
+    def test_get_miss(self):
+        cache = self._make_one()
+
+        self.assertIsNone(cache.get(('key',), client=None))
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 0)
+
+    def test_put_and_get(self):
+        cache = self._make_one()
+        schema = self._schema()
+
+        self.assertTrue(cache.put(('key',), schema, [('a', 1), ('b', 2)]))
+        result = cache.get(('key',), client=None)
+
+        self.assertEqual(result.schema, schema)
+        self.assertEqual(result.rows, (('a', 1), ('b', 2)))
+        self.assertEqual(result.total_rows, 2)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(len(cache), 1)
+        self.assertGreater(cache.num_bytes, 0)
+
+    def test_put_too_large(self):
+        cache = self._make_one(max_bytes=100)
+
+        self.assertFalse(cache.put(('key',), [], [('x' * 200,)]))
+        self.assertEqual(len(cache), 0)
+
+    def test_put_replaces_entry(self):
+        cache = self._make_one()
+
+        cache.put(('key',), [], [('a' * 100,)])
+        cache.put(('key',), [], [('b',)])
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get(('key',), None).rows, (('b',),))
+        self.assertLess(cache.num_bytes, 100)
+
+    def test_put_evicts_least_recently_used(self):
+        cache = self._make_one(max_bytes=300)
+
+        cache.put(('a',), [], [('x' * 50,)])
+        cache.put(('b',), [], [('x' * 50,)])
+        cache.get(('a',), None)
+        cache.put(('c',), [], [('x' * 50,)])
+
+        self.assertIsNotNone(cache.get(('a',), None))
+        self.assertIsNone(cache.get(('b',), None))
+        self.assertIsNotNone(cache.get(('c',), None))
+        self.assertLessEqual(cache.num_bytes, 300)
+
+    def test_get_expired(self):
+        cache = self._make_one(ttl=10)
+
+        with mock.patch('time.time', return_value=1000.0):
+            cache.put(('key',), [], [(1,)])
+        with mock.patch('time.time', return_value=1011.0):
+            self.assertIsNone(cache.get(('key',), None))
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.num_bytes, 0)
+
+    def test_get_checks_tables(self):
+        connection = _Connection(
+            {'lastModifiedTime': '1000.0'}, {'lastModifiedTime': '2000.0'})
+        client = _Client(connection)
+        cache = self._make_one(check_interval=10)
+
+        with mock.patch('time.time', return_value=1.0):
+            cache.put(('key',), [], [(1,)], tables=[_TABLE],
+                      snapshot_millis=1500.0)
+        with mock.patch('time.time', return_value=5.0):
+            self.assertIsNotNone(cache.get(('key',), client))
+        self.assertEqual(connection._requested, [])
+
+        with mock.patch('time.time', return_value=12.0):
+            self.assertIsNotNone(cache.get(('key',), client))
+        with mock.patch('time.time', return_value=15.0):
+            self.assertIsNotNone(cache.get(('key',), client))
+        with mock.patch('time.time', return_value=30.0):
+            self.assertIsNone(cache.get(('key',), client))
+
+        first, second = connection._requested
+        self.assertEqual(first, {
+            'method': 'GET',
+            'path': _TABLE_PATH,
+            'query_params': {'fields': 'lastModifiedTime'},
+        })
+        self.assertEqual(len(cache), 0)
+
+    def test_get_entry_replaced_while_checking(self):
+        cache = self._make_one(check_interval=0)
+        cache.put(('key',), [], [(1,)], tables=[_TABLE])
+
+        def replace_entry(client, tables, snapshot_millis):
+            cache.put(('key',), [], [(2,)], tables=[_TABLE])
+            return True
+
+        with mock.patch(
+                'google.cloud.bigquery.cache._tables_unchanged',
+                new=replace_entry):
+            entry = cache.get(('key',), None)
+
+        # The stale entry is still returned, but doesn't overwrite the new
+        # one.
+        self.assertEqual(entry.rows, ((1,),))
+        self.assertEqual(cache._entries[('key',)].result.rows, ((2,),))
+
+    def test_get_table_deleted(self):
+        from google.cloud.exceptions import NotFound
+
+        client = _Client(_Connection(NotFound('gone')))
+        cache = self._make_one(check_interval=0)
+        cache.put(('key',), [], [(1,)], tables=[_TABLE])
+
+        self.assertIsNone(cache.get(('key',), client))
+
+    def test_get_wo_check_tables(self):
+        cache = self._make_one(check_tables=False, check_interval=0)
+        cache.put(('key',), [], [(1,)], tables=[_TABLE])
+
+        self.assertIsNotNone(cache.get(('key',), client=None))
+
+    def test_discard_and_clear(self):
+        cache = self._make_one()
+        cache.put(('a',), [], [(1,)])
+        cache.put(('b',), [], [(2,)])
+
+        cache.discard(('a',))
+        cache.discard(('missing',))
+        self.assertEqual(len(cache), 1)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.num_bytes, 0)
+
+
+class Test__referenced_tables(unittest.TestCase):
+
+    def _call_fut(self, job_resource):
+        from google.cloud.bigquery.cache import _referenced_tables
+
+        return _referenced_tables(job_resource)
+
+    def test_empty(self):
+        self.assertEqual(self._call_fut({}), ((), None))
+
+    def test_w_tables(self):
+        resource = {'statistics': {
+            'creationTime': '1500.0',
+            'query': {'referencedTables': [{
+                'projectId': 'project',
+                'datasetId': 'dataset',
+                'tableId': 'table',
+            }]},
+        }}
+
+        self.assertEqual(self._call_fut(resource), ((_TABLE,), 1500.0))
+
+
+class Test__estimate_size(unittest.TestCase):
+
+    def _call_fut(self, value):
+        from google.cloud.bigquery.cache import _estimate_size
+
+        return _estimate_size(value)
+
+    def test_scalars(self):
+        self.assertEqual(self._call_fut(None), 16)
+        self.assertEqual(self._call_fut(1.5), 16)
+        self.assertEqual(self._call_fut(u'abc'), 19)
+        self.assertEqual(self._call_fut(b'abcd'), 20)
+
+    def test_containers(self):
+        self.assertEqual(self._call_fut((1, u'a')), 64 + 16 + 17)
+        self.assertEqual(self._call_fut({u'a': [1]}), 64 + 17 + 64 + 16)
+
+
+class _Client(object):
+
+    def __init__(self, connection):
+        self._connection = connection
+
+
+class _Connection(object):
+
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self._requested = []
+
+    def api_request(self, **kw):
+        self._requested.append(kw)
+        response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
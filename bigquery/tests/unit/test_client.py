@@ -44,6 +44,28 @@ class TestClient(unittest.TestCase):
         self.assertIsInstance(client._connection, Connection)
         self.assertIs(client._connection.credentials, creds)
         self.assertIs(client._connection.http, http)
+        self.assertIsNone(client.query_cache)
+
+    def test_ctor_w_query_cache(self):
+        from google.cloud.bigquery.cache import QueryCache
+
+        cache = QueryCache()
+        client = self._make_one(
+            project='PROJECT', credentials=_make_credentials(),
+            query_cache=cache)
+        self.assertIs(client.query_cache, cache)
+
+    def test_ctor_w_transport_config(self):
+        from google.cloud.client import TransportConfig
+
+        config = TransportConfig(pool_maxsize=50)
+        client = self._make_one(
+            project='PROJECT', credentials=_make_credentials(),
+            transport_config=config)
+
+        adapter = client._connection.http.get_adapter(
+            'https://www.googleapis.com/')
+        self.assertEqual(adapter._pool_maxsize, 50)
 
     def test__get_query_results_miss_w_explicit_project_and_timeout(self):
         from google.cloud.exceptions import NotFound
@@ -103,6 +125,31 @@ class TestClient(unittest.TestCase):
         self.assertEqual(query_results.total_rows, 10)
         self.assertTrue(query_results.complete)
 
+    def test__get_query_results_w_first_page(self):
+        project = 'PROJECT'
+        job_id = 'query_job'
+        data = {
+            'jobReference': {
+                'projectId': project,
+                'jobId': job_id,
+            },
+            'jobComplete': True,
+            'schema': {'fields': [
+                {'name': 'title', 'type': 'STRING', 'mode': 'NULLABLE'},
+            ]},
+            'totalRows': '1',
+            'rows': [{'f': [{'v': 'abc'}]}],
+        }
+
+        creds = _make_credentials()
+        client = self._make_one(project, creds)
+        conn = client._connection = _Connection(data)
+        query_results = client._get_query_results(job_id, max_results=None)
+
+        self.assertEqual(query_results.rows, [('abc',)])
+        req, = conn._requested
+        self.assertEqual(req['query_params'], {})
+
     def test_list_projects_defaults(self):
         import six
         from google.cloud.bigquery.client import Project
@@ -28,9 +28,11 @@ class TestCursor(unittest.TestCase):
         return self._get_target_class()(*args, **kw)
 
     def _mock_client(
-            self, rows=None, schema=None, num_dml_affected_rows=None):
+            self, rows=None, schema=None, num_dml_affected_rows=None,
+            query_cache=None):
         from google.cloud.bigquery import client
         mock_client = mock.create_autospec(client.Client)
+        mock_client.query_cache = query_cache
         mock_client.run_async_query.return_value = self._mock_job(
             rows=rows, schema=schema,
             num_dml_affected_rows=num_dml_affected_rows)
@@ -43,6 +45,14 @@ class TestCursor(unittest.TestCase):
         mock_job.error_result = None
         mock_job.state = 'DONE'
         mock_job.result.return_value = mock_job
+        mock_job._properties = {'statistics': {
+            'creationTime': '1000.0',
+            'query': {'referencedTables': [{
+                'projectId': 'project',
+                'datasetId': 'dataset',
+                'tableId': 'table',
+            }]},
+        }}
         mock_job.query_results.return_value = self._mock_results(
             rows=rows, schema=schema,
             num_dml_affected_rows=num_dml_affected_rows)
@@ -60,7 +70,8 @@ class TestCursor(unittest.TestCase):
         else:
             mock_results.total_rows = len(rows)
 
-        mock_results.fetch_data.return_value = rows
+        mock_results.fetch_data.side_effect = (
+            lambda max_results=None: _RowIterator(rows, max_results))
         return mock_results
 
     def test_ctor(self):
@@ -75,9 +86,22 @@ class TestCursor(unittest.TestCase):
         from google.cloud.bigquery.dbapi import connect
         connection = connect(self._mock_client())
         cursor = connection.cursor()
-        # close() is a no-op, there is nothing to test.
         cursor.close()
 
+    def test_close_after_execute(self):
+        from google.cloud.bigquery import dbapi
+        connection = dbapi.connect(self._mock_client(rows=[(1,), (2,)]))
+        cursor = connection.cursor()
+        cursor.execute('SELECT 1;')
+        self.assertEqual(cursor.fetchone(), (1,))
+        pages = cursor._query_data
+
+        cursor.close()
+
+        with self.assertRaises(StopIteration):
+            next(pages)
+        self.assertRaises(dbapi.Error, cursor.fetchone)
+
     def test_fetchone_wo_execute_raises_error(self):
         from google.cloud.bigquery import dbapi
         connection = dbapi.connect(self._mock_client())
@@ -153,6 +177,50 @@ class TestCursor(unittest.TestCase):
         third_page = cursor.fetchmany()
         self.assertEqual(third_page, [])
 
+    def test_fetchmany_requests_pages(self):
+        from google.cloud.bigquery import dbapi
+        client = self._mock_client(rows=[(index,) for index in range(5)])
+        cursor = dbapi.connect(client).cursor()
+        cursor.execute('SELECT a;')
+
+        self.assertEqual(cursor.fetchmany(size=2), [(0,), (1,)])
+        self.assertEqual(cursor.fetchmany(size=3), [(2,), (3,), (4,)])
+        self.assertEqual(cursor.fetchmany(size=3), [])
+
+        results = client.run_async_query.return_value.query_results()
+        results.fetch_data.assert_called_once_with(max_results=2)
+
+    def test_fetchone_requests_pages_of_arraysize(self):
+        from google.cloud.bigquery import dbapi
+        client = self._mock_client(rows=[(index,) for index in range(5)])
+        cursor = dbapi.connect(client).cursor()
+        cursor.arraysize = 3
+        cursor.execute('SELECT a;')
+
+        self.assertEqual(cursor.fetchone(), (0,))
+        self.assertEqual(cursor.fetchall(), [(1,), (2,), (3,), (4,)])
+
+        results = client.run_async_query.return_value.query_results()
+        results.fetch_data.assert_called_once_with(max_results=3)
+
+    def test_fetchall_prefetches_pages(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery.dbapi import cursor as cursor_module
+        client = self._mock_client(rows=[(1,), (2,)])
+        cursor = dbapi.connect(client).cursor()
+        cursor.execute('SELECT a;')
+
+        iterators = []
+        results = client.run_async_query.return_value.query_results()
+        fetch_data = results.fetch_data.side_effect
+        results.fetch_data.side_effect = (
+            lambda **kw: iterators.append(fetch_data(**kw)) or iterators[-1])
+
+        self.assertEqual(cursor.fetchall(), [(1,), (2,)])
+        results.fetch_data.assert_called_once_with(max_results=None)
+        iterator, = iterators
+        self.assertEqual(iterator.prefetch, cursor_module._PREFETCH_PAGES)
+
     def test_fetchall_wo_execute_raises_error(self):
         from google.cloud.bigquery import dbapi
         connection = dbapi.connect(self._mock_client())
@@ -239,6 +307,7 @@ class TestCursor(unittest.TestCase):
         job = mock.create_autospec(job.QueryJob)
         job.result.side_effect = google.cloud.exceptions.GoogleCloudError('')
         client = mock.create_autospec(client.Client)
+        client.query_cache = None
         client.run_async_query.return_value = job
         connection = connect(client)
         cursor = connection.cursor()
@@ -246,6 +315,77 @@ class TestCursor(unittest.TestCase):
         with self.assertRaises(exceptions.DatabaseError):
             cursor.execute('SELECT 1')
 
+    def test_execute_w_query_cache(self):
+        from google.cloud.bigquery.cache import QueryCache
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.dbapi import connect
+
+        schema = [SchemaField('a', 'INTEGER')]
+        cache = QueryCache(check_tables=False)
+        client = self._mock_client(
+            rows=[(1,), (2,)], schema=schema, query_cache=cache)
+        cursor = connect(client).cursor()
+
+        cursor.execute('SELECT a FROM t WHERE a > %(a)s', {'a': 0})
+        self.assertEqual(cursor.fetchall(), [(1,), (2,)])
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(client.run_async_query.call_count, 1)
+        self.assertEqual(
+            cache._entries[list(cache._entries)[0]].tables,
+            (('project', 'dataset', 'table'),))
+
+        cursor.execute('SELECT a   FROM  t WHERE a > %(a)s ', {'a': 0})
+        self.assertEqual(client.run_async_query.call_count, 1)
+        self.assertEqual(cursor.rowcount, 2)
+        self.assertEqual(cursor.description[0].name, 'a')
+        self.assertEqual(cursor.fetchone(), (1,))
+        self.assertEqual(cursor.fetchmany(5), [(2,)])
+        self.assertEqual(cache.hits, 1)
+
+        cursor.execute('SELECT a FROM t WHERE a > %(a)s', {'a': 1})
+        self.assertEqual(client.run_async_query.call_count, 2)
+
+    def test_execute_w_query_cache_partial_fetch(self):
+        from google.cloud.bigquery.cache import QueryCache
+        from google.cloud.bigquery.dbapi import connect
+
+        cache = QueryCache()
+        client = self._mock_client(rows=[(1,), (2,)], query_cache=cache)
+        cursor = connect(client).cursor()
+
+        cursor.execute('SELECT 1')
+        cursor.fetchone()
+        self.assertEqual(len(cache), 0)
+
+    def test_execute_w_query_cache_too_large(self):
+        from google.cloud.bigquery import cache as cache_module
+        from google.cloud.bigquery.dbapi import connect
+
+        cache = cache_module.QueryCache(
+            max_bytes=cache_module._estimate_size((1,)))
+        client = self._mock_client(
+            rows=[(1,), (2,), (3,)], query_cache=cache)
+        cursor = connect(client).cursor()
+
+        cursor.execute('SELECT a FROM t')
+        rows = [cursor.fetchmany(1) for _ in range(4)]
+
+        self.assertEqual(rows, [[(1,)], [(2,)], [(3,)], []])
+        self.assertEqual(len(cache), 0)
+
+    def test_execute_w_query_cache_w_dml(self):
+        from google.cloud.bigquery.cache import QueryCache
+        from google.cloud.bigquery.dbapi import connect
+
+        cache = QueryCache()
+        client = self._mock_client(
+            rows=[], num_dml_affected_rows=3, query_cache=cache)
+        cursor = connect(client).cursor()
+
+        cursor.execute('DELETE FROM t WHERE TRUE')
+        cursor.fetchall()
+        self.assertEqual(len(cache), 0)
+
     def test_executemany_w_dml(self):
         from google.cloud.bigquery.dbapi import connect
         connection = connect(
@@ -257,6 +397,122 @@ class TestCursor(unittest.TestCase):
         self.assertIsNone(cursor.description)
         self.assertEqual(cursor.rowcount, 12)
 
+    def test_executemany_w_insert_values(self):
+        from google.cloud.bigquery.dbapi import connect
+        client = self._mock_client(rows=[], num_dml_affected_rows=3)
+        cursor = connect(client).cursor()
+        cursor.executemany(
+            'INSERT INTO t (a, b) VALUES (%s, %s);',
+            [(1, 'x'), (2, 'y'), (3, 'z')])
+
+        self.assertEqual(client.run_async_query.call_count, 1)
+        _, query = client.run_async_query.call_args[0]
+        self.assertEqual(
+            query, 'INSERT INTO t (a, b) VALUES (?, ?), (?, ?), (?, ?);')
+        parameters = client.run_async_query.call_args[1]['query_parameters']
+        self.assertEqual(
+            [parameter.value for parameter in parameters],
+            [1, 'x', 2, 'y', 3, 'z'])
+        self.assertTrue(all(parameter.name is None
+                            for parameter in parameters))
+        self.assertEqual(cursor.rowcount, 3)
+
+    def test_executemany_w_insert_values_dict_batches(self):
+        from google.cloud.bigquery.dbapi import connect
+        client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        cursor = connect(client).cursor()
+
+        with mock.patch(
+                'google.cloud.bigquery.dbapi.cursor._EXECUTEMANY_BATCH_SIZE',
+                new=2):
+            cursor.executemany(
+                'insert t (a, b)\nvalues (%(b)s, %(a)s)',
+                ({'a': index, 'b': -index} for index in range(3)))
+
+        self.assertEqual(client.run_async_query.call_count, 2)
+        first, second = client.run_async_query.call_args_list
+        self.assertEqual(
+            first[0][1], 'insert t (a, b)\nvalues (?, ?), (?, ?)')
+        self.assertEqual(
+            [parameter.value for parameter in first[1]['query_parameters']],
+            [0, 0, -1, 1])
+        self.assertEqual(second[0][1], 'insert t (a, b)\nvalues (?, ?)')
+        self.assertEqual(cursor.rowcount, 4)
+
+    def test_executemany_w_insert_values_parameter_limit(self):
+        from google.cloud.bigquery.dbapi import connect
+        client = self._mock_client(rows=[], num_dml_affected_rows=1)
+        cursor = connect(client).cursor()
+
+        with mock.patch(
+                'google.cloud.bigquery.dbapi.cursor._MAX_QUERY_PARAMETERS',
+                new=5):
+            cursor.executemany(
+                'INSERT t (a, b) VALUES (%s, %s)',
+                [(index, index) for index in range(5)])
+
+        self.assertEqual(client.run_async_query.call_count, 3)
+        batch_sizes = [
+            len(call[1]['query_parameters']) // 2
+            for call in client.run_async_query.call_args_list]
+        self.assertEqual(batch_sizes, [2, 2, 1])
+
+    def test_executemany_w_insert_values_over_parameter_limit(self):
+        from google.cloud.bigquery.dbapi import connect
+        client = self._mock_client(rows=[], num_dml_affected_rows=1)
+        cursor = connect(client).cursor()
+
+        with mock.patch(
+                'google.cloud.bigquery.dbapi.cursor._MAX_QUERY_PARAMETERS',
+                new=1):
+            cursor.executemany(
+                'INSERT t (a, b) VALUES (%s, %s)', [(1, 1), (2, 2)])
+
+        self.assertEqual(client.run_async_query.call_count, 2)
+        self.assertEqual(cursor.rowcount, 2)
+
+    def test_executemany_w_insert_values_empty(self):
+        from google.cloud.bigquery.dbapi import connect
+        client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        cursor = connect(client).cursor()
+
+        cursor.executemany('INSERT t (a) VALUES (%s)', [])
+
+        self.assertEqual(client.run_async_query.call_count, 0)
+        self.assertEqual(cursor.rowcount, -1)
+
+    def test_executemany_w_insert_select(self):
+        from google.cloud.bigquery.dbapi import connect
+        client = self._mock_client(rows=[], num_dml_affected_rows=1)
+        cursor = connect(client).cursor()
+
+        cursor.executemany(
+            'INSERT t (a) SELECT a FROM u WHERE a = %s', [(1,), (2,)])
+
+        self.assertEqual(client.run_async_query.call_count, 2)
+
+    def test__format_operation_positional_w_dict(self):
+        from google.cloud.bigquery.dbapi import cursor
+        formatted, values = cursor._format_operation_positional(
+            '(%(a)s, %(b)s, %(a)s)', {'a': 1, 'b': 2})
+        self.assertEqual(formatted, '(?, ?, ?)')
+        self.assertEqual(values, [1, 2, 1])
+
+    def test__format_operation_positional_w_wrong_dict(self):
+        from google.cloud.bigquery import dbapi
+        from google.cloud.bigquery.dbapi import cursor
+        self.assertRaises(
+            dbapi.ProgrammingError,
+            cursor._format_operation_positional,
+            '(%(a)s, %(b)s)', {'a': 1})
+
+    def test__format_operation_positional_w_sequence(self):
+        from google.cloud.bigquery.dbapi import cursor
+        formatted, values = cursor._format_operation_positional(
+            '(%s, %s)', ('a', 'b'))
+        self.assertEqual(formatted, '(?, ?)')
+        self.assertEqual(values, ['a', 'b'])
+
     def test__format_operation_w_dict(self):
         from google.cloud.bigquery.dbapi import cursor
         formatted_operation = cursor._format_operation(
@@ -294,3 +550,20 @@ class TestCursor(unittest.TestCase):
             cursor._format_operation,
             'SELECT %s, %s;',
             ('hello',))
+
+
+class _RowIterator(object):
+    """Serve rows in pages of ``max_results`` rows."""
+
+    def __init__(self, rows, max_results):
+        self._rows = rows
+        self.max_results = max_results
+        self.prefetch = 0
+        self.pages_fetched = 0
+
+    @property
+    def pages(self):
+        page_size = self.max_results or len(self._rows) or 1
+        for start in range(0, len(self._rows), page_size):
+            self.pages_fetched += 1
+            yield iter(self._rows[start:start + page_size])
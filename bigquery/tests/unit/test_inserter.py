@@ -0,0 +1,332 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+import mock
+
+
+_PATH = '/projects/project/datasets/dataset/tables/table'
+
+
+def _make_table(schema=None, client=None):
+    from google.cloud.bigquery.schema import SchemaField
+
+    if schema is None:
+        schema = [
+            SchemaField('full_name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED'),
+        ]
+    table = mock.Mock(
+        schema=schema, path=_PATH, spec=['schema', 'path', '_require_client'])
+    table._require_client.side_effect = lambda other: other or client
+    return table
+
+
+class TestTableInserter(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.inserter import TableInserter
+
+        return TableInserter
+
+    def _make_one(self, *responses, **kw):
+        connection = _Connection(*responses)
+        client = _Client(connection)
+        kw.setdefault('max_latency', None)
+        kw.setdefault('retry_delay', 0)
+        inserter = self._get_target_class()(
+            _make_table(client=client), **kw)
+        return inserter, connection
+
+    def test_ctor_wo_schema(self):
+        with self.assertRaises(ValueError):
+            self._get_target_class()(_make_table(schema=[]))
+
+    def test_ctor_w_options(self):
+        inserter, _ = self._make_one(
+            skip_invalid_rows=True, ignore_unknown_values=False,
+            template_suffix='_suffix')
+
+        self.assertEqual(inserter._options, {
+            'skipInvalidRows': True,
+            'ignoreUnknownValues': False,
+            'templateSuffix': '_suffix',
+        })
+
+    def test_flush_empty(self):
+        inserter, connection = self._make_one()
+
+        self.assertEqual(inserter.flush(), [])
+        self.assertEqual(connection._requested, [])
+
+    def test_insert_and_flush(self):
+        inserter, connection = self._make_one({}, skip_invalid_rows=True)
+
+        inserter.insert(('Phred Phlyntstone', 32), row_id='a')
+        inserter.insert(('Bharney Rhubble', 33))
+        self.assertEqual(inserter.backlog, 2)
+        self.assertEqual(connection._requested, [])
+
+        self.assertEqual(inserter.flush(), [])
+
+        request, = connection._requested
+        self.assertEqual(request['method'], 'POST')
+        self.assertEqual(request['path'], '%s/insertAll' % _PATH)
+        self.assertTrue(request['data']['skipInvalidRows'])
+        rows = request['data']['rows']
+        self.assertEqual(rows[0], {
+            'json': {'full_name': 'Phred Phlyntstone', 'age': '32'},
+            'insertId': 'a',
+        })
+        self.assertEqual(
+            rows[1]['json'], {'full_name': 'Bharney Rhubble', 'age': '33'})
+        self.assertEqual(len(rows[1]['insertId']), 36)
+        self.assertEqual(inserter.backlog, 0)
+        self.assertEqual(inserter.rows_inserted, 2)
+        self.assertEqual(len(inserter.flush_latencies), 1)
+
+    def test_insert_many_batches_by_rows(self):
+        inserter, connection = self._make_one({}, {}, max_rows=2)
+
+        inserter.insert_many(
+            [('a', 1), ('b', 2), ('c', 3)], row_ids=['1', '2', '3'])
+        inserter.flush()
+
+        self.assertEqual(
+            sorted([row['insertId'] for row in request['data']['rows']]
+                   for request in connection._requested),
+            [['1', '2'], ['3']])
+
+    def test_insert_many_wo_row_ids(self):
+        inserter, connection = self._make_one({})
+
+        inserter.insert_many([('a', 1), ('b', 2)])
+        inserter.flush()
+
+        request, = connection._requested
+        row_ids = [row['insertId'] for row in request['data']['rows']]
+        self.assertEqual(len(set(row_ids)), 2)
+
+    def test_insert_batches_by_bytes(self):
+        inserter, connection = self._make_one({}, {}, {}, max_bytes=150)
+
+        inserter.insert(('x' * 50, 1), row_id='1')
+        inserter.insert(('x' * 50, 2), row_id='2')
+        # Larger than max_bytes on its own.
+        inserter.insert(('x' * 200, 3), row_id='3')
+        inserter.flush()
+
+        self.assertEqual(
+            sorted([row['insertId'] for row in request['data']['rows']]
+                   for request in connection._requested),
+            [['1'], ['2'], ['3']])
+
+    def test_insert_batches_by_latency(self):
+        inserter, connection = self._make_one({}, max_latency=0.01)
+
+        inserter.insert(('a', 1))
+        connection._sent.wait(5)
+
+        self.assertEqual(len(connection._requested), 1)
+        inserter.close()
+
+    def test_flush_waits_for_batches_in_flight(self):
+        inserter, connection = self._make_one({}, max_rows=1)
+        connection._gate = threading.Event()
+
+        inserter.insert(('a', 1))
+        # The batch is blocked in api_request, so flush has to wait for it.
+        timer = threading.Timer(0.05, connection._gate.set)
+        timer.start()
+        self.assertEqual(inserter.flush(), [])
+
+        self.assertEqual(inserter.backlog, 0)
+        self.assertEqual(inserter.rows_inserted, 1)
+        timer.join()
+
+    def test_timer_waits_for_rows_after_flush(self):
+        inserter, connection = self._make_one({}, {}, max_latency=60)
+
+        inserter.insert(('a', 1))
+        inserter.flush()
+        # The timer now waits for rows, rather than for the buffer to age.
+        inserter.insert(('b', 2))
+        inserter.close()
+
+        self.assertEqual(len(connection._requested), 2)
+        inserter._timer.join(5)
+        self.assertFalse(inserter._timer.is_alive())
+
+    def test_send_failure(self):
+        inserter, connection = self._make_one(max_rows=1)
+        inserter._slots = mock.Mock(spec=['acquire', 'release'])
+        inserter._executor = mock.Mock(spec=['submit', 'shutdown'])
+        inserter._executor.submit.side_effect = RuntimeError('shut down')
+
+        with self.assertRaises(RuntimeError):
+            inserter.insert(('a', 1))
+
+        inserter._slots.acquire.assert_called_once_with()
+        inserter._slots.release.assert_called_once_with()
+        self.assertEqual(inserter.backlog, 0)
+        self.assertEqual(inserter.flush(), [])
+        self.assertEqual(connection._requested, [])
+
+    def test_retry_failed_rows(self):
+        responses = [
+            {'insertErrors': [
+                {'index': 0, 'errors': [{'reason': 'invalid'}]},
+                {'index': 1, 'errors': [{'reason': 'stopped'}]},
+                {'index': 2, 'errors': [{'reason': 'backendError'}]},
+            ]},
+            {},
+        ]
+        inserter, connection = self._make_one(*responses)
+
+        inserter.insert_many(
+            [('a', 1), ('b', 2), ('c', 3), ('d', 4)],
+            row_ids=['1', '2', '3', '4'])
+        errors = inserter.flush()
+
+        self.assertEqual(errors, [{
+            'row': ('a', 1),
+            'row_id': '1',
+            'errors': [{'reason': 'invalid'}],
+        }])
+        first, second = connection._requested
+        self.assertEqual(
+            [row['insertId'] for row in second['data']['rows']], ['2', '3'])
+        self.assertEqual(inserter.rows_inserted, 3)
+        self.assertEqual(inserter.flush(), [])
+
+    def test_retry_exhausted(self):
+        response = {'insertErrors': [
+            {'index': 0, 'errors': [{'reason': 'timeout'}]},
+        ]}
+        inserter, connection = self._make_one(
+            response, response, max_retries=1)
+
+        inserter.insert(('a', 1), row_id='1')
+        errors = inserter.flush()
+
+        self.assertEqual(errors, [{
+            'row': ('a', 1),
+            'row_id': '1',
+            'errors': [{'reason': 'timeout'}],
+        }])
+        self.assertEqual(len(connection._requested), 2)
+        self.assertEqual(inserter.rows_inserted, 0)
+
+    def test_retry_server_error(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        inserter, connection = self._make_one(ServiceUnavailable('oops'), {})
+
+        inserter.insert(('a', 1), row_id='1')
+
+        with mock.patch('time.sleep') as sleep:
+            self.assertEqual(inserter.flush(), [])
+
+        self.assertEqual(len(connection._requested), 2)
+        sleep.assert_called_once_with(0)
+
+    def test_request_error(self):
+        from google.cloud.exceptions import BadRequest
+
+        inserter, _ = self._make_one(BadRequest('invalid'))
+
+        inserter.insert(('a', 1), row_id='1')
+        errors = inserter.flush()
+
+        self.assertEqual(errors, [{
+            'row': ('a', 1),
+            'row_id': '1',
+            'errors': [{'reason': 'BadRequest', 'message': '400 invalid'}],
+        }])
+        self.assertEqual(inserter.backlog, 0)
+
+    def test_insert_from_threads(self):
+        inserter, connection = self._make_one(
+            *([{}] * 10), max_rows=10, max_concurrent=2)
+
+        def insert_rows(prefix):
+            for index in range(25):
+                inserter.insert((prefix, index))
+
+        threads = [
+            threading.Thread(target=insert_rows, args=(prefix,))
+            for prefix in 'abcd']
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        inserter.close()
+
+        rows = [
+            row for request in connection._requested
+            for row in request['data']['rows']]
+        self.assertEqual(len(rows), 100)
+        self.assertEqual(len(set(row['insertId'] for row in rows)), 100)
+        self.assertEqual(inserter.rows_inserted, 100)
+
+    def test_close(self):
+        inserter, connection = self._make_one({})
+
+        inserter.insert(('a', 1))
+        self.assertEqual(inserter.close(), [])
+        self.assertEqual(inserter.close(), [])
+
+        self.assertEqual(len(connection._requested), 1)
+        with self.assertRaises(ValueError):
+            inserter.insert(('b', 2))
+
+    def test_context_manager(self):
+        inserter, connection = self._make_one({}, max_latency=60)
+
+        with inserter:
+            inserter.insert(('a', 1))
+
+        self.assertEqual(len(connection._requested), 1)
+        inserter._timer.join(5)
+        self.assertFalse(inserter._timer.is_alive())
+
+
+class _Client(object):
+
+    def __init__(self, connection):
+        self._connection = connection
+
+
+class _Connection(object):
+
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self._requested = []
+        self._lock = threading.Lock()
+        self._sent = threading.Event()
+        self._gate = None
+
+    def api_request(self, **kw):
+        if self._gate is not None:
+            self._gate.wait(5)
+        with self._lock:
+            self._requested.append(kw)
+            response = self._responses.pop(0)
+        self._sent.set()
+        if isinstance(response, Exception):
+            raise response
+        return response
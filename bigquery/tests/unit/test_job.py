@@ -14,6 +14,7 @@
 
 import copy
 
+import mock
 from six.moves import http_client
 import unittest
 
@@ -1751,8 +1752,105 @@ class TestQueryJob(unittest.TestCase, _Base):
         begin_request, _, query_request, reload_request = connection._requested
         self.assertEqual(begin_request['method'], 'POST')
         self.assertEqual(query_request['method'], 'GET')
+        # Asks for the first page of rows.
+        self.assertEqual(query_request['query_params'], {})
         self.assertEqual(reload_request['method'], 'GET')
 
+    def test_result_w_first_page(self):
+        query_resource = {
+            'jobComplete': True,
+            'jobReference': {
+                'projectId': self.PROJECT,
+                'jobId': self.JOB_NAME,
+            },
+            'schema': {'fields': [
+                {'name': 'name', 'type': 'STRING', 'mode': 'NULLABLE'},
+            ]},
+            'totalRows': '2',
+            'rows': [{'f': [{'v': 'abc'}]}, {'f': [{'v': 'def'}]}],
+        }
+        done_resource = self._makeResource(ended=True)
+        connection = _Connection(query_resource, done_resource)
+        client = _Client(self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_NAME, self.QUERY, client)
+        job._properties['status'] = {'state': 'RUNNING'}
+
+        rows = list(job.result())
+
+        self.assertEqual(rows, [('abc',), ('def',)])
+        # The first page is not fetched again.
+        self.assertEqual(len(connection._requested), 2)
+
+    def test_result_w_timeout(self):
+        incomplete_resource = {'jobComplete': False}
+        query_resource = {
+            'jobComplete': True,
+            'jobReference': {
+                'projectId': self.PROJECT,
+                'jobId': self.JOB_NAME,
+            },
+        }
+        done_resource = self._makeResource(ended=True)
+        connection = _Connection(
+            incomplete_resource, query_resource, done_resource)
+        client = _Client(self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_NAME, self.QUERY, client)
+        job._properties['status'] = {'state': 'RUNNING'}
+
+        # The first long-poll runs its full ten seconds.
+        clock = mock.Mock(side_effect=[100.0, 100.0, 110.0])
+
+        with mock.patch('time.sleep'):
+            with mock.patch(
+                    'google.cloud.bigquery.job._monotonic', new=clock):
+                job.result(timeout=15.5)
+
+        first, second, _ = connection._requested
+        self.assertEqual(first['query_params'], {'timeoutMs': 10000})
+        self.assertEqual(second['query_params'], {'timeoutMs': 5400})
+        self.assertIsNone(job._done_deadline)
+
+    def test_result_w_timeout_w_early_response(self):
+        incomplete_resource = {'jobComplete': False}
+        query_resource = {
+            'jobComplete': True,
+            'jobReference': {
+                'projectId': self.PROJECT,
+                'jobId': self.JOB_NAME,
+            },
+        }
+        done_resource = self._makeResource(ended=True)
+        connection = _Connection(
+            incomplete_resource, query_resource, done_resource)
+        client = _Client(self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_NAME, self.QUERY, client)
+        job._properties['status'] = {'state': 'RUNNING'}
+        # The first long-poll returns after one second: the next one may
+        # use the rest of the timeout, not what the first one requested.
+        clock = mock.Mock(side_effect=[100.0, 100.0, 101.0])
+
+        with mock.patch('time.sleep'):
+            with mock.patch(
+                    'google.cloud.bigquery.job._monotonic', new=clock):
+                job.result(timeout=15.5)
+
+        first, second, _ = connection._requested
+        self.assertEqual(first['query_params'], {'timeoutMs': 10000})
+        self.assertEqual(second['query_params'], {'timeoutMs': 10000})
+        self.assertIsNone(job._done_deadline)
+
+    def test_done_wo_timeout(self):
+        incomplete_resource = {'jobComplete': False}
+        connection = _Connection(incomplete_resource)
+        client = _Client(self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_NAME, self.QUERY, client)
+        job._properties['status'] = {'state': 'RUNNING'}
+
+        self.assertFalse(job.done())
+
+        request, = connection._requested
+        self.assertEqual(request['query_params'], {})
+
     def test_result_error(self):
         from google.cloud import exceptions
 
@@ -2154,6 +2252,217 @@ class TestQueryJob(unittest.TestCase, _Base):
         self._verifyResourceProperties(job, RESOURCE)
 
 
+class _WaitBase(object):
+    PROJECT = 'project'
+
+    def _make_job(self, name, client, state='RUNNING'):
+        from google.cloud.bigquery.job import CopyJob
+
+        job = CopyJob(name, _Table('destination'), [_Table('source')], client)
+        if state is not None:
+            job._properties['status'] = {'state': state}
+        return job
+
+    def _make_client(self, states, active=()):
+        """Serve job reloads from ``states`` and lists from ``active``.
+
+        ``states`` maps job names to the successive states returned when
+        reloading the job; ``active`` holds the names of the jobs listed as
+        active, per round.
+        """
+        def handle(**kw):
+            path = kw['path']
+            if kw['method'] == 'POST':
+                name = kw['data']['jobReference']['jobId']
+            elif path == '/projects/%s/jobs' % (self.PROJECT,):
+                names = active.pop(0)
+                return {'jobs': [
+                    {'jobReference': {'jobId': name}} for name in names]}
+            else:
+                name = path.rsplit('/', 1)[-1]
+            status = {'state': states[name].pop(0)}
+            if status['state'] == 'FAILED':
+                status = {'state': 'DONE', 'errorResult': {
+                    'reason': 'invalid', 'message': 'oops'}}
+            elif status['state'] == 'BEGUN':
+                status = {'state': 'RUNNING'}
+            return {'status': status}
+
+        connection = mock.Mock(spec=['api_request'])
+        connection.api_request.side_effect = handle
+        return _Client(self.PROJECT, connection=connection)
+
+    @staticmethod
+    def _requested_paths(client):
+        return [
+            call[2]['path']
+            for call in client._connection.api_request.mock_calls]
+
+
+class Test_wait(unittest.TestCase, _WaitBase):
+
+    def _call_fut(self, *args, **kw):
+        from google.cloud.bigquery.job import wait
+
+        with mock.patch('time.sleep') as sleep:
+            result = wait(*args, **kw)
+        self.sleep = sleep
+        return result
+
+    def test_all_completed_single(self):
+        client = self._make_client({'a': ['RUNNING', 'DONE']})
+        job = self._make_job('a', client)
+
+        done, not_done = self._call_fut([job])
+
+        self.assertEqual(done, set([job]))
+        self.assertEqual(not_done, set())
+        self.assertIs(job.result(), job)
+        self.assertEqual(self.sleep.call_count, 1)
+
+    def test_all_completed_w_list(self):
+        client = self._make_client(
+            {'a': ['DONE'], 'b': ['DONE'], 'c': ['DONE']},
+            active=[['b', 'c'], ['c']])
+        jobs = [self._make_job(name, client) for name in 'abc']
+
+        done, not_done = self._call_fut(jobs)
+
+        self.assertEqual(done, set(jobs))
+        self.assertEqual(not_done, set())
+        # Each round lists the active jobs, then reloads the others; the
+        # last job left is reloaded directly.
+        self.assertEqual(self._requested_paths(client), [
+            '/projects/project/jobs',
+            '/projects/project/jobs/a',
+            '/projects/project/jobs',
+            '/projects/project/jobs/b',
+            '/projects/project/jobs/c',
+        ])
+        list_call = client._connection.api_request.mock_calls[0]
+        self.assertEqual(list_call[2]['query_params'], [
+            ('stateFilter', 'pending'),
+            ('stateFilter', 'running'),
+            ('projection', 'minimal'),
+            ('maxResults', 1000),
+        ])
+
+    def test_list_paged(self):
+        from google.cloud.bigquery.job import _list_active_job_names
+
+        connection = mock.Mock(spec=['api_request'])
+        connection.api_request.side_effect = [
+            {'jobs': [{'jobReference': {'jobId': 'a'}}],
+             'nextPageToken': 'TOKEN'},
+            {'jobs': [{'jobReference': {'jobId': 'b'}}]},
+        ]
+        client = _Client(self.PROJECT, connection=connection)
+
+        names = _list_active_job_names(client, self.PROJECT)
+
+        self.assertEqual(names, set(['a', 'b']))
+        second = connection.api_request.mock_calls[1]
+        self.assertEqual(
+            second[2]['query_params'][-1], ('pageToken', 'TOKEN'))
+
+    def test_already_done(self):
+        client = self._make_client({})
+        job = self._make_job('a', client, state='DONE')
+
+        done, not_done = self._call_fut([job, job])
+
+        self.assertEqual(done, set([job]))
+        self.assertEqual(self._requested_paths(client), [])
+
+    def test_begins_jobs(self):
+        client = self._make_client({'a': ['BEGUN', 'DONE']})
+        job = self._make_job('a', client, state=None)
+
+        done, _ = self._call_fut([job])
+
+        self.assertEqual(done, set([job]))
+        begin_call = client._connection.api_request.mock_calls[0]
+        self.assertEqual(begin_call[2]['method'], 'POST')
+
+    def test_first_completed(self):
+        client = self._make_client(
+            {'a': ['DONE'], 'b': ['RUNNING']}, active=[['b']])
+        job_a = self._make_job('a', client)
+        job_b = self._make_job('b', client)
+
+        done, not_done = self._call_fut(
+            [job_a, job_b], return_when='FIRST_COMPLETED')
+
+        self.assertEqual(done, set([job_a]))
+        self.assertEqual(not_done, set([job_b]))
+
+    def test_first_exception(self):
+        from google.cloud.exceptions import BadRequest
+
+        client = self._make_client(
+            {'a': ['RUNNING', 'DONE'], 'b': ['FAILED'], 'c': ['RUNNING']},
+            active=[['c']])
+        jobs = [self._make_job(name, client) for name in 'abc']
+
+        done, not_done = self._call_fut(jobs, return_when='FIRST_EXCEPTION')
+
+        self.assertEqual(done, set([jobs[1]]))
+        self.assertEqual(not_done, set([jobs[0], jobs[2]]))
+        with self.assertRaises(BadRequest):
+            jobs[1].result()
+
+    def test_timeout(self):
+        client = self._make_client({'a': ['RUNNING'] * 100})
+        job = self._make_job('a', client)
+
+        with mock.patch('time.time', side_effect=[0.0, 1.0, 3.0]):
+            done, not_done = self._call_fut([job], timeout=2.0)
+
+        self.assertEqual(done, set())
+        self.assertEqual(not_done, set([job]))
+        self.assertLessEqual(self.sleep.mock_calls[0][1][0], 1.0)
+
+
+class Test_as_completed(unittest.TestCase, _WaitBase):
+
+    def _call_fut(self, *args, **kw):
+        from google.cloud.bigquery.job import as_completed
+
+        with mock.patch('time.sleep'):
+            return list(as_completed(*args, **kw))
+
+    def test_it(self):
+        client = self._make_client(
+            {'a': ['RUNNING', 'DONE'], 'b': ['DONE']},
+            active=[['a'], ['a']])
+        job_a = self._make_job('a', client)
+        job_b = self._make_job('b', client)
+
+        self.assertEqual(self._call_fut([job_a, job_b]), [job_b, job_a])
+
+    def test_duplicate_jobs(self):
+        client = self._make_client({'a': ['DONE']})
+        job = self._make_job('a', client)
+
+        self.assertEqual(self._call_fut([job, job]), [job])
+        self.assertEqual(
+            self._requested_paths(client), ['/projects/project/jobs/a'])
+
+    def test_timeout(self):
+        import concurrent.futures
+
+        client = self._make_client({'a': ['DONE'], 'b': ['RUNNING'] * 10},
+                                   active=[['b'], ['b']])
+        job_a = self._make_job('a', client)
+        job_b = self._make_job('b', client)
+
+        with mock.patch('time.time', side_effect=[0.0, 1.0, 3.0]):
+            with self.assertRaises(concurrent.futures.TimeoutError):
+                self._call_fut([job_a, job_b], timeout=2.0)
+
+        self.assertIs(job_a.result(), job_a)
+
+
 class _Client(object):
 
     def __init__(self, project='project', connection=None):
@@ -2165,10 +2474,16 @@ class _Client(object):
 
         return Dataset(name, client=self)
 
-    def _get_query_results(self, job_id):
+    def _get_query_results(self, job_id, timeout_ms=None, max_results=0):
         from google.cloud.bigquery.query import QueryResults
 
-        resource = self._connection.api_request(method='GET')
+        query_params = {}
+        if timeout_ms is not None:
+            query_params['timeoutMs'] = timeout_ms
+        if max_results is not None:
+            query_params['maxResults'] = max_results
+        resource = self._connection.api_request(
+            method='GET', query_params=query_params)
         return QueryResults.from_api_repr(resource, self)
 
 
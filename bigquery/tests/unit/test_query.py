@@ -14,6 +14,16 @@
 
 import unittest
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
 
 class TestQueryResults(unittest.TestCase):
     PROJECT = 'project'
@@ -450,6 +460,219 @@ class TestQueryResults(unittest.TestCase):
         self.assertEqual(req['data'], SENT)
         self._verifyResourceProperties(query, RESOURCE)
 
+    def _run_w_query_cache_resource(self):
+        resource = self._makeResource(complete=True)
+        del resource['pageToken']
+        del resource['numDmlAffectedRows']
+        resource['totalRows'] = '2'
+        resource['rows'] = [
+            {'f': [{'v': 'Phred'}, {'v': '32'}]},
+            {'f': [{'v': 'Bharney'}, {'v': '33'}]},
+        ]
+        job_resource = {'statistics': {
+            'creationTime': '1000.0',
+            'query': {'referencedTables': [{
+                'projectId': self.PROJECT,
+                'datasetId': 'dataset',
+                'tableId': 'table',
+            }]},
+        }}
+        return resource, job_resource
+
+    def test_run_w_query_cache(self):
+        from google.cloud.bigquery.cache import QueryCache
+
+        resource, job_resource = self._run_w_query_cache_resource()
+        conn = _Connection(resource, job_resource)
+        cache = QueryCache(check_interval=0)
+        client = _Client(
+            project=self.PROJECT, connection=conn, query_cache=cache)
+
+        query = self._make_one(self.QUERY, client)
+        query.timeout_ms = 1000
+        query.run()
+
+        self.assertEqual(len(conn._requested), 2)
+        req = conn._requested[1]
+        self.assertEqual(req['method'], 'GET')
+        path = '/projects/%s/jobs/%s' % (self.PROJECT, self.JOB_NAME)
+        self.assertEqual(req['path'], path)
+        self.assertEqual(len(cache), 1)
+
+        conn._responses = ({'lastModifiedTime': '999.0'},)
+        again = self._make_one(self.QUERY + '  ', client)
+        again.run()
+
+        self.assertEqual(len(conn._requested), 3)
+        req = conn._requested[2]
+        self.assertEqual(req['method'], 'GET')
+        self.assertEqual(
+            req['path'],
+            '/projects/%s/datasets/dataset/tables/table' % self.PROJECT)
+        self.assertTrue(again.complete)
+        self.assertTrue(again.cache_hit)
+        self.assertIsNone(again.name)
+        self.assertEqual(again.total_rows, 2)
+        self.assertEqual(again.schema, query.schema)
+        self.assertEqual(again.rows, [('Phred', 32), ('Bharney', 33)])
+        self.assertEqual(cache.hits, 1)
+
+    def _run_w_warm_query_cache(self):
+        from google.cloud.bigquery.cache import QueryCache
+
+        resource, _ = self._run_w_query_cache_resource()
+        conn = _Connection(resource)
+        cache = QueryCache(check_tables=False)
+        client = _Client(
+            project=self.PROJECT, connection=conn, query_cache=cache)
+        self._make_one(self.QUERY, client).run()
+
+        query = self._make_one(self.QUERY, client)
+        query.run()
+        self.assertTrue(query.cache_hit)
+        self.assertIsNone(query.name)
+        return query, conn
+
+    def test_fetch_data_w_query_cache(self):
+        query, conn = self._run_w_warm_query_cache()
+
+        iterator = query.fetch_data()
+        rows = list(iterator)
+
+        self.assertEqual(rows, [('Phred', 32), ('Bharney', 33)])
+        self.assertEqual(iterator.total_rows, 2)
+        self.assertIs(iterator.query_result, query)
+        self.assertEqual(iterator.schema, query.schema)
+        self.assertEqual(len(conn._requested), 1)
+
+    def test_fetch_data_w_query_cache_range(self):
+        query, conn = self._run_w_warm_query_cache()
+
+        iterator = query.fetch_data(start_index=1, max_results=5)
+        pages = list(iterator.pages)
+
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(list(pages[0]), [('Bharney', 33)])
+        self.assertIsNone(iterator.next_page_token)
+        self.assertEqual(len(conn._requested), 1)
+
+    def test_fetch_data_w_query_cache_pages(self):
+        query, conn = self._run_w_warm_query_cache()
+
+        iterator = query.fetch_data(max_results=1)
+        pages = [list(page) for page in iterator.pages]
+
+        self.assertEqual(pages, [[('Phred', 32)], [('Bharney', 33)]])
+        self.assertEqual(iterator.total_rows, 2)
+        self.assertEqual(len(conn._requested), 1)
+
+    def test_fetch_data_w_query_cache_page_token(self):
+        import six
+
+        query, _ = self._run_w_warm_query_cache()
+        first = query.fetch_data(max_results=1)
+        six.next(first.pages)
+
+        iterator = query.fetch_data(
+            max_results=1, page_token=first.next_page_token)
+
+        self.assertEqual(list(iterator), [('Bharney', 33)])
+        self.assertIsNone(iterator.next_page_token)
+
+    def _fetch_data_uncached(self, **kw):
+        resource, _ = self._run_w_query_cache_resource()
+        conn = _RowPageConnection(resource)
+        client = _Client(project=self.PROJECT, connection=conn)
+        query = self._make_one(self.QUERY, client)
+        query._set_properties(resource)
+        return query.fetch_data(**kw)
+
+    def _fetch_data_both(self, **kw):
+        query, _ = self._run_w_warm_query_cache()
+        return query.fetch_data(**kw), self._fetch_data_uncached(**kw)
+
+    def test_fetch_data_w_query_cache_same_pages(self):
+        for kw in ({}, {'max_results': 1}, {'max_results': 5},
+                   {'start_index': 1}, {'start_index': 1, 'max_results': 1},
+                   {'max_results': 1, 'page_token': '1'}):
+            cached, uncached = self._fetch_data_both(**kw)
+
+            cached_pages = [list(page) for page in cached.pages]
+            uncached_pages = [list(page) for page in uncached.pages]
+
+            self.assertEqual(cached_pages, uncached_pages, kw)
+            self.assertEqual(cached.total_rows, uncached.total_rows, kw)
+            self.assertEqual(cached.schema, uncached.schema, kw)
+
+    @unittest.skipIf(numpy is None, 'Requires `numpy`')
+    def test_fetch_data_w_query_cache_same_arrays(self):
+        cached, uncached = self._fetch_data_both(max_results=1)
+
+        cached_arrays = cached.to_arrays()
+        uncached_arrays = uncached.to_arrays()
+
+        self.assertEqual(list(cached_arrays), list(uncached_arrays))
+        for name, array in cached_arrays.items():
+            expected = uncached_arrays[name]
+            self.assertEqual(array.dtype, expected.dtype)
+            self.assertEqual(array.tolist(), expected.tolist())
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_fetch_data_w_query_cache_same_dataframe(self):
+        cached, uncached = self._fetch_data_both(max_results=1)
+
+        pandas.testing.assert_frame_equal(
+            cached.to_dataframe(), uncached.to_dataframe())
+
+    def test_fetch_data_parallel_w_query_cache(self):
+        query, conn = self._run_w_warm_query_cache()
+
+        rows = list(query.fetch_data_parallel())
+
+        self.assertEqual(rows, [('Phred', 32), ('Bharney', 33)])
+        self.assertEqual(len(conn._requested), 1)
+
+    def test_run_w_query_cache_table_modified(self):
+        from google.cloud.bigquery.cache import QueryCache
+
+        resource, job_resource = self._run_w_query_cache_resource()
+        conn = _Connection(
+            resource, job_resource, {'lastModifiedTime': '1001.0'},
+            resource, job_resource)
+        cache = QueryCache(check_interval=0)
+        client = _Client(
+            project=self.PROJECT, connection=conn, query_cache=cache)
+
+        self._make_one(self.QUERY, client).run()
+        query = self._make_one(self.QUERY, client)
+        query.run()
+
+        self.assertEqual(len(conn._requested), 5)
+        self.assertEqual(conn._requested[3]['method'], 'POST')
+        self.assertEqual(query.name, self.JOB_NAME)
+        self.assertEqual(cache.misses, 2)
+
+    def test_run_w_query_cache_skipped(self):
+        from google.cloud.bigquery.cache import QueryCache
+
+        resource, _ = self._run_w_query_cache_resource()
+        incomplete = self._makeResource(complete=False)
+        conn = _Connection(resource, resource, incomplete)
+        cache = QueryCache(check_tables=False)
+        client = _Client(
+            project=self.PROJECT, connection=conn, query_cache=cache)
+
+        query = self._make_one(self.QUERY, client)
+        query.use_query_cache = False
+        query.run()
+        query = self._make_one(self.QUERY, client)
+        query.dry_run = True
+        query.run()
+        self._make_one(self.QUERY, client).run()
+
+        self.assertEqual(len(conn._requested), 3)
+        self.assertEqual(len(cache), 0)
+
     def test_run_w_alternate_client(self):
         PATH = 'projects/%s/queries' % self.PROJECT
         RESOURCE = self._makeResource(complete=True)
@@ -734,12 +957,118 @@ class TestQueryResults(unittest.TestCase):
                           'startIndex': START,
                           'timeoutMs': TIMEOUT})
 
+    def _make_parallel_query(self, connection):
+        query = self._make_one(
+            self.QUERY, _Client(project=self.PROJECT, connection=connection))
+        query._set_properties(self._makeResource(complete=False))
+        return query
+
+    def test_fetch_data_parallel_query_not_yet_run(self):
+        client = _Client(project=self.PROJECT, connection=_Connection())
+        query = self._make_one(self.QUERY, client)
+
+        with self.assertRaises(ValueError):
+            query.fetch_data_parallel()
+
+    def test_fetch_data_parallel_query_not_complete(self):
+        conn = _Connection(self._makeResource(complete=False))
+        query = self._make_parallel_query(conn)
+
+        with self.assertRaises(ValueError):
+            query.fetch_data_parallel(timeout_ms=100)
+
+        self.assertEqual(
+            conn._requested[0]['query_params'],
+            {'maxResults': 10000, 'timeoutMs': 100})
+
+    def test_fetch_data_parallel_single_request(self):
+        resource = self._makeResource(complete=True)
+        resource['totalRows'] = '4'
+        conn = _Connection(resource)
+        query = self._make_parallel_query(conn)
+
+        rows = list(query.fetch_data_parallel())
+
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[0], ('Phred Phlyntstone', 32))
+        self.assertEqual(len(conn._requested), 1)
+
+    def test_fetch_data_parallel_ordered(self):
+        PATH = '/projects/%s/queries/%s' % (self.PROJECT, self.JOB_NAME)
+        conn = _RowRangeConnection(
+            self._makeResource(complete=True), 23, max_rows=3)
+        query = self._make_parallel_query(conn)
+
+        rows = list(query.fetch_data_parallel(
+            max_workers=2, rows_per_request=5))
+
+        self.assertEqual(rows, [('row', index) for index in range(23)])
+        self.assertEqual(conn._requested[0]['path'], PATH)
+        self.assertEqual(
+            conn._requested[0]['query_params'], {'maxResults': 5})
+        # Each range of 5 rows takes two requests of at most 3 rows.
+        self.assertEqual(
+            sorted(request['query_params']['startIndex']
+                   for request in conn._requested[1:]),
+            [3, 6, 8, 11, 13, 16, 18, 21])
+        self.assertEqual(conn._requested[-1]['path'], PATH)
+
+    def test_fetch_data_parallel_unordered(self):
+        conn = _RowRangeConnection(self._makeResource(complete=True), 23)
+        query = self._make_parallel_query(conn)
+
+        rows = list(query.fetch_data_parallel(
+            max_workers=3, rows_per_request=4, ordered=False))
+
+        self.assertEqual(rows[:4], [('row', index) for index in range(4)])
+        self.assertEqual(
+            sorted(rows), [('row', index) for index in range(23)])
+
+    def test_fetch_data_parallel_short_result(self):
+        conn = _RowRangeConnection(
+            self._makeResource(complete=True), 7, total_rows=12)
+        query = self._make_parallel_query(conn)
+
+        rows = list(query.fetch_data_parallel(rows_per_request=3))
+
+        self.assertEqual(rows, [('row', index) for index in range(7)])
+
+    def test_fetch_data_parallel_error(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        conn = _RowRangeConnection(
+            self._makeResource(complete=True), 10,
+            error=ServiceUnavailable('oops'))
+        query = self._make_parallel_query(conn)
+        iterator = query.fetch_data_parallel(rows_per_request=3)
+
+        self.assertEqual(
+            [next(iterator) for _ in range(3)],
+            [('row', index) for index in range(3)])
+        with self.assertRaises(ServiceUnavailable):
+            next(iterator)
+
+    def test_fetch_data_parallel_close_early(self):
+        conn = _RowRangeConnection(self._makeResource(complete=True), 100)
+        query = self._make_parallel_query(conn)
+        iterator = query.fetch_data_parallel(
+            max_workers=1, rows_per_request=2)
+
+        self.assertEqual(
+            [next(iterator) for _ in range(3)],
+            [('row', index) for index in range(3)])
+        iterator.close()
+
+        # The first request, plus at most the two ranges fetched ahead.
+        self.assertLessEqual(len(conn._requested), 4)
+
 
 class _Client(object):
 
-    def __init__(self, project='project', connection=None):
+    def __init__(self, project='project', connection=None, query_cache=None):
         self.project = project
         self._connection = connection
+        self.query_cache = query_cache
 
     def dataset(self, name):
         from google.cloud.bigquery.dataset import Dataset
@@ -757,3 +1086,56 @@ class _Connection(object):
         self._requested.append(kw)
         response, self._responses = self._responses[0], self._responses[1:]
         return response
+
+
+class _RowPageConnection(object):
+    """Serve the rows of a result set by ``pageToken`` / ``maxResults``."""
+
+    def __init__(self, resource):
+        self._resource = resource
+        self._requested = []
+
+    def api_request(self, **kw):
+        self._requested.append(kw)
+        params = kw['query_params']
+        rows = self._resource['rows']
+        start = int(params.get('pageToken', params.get('startIndex', 0)))
+        stop = start + params.get('maxResults', len(rows))
+        response = dict(self._resource)
+        response['rows'] = rows[start:stop]
+        if stop < len(rows):
+            response['pageToken'] = str(stop)
+        return response
+
+
+class _RowRangeConnection(object):
+    """Serve the rows of a result set by ``startIndex`` / ``maxResults``."""
+
+    def __init__(self, resource, num_rows, total_rows=None, max_rows=None,
+                 error=None):
+        import threading
+
+        self._resource = resource
+        self._rows = [
+            {'f': [{'v': 'row'}, {'v': str(index)}]}
+            for index in range(num_rows)]
+        self._total_rows = num_rows if total_rows is None else total_rows
+        self._max_rows = max_rows
+        self._error = error
+        self._lock = threading.Lock()
+        self._requested = []
+
+    def api_request(self, **kw):
+        with self._lock:
+            self._requested.append(kw)
+        params = kw['query_params']
+        start = params.get('startIndex', 0)
+        if start and self._error is not None:
+            raise self._error
+        num_rows = params['maxResults']
+        if self._max_rows is not None:
+            num_rows = min(num_rows, self._max_rows)
+        response = dict(self._resource)
+        response['totalRows'] = str(self._total_rows)
+        response['rows'] = self._rows[start:start + num_rows]
+        return response
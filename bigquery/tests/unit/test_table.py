@@ -21,6 +21,16 @@ import mock
 from six.moves import http_client
 import pytest
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
 
 class _SchemaBase(object):
 
@@ -1160,6 +1170,72 @@ class TestTable(unittest.TestCase, _SchemaBase):
         self.assertEqual(req['method'], 'GET')
         self.assertEqual(req['path'], '/%s' % PATH)
 
+    def test_fetch_data_w_prefetch(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        DATA = {
+            'totalRows': '2',
+            'rows': [
+                {'f': [{'v': 'Phred Phlyntstone'}]},
+                {'f': [{'v': 'Bharney Rhubble'}]},
+            ]
+        }
+        conn = _Connection(DATA)
+        client = _Client(project=self.PROJECT, connection=conn)
+        dataset = _Dataset(client)
+        full_name = SchemaField('full_name', 'STRING', mode='REQUIRED')
+        table = self._make_one(self.TABLE_NAME, dataset=dataset,
+                               schema=[full_name])
+
+        iterator = table.fetch_data(prefetch=2)
+        rows = list(iterator)
+
+        self.assertEqual(iterator.prefetch, 2)
+        self.assertEqual(
+            rows, [('Phred Phlyntstone',), ('Bharney Rhubble',)])
+        self.assertEqual(len(conn._requested), 1)
+
+    def test_fetch_data_w_stream(self):
+        import json
+
+        import mock
+        import requests
+
+        from google.cloud._http import StreamedJSONResponse
+        from google.cloud.bigquery.table import SchemaField
+
+        # 'totalRows' follows the rows, which are buffered to read it.
+        payload = json.dumps({
+            'rows': [
+                {'f': [{'v': 'Phred Phlyntstone'}, {'v': '32'}]},
+                {'f': [{'v': 'Bharney Rhubble'}, {'v': None}]},
+            ],
+            'totalRows': '2',
+            'pageToken': 'TOKEN',
+        }, sort_keys=True).encode('utf-8')
+        response = mock.create_autospec(requests.Response, instance=True)
+        response.iter_content.return_value = iter(
+            [payload[i:i + 7] for i in range(0, len(payload), 7)])
+        conn = _Connection(StreamedJSONResponse(response, 'rows'))
+        client = _Client(project=self.PROJECT, connection=conn)
+        dataset = _Dataset(client)
+        full_name = SchemaField('full_name', 'STRING', mode='REQUIRED')
+        age = SchemaField('age', 'INTEGER', mode='NULLABLE')
+        table = self._make_one(self.TABLE_NAME, dataset=dataset,
+                               schema=[full_name, age])
+
+        iterator = table.fetch_data(stream=True)
+        page = next(iterator.pages)
+        rows = list(page)
+
+        self.assertEqual(
+            rows, [('Phred Phlyntstone', 32), ('Bharney Rhubble', None)])
+        self.assertEqual(iterator.total_rows, 2)
+        self.assertEqual(iterator.next_page_token, 'TOKEN')
+        req, = conn._requested
+        self.assertEqual(req['stream_key'], 'rows')
+        response.close.assert_called_once_with()
+
     def test_fetch_data_w_alternate_client(self):
         import six
         from google.cloud.bigquery.table import SchemaField
@@ -1981,6 +2057,109 @@ class TestTableUpload(object):
         assert response.text in exc_info.value.message
         assert exc_info.value.errors == []
 
+    @staticmethod
+    def _make_schema():
+        from google.cloud.bigquery.table import SchemaField
+
+        return [
+            SchemaField('full_name', 'STRING', mode='REQUIRED'),
+            SchemaField('age', 'INTEGER', mode='REQUIRED'),
+        ]
+
+    def test_load_from_rows(self):
+        import google.cloud.bigquery.table
+
+        table = self._make_table()
+        table.schema = self._make_schema()
+        uploaded = []
+
+        def do_upload(client, stream, metadata, num_retries):
+            uploaded.append(stream.read())
+            return self._make_response(
+                http_client.OK, json.dumps({}),
+                {'Content-Type': 'application/json'})
+
+        do_upload_patch = self._make_do_upload_patch(
+            table, '_do_resumable_upload', side_effect=do_upload)
+        with do_upload_patch as do_upload:
+            table.load_from_rows(
+                iter([(u'Phred Phlyntstone', 32), (u'J\xf6e', 33)]),
+                write_disposition='WRITE_APPEND', job_name='oddjob')
+
+        expected_config = {
+            'configuration': {
+                'load': {
+                    'sourceFormat': 'NEWLINE_DELIMITED_JSON',
+                    'destinationTable': {
+                        'projectId': 'project_id',
+                        'datasetId': 'test_dataset',
+                        'tableId': 'test_table',
+                    },
+                    'schema': {'fields': [
+                        {'name': 'full_name', 'type': 'STRING',
+                         'mode': 'REQUIRED'},
+                        {'name': 'age', 'type': 'INTEGER',
+                         'mode': 'REQUIRED'},
+                    ]},
+                    'writeDisposition': 'WRITE_APPEND',
+                    'jobReference': {'jobId': 'oddjob'},
+                },
+            },
+        }
+        do_upload.assert_called_once_with(
+            table._dataset._client,
+            mock.ANY,
+            expected_config,
+            google.cloud.bigquery.table._DEFAULT_NUM_RETRIES)
+        lines = uploaded[0].decode('utf-8').splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {'full_name': u'Phred Phlyntstone', 'age': '32'},
+            {'full_name': u'J\xf6e', 'age': '33'},
+        ]
+        table._dataset._client.job_from_resource.assert_called_once_with({})
+
+    def test_load_from_rows_wo_schema(self):
+        table = self._make_table()
+
+        with pytest.raises(ValueError):
+            table.load_from_rows([(u'Phred Phlyntstone', 32)])
+
+    def test_load_from_rows_failure(self):
+        from google.resumable_media import InvalidResponse
+        from google.cloud import exceptions
+
+        table = self._make_table()
+        table.schema = self._make_schema()
+        response = self._make_response(
+            content='Someone is already in this spot.',
+            status_code=http_client.CONFLICT)
+
+        do_upload_patch = self._make_do_upload_patch(
+            table, '_do_resumable_upload',
+            side_effect=InvalidResponse(response))
+
+        with do_upload_patch, pytest.raises(exceptions.Conflict):
+            table.load_from_rows([(u'Phred Phlyntstone', 32)])
+
+    def test_load_from_rows_resumable_upload(self):
+        table = self._make_table()
+        table.schema = self._make_schema()
+        rows = [(u'name-%d' % (index,), index) for index in range(1000)]
+        expected = b''.join(
+            json.dumps({'full_name': name, 'age': str(age)},
+                       separators=(',', ':')).encode('utf-8') + b'\n'
+            for name, age in rows)
+        transport = self._make_transport(
+            self._make_resumable_upload_responses(len(expected)))
+        table._dataset._client._http = transport
+
+        table.load_from_rows(rows)
+
+        put_data = transport.request.mock_calls[1][2]['data']
+        assert put_data == expected
+
+    # Low-level tests
+
     def test_upload_from_file_bad_mode(self):
         table = self._make_table()
         file_obj = mock.Mock(spec=['mode'])
@@ -2087,6 +2266,263 @@ class TestTableUpload(object):
                 None)
 
 
+class Test_EncodedRowStream(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.table import _EncodedRowStream
+
+        return _EncodedRowStream
+
+    def _make_one(self, rows, **kw):
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [SchemaField('n', 'INTEGER')]
+        stream = self._get_target_class()(rows, schema, **kw)
+        self.addCleanup(stream.close)
+        return stream
+
+    def test_read_sizes(self):
+        stream = self._make_one(iter([(1,), (22,), (333,)]), block_size=8)
+
+        self.assertEqual(stream.tell(), 0)
+        self.assertEqual(stream.read(5), b'{"n":')
+        self.assertEqual(stream.read(10), b'"1"}\n{"n":')
+        self.assertEqual(stream.tell(), 15)
+        self.assertEqual(stream.read(), b'"22"}\n{"n":"333"}\n')
+        self.assertEqual(stream.read(10), b'')
+
+    def test_empty(self):
+        stream = self._make_one([])
+
+        self.assertEqual(stream.read(10), b'')
+        self.assertEqual(stream.tell(), 0)
+
+    def test_seek_back(self):
+        stream = self._make_one([(1,), (2,)], block_size=1)
+
+        self.assertEqual(stream.read(6), b'{"n":"')
+        self.assertEqual(stream.read(6), b'1"}\n{"')
+        stream.seek(9)
+        self.assertEqual(stream.tell(), 9)
+        self.assertEqual(stream.read(6), b'\n{"n":')
+        stream.seek(9)
+        self.assertEqual(stream.read(), b'\n{"n":"2"}\n')
+
+    def test_seek_outside_last_read(self):
+        stream = self._make_one([(1,), (2,)], block_size=1)
+        stream.read(6)
+        stream.read(6)
+
+        with self.assertRaises(ValueError):
+            stream.seek(5)
+        with self.assertRaises(ValueError):
+            stream.seek(13)
+
+    def test_read_w_error(self):
+        def rows():
+            yield (1,)
+            raise RuntimeError('oops')
+
+        stream = self._make_one(rows(), block_size=1)
+
+        self.assertEqual(stream.read(10), b'{"n":"1"}\n')
+        with self.assertRaises(RuntimeError):
+            stream.read(10)
+
+    def test_close_stops_encoding(self):
+        import itertools
+
+        stream = self._make_one(
+            ((index,) for index in itertools.count()),
+            block_size=1, max_blocks=1)
+        stream.read(100)
+
+        stream.close()
+
+        stream._thread.join(5)
+        self.assertFalse(stream._thread.is_alive())
+
+    def test_close_while_blocked_on_full_queue(self):
+        import threading
+
+        from six.moves import queue
+
+        blocked = threading.Event()
+
+        class _Queue(queue.Queue):
+
+            def put(self, item, block=True, timeout=None):
+                try:
+                    super(_Queue, self).put(item, block, timeout)
+                except queue.Full:
+                    blocked.set()
+                    raise
+
+        patch_queue = mock.patch(
+            'google.cloud.bigquery.table.queue.Queue', new=_Queue)
+        patch_interval = mock.patch(
+            'google.cloud.bigquery.table._ENCODER_POLL_INTERVAL', new=0.01)
+        with patch_interval:
+            with patch_queue:
+                # The first row fills a block and the queue; the last block
+                # then waits for room.
+                stream = self._make_one(
+                    [(1000,), (1,)], block_size=12, max_blocks=1)
+
+            self.assertTrue(blocked.wait(5))
+            stream.close()
+
+            stream._thread.join(5)
+        self.assertFalse(stream._thread.is_alive())
+        self.assertEqual(stream._blocks.qsize(), 1)
+
+
+class TestRowIterator(unittest.TestCase):
+
+    PATH = '/projects/project/datasets/ds/tables/t/data'
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.table import RowIterator
+
+        return RowIterator
+
+    def _make_one(self, *responses):
+        from google.cloud.bigquery._helpers import _item_to_row
+        from google.cloud.bigquery.table import SchemaField
+
+        connection = _Connection(*responses)
+        client = _Client(connection=connection)
+        iterator = self._get_target_class()(
+            client=client,
+            api_request=connection.api_request,
+            path=self.PATH,
+            item_to_value=_item_to_row,
+            items_key='rows',
+            next_token='pageToken')
+        iterator.schema = (
+            SchemaField('name', 'STRING'),
+            SchemaField('age', 'INTEGER'),
+            SchemaField('score', 'FLOAT'),
+            SchemaField('active', 'BOOLEAN'),
+            SchemaField('joined', 'TIMESTAMP'),
+            SchemaField('tags', 'STRING', mode='REPEATED'),
+        )
+        return iterator, connection
+
+    PAGES = (
+        {
+            'pageToken': 'TOKEN',
+            'rows': [
+                {'f': [
+                    {'v': 'Phred'}, {'v': '32'}, {'v': '1.5'},
+                    {'v': 'true'}, {'v': '1.0'},
+                    {'v': [{'v': 'a'}, {'v': 'b'}]},
+                ]},
+                {'f': [
+                    {'v': None}, {'v': None}, {'v': None},
+                    {'v': None}, {'v': None}, {'v': []},
+                ]},
+            ],
+        },
+        {
+            'rows': [
+                {'f': [
+                    {'v': 'Wylma'}, {'v': '29'}, {'v': '-2'},
+                    {'v': 'false'}, {'v': '1.5E9'}, {'v': [{'v': 'c'}]},
+                ]},
+            ],
+        },
+    )
+
+    def test_iterate_rows(self):
+        iterator, _ = self._make_one(*self.PAGES)
+
+        rows = list(iterator)
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0][:4], ('Phred', 32, 1.5, True))
+
+    @unittest.skipIf(numpy is None, 'Requires `numpy`')
+    def test_to_arrays(self):
+        iterator, connection = self._make_one(*self.PAGES)
+
+        arrays = iterator.to_arrays()
+
+        self.assertEqual(
+            list(arrays), ['name', 'age', 'score', 'active', 'joined', 'tags'])
+        self.assertEqual(arrays['age'].dtype, numpy.int64)
+        self.assertEqual(arrays['age'].tolist(), [32, None, 29])
+        self.assertEqual(arrays['score'].dtype, numpy.float64)
+        self.assertEqual(arrays['score'].tolist(), [1.5, None, -2.0])
+        self.assertEqual(arrays['active'].dtype, numpy.bool_)
+        self.assertEqual(arrays['active'].tolist(), [True, None, False])
+        self.assertEqual(arrays['joined'].dtype, numpy.dtype('datetime64[us]'))
+        self.assertEqual(
+            list(numpy.ma.getmaskarray(arrays['joined'])),
+            [False, True, False])
+        self.assertEqual(
+            str(arrays['joined'][2]), '2017-07-14T02:40:00.000000')
+        self.assertEqual(arrays['name'].tolist(), ['Phred', None, 'Wylma'])
+        self.assertEqual(arrays['tags'].tolist(), [['a', 'b'], [], ['c']])
+        self.assertEqual(iterator.num_results, 3)
+        self.assertEqual(len(connection._requested), 2)
+        self.assertEqual(
+            connection._requested[1]['query_params'], {'pageToken': 'TOKEN'})
+
+    @unittest.skipIf(numpy is None, 'Requires `numpy`')
+    def test_to_arrays_empty(self):
+        iterator, _ = self._make_one({})
+
+        arrays = iterator.to_arrays()
+
+        self.assertEqual(len(arrays['age']), 0)
+        self.assertEqual(arrays['age'].dtype, numpy.int64)
+
+    @unittest.skipIf(numpy is None, 'Requires `numpy`')
+    def test_to_arrays_started(self):
+        iterator, _ = self._make_one(*self.PAGES)
+        iter(iterator)
+
+        with self.assertRaises(ValueError):
+            iterator.to_arrays()
+
+    def test_to_arrays_wo_numpy(self):
+        iterator, _ = self._make_one(*self.PAGES)
+
+        with mock.patch('google.cloud.bigquery.table.numpy', new=None):
+            with self.assertRaises(ValueError):
+                iterator.to_arrays()
+
+    @unittest.skipIf(pandas is None, 'Requires `pandas`')
+    def test_to_dataframe(self):
+        iterator, _ = self._make_one(*self.PAGES)
+
+        df = iterator.to_dataframe()
+
+        self.assertEqual(
+            list(df.columns),
+            ['name', 'age', 'score', 'active', 'joined', 'tags'])
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df['name'].tolist(), ['Phred', None, 'Wylma'])
+        self.assertEqual(df['age'].dtype, numpy.float64)
+        self.assertTrue(pandas.isnull(df['age'][1]))
+        self.assertEqual(df['age'][2], 29)
+        self.assertEqual(str(df['joined'].dt.tz), 'UTC')
+        self.assertTrue(pandas.isnull(df['joined'][1]))
+        self.assertEqual(
+            df['joined'][2], pandas.Timestamp('2017-07-14 02:40', tz='UTC'))
+        self.assertEqual(df['tags'].tolist(), [['a', 'b'], [], ['c']])
+
+    def test_to_dataframe_wo_pandas(self):
+        iterator, _ = self._make_one(*self.PAGES)
+
+        with mock.patch('google.cloud.bigquery.table.pandas', new=None):
+            with self.assertRaises(ValueError):
+                iterator.to_dataframe()
+
+
 class Test_parse_schema_resource(unittest.TestCase, _SchemaBase):
 
     def _call_fut(self, resource):
@@ -0,0 +1,222 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pool of gRPC channels for the Google Cloud Bigtable Data API.
+
+A single HTTP/2 connection caps the number of concurrent streams, so a
+process sending many concurrent ``ReadRows`` / ``MutateRows`` calls can
+spread them over several channels.
+"""
+
+
+import threading
+
+import six
+
+
+ROUND_ROBIN = 'round_robin'
+"""Policy sending each call to the next channel in turn."""
+
+LEAST_IN_FLIGHT = 'least_in_flight'
+"""Policy sending each call to the channel with the fewest calls in flight."""
+
+# Data API methods returning a stream of responses.  The others are unary.
+_STREAMING_METHODS = frozenset([
+    'MutateRows',
+    'ReadRows',
+    'SampleRowKeys',
+])
+
+
+class ChannelPool(object):
+    """Spread the calls of a gRPC stub over several channels.
+
+    Acts as a stub: each method call is sent with one of ``stubs``, chosen
+    per ``policy``.  A call is in flight until it returns or, for streaming
+    methods, until its stream is exhausted, fails or is cancelled.
+
+    :type stubs: list
+    :param stubs: Stubs for the same service, each on its own channel.
+
+    :type policy: str
+    :param policy: (Optional) How to choose the channel of a call, either
+                   :data:`ROUND_ROBIN` (the default) or
+                   :data:`LEAST_IN_FLIGHT`.
+
+    :raises: :class:`ValueError <exceptions.ValueError>` if ``stubs`` is
+             empty or ``policy`` is unknown.
+    """
+
+    def __init__(self, stubs, policy=ROUND_ROBIN):
+        if not stubs:
+            raise ValueError('A channel pool needs at least one stub.')
+        if policy not in (ROUND_ROBIN, LEAST_IN_FLIGHT):
+            raise ValueError('Unknown channel pool policy: %r' % (policy,))
+        self._stubs = list(stubs)
+        self._policy = policy
+        self._lock = threading.Lock()
+        self._in_flight = [0] * len(self._stubs)
+        self._calls = [0] * len(self._stubs)
+        self._next_index = 0
+
+    def __len__(self):
+        return len(self._stubs)
+
+    @property
+    def policy(self):
+        """How the channel of a call is chosen.
+
+        :rtype: str
+        :returns: :data:`ROUND_ROBIN` or :data:`LEAST_IN_FLIGHT`.
+        """
+        return self._policy
+
+    @property
+    def in_flight(self):
+        """The number of calls in flight on each channel.
+
+        :rtype: list of int
+        :returns: One count per channel.
+        """
+        with self._lock:
+            return list(self._in_flight)
+
+    @property
+    def calls(self):
+        """The number of calls sent on each channel so far.
+
+        :rtype: list of int
+        :returns: One count per channel.
+        """
+        with self._lock:
+            return list(self._calls)
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return _PooledMethod(self, name)
+
+    def _acquire(self):
+        """Choose the channel of a new call, and count the call.
+
+        :rtype: int
+        :returns: The index of the chosen channel.
+        """
+        with self._lock:
+            if self._policy == LEAST_IN_FLIGHT:
+                index = min(six.moves.xrange(len(self._stubs)),
+                            key=self._in_flight.__getitem__)
+            else:
+                index = self._next_index
+                self._next_index = (index + 1) % len(self._stubs)
+            self._in_flight[index] += 1
+            self._calls[index] += 1
+            return index
+
+    def _release(self, index):
+        """Count the end of a call.
+
+        :type index: int
+        :param index: The index of the call's channel.
+        """
+        with self._lock:
+            self._in_flight[index] -= 1
+
+
+class _PooledMethod(object):
+    """A method of :class:`ChannelPool`, sent on one of its channels.
+
+    :type pool: :class:`ChannelPool`
+    :param pool: The pool owning the method.
+
+    :type name: str
+    :param name: The name of the method.
+    """
+
+    def __init__(self, pool, name):
+        self._pool = pool
+        self._name = name
+
+    def __call__(self, *args, **kwargs):
+        pool = self._pool
+        index = pool._acquire()
+        try:
+            method = getattr(pool._stubs[index], self._name)
+            result = method(*args, **kwargs)
+        except Exception:
+            pool._release(index)
+            raise
+
+        if self._name in _STREAMING_METHODS:
+            return _TrackedStream(result, pool, index)
+        pool._release(index)
+        return result
+
+
+class _TrackedStream(object):
+    """Response stream keeping its call in flight until it ends.
+
+    Other attributes (e.g. ``code()``) are those of the wrapped stream.
+
+    :type stream: :class:`~google.cloud.exceptions.GrpcRendezvous`
+    :param stream: The stream returned by a streaming method.
+
+    :type pool: :class:`ChannelPool`
+    :param pool: The pool which sent the call.
+
+    :type index: int
+    :param index: The index of the call's channel.
+    """
+
+    def __init__(self, stream, pool, index):
+        self._stream = stream
+        self._iterator = iter(stream)
+        self._pool = pool
+        self._index = index
+        self._done = False
+
+    def _finish(self):
+        """Count the end of the call, once."""
+        if not self._done:
+            self._done = True
+            self._pool._release(self._index)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return six.next(self._iterator)
+        except Exception:
+            self._finish()
+            raise
+
+    next = __next__
+
+    def cancel(self):
+        """Cancels the stream, ending the call."""
+        try:
+            return self._stream.cancel()
+        finally:
+            self._finish()
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self._stream, name)
+
+    def __del__(self):
+        # A stream dropped before it ended is cancelled by gRPC.
+        if '_done' in self.__dict__:
+            self._finish()
@@ -44,6 +44,8 @@ from google.cloud.bigtable import __version__
 from google.cloud.bigtable._generated import bigtable_instance_admin_pb2
 from google.cloud.bigtable._generated import bigtable_pb2
 from google.cloud.bigtable._generated import bigtable_table_admin_pb2
+from google.cloud.bigtable.channel_pool import ChannelPool
+from google.cloud.bigtable.channel_pool import ROUND_ROBIN
 from google.cloud.bigtable.cluster import DEFAULT_SERVE_NODES
 from google.cloud.bigtable.instance import Instance
 from google.cloud.bigtable.instance import _EXISTING_INSTANCE_LOCATION_ID
@@ -81,21 +83,50 @@ _GRPC_MAX_LENGTH_OPTIONS = _GRPC_EXTRA_OPTIONS + (
     ('grpc.max_message_length', _MAX_MSG_LENGTH_100MB),
     ('grpc.max_receive_message_length', _MAX_MSG_LENGTH_100MB),
 )
+# NOTE: gRPC shares one connection between channels created with the same
+#       target and options, so each channel of a pool gets its own index.
+_GRPC_CHANNEL_INDEX_OPTION = 'google.cloud.bigtable.channel_index'
 
 
 def _make_data_stub(client):
     """Creates gRPC stub to make requests to the Data API.
 
+    If the client's ``channel_pool_size`` is greater than one, the stub is a
+    :class:`.ChannelPool` spreading requests over that many channels.
+
+    :type client: :class:`Client`
+    :param client: The client that will hold the stub.
+
+    :rtype: :class:`._generated.bigtable_pb2.BigtableStub` or
+            :class:`.ChannelPool`
+    :returns: A gRPC stub object.
+    """
+    if client.channel_pool_size <= 1:
+        return _make_data_channel_stub(client)
+    stubs = [_make_data_channel_stub(client, index=index)
+             for index in range(client.channel_pool_size)]
+    return ChannelPool(stubs, policy=client.channel_pool_policy)
+
+
+def _make_data_channel_stub(client, index=None):
+    """Creates gRPC stub on its own channel to the Data API.
+
     :type client: :class:`Client`
     :param client: The client that will hold the stub.
 
+    :type index: int
+    :param index: (Optional) The index of the channel in a pool.
+
     :rtype: :class:`._generated.bigtable_pb2.BigtableStub`
     :returns: A gRPC stub object.
     """
     if client.emulator_host is None:
+        extra_options = _GRPC_MAX_LENGTH_OPTIONS
+        if index is not None:
+            extra_options += ((_GRPC_CHANNEL_INDEX_OPTION, index),)
         return make_secure_stub(client.credentials, client.user_agent,
                                 bigtable_pb2.BigtableStub, DATA_API_HOST,
-                                extra_options=_GRPC_MAX_LENGTH_OPTIONS)
+                                extra_options=extra_options)
     else:
         return make_insecure_stub(bigtable_pb2.BigtableStub,
                                   client.emulator_host)
@@ -195,6 +226,19 @@ class Client(ClientWithProject):
     :param user_agent: (Optional) The user agent to be used with API request.
                        Defaults to :const:`DEFAULT_USER_AGENT`.
 
+    :type channel_pool_size: int
+    :param channel_pool_size: (Optional) The number of gRPC channels (each
+                              with its own HTTP/2 connection) over which
+                              Data API requests are spread.  Defaults to 1.
+
+    :type channel_pool_policy: str
+    :param channel_pool_policy: (Optional) How the channel of a request is
+                                chosen when ``channel_pool_size`` is
+                                greater than one: either
+                                :data:`.channel_pool.ROUND_ROBIN` (the
+                                default) or
+                                :data:`.channel_pool.LEAST_IN_FLIGHT`.
+
     :raises: :class:`ValueError <exceptions.ValueError>` if both ``read_only``
              and ``admin`` are :data:`True`
     """
@@ -205,7 +249,8 @@ class Client(ClientWithProject):
     _SET_PROJECT = True  # Used by from_service_account_json()
 
     def __init__(self, project=None, credentials=None,
-                 read_only=False, admin=False, user_agent=DEFAULT_USER_AGENT):
+                 read_only=False, admin=False, user_agent=DEFAULT_USER_AGENT,
+                 channel_pool_size=1, channel_pool_policy=ROUND_ROBIN):
         if read_only and admin:
             raise ValueError('A read-only client cannot also perform'
                              'administrative actions.')
@@ -222,6 +267,8 @@ class Client(ClientWithProject):
         super(Client, self).__init__(
             project=project, credentials=credentials, _http=None)
         self.user_agent = user_agent
+        self.channel_pool_size = channel_pool_size
+        self.channel_pool_policy = channel_pool_policy
         self.emulator_host = os.getenv(BIGTABLE_EMULATOR)
 
         # Create gRPC stubs for making requests.
@@ -262,6 +309,8 @@ class Client(ClientWithProject):
             self._read_only,
             self._admin,
             self.user_agent,
+            self.channel_pool_size,
+            self.channel_pool_policy,
         )
 
     @property
@@ -293,6 +342,20 @@ class Client(ClientWithProject):
         """
         return 'projects/' + self.project
 
+    @property
+    def data_channel_pool(self):
+        """The pool of channels used for the Data API, if any.
+
+        Its :attr:`~.ChannelPool.in_flight` and :attr:`~.ChannelPool.calls`
+        count the requests of each channel.
+
+        :rtype: :class:`.ChannelPool`
+        :returns: The pool, or :data:`None` if ``channel_pool_size`` is 1.
+        """
+        if isinstance(self._data_stub, ChannelPool):
+            return self._data_stub
+        return None
+
     @property
     def _instance_stub(self):
         """Getter for the gRPC stub used for the Instance Admin API.
@@ -16,12 +16,43 @@
 
 
 import copy
+
+import grpc
 import six
 
+from google.api.core import retry
 from google.cloud._helpers import _datetime_from_microseconds
 from google.cloud._helpers import _to_bytes
 
 
+_RETRYABLE_READ_ROWS_CODES = (
+    grpc.StatusCode.ABORTED,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.UNAVAILABLE,
+)
+
+
+def _retry_read_rows_exception(exc):
+    """Check whether a ``ReadRows`` stream failing with ``exc`` can resume.
+
+    :type exc: :class:`Exception`
+    :param exc: The error raised while reading the stream.
+
+    :rtype: bool
+    :returns: True if the error is a retryable gRPC error.
+    """
+    return (isinstance(exc, grpc.RpcError) and
+            exc.code() in _RETRYABLE_READ_ROWS_CODES)
+
+
+DEFAULT_RETRY_READ_ROWS = retry.Retry(predicate=_retry_read_rows_exception)
+"""The default retry policy of ``ReadRows`` streams.
+
+Streams failing with a retryable error are resumed after the last row read
+(see :class:`PartialRowsData`), until no response is read for 120 seconds.
+"""
+
+
 class Cell(object):
     """Representation of a Google Cloud Bigtable Cell.
 
@@ -35,6 +66,8 @@ class Cell(object):
     :param labels: (Optional) List of strings. Labels applied to the cell.
     """
 
+    __slots__ = ('value', 'timestamp', 'labels')
+
     def __init__(self, value, timestamp, labels=()):
         self.value = value
         self.timestamp = timestamp
@@ -92,6 +125,10 @@ class PartialCellData(object):
     :type value: bytes
     :param value: The (accumulated) value of the (partial) cell.
     """
+
+    __slots__ = ('row_key', 'family_name', 'qualifier', 'timestamp_micros',
+                 'labels', '_chunks')
+
     def __init__(self, row_key, family_name, qualifier, timestamp_micros,
                  labels=(), value=b''):
         self.row_key = row_key
@@ -99,15 +136,36 @@ class PartialCellData(object):
         self.qualifier = qualifier
         self.timestamp_micros = timestamp_micros
         self.labels = labels
-        self.value = value
+        self._chunks = [value]
+
+    @property
+    def value(self):
+        """The value accumulated so far.
+
+        The chunks appended since the last access are joined in one copy.
+
+        :rtype: bytes
+        :returns: The (partial) cell's value.
+        """
+        chunks = self._chunks
+        if len(chunks) > 1:
+            chunks[:] = [b''.join(chunks)]
+        return chunks[0]
+
+    @value.setter
+    def value(self, value):
+        self._chunks = [value]
 
     def append_value(self, value):
         """Append bytes from a new chunk to value.
 
+        The bytes are kept aside until :attr:`value` is read, so that
+        appending many chunks copies each of them only once.
+
         :type value: bytes
         :param value: bytes to append
         """
-        self.value += value
+        self._chunks.append(value)
 
 
 class PartialRowData(object):
@@ -120,6 +178,8 @@ class PartialRowData(object):
     :param row_key: The key for the row holding the (partial) data.
     """
 
+    __slots__ = ('_row_key', '_cells')
+
     def __init__(self, row_key):
         self._row_key = row_key
         self._cells = {}
@@ -183,17 +243,56 @@ class InvalidChunk(RuntimeError):
 class PartialRowsData(object):
     """Convenience wrapper for consuming a ``ReadRows`` streaming response.
 
+    Either iterate over the rows as they are streamed, or call
+    :meth:`consume_all` and then use :attr:`rows`::
+
+        >>> for row in partial_rows_data:
+        ...     print(row.row_key)
+
+    Iterating keeps no more than the rows of one ``ReadRowsResponse`` in
+    memory; the next response is only read once the rows of the current one
+    are used, so a slow consumer holds back the stream.
+
+    If ``read_method`` and ``request_pb`` are passed, a stream failing with
+    an error retryable under ``retry`` is reissued, reading only the rows
+    after the last row committed or scanned, and (if the request has a
+    ``rows_limit``) no more rows than remain to be read. Cells of a row in
+    progress when the stream failed are dropped and read again.
+
     :type response_iterator: :class:`~google.cloud.exceptions.GrpcRendezvous`
     :param response_iterator: A streaming iterator returned from a
                               ``ReadRows`` request.
+
+    :type read_method: callable
+    :param read_method: (Optional) The ``ReadRows`` method of the data stub,
+                        to reissue ``request_pb``.
+
+    :type request_pb: :class:`data_messages_v2_pb2.ReadRowsRequest`
+    :param request_pb: (Optional) The request which returned
+                       ``response_iterator``.
+
+    :type retry: :class:`~google.api.core.retry.Retry`
+    :param retry: (Optional) How to retry reading the stream. Defaults to
+                  :data:`DEFAULT_RETRY_READ_ROWS`. Pass :data:`None` to
+                  disable retries.
     """
     START = "Start"                         # No responses yet processed.
     NEW_ROW = "New row"                     # No cells yet complete for row
     ROW_IN_PROGRESS = "Row in progress"     # Some cells complete for row
     CELL_IN_PROGRESS = "Cell in progress"   # Incomplete cell for row
 
-    def __init__(self, response_iterator):
+    def __init__(self, response_iterator, read_method=None, request_pb=None,
+                 retry=DEFAULT_RETRY_READ_ROWS):
         self._response_iterator = response_iterator
+        self._read_method = read_method
+        self._request_pb = request_pb
+        self._retry = retry
+        # Set when the stream failed and must be reissued before reading.
+        self._restart = False
+        # The key after which a reissued stream starts, and the number of
+        # rows committed so far.
+        self._resume_key = b''
+        self._rows_read = 0
         # Fully-processed rows, keyed by `row_key`
         self._rows = {}
         # Counter for responses pulled from iterator
@@ -252,13 +351,77 @@ class PartialRowsData(object):
         """Cancels the iterator, closing the stream."""
         self._response_iterator.cancel()
 
+    def _read_next(self):
+        """Read the next response, reissuing the request if it failed.
+
+        :rtype: :class:`data_messages_v2_pb2.ReadRowsResponse`
+        :returns: The next response of the stream.
+        """
+        if self._restart:
+            self._restart = False
+            request_pb = _resume_request(
+                self._request_pb, self._resume_key, self._rows_read)
+            if request_pb is None:
+                # Every requested row was read before the stream failed.
+                self._response_iterator = iter(())
+            else:
+                self._response_iterator = self._read_method(request_pb)
+        return six.next(self._response_iterator)
+
+    def _on_error(self, exc):  # pylint: disable=unused-argument
+        """Prepare to resume the stream after a retryable error.
+
+        :type exc: :class:`Exception`
+        :param exc: The error raised while reading the stream.
+        """
+        self._row = self._cell = self._previous_cell = None
+        self._restart = True
+
+    def _read_next_response(self):
+        """Read the next response, retrying per ``retry`` if possible.
+
+        :rtype: :class:`data_messages_v2_pb2.ReadRowsResponse`
+        :returns: The next response of the stream.
+        """
+        if self._retry is None or self._read_method is None:
+            return six.next(self._response_iterator)
+        return self._retry(self._read_next, on_error=self._on_error)()
+
+    def __iter__(self):
+        """Iterate over the rows of the stream, as they are completed.
+
+        Rows are yielded in order by row key, and are not kept in
+        :attr:`rows`. Closing the iterator before the end of the stream
+        (e.g. by breaking out of a loop over it) cancels the stream.
+
+        :rtype: iterator
+        :returns: The :class:`PartialRowData` of each row.
+        :raises: :class:`ValueError <exceptions.ValueError>` if the stream
+                 ends within a row.
+        """
+        try:
+            while True:
+                rows, self._rows = self._rows, {}
+                for row_key in sorted(rows):
+                    yield rows[row_key]
+                try:
+                    self.consume_next()
+                except StopIteration:
+                    break
+        except GeneratorExit:
+            self.cancel()
+            raise
+
+        if self.state not in (self.NEW_ROW, self.START):
+            raise ValueError('The row remains partial / is not committed.')
+
     def consume_next(self):
         """Consume the next ``ReadRowsResponse`` from the stream.
 
         Parse the response and its chunks into a new/existing row in
         :attr:`_rows`. Rows are returned in order by row key.
         """
-        response = six.next(self._response_iterator)
+        response = self._read_next_response()
         self._counter += 1
 
         if self._last_scanned_row_key is None:  # first response
@@ -266,6 +429,8 @@ class PartialRowsData(object):
                 raise InvalidReadRowsResponse()
 
         self._last_scanned_row_key = response.last_scanned_row_key
+        if response.last_scanned_row_key:
+            self._resume_key = response.last_scanned_row_key
 
         row = self._row
         cell = self._cell
@@ -283,14 +448,7 @@ class PartialRowsData(object):
                 row = self._row = PartialRowData(chunk.row_key)
 
             if cell is None:
-                cell = self._cell = PartialCellData(
-                    chunk.row_key,
-                    chunk.family_name.value,
-                    chunk.qualifier.value,
-                    chunk.timestamp_micros,
-                    chunk.labels,
-                    chunk.value)
-                self._copy_from_previous(cell)
+                cell = self._cell = self._new_cell(chunk)
             else:
                 cell.append_value(chunk.value)
 
@@ -343,7 +501,6 @@ class PartialRowsData(object):
 
     def _validate_chunk_new_row(self, chunk):
         """Helper for :meth:`_validate_chunk`."""
-        assert self.state == self.NEW_ROW
         _raise_if(chunk.reset_row)
         _raise_if(not chunk.row_key)
         _raise_if(not chunk.family_name)
@@ -364,7 +521,6 @@ class PartialRowsData(object):
 
     def _validate_chunk_row_in_progress(self, chunk):
         """Helper for :meth:`_validate_chunk`"""
-        assert self.state == self.ROW_IN_PROGRESS
         self._validate_chunk_status(chunk)
         _raise_if(chunk.row_key and
                   chunk.row_key != self._row.row_key)
@@ -374,20 +530,16 @@ class PartialRowsData(object):
         _raise_if(self._same_as_previous(chunk) and
                   chunk.timestamp_micros <= previous.timestamp_micros)
 
-    def _validate_chunk_cell_in_progress(self, chunk):
-        """Helper for :meth:`_validate_chunk`"""
-        assert self.state == self.CELL_IN_PROGRESS
-        self._validate_chunk_status(chunk)
-        self._copy_from_current(chunk)
-
     def _validate_chunk(self, chunk):
         """Helper for :meth:`consume_next`."""
-        if self.state == self.NEW_ROW:
+        state = self.state
+        if state == self.NEW_ROW:
             self._validate_chunk_new_row(chunk)
-        if self.state == self.ROW_IN_PROGRESS:
+        elif state == self.ROW_IN_PROGRESS:
             self._validate_chunk_row_in_progress(chunk)
-        if self.state == self.CELL_IN_PROGRESS:
-            self._validate_chunk_cell_in_progress(chunk)
+        elif state == self.CELL_IN_PROGRESS:
+            # Continuation chunks only carry more of the value.
+            self._validate_chunk_status(chunk)
 
     def _save_current_cell(self):
         """Helper for :meth:`consume_next`."""
@@ -398,41 +550,97 @@ class PartialRowsData(object):
         qualified.append(complete)
         self._cell, self._previous_cell = None, cell
 
-    def _copy_from_current(self, chunk):
-        """Helper for :meth:`consume_next`."""
-        current = self._cell
-        if current is not None:
-            if not chunk.row_key:
-                chunk.row_key = current.row_key
-            if not chunk.HasField('family_name'):
-                chunk.family_name.value = current.family_name
-            if not chunk.HasField('qualifier'):
-                chunk.qualifier.value = current.qualifier
-            if not chunk.timestamp_micros:
-                chunk.timestamp_micros = current.timestamp_micros
-            if not chunk.labels:
-                chunk.labels.extend(current.labels)
-
-    def _copy_from_previous(self, cell):
-        """Helper for :meth:`consume_next`."""
+    def _new_cell(self, chunk):
+        """Helper for :meth:`consume_next`.
+
+        Start a cell from its first chunk.  The row key, family name and
+        qualifier omitted by the chunk are those of the previous cell.
+
+        :type chunk: :class:`data_messages_v2_pb2.ReadRowsResponse.CellChunk`
+        :param chunk: The first chunk of the cell.
+
+        :rtype: :class:`PartialCellData`
+        :returns: The new (partial) cell.
+        """
         previous = self._previous_cell
-        if previous is not None:
-            if not cell.row_key:
-                cell.row_key = previous.row_key
-            if not cell.family_name:
-                cell.family_name = previous.family_name
-            if not cell.qualifier:
-                cell.qualifier = previous.qualifier
+        if previous is None:
+            row_key = chunk.row_key
+            family_name = chunk.family_name.value
+            qualifier = chunk.qualifier.value
+        else:
+            row_key = chunk.row_key or previous.row_key
+            family_name = previous.family_name
+            qualifier = previous.qualifier
+            if chunk.HasField('family_name'):
+                family_name = chunk.family_name.value or family_name
+            if chunk.HasField('qualifier'):
+                qualifier = chunk.qualifier.value or qualifier
+        return PartialCellData(
+            row_key, family_name, qualifier, chunk.timestamp_micros,
+            chunk.labels, chunk.value)
 
     def _save_current_row(self):
         """Helper for :meth:`consume_next`."""
         if self._cell:
             self._save_current_cell()
         self._rows[self._row.row_key] = self._row
+        self._resume_key = self._row.row_key
+        self._rows_read += 1
         self._row, self._previous_row = None, self._row
         self._previous_cell = None
 
 
+def _resume_request(request_pb, resume_key, rows_read):
+    """Build the request reading the rows not yet read by a request.
+
+    :type request_pb: :class:`data_messages_v2_pb2.ReadRowsRequest`
+    :param request_pb: The original request.
+
+    :type resume_key: bytes
+    :param resume_key: The last row key committed or scanned, if any.
+
+    :type rows_read: int
+    :param rows_read: The number of rows committed.
+
+    :rtype: :class:`data_messages_v2_pb2.ReadRowsRequest`
+    :returns: The request for the remaining rows, or :data:`None` if no
+              rows remain.
+    """
+    resumed = copy.deepcopy(request_pb)
+    if request_pb.rows_limit:
+        resumed.rows_limit = request_pb.rows_limit - rows_read
+        if resumed.rows_limit <= 0:
+            return None
+
+    if not resume_key:
+        return resumed
+
+    row_set = request_pb.rows
+    if not row_set.row_keys and not row_set.row_ranges:
+        resumed.rows.row_ranges.add(start_key_open=resume_key)
+        return resumed
+
+    resumed.ClearField('rows')
+    for row_key in row_set.row_keys:
+        if row_key > resume_key:
+            resumed.rows.row_keys.append(row_key)
+
+    for row_range in row_set.row_ranges:
+        end_key = row_range.end_key_open or row_range.end_key_closed
+        if end_key and end_key <= resume_key:
+            continue
+        remaining = resumed.rows.row_ranges.add()
+        remaining.CopyFrom(row_range)
+        start_key = (
+            row_range.start_key_open or row_range.start_key_closed)
+        if start_key <= resume_key:
+            remaining.start_key_open = resume_key
+
+    if not resumed.rows.row_keys and not resumed.rows.row_ranges:
+        return None
+    return resumed
+
+
 def _raise_if(predicate, *args):
     """Helper for validation methods."""
     if predicate:
@@ -0,0 +1,160 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Sets of row keys and row ranges to read from Google Cloud Bigtable."""
+
+
+from google.cloud._helpers import _to_bytes
+from google.cloud.bigtable._generated import (
+    data_pb2 as data_v2_pb2)
+
+
+class RowSet(object):
+    """A set of rows to read, given as row keys and row key ranges.
+
+    Rows matched by several keys or ranges are read once.
+
+    :type row_keys: list
+    :param row_keys: (Optional) List or other iterable of row keys
+                     (bytes) to read.
+
+    :type row_ranges: list
+    :param row_ranges: (Optional) List or other iterable of
+                       :class:`RowRange` instances to read.
+    """
+
+    def __init__(self, row_keys=(), row_ranges=()):
+        self.row_keys = [_to_bytes(row_key) for row_key in row_keys]
+        self.row_ranges = list(row_ranges)
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return (other.row_keys == self.row_keys and
+                other.row_ranges == self.row_ranges)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def add_row_key(self, row_key):
+        """Add a row key to the set.
+
+        :type row_key: bytes
+        :param row_key: The key of a row to read.
+        """
+        self.row_keys.append(_to_bytes(row_key))
+
+    def add_row_range(self, row_range):
+        """Add a row range to the set.
+
+        :type row_range: :class:`RowRange`
+        :param row_range: The range of rows to read.
+        """
+        self.row_ranges.append(row_range)
+
+    def add_row_range_from_keys(self, start_key=None, end_key=None,
+                                start_inclusive=True, end_inclusive=False):
+        """Add a row range to the set, from its start and end keys.
+
+        See :class:`RowRange`.
+
+        :type start_key: bytes
+        :param start_key: (Optional) The start of the range.
+
+        :type end_key: bytes
+        :param end_key: (Optional) The end of the range.
+
+        :type start_inclusive: bool
+        :param start_inclusive: (Optional) Whether ``start_key`` is part of
+                                the range.  Defaults to True.
+
+        :type end_inclusive: bool
+        :param end_inclusive: (Optional) Whether ``end_key`` is part of the
+                              range.  Defaults to False.
+        """
+        self.add_row_range(RowRange(
+            start_key=start_key, end_key=end_key,
+            start_inclusive=start_inclusive, end_inclusive=end_inclusive))
+
+    def to_pb(self):
+        """Converts the row set to a protobuf.
+
+        :rtype: :class:`.data_v2_pb2.RowSet`
+        :returns: The converted current object.
+        """
+        return data_v2_pb2.RowSet(
+            row_keys=self.row_keys,
+            row_ranges=[row_range.to_pb() for row_range in self.row_ranges])
+
+
+class RowRange(object):
+    """A range of row keys.
+
+    :type start_key: bytes
+    :param start_key: (Optional) The start of the range.  If unset, the
+                      range starts at the beginning of the table.
+
+    :type end_key: bytes
+    :param end_key: (Optional) The end of the range.  If unset, the range
+                    ends at the end of the table.
+
+    :type start_inclusive: bool
+    :param start_inclusive: (Optional) Whether ``start_key`` is part of the
+                            range.  Defaults to True.
+
+    :type end_inclusive: bool
+    :param end_inclusive: (Optional) Whether ``end_key`` is part of the
+                          range.  Defaults to False.
+    """
+
+    def __init__(self, start_key=None, end_key=None, start_inclusive=True,
+                 end_inclusive=False):
+        if start_key is not None:
+            start_key = _to_bytes(start_key)
+        if end_key is not None:
+            end_key = _to_bytes(end_key)
+        self.start_key = start_key
+        self.end_key = end_key
+        self.start_inclusive = start_inclusive
+        self.end_inclusive = end_inclusive
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return (other.start_key == self.start_key and
+                other.end_key == self.end_key and
+                other.start_inclusive == self.start_inclusive and
+                other.end_inclusive == self.end_inclusive)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def to_pb(self):
+        """Converts the row range to a protobuf.
+
+        :rtype: :class:`.data_v2_pb2.RowRange`
+        :returns: The converted current object.
+        """
+        range_kwargs = {}
+        if self.start_key is not None:
+            if self.start_inclusive:
+                range_kwargs['start_key_closed'] = self.start_key
+            else:
+                range_kwargs['start_key_open'] = self.start_key
+        if self.end_key is not None:
+            if self.end_inclusive:
+                range_kwargs['end_key_closed'] = self.end_key
+            else:
+                range_kwargs['end_key_open'] = self.end_key
+        return data_v2_pb2.RowRange(**range_kwargs)
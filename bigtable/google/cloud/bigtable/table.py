@@ -15,6 +15,12 @@
 """User-friendly container for Google Cloud Bigtable Table."""
 
 
+import collections
+from concurrent import futures
+import threading
+import time
+
+import grpc
 import six
 
 from google.cloud._helpers import _to_bytes
@@ -29,13 +35,39 @@ from google.cloud.bigtable.column_family import ColumnFamily
 from google.cloud.bigtable.row import AppendRow
 from google.cloud.bigtable.row import ConditionalRow
 from google.cloud.bigtable.row import DirectRow
+from google.cloud.bigtable.row_data import DEFAULT_RETRY_READ_ROWS
 from google.cloud.bigtable.row_data import PartialRowsData
+from google.cloud.bigtable.row_set import RowSet
+from google.rpc import status_pb2
 
 
 # Maximum number of mutations in bulk (MutateRowsRequest message):
 # https://cloud.google.com/bigtable/docs/reference/data/rpc/google.bigtable.v2#google.bigtable.v2.MutateRowRequest
 _MAX_BULK_MUTATIONS = 100000
 
+_DEFAULT_MAX_MUTATIONS = 10000
+_DEFAULT_MAX_BYTES = 5 * 1024 * 1024  # 5 MB
+_DEFAULT_MAX_LATENCY = 1.0  # seconds
+_DEFAULT_MAX_CONCURRENT = 10
+_DEFAULT_MAX_RETRIES = 5
+_DEFAULT_RETRY_DELAY = 0.1  # seconds
+
+# Status codes of entries (or of whole ``MutateRows`` calls) which may
+# succeed when sent again.
+_RETRYABLE_MUTATION_CODES = frozenset([
+    grpc.StatusCode.ABORTED.value[0],
+    grpc.StatusCode.DEADLINE_EXCEEDED.value[0],
+    grpc.StatusCode.UNAVAILABLE.value[0],
+])
+
+_DEFAULT_SCAN_WORKERS = 8
+_DEFAULT_MAX_QUEUED_ROWS = 1000
+_DEFAULT_KEYS_PER_REQUEST = 1000
+_QUEUE_POLL_INTERVAL = 0.1  # seconds
+
+_PendingEntry = collections.namedtuple(
+    '_PendingEntry', ['row', 'entry_pb', 'num_mutations', 'size'])
+
 
 class TableMismatchError(ValueError):
     """Row from another table."""
@@ -257,7 +289,8 @@ class Table(object):
         return rows_data.rows[row_key]
 
     def read_rows(self, start_key=None, end_key=None, limit=None,
-                  filter_=None, end_inclusive=False):
+                  filter_=None, end_inclusive=False,
+                  retry=DEFAULT_RETRY_READ_ROWS, row_set=None):
         """Read rows from this table.
 
         :type start_key: bytes
@@ -284,17 +317,33 @@ class Table(object):
         :param end_inclusive: (Optional) Whether the ``end_key`` should be
                       considered inclusive. The default is False (exclusive).
 
+        :type retry: :class:`~google.api.core.retry.Retry`
+        :param retry: (Optional) How to retry a stream failing partway
+                      through, resuming after the last row read. Pass
+                      :data:`None` to disable retries.
+
+        :type row_set: :class:`.RowSet`
+        :param row_set: (Optional) The row keys and row ranges to read,
+                        instead of ``start_key`` and ``end_key``.  For many
+                        row keys, see :meth:`read_rows_multi`.
+
         :rtype: :class:`.PartialRowsData`
         :returns: A :class:`.PartialRowsData` convenience wrapper for consuming
-                  the streamed results.
+                  the streamed results. Iterate over it to process each row
+                  as soon as it is read, in constant memory.
+        :raises: :class:`ValueError <exceptions.ValueError>` if ``row_set``
+                 has no row keys or row ranges.
         """
         request_pb = _create_row_request(
             self.name, start_key=start_key, end_key=end_key, filter_=filter_,
-            limit=limit, end_inclusive=end_inclusive)
+            limit=limit, end_inclusive=end_inclusive, row_set=row_set)
         client = self._instance._client
-        response_iterator = client._data_stub.ReadRows(request_pb)
+        read_method = client._data_stub.ReadRows
+        response_iterator = read_method(request_pb)
         # We expect an iterator of `data_messages_v2_pb2.ReadRowsResponse`
-        return PartialRowsData(response_iterator)
+        return PartialRowsData(
+            response_iterator, read_method=read_method,
+            request_pb=request_pb, retry=retry)
 
     def mutate_rows(self, rows):
         """Mutates multiple rows in bulk.
@@ -325,6 +374,118 @@ class Table(object):
                     rows[entry.index].clear()
         return responses_statuses
 
+    def batcher(self, **kwargs):
+        """Factory to create a buffered bulk writer for this table.
+
+        :type kwargs: dict
+        :param kwargs: (Optional) Keyword arguments passed to
+                       :class:`MutationsBatcher`.
+
+        :rtype: :class:`MutationsBatcher`
+        :returns: A batcher sending mutations to this table.
+        """
+        return MutationsBatcher(self, **kwargs)
+
+    def parallel_scan(self, filter_=None, workers=_DEFAULT_SCAN_WORKERS,
+                      ordered=False, max_queued_rows=_DEFAULT_MAX_QUEUED_ROWS,
+                      retry=DEFAULT_RETRY_READ_ROWS):
+        """Read the whole table in concurrent streams.
+
+        The table is split into contiguous row ranges at the keys returned
+        by :meth:`sample_row_keys`, and each range is read by a
+        :meth:`read_rows` stream on a pool of ``workers`` threads.  Rows are
+        passed from the streams to the caller through bounded queues, so
+        streams are held back (rather than rows accumulated) when the caller
+        is slower than them.
+
+        Closing the returned iterator early (e.g. by breaking out of a loop
+        over it) cancels the streams.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter to apply to the contents of the
+                        rows. If unset, reads every column in each row.
+
+        :type workers: int
+        :param workers: (Optional) The number of concurrent streams.
+
+        :type ordered: bool
+        :param ordered: (Optional) Whether rows are yielded in order by row
+                        key.  Otherwise (the default), rows are yielded as
+                        soon as any stream reads them.
+
+        :type max_queued_rows: int
+        :param max_queued_rows: (Optional) The maximum number of rows read
+                                ahead of the caller (per stream, if
+                                ``ordered``).
+
+        :type retry: :class:`~google.api.core.retry.Retry`
+        :param retry: (Optional) How to retry a stream failing partway
+                      through.  See :meth:`read_rows`.
+
+        :rtype: iterator
+        :returns: The :class:`.PartialRowData` of each row.
+        """
+        split_keys = [response.row_key for response in self.sample_row_keys()]
+        reads = [
+            {'start_key': start_key, 'end_key': end_key, 'filter_': filter_,
+             'retry': retry}
+            for start_key, end_key in _split_key_ranges(split_keys)]
+        return _scan_in_parallel(
+            self, reads, workers, ordered, max_queued_rows)
+
+    def read_rows_multi(self, row_keys, filter_=None,
+                        workers=_DEFAULT_SCAN_WORKERS, ordered=False,
+                        keys_per_request=_DEFAULT_KEYS_PER_REQUEST,
+                        max_queued_rows=_DEFAULT_MAX_QUEUED_ROWS,
+                        retry=DEFAULT_RETRY_READ_ROWS):
+        """Read many rows from this table, given their keys.
+
+        The keys are sorted and split into chunks of ``keys_per_request``
+        keys, and each chunk is read by a :meth:`read_rows` stream on a pool
+        of ``workers`` threads (see :meth:`parallel_scan`).  Keys of rows
+        which do not exist are skipped.
+
+        :type row_keys: list
+        :param row_keys: List or other iterable of row keys (bytes) to read.
+                         Duplicated keys are read once.
+
+        :type filter_: :class:`.RowFilter`
+        :param filter_: (Optional) The filter to apply to the contents of the
+                        rows. If unset, reads every column in each row.
+
+        :type workers: int
+        :param workers: (Optional) The number of concurrent streams.
+
+        :type ordered: bool
+        :param ordered: (Optional) Whether rows are yielded in order by row
+                        key.  Otherwise (the default), rows are yielded as
+                        soon as any stream reads them.
+
+        :type keys_per_request: int
+        :param keys_per_request: (Optional) The maximum number of row keys
+                                 per ``ReadRows`` request.
+
+        :type max_queued_rows: int
+        :param max_queued_rows: (Optional) The maximum number of rows read
+                                ahead of the caller (per stream, if
+                                ``ordered``).
+
+        :type retry: :class:`~google.api.core.retry.Retry`
+        :param retry: (Optional) How to retry a stream failing partway
+                      through.  See :meth:`read_rows`.
+
+        :rtype: iterator
+        :returns: The :class:`.PartialRowData` of each row.
+        """
+        row_keys = sorted(set(_to_bytes(row_key) for row_key in row_keys))
+        reads = []
+        for index in six.moves.xrange(0, len(row_keys), keys_per_request):
+            row_set = RowSet(row_keys=row_keys[index:index + keys_per_request])
+            reads.append(
+                {'row_set': row_set, 'filter_': filter_, 'retry': retry})
+        return _scan_in_parallel(
+            self, reads, workers, ordered, max_queued_rows)
+
     def sample_row_keys(self):
         """Read a sample of row keys in the table.
 
@@ -363,8 +524,473 @@ class Table(object):
         return response_iterator
 
 
+class MutationsBatcher(object):
+    """Apply row mutations in buffered, concurrent ``MutateRows`` calls.
+
+    Rows passed to :meth:`mutate` (from any number of threads) are
+    buffered, and the buffer is sent when it holds ``max_mutations``
+    mutations or ``max_bytes`` bytes of entries, or when its oldest row
+    has waited ``max_latency`` seconds.  Up to ``max_concurrent`` requests
+    run at once; :meth:`mutate` blocks while ``2 * max_concurrent``
+    batches are waiting to be sent.
+
+    Entries failing with a retryable status (``ABORTED``,
+    ``DEADLINE_EXCEEDED`` or ``UNAVAILABLE``), including the entries not
+    yet reported by a ``MutateRows`` stream failing with such a status,
+    are sent again up to ``max_retries`` times; other failures are
+    returned by :meth:`flush`.
+
+    .. note::
+
+        Batches are sent concurrently, so mutations of the same row added
+        in different batches may be applied in any order.
+
+    Can be used as a context manager, flushing and closing on exit.
+
+    :type table: :class:`Table`
+    :param table: The table to mutate.
+
+    :type max_mutations: int
+    :param max_mutations: (Optional) The maximum number of mutations per
+                          request.  At most ``100,000``.
+
+    :type max_bytes: int
+    :param max_bytes: (Optional) The maximum size of the entries of a
+                      request.  A single row larger than this is sent on
+                      its own.
+
+    :type max_latency: float
+    :param max_latency: (Optional) The maximum number of seconds a row is
+                        buffered before being sent.  If ``None``, rows are
+                        only sent when a batch is full or on :meth:`flush`.
+
+    :type max_concurrent: int
+    :param max_concurrent: (Optional) The number of concurrent requests.
+
+    :type max_retries: int
+    :param max_retries: (Optional) The number of times an entry is retried.
+
+    :type retry_delay: float
+    :param retry_delay: (Optional) The number of seconds to wait before the
+                        first retry of a batch; doubled for each retry.
+    """
+
+    def __init__(self, table,
+                 max_mutations=_DEFAULT_MAX_MUTATIONS,
+                 max_bytes=_DEFAULT_MAX_BYTES,
+                 max_latency=_DEFAULT_MAX_LATENCY,
+                 max_concurrent=_DEFAULT_MAX_CONCURRENT,
+                 max_retries=_DEFAULT_MAX_RETRIES,
+                 retry_delay=_DEFAULT_RETRY_DELAY):
+        self._table = table
+        self._max_mutations = min(max_mutations, _MAX_BULK_MUTATIONS)
+        self._max_bytes = max_bytes
+        self._max_latency = max_latency
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+
+        self._lock = threading.Condition()
+        self._buffer = []
+        self._buffer_mutations = 0
+        self._buffer_bytes = 0
+        self._buffer_started = None
+        self._in_flight_rows = 0
+        self._errors = []
+        self._rows_mutated = 0
+        self._closed = False
+        self._slots = threading.BoundedSemaphore(2 * max_concurrent)
+        self._executor = futures.ThreadPoolExecutor(max_concurrent)
+        self._timer = None
+
+    @property
+    def backlog(self):
+        """The number of rows buffered or being sent.
+
+        :rtype: int
+        :returns: The number of rows not yet applied (or failed).
+        """
+        with self._lock:
+            return len(self._buffer) + self._in_flight_rows
+
+    @property
+    def rows_mutated(self):
+        """The number of rows whose mutations were applied so far.
+
+        :rtype: int
+        :returns: The number of entries accepted by the service.
+        """
+        return self._rows_mutated
+
+    def mutate(self, row):
+        """Buffer the mutations of a row, sending the buffer if it is full.
+
+        The row's mutations are copied, so the row can be cleared and
+        reused as soon as this returns.
+
+        :type row: :class:`.DirectRow`
+        :param row: The row to mutate.
+
+        :raises: :exc:`~.table.TooManyMutationsError` if the row has more
+                 than 100,000 mutations,
+                 :exc:`~.table.TableMismatchError` if the row belongs to
+                 another table,
+                 :class:`TypeError <exceptions.TypeError>` if the row is
+                 not a :class:`.DirectRow`, and
+                 :class:`ValueError <exceptions.ValueError>` if the batcher
+                 is closed.
+        """
+        entry_pb = _mutate_rows_entry(self._table.name, row)
+        num_mutations = len(entry_pb.mutations)
+        if num_mutations > _MAX_BULK_MUTATIONS:
+            raise TooManyMutationsError('Maximum number of mutations is %s' %
+                                        (_MAX_BULK_MUTATIONS,))
+        pending = _PendingEntry(
+            row, entry_pb, num_mutations, entry_pb.ByteSize())
+
+        batches = []
+        with self._lock:
+            if self._closed:
+                raise ValueError('Batcher is closed.')
+            if self._buffer and (
+                    self._buffer_mutations + num_mutations >
+                    self._max_mutations or
+                    self._buffer_bytes + pending.size > self._max_bytes):
+                batches.append(self._take_batch())
+            self._buffer.append(pending)
+            self._buffer_mutations += num_mutations
+            self._buffer_bytes += pending.size
+            if len(self._buffer) == 1:
+                self._buffer_started = time.time()
+                self._start_timer()
+            if (self._buffer_mutations >= self._max_mutations or
+                    self._buffer_bytes >= self._max_bytes):
+                batches.append(self._take_batch())
+
+        for batch in batches:
+            self._send(batch)
+
+    def mutate_rows(self, rows):
+        """Buffer the mutations of several rows.
+
+        :type rows: list
+        :param rows: List or other iterable of :class:`.DirectRow`
+                     instances.  See :meth:`mutate`.
+        """
+        for row in rows:
+            self.mutate(row)
+
+    def flush(self):
+        """Send the buffered rows, and wait for all batches to complete.
+
+        :rtype: list of tuples
+        :returns: One ``(row, status)`` pair per row which could not be
+                  mutated since the last call, where ``status`` is the
+                  ``google.rpc.status_pb2.Status`` of its last attempt.
+        """
+        with self._lock:
+            batch = self._take_batch() if self._buffer else None
+        if batch is not None:
+            self._send(batch)
+
+        with self._lock:
+            while self._in_flight_rows:
+                self._lock.wait()
+            errors, self._errors = self._errors, []
+        return errors
+
+    def close(self):
+        """Flush the buffered rows, and stop accepting new ones.
+
+        :rtype: list of tuples
+        :returns: The rows which could not be mutated (see :meth:`flush`).
+        """
+        with self._lock:
+            if self._closed:
+                return []
+            self._closed = True
+            self._lock.notify_all()
+        try:
+            return self.flush()
+        finally:
+            self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _start_timer(self):
+        """Start the thread flushing rows after ``max_latency``, if needed.
+
+        Must be called with the lock held.
+        """
+        if self._max_latency is None:
+            return
+        if self._timer is None:
+            self._timer = threading.Thread(target=self._flush_periodically)
+            self._timer.daemon = True
+            self._timer.start()
+        else:
+            self._lock.notify_all()
+
+    def _flush_periodically(self):
+        """Send the buffer once its oldest row is ``max_latency`` old.
+
+        Runs on the timer thread until the batcher is closed.
+        """
+        while True:
+            batch = None
+            with self._lock:
+                if self._closed:
+                    return
+                if not self._buffer:
+                    self._lock.wait()
+                    continue
+                age = time.time() - self._buffer_started
+                if age >= self._max_latency:
+                    batch = self._take_batch()
+                else:
+                    self._lock.wait(self._max_latency - age)
+
+            if batch is not None:
+                self._send(batch)
+
+    def _take_batch(self):
+        """Empty the buffer.
+
+        Must be called with the lock held.
+
+        :rtype: list
+        :returns: The buffered :class:`_PendingEntry` instances.
+        """
+        batch = self._buffer
+        self._in_flight_rows += len(batch)
+        self._buffer = []
+        self._buffer_mutations = 0
+        self._buffer_bytes = 0
+        self._buffer_started = None
+        return batch
+
+    def _send(self, batch):
+        """Schedule a batch of entries, blocking while too many are pending.
+
+        :type batch: list
+        :param batch: The :class:`_PendingEntry` instances to send.
+        """
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(self._mutate_batch, batch)
+        except Exception:
+            # The entries were counted as in flight by ``_take_batch``, so
+            # ``flush`` would wait for them forever.
+            self._slots.release()
+            with self._lock:
+                self._in_flight_rows -= len(batch)
+                self._lock.notify_all()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+
+    def _mutate_batch(self, batch):
+        """Send a batch of entries, retrying entries which failed transiently.
+
+        Runs on a worker thread.
+
+        :type batch: list
+        :param batch: The :class:`_PendingEntry` instances to send.
+        """
+        errors = []
+        try:
+            self._mutate_with_retries(batch, errors)
+        finally:
+            with self._lock:
+                self._in_flight_rows -= len(batch)
+                self._rows_mutated += len(batch) - len(errors)
+                self._errors.extend(errors)
+                self._lock.notify_all()
+
+    def _mutate_with_retries(self, batch, errors):
+        """Send entries until applied, failed, or out of retries.
+
+        :type batch: list
+        :param batch: The :class:`_PendingEntry` instances to send.
+
+        :type errors: list
+        :param errors: Collects the ``(row, status)`` pairs of the rows
+                       which could not be mutated.
+        """
+        attempt = 0
+        while batch:
+            statuses = self._mutate_once(batch)
+            retry = []
+            for pending, status in zip(batch, statuses):
+                if status.code == 0:
+                    continue
+                if (attempt < self._max_retries and
+                        status.code in _RETRYABLE_MUTATION_CODES):
+                    retry.append(pending)
+                else:
+                    errors.append((pending.row, status))
+
+            batch = retry
+            if batch:
+                time.sleep(self._retry_delay * 2 ** attempt)
+                attempt += 1
+
+    def _mutate_once(self, batch):
+        """Send one ``MutateRows`` request.
+
+        :type batch: list
+        :param batch: The :class:`_PendingEntry` instances to send.
+
+        :rtype: list
+        :returns: The ``google.rpc.status_pb2.Status`` of each entry.  If
+                  the call fails, entries not yet reported get its status.
+        """
+        request_pb = data_messages_v2_pb2.MutateRowsRequest(
+            table_name=self._table.name,
+            entries=[pending.entry_pb for pending in batch])
+        client = self._table._instance._client
+        statuses = [None] * len(batch)
+        try:
+            for response in client._data_stub.MutateRows(request_pb):
+                for entry in response.entries:
+                    statuses[entry.index] = entry.status
+        except grpc.RpcError as exc:
+            failed = status_pb2.Status(
+                code=exc.code().value[0], message=exc.details())
+        except Exception as exc:  # pylint: disable=broad-except
+            failed = status_pb2.Status(
+                code=grpc.StatusCode.UNKNOWN.value[0], message=str(exc))
+        else:
+            failed = status_pb2.Status(
+                code=grpc.StatusCode.UNKNOWN.value[0],
+                message='No status returned for the entry.')
+        return [failed if status is None else status for status in statuses]
+
+
+def _split_key_ranges(split_keys):
+    """Split the table into contiguous row ranges.
+
+    :type split_keys: list
+    :param split_keys: Row keys, as returned by :meth:`Table.sample_row_keys`.
+                       The empty key stands for the end of the table.
+
+    :rtype: list
+    :returns: ``(start_key, end_key)`` pairs, covering the whole table in
+              order, where ``None`` stands for the start or end of the
+              table.
+    """
+    keys = sorted(set(key for key in split_keys if key))
+    bounds = [None] + keys + [None]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _scan_in_parallel(table, reads, workers, ordered, max_queued_rows):
+    """Read disjoint sets of rows of a table concurrently.
+
+    See :meth:`Table.parallel_scan`.
+
+    :type table: :class:`Table`
+    :param table: The table to read.
+
+    :type reads: list
+    :param reads: The keyword arguments of each :meth:`Table.read_rows`
+                  call, in order by row key.
+
+    :type workers: int
+    :param workers: The number of concurrent streams.
+
+    :type ordered: bool
+    :param ordered: Whether rows are yielded in order by row key.
+
+    :type max_queued_rows: int
+    :param max_queued_rows: The size of each queue.
+
+    :rtype: iterator
+    :returns: The :class:`.PartialRowData` of each row.
+    """
+    stopped = threading.Event()
+
+    def scan(read_kwargs, rows_queue):
+        if stopped.is_set():
+            return
+        error = None
+        try:
+            rows_iter = iter(table.read_rows(**read_kwargs))
+            try:
+                for row in rows_iter:
+                    if not _put_unless_stopped(rows_queue, row, stopped):
+                        break
+            finally:
+                rows_iter.close()
+        except Exception as exc:  # pylint: disable=broad-except
+            error = exc
+        _put_unless_stopped(rows_queue, _ScanDone(error), stopped)
+
+    if ordered:
+        queues = [six.moves.queue.Queue(max_queued_rows) for _ in reads]
+    else:
+        queues = [six.moves.queue.Queue(max_queued_rows)] * len(reads)
+
+    executor = futures.ThreadPoolExecutor(workers)
+    try:
+        for read_kwargs, rows_queue in zip(reads, queues):
+            executor.submit(scan, read_kwargs, rows_queue)
+
+        # In ordered mode, streams are read one queue after the other; in
+        # unordered mode, the shared queue is read until all are done.
+        for rows_queue in queues:
+            while True:
+                item = rows_queue.get()
+                if isinstance(item, _ScanDone):
+                    if item.error is not None:
+                        raise item.error
+                    break
+                yield item
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False)
+
+
+class _ScanDone(object):
+    """Marks the end of the rows of a stream in :func:`_scan_in_parallel`.
+
+    :type error: :class:`Exception`
+    :param error: The error which ended reading the stream, if any.
+    """
+
+    def __init__(self, error=None):
+        self.error = error
+
+
+def _put_unless_stopped(rows_queue, item, stopped):
+    """Put an item in a bounded queue, unless the reader stops first.
+
+    :type rows_queue: :class:`~six.moves.queue.Queue`
+    :param rows_queue: The queue.
+
+    :type item: object
+    :param item: The item to put.
+
+    :type stopped: :class:`threading.Event`
+    :param stopped: Set once the queue's reader stopped.
+
+    :rtype: bool
+    :returns: True if the item was put, False if the reader stopped.
+    """
+    while not stopped.is_set():
+        try:
+            rows_queue.put(item, timeout=_QUEUE_POLL_INTERVAL)
+        except six.moves.queue.Full:
+            continue
+        return True
+    return False
+
+
 def _create_row_request(table_name, row_key=None, start_key=None, end_key=None,
-                        filter_=None, limit=None, end_inclusive=False):
+                        filter_=None, limit=None, end_inclusive=False,
+                        row_set=None):
     """Creates a request to read rows in a table.
 
     :type table_name: str
@@ -396,16 +1022,29 @@ def _create_row_request(table_name, row_key=None, start_key=None, end_key=None,
     :param end_inclusive: (Optional) Whether the ``end_key`` should be
                   considered inclusive. The default is False (exclusive).
 
+    :type row_set: :class:`.RowSet`
+    :param row_set: (Optional) The row keys and row ranges to read.
+
     :rtype: :class:`data_messages_v2_pb2.ReadRowsRequest`
     :returns: The ``ReadRowsRequest`` protobuf corresponding to the inputs.
-    :raises: :class:`ValueError <exceptions.ValueError>` if both
-             ``row_key`` and one of ``start_key`` and ``end_key`` are set
+    :raises: :class:`ValueError <exceptions.ValueError>` if more than one
+             of ``row_key``, ``row_set`` and a range (``start_key`` or
+             ``end_key``) are set, or if ``row_set`` is empty
     """
     request_kwargs = {'table_name': table_name}
     if (row_key is not None and
             (start_key is not None or end_key is not None)):
         raise ValueError('Row key and row range cannot be '
                          'set simultaneously')
+    if (row_set is not None and
+            (row_key is not None or start_key is not None or
+             end_key is not None)):
+        raise ValueError('Row set cannot be set simultaneously with '
+                         'a row key or row range')
+    if (row_set is not None and
+            not row_set.row_keys and not row_set.row_ranges):
+        # The service would read the whole table.
+        raise ValueError('Row set must have a row key or row range')
     range_kwargs = {}
     if start_key is not None or end_key is not None:
         if start_key is not None:
@@ -419,6 +1058,8 @@ def _create_row_request(table_name, row_key=None, start_key=None, end_key=None,
         request_kwargs['filter'] = filter_.to_pb()
     if limit is not None:
         request_kwargs['rows_limit'] = limit
+    if row_set is not None:
+        request_kwargs['rows'] = row_set.to_pb()
 
     message = data_messages_v2_pb2.ReadRowsRequest(**request_kwargs)
 
@@ -448,21 +1089,38 @@ def _mutate_rows_request(table_name, rows):
     request_pb = data_messages_v2_pb2.MutateRowsRequest(table_name=table_name)
     mutations_count = 0
     for row in rows:
-        _check_row_table_name(table_name, row)
-        _check_row_type(row)
-        entry = request_pb.entries.add()
-        entry.row_key = row.row_key
-        # NOTE: Since `_check_row_type` has verified `row` is a `DirectRow`,
-        #  the mutations have no state.
-        for mutation in row._get_mutations(None):
-            mutations_count += 1
-            entry.mutations.add().CopyFrom(mutation)
+        entry = _mutate_rows_entry(table_name, row)
+        mutations_count += len(entry.mutations)
+        request_pb.entries.extend([entry])
     if mutations_count > _MAX_BULK_MUTATIONS:
         raise TooManyMutationsError('Maximum number of mutations is %s' %
                                     (_MAX_BULK_MUTATIONS,))
     return request_pb
 
 
+def _mutate_rows_entry(table_name, row):
+    """Creates the entry of a ``MutateRowsRequest`` for a row.
+
+    :type table_name: str
+    :param table_name: The name of the table to write to.
+
+    :type row: :class:`.DirectRow`
+    :param row: The row to mutate.
+
+    :rtype: :class:`data_messages_v2_pb2.MutateRowsRequest.Entry`
+    :returns: The entry holding a copy of the row's mutations.
+    :raises: :exc:`~.table.TableMismatchError` if the row does not belong to
+             the table, and :class:`TypeError <exceptions.TypeError>` if it
+             is not a :class:`.DirectRow`.
+    """
+    _check_row_table_name(table_name, row)
+    _check_row_type(row)
+    # NOTE: Since `_check_row_type` has verified `row` is a `DirectRow`,
+    #  the mutations have no state.
+    return data_messages_v2_pb2.MutateRowsRequest.Entry(
+        row_key=row.row_key, mutations=row._get_mutations(None))
+
+
 def _check_row_table_name(table_name, row):
     """Checks that a row belongs to a table.
 
@@ -0,0 +1,186 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+
+class TestChannelPool(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.channel_pool import ChannelPool
+
+        return ChannelPool
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def test_constructor_defaults(self):
+        from google.cloud.bigtable.channel_pool import ROUND_ROBIN
+
+        stubs = [_Stub(), _Stub()]
+        pool = self._make_one(stubs)
+        self.assertEqual(pool._stubs, stubs)
+        self.assertEqual(len(pool), 2)
+        self.assertEqual(pool.policy, ROUND_ROBIN)
+        self.assertEqual(pool.in_flight, [0, 0])
+        self.assertEqual(pool.calls, [0, 0])
+
+    def test_constructor_no_stubs(self):
+        with self.assertRaises(ValueError):
+            self._make_one([])
+
+    def test_constructor_bad_policy(self):
+        with self.assertRaises(ValueError):
+            self._make_one([_Stub()], policy='random')
+
+    def test_private_attribute(self):
+        pool = self._make_one([_Stub()])
+        with self.assertRaises(AttributeError):
+            getattr(pool, '_missing')
+
+    def test_unary_round_robin(self):
+        stubs = [_Stub(), _Stub(), _Stub()]
+        pool = self._make_one(stubs)
+
+        results = [pool.MutateRow(index, key='value') for index in range(4)]
+
+        self.assertEqual(results, [
+            (stubs[0], 'MutateRow', (0,), {'key': 'value'}),
+            (stubs[1], 'MutateRow', (1,), {'key': 'value'}),
+            (stubs[2], 'MutateRow', (2,), {'key': 'value'}),
+            (stubs[0], 'MutateRow', (3,), {'key': 'value'}),
+        ])
+        self.assertEqual(pool.in_flight, [0, 0, 0])
+        self.assertEqual(pool.calls, [2, 1, 1])
+
+    def test_unary_failure(self):
+        pool = self._make_one([_Stub(error=ValueError('Failed'))])
+
+        with self.assertRaises(ValueError):
+            pool.CheckAndMutateRow(None)
+
+        self.assertEqual(pool.in_flight, [0])
+        self.assertEqual(pool.calls, [1])
+
+    def test_stream_in_flight_until_exhausted(self):
+        stream = _Stream(['a', 'b'])
+        pool = self._make_one([_Stub(stream)])
+
+        result = pool.ReadRows(None)
+        self.assertEqual(pool.in_flight, [1])
+        self.assertEqual(next(result), 'a')
+        self.assertEqual(pool.in_flight, [1])
+        self.assertEqual(list(result), ['b'])
+        self.assertEqual(pool.in_flight, [0])
+
+    def test_stream_cancel(self):
+        stream = _Stream(['a', 'b'])
+        pool = self._make_one([_Stub(stream)])
+
+        result = pool.MutateRows(None)
+        result.cancel()
+        result.cancel()
+
+        self.assertTrue(stream.cancelled)
+        self.assertEqual(pool.in_flight, [0])
+
+    def test_stream_error(self):
+        stream = _Stream([], error=ValueError('Failed'))
+        pool = self._make_one([_Stub(stream)])
+
+        result = pool.SampleRowKeys(None)
+        with self.assertRaises(ValueError):
+            list(result)
+
+        self.assertEqual(pool.in_flight, [0])
+
+    def test_stream_attributes(self):
+        stream = _Stream([])
+        pool = self._make_one([_Stub(stream)])
+
+        result = pool.ReadRows(None)
+
+        self.assertEqual(result.code(), 'OK')
+        with self.assertRaises(AttributeError):
+            getattr(result, '_missing')
+
+    def test_stream_dropped(self):
+        pool = self._make_one([_Stub(_Stream(['a']))])
+
+        pool.ReadRows(None)
+
+        self.assertEqual(pool.in_flight, [0])
+
+    def test_least_in_flight(self):
+        from google.cloud.bigtable.channel_pool import LEAST_IN_FLIGHT
+
+        stubs = [_Stub(_Stream(['a'])), _Stub(_Stream(['b'])),
+                 _Stub(_Stream(['c']))]
+        pool = self._make_one(stubs, policy=LEAST_IN_FLIGHT)
+
+        first = pool.ReadRows(None)
+        second = pool.ReadRows(None)
+        self.assertEqual(pool.in_flight, [1, 1, 0])
+        self.assertEqual(list(first), ['a'])
+        self.assertEqual(pool.in_flight, [0, 1, 0])
+        third = pool.ReadRows(None)
+        self.assertEqual(pool.in_flight, [1, 1, 0])
+        self.assertEqual(pool.calls, [2, 1, 0])
+        self.assertEqual(list(second), ['b'])
+        self.assertEqual(list(third), [])
+        self.assertEqual(pool.in_flight, [0, 0, 0])
+
+
+class _Stub(object):
+
+    def __init__(self, result=None, error=None):
+        self._result = result
+        self._error = error
+
+    def __getattr__(self, name):
+        def method(*args, **kwargs):
+            if self._error is not None:
+                raise self._error
+            if self._result is not None:
+                return self._result
+            return self, name, args, kwargs
+        return method
+
+
+class _Stream(object):
+
+    def __init__(self, values, error=None):
+        self._values = list(values)
+        self._error = error
+        self.cancelled = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._values:
+            return self._values.pop(0)
+        if self._error is not None:
+            raise self._error
+        raise StopIteration
+
+    next = __next__
+
+    def cancel(self):
+        self.cancelled = True
+
+    def code(self):
+        return 'OK'
@@ -80,6 +80,35 @@ class Test__make_data_stub(unittest.TestCase):
             ),
         ])
 
+    @mock.patch('google.cloud.bigtable.client.make_secure_stub',
+                side_effect=[mock.sentinel.stub1, mock.sentinel.stub2])
+    def test_with_channel_pool(self, make_stub):
+        from google.cloud.bigtable import client as MUT
+        from google.cloud.bigtable.channel_pool import ChannelPool
+        from google.cloud.bigtable.channel_pool import LEAST_IN_FLIGHT
+
+        credentials = _make_credentials()
+        user_agent = 'you-sir-age-int'
+        client = _Client(credentials, user_agent, channel_pool_size=2,
+                         channel_pool_policy=LEAST_IN_FLIGHT)
+
+        result = self._call_fut(client)
+        self.assertIsInstance(result, ChannelPool)
+        self.assertEqual(result._stubs,
+                         [mock.sentinel.stub1, mock.sentinel.stub2])
+        self.assertEqual(result.policy, LEAST_IN_FLIGHT)
+        make_stub.assert_has_calls([
+            mock.call(
+                client.credentials,
+                client.user_agent,
+                MUT.bigtable_pb2.BigtableStub,
+                MUT.DATA_API_HOST,
+                extra_options=MUT._GRPC_MAX_LENGTH_OPTIONS + (
+                    (MUT._GRPC_CHANNEL_INDEX_OPTION, index),),
+            )
+            for index in range(2)
+        ])
+
 
 class Test__make_instance_stub(unittest.TestCase):
 
@@ -444,6 +473,10 @@ class TestClient(unittest.TestCase):
         self.assertEqual(new_client._credentials, client._credentials)
         self.assertEqual(new_client.project, client.project)
         self.assertEqual(new_client.user_agent, client.user_agent)
+        self.assertEqual(new_client.channel_pool_size,
+                         client.channel_pool_size)
+        self.assertEqual(new_client.channel_pool_policy,
+                         client.channel_pool_policy)
         # Make sure stubs are not preserved.
         self.assertIs(client._data_stub, mock.sentinel.data_stub1)
         self.assertIs(new_client._data_stub, mock.sentinel.data_stub2)
@@ -475,6 +508,9 @@ class TestClient(unittest.TestCase):
     def test_copy_read_only(self):
         self._copy_test_helper(read_only=True)
 
+    def test_copy_channel_pool(self):
+        self._copy_test_helper(channel_pool_size=3)
+
     def test_credentials_getter(self):
         credentials = _make_credentials()
         project = 'PROJECT'
@@ -482,6 +518,27 @@ class TestClient(unittest.TestCase):
             project=project, credentials=credentials)
         self.assertIs(client.credentials, credentials.with_scopes.return_value)
 
+    def test_constructor_channel_pool(self):
+        from google.cloud.bigtable.channel_pool import LEAST_IN_FLIGHT
+
+        credentials = _make_credentials()
+        client = self._make_one_with_mocks(
+            project=self.PROJECT, credentials=credentials,
+            channel_pool_size=4, channel_pool_policy=LEAST_IN_FLIGHT)
+        self.assertEqual(client.channel_pool_size, 4)
+        self.assertEqual(client.channel_pool_policy, LEAST_IN_FLIGHT)
+
+    def test_data_channel_pool(self):
+        from google.cloud.bigtable.channel_pool import ChannelPool
+
+        credentials = _make_credentials()
+        client = self._make_one_with_mocks(
+            project=self.PROJECT, credentials=credentials)
+        self.assertIsNone(client.data_channel_pool)
+
+        client._data_stub = ChannelPool([object(), object()])
+        self.assertIs(client.data_channel_pool, client._data_stub)
+
     def test_project_name_property(self):
         credentials = _make_credentials()
         project = 'PROJECT'
@@ -650,7 +707,10 @@ class TestClient(unittest.TestCase):
 
 class _Client(object):
 
-    def __init__(self, credentials, user_agent, emulator_host=None):
+    def __init__(self, credentials, user_agent, emulator_host=None,
+                 channel_pool_size=1, channel_pool_policy='round_robin'):
         self.credentials = credentials
         self.user_agent = user_agent
         self.emulator_host = emulator_host
+        self.channel_pool_size = channel_pool_size
+        self.channel_pool_policy = channel_pool_policy
@@ -15,6 +15,7 @@
 
 import unittest
 
+import grpc
 import mock
 
 
@@ -95,6 +96,44 @@ class TestCell(unittest.TestCase):
         self.assertNotEqual(cell1, cell2)
 
 
+class TestPartialCellData(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.row_data import PartialCellData
+
+        return PartialCellData
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def test_constructor(self):
+        cell = self._make_one(b'RK', u'A', b'C', 100, labels=['L'],
+                              value=b'V')
+        self.assertEqual(cell.row_key, b'RK')
+        self.assertEqual(cell.family_name, u'A')
+        self.assertEqual(cell.qualifier, b'C')
+        self.assertEqual(cell.timestamp_micros, 100)
+        self.assertEqual(cell.labels, ['L'])
+        self.assertEqual(cell.value, b'V')
+
+    def test_append_value(self):
+        cell = self._make_one(b'RK', u'A', b'C', 100, value=b'V1')
+        cell.append_value(b'V2')
+        cell.append_value(b'V3')
+        self.assertEqual(cell._chunks, [b'V1', b'V2', b'V3'])
+        self.assertEqual(cell.value, b'V1V2V3')
+        self.assertEqual(cell._chunks, [b'V1V2V3'])
+        cell.append_value(b'V4')
+        self.assertEqual(cell.value, b'V1V2V3V4')
+
+    def test_value_setter(self):
+        cell = self._make_one(b'RK', u'A', b'C', 100, value=b'V1')
+        cell.append_value(b'V2')
+        cell.value = b'V'
+        self.assertEqual(cell.value, b'V')
+
+
 class TestPartialRowData(unittest.TestCase):
 
     @staticmethod
@@ -269,6 +308,158 @@ class TestPartialRowsData(unittest.TestCase):
         partial_rows_data.cancel()
         self.assertEqual(response_iterator.cancel_calls, 1)
 
+    @staticmethod
+    def _row_response(*row_keys, **kw):
+        commit_row = kw.pop('commit_row', True)
+        chunks = _generate_cell_chunks([
+            'row_key: "%s" family_name { value: "A" } '
+            'qualifier { value: "C" } timestamp_micros: 100 '
+            'value: "value" commit_row: %s' % (
+                row_key, 'true' if commit_row else 'false')
+            for row_key in row_keys])
+        return _ReadRowsResponseV2(chunks)
+
+    def test___iter__(self):
+        iterator = _MockCancellableIterator(
+            self._row_response('RK1', 'RK2'), self._row_response('RK3'))
+        prd = self._make_one(iterator)
+
+        rows = iter(prd)
+        first = next(rows)
+        self.assertEqual(first.row_key, b'RK1')
+        self.assertEqual(first.cells[u'A'][b'C'][0].value, b'value')
+        # The second response is only read once the first one's rows are.
+        self.assertEqual(len(list(iterator.iter_values)), 1)
+        self.assertEqual(next(rows).row_key, b'RK2')
+        self.assertEqual(prd.rows, {})
+
+    def test___iter___all_responses(self):
+        iterator = _MockCancellableIterator(
+            self._row_response('RK1', 'RK2'), self._row_response('RK3'))
+        prd = self._make_one(iterator)
+
+        row_keys = [row.row_key for row in prd]
+
+        self.assertEqual(row_keys, [b'RK1', b'RK2', b'RK3'])
+        self.assertEqual(prd.rows, {})
+        self.assertEqual(iterator.cancel_calls, 0)
+
+    def test___iter___partial_row(self):
+        iterator = _MockCancellableIterator(
+            self._row_response('RK1'),
+            self._row_response('RK2', commit_row=False))
+        prd = self._make_one(iterator)
+        rows = iter(prd)
+
+        self.assertEqual(next(rows).row_key, b'RK1')
+        with self.assertRaises(ValueError):
+            next(rows)
+
+    def test___iter___close_cancels(self):
+        iterator = _MockCancellableIterator(
+            self._row_response('RK1'), self._row_response('RK2'))
+        prd = self._make_one(iterator)
+
+        rows = iter(prd)
+        self.assertEqual(next(rows).row_key, b'RK1')
+        rows.close()
+
+        self.assertEqual(iterator.cancel_calls, 1)
+
+    def _make_retrying(self, *streams, **kw):
+        from google.cloud.bigtable._generated import (
+            bigtable_pb2 as messages_v2_pb2)
+
+        request_pb = kw.pop(
+            'request_pb', messages_v2_pb2.ReadRowsRequest(table_name='t'))
+        requests = []
+
+        def read_method(request):
+            requests.append(request)
+            return streams[len(requests)]
+
+        prd = self._make_one(
+            streams[0], read_method=read_method, request_pb=request_pb, **kw)
+        return prd, requests
+
+    def test___iter___resumes_after_retryable_error(self):
+        import grpc
+
+        first = _MockCancellableIterator(
+            self._row_response('RK1'),
+            self._row_response('RK2', commit_row=False),
+            _MockRpcError(grpc.StatusCode.UNAVAILABLE))
+        second = _MockCancellableIterator(self._row_response('RK2', 'RK3'))
+        prd, requests = self._make_retrying(first, second)
+
+        with mock.patch('time.sleep'):
+            row_keys = [row.row_key for row in prd]
+
+        self.assertEqual(row_keys, [b'RK1', b'RK2', b'RK3'])
+        request, = requests
+        row_range, = request.rows.row_ranges
+        self.assertEqual(row_range.start_key_open, b'RK1')
+        self.assertEqual(request.table_name, 't')
+
+    def test_consume_next_resumes_after_last_scanned_row_key(self):
+        import grpc
+
+        first = _MockCancellableIterator(
+            _ReadRowsResponseV2((), last_scanned_row_key=b'RK5'),
+            _MockRpcError(grpc.StatusCode.DEADLINE_EXCEEDED))
+        second = _MockCancellableIterator(self._row_response('RK6'))
+        prd, requests = self._make_retrying(first, second)
+        prd._last_scanned_row_key = b''
+
+        prd.consume_next()
+        with mock.patch('time.sleep'):
+            prd.consume_next()
+
+        self.assertEqual(list(prd.rows), [b'RK6'])
+        self.assertEqual(
+            requests[0].rows.row_ranges[0].start_key_open, b'RK5')
+
+    def test___iter___resume_w_all_rows_read(self):
+        import grpc
+        from google.cloud.bigtable._generated import (
+            bigtable_pb2 as messages_v2_pb2)
+
+        first = _MockCancellableIterator(
+            self._row_response('RK1'),
+            _MockRpcError(grpc.StatusCode.UNAVAILABLE))
+        request_pb = messages_v2_pb2.ReadRowsRequest(rows_limit=1)
+        prd, requests = self._make_retrying(first, request_pb=request_pb)
+
+        with mock.patch('time.sleep'):
+            row_keys = [row.row_key for row in prd]
+
+        self.assertEqual(row_keys, [b'RK1'])
+        self.assertEqual(requests, [])
+
+    def test___iter___non_retryable_error(self):
+        import grpc
+
+        error = _MockRpcError(grpc.StatusCode.INVALID_ARGUMENT)
+        first = _MockCancellableIterator(self._row_response('RK1'), error)
+        prd, requests = self._make_retrying(first)
+        rows = iter(prd)
+
+        self.assertEqual(next(rows).row_key, b'RK1')
+        with self.assertRaises(_MockRpcError):
+            next(rows)
+        self.assertEqual(requests, [])
+
+    def test___iter___wo_retry(self):
+        import grpc
+
+        first = _MockCancellableIterator(
+            _MockRpcError(grpc.StatusCode.UNAVAILABLE))
+        prd, requests = self._make_retrying(first, retry=None)
+
+        with self.assertRaises(_MockRpcError):
+            list(prd)
+        self.assertEqual(requests, [])
+
     # 'consume_nest' tested via 'TestPartialRowsData_JSON_acceptance_tests'
 
     def test_consume_all(self):
@@ -295,92 +486,48 @@ class TestPartialRowsData(unittest.TestCase):
         self.assertEqual(
             list(response_iterator.iter_values), [value2, value3])
 
-    def test__copy_from_current_unset(self):
-        prd = self._make_one([])
-        chunks = _generate_cell_chunks([''])
-        chunk = chunks[0]
-        prd._copy_from_current(chunk)
-        self.assertEqual(chunk.row_key, b'')
-        self.assertEqual(chunk.family_name.value, u'')
-        self.assertEqual(chunk.qualifier.value, b'')
-        self.assertEqual(chunk.timestamp_micros, 0)
-        self.assertEqual(chunk.labels, [])
-
-    def test__copy_from_current_blank(self):
-        ROW_KEY = b'RK'
-        FAMILY_NAME = u'A'
-        QUALIFIER = b'C'
-        TIMESTAMP_MICROS = 100
-        LABELS = ['L1', 'L2']
-        prd = self._make_one([])
-        prd._cell = _PartialCellData()
-        chunks = _generate_cell_chunks([''])
-        chunk = chunks[0]
-        chunk.row_key = ROW_KEY
-        chunk.family_name.value = FAMILY_NAME
-        chunk.qualifier.value = QUALIFIER
-        chunk.timestamp_micros = TIMESTAMP_MICROS
-        chunk.labels.extend(LABELS)
-        prd._copy_from_current(chunk)
-        self.assertEqual(chunk.row_key, ROW_KEY)
-        self.assertEqual(chunk.family_name.value, FAMILY_NAME)
-        self.assertEqual(chunk.qualifier.value, QUALIFIER)
-        self.assertEqual(chunk.timestamp_micros, TIMESTAMP_MICROS)
-        self.assertEqual(chunk.labels, LABELS)
-
-    def test__copy_from_previous_unset(self):
+    def test__new_cell_first(self):
         prd = self._make_one([])
-        cell = _PartialCellData()
-        prd._copy_from_previous(cell)
-        self.assertEqual(cell.row_key, '')
-        self.assertEqual(cell.family_name, u'')
-        self.assertEqual(cell.qualifier, b'')
-        self.assertEqual(cell.timestamp_micros, 0)
-        self.assertEqual(cell.labels, [])
-
-    def test__copy_from_previous_blank(self):
-        ROW_KEY = 'RK'
-        FAMILY_NAME = u'A'
-        QUALIFIER = b'C'
-        TIMESTAMP_MICROS = 100
-        LABELS = ['L1', 'L2']
+        chunk = _generate_cell_chunks([
+            'row_key: "RK" family_name: <value: "A"> qualifier: <value: "C">'
+            ' timestamp_micros: 100 labels: "L1" value: "V"'])[0]
+        cell = prd._new_cell(chunk)
+        self.assertEqual(cell.row_key, b'RK')
+        self.assertEqual(cell.family_name, u'A')
+        self.assertEqual(cell.qualifier, b'C')
+        self.assertEqual(cell.timestamp_micros, 100)
+        self.assertEqual(list(cell.labels), ['L1'])
+        self.assertEqual(cell.value, b'V')
+
+    def test__new_cell_from_previous(self):
         prd = self._make_one([])
-        cell = _PartialCellData(
-            row_key=ROW_KEY,
-            family_name=FAMILY_NAME,
-            qualifier=QUALIFIER,
-            timestamp_micros=TIMESTAMP_MICROS,
-            labels=LABELS,
+        prd._previous_cell = _PartialCellData(
+            row_key=b'RK',
+            family_name=u'A',
+            qualifier=b'C',
+            timestamp_micros=100,
+            labels=['L1'],
         )
-        prd._previous_cell = _PartialCellData()
-        prd._copy_from_previous(cell)
-        self.assertEqual(cell.row_key, ROW_KEY)
-        self.assertEqual(cell.family_name, FAMILY_NAME)
-        self.assertEqual(cell.qualifier, QUALIFIER)
-        self.assertEqual(cell.timestamp_micros, TIMESTAMP_MICROS)
-        self.assertEqual(cell.labels, LABELS)
-
-    def test__copy_from_previous_filled(self):
-        ROW_KEY = 'RK'
-        FAMILY_NAME = u'A'
-        QUALIFIER = b'C'
-        TIMESTAMP_MICROS = 100
-        LABELS = ['L1', 'L2']
+        chunk = _generate_cell_chunks(['timestamp_micros: 50'])[0]
+        cell = prd._new_cell(chunk)
+        self.assertEqual(cell.row_key, b'RK')
+        self.assertEqual(cell.family_name, u'A')
+        self.assertEqual(cell.qualifier, b'C')
+        self.assertEqual(cell.timestamp_micros, 50)
+        self.assertEqual(list(cell.labels), [])
+
+    def test__new_cell_new_qualifier(self):
         prd = self._make_one([])
         prd._previous_cell = _PartialCellData(
-            row_key=ROW_KEY,
-            family_name=FAMILY_NAME,
-            qualifier=QUALIFIER,
-            timestamp_micros=TIMESTAMP_MICROS,
-            labels=LABELS,
+            row_key=b'RK',
+            family_name=u'A',
+            qualifier=b'C',
         )
-        cell = _PartialCellData()
-        prd._copy_from_previous(cell)
-        self.assertEqual(cell.row_key, ROW_KEY)
-        self.assertEqual(cell.family_name, FAMILY_NAME)
-        self.assertEqual(cell.qualifier, QUALIFIER)
-        self.assertEqual(cell.timestamp_micros, 0)
-        self.assertEqual(cell.labels, [])
+        chunk = _generate_cell_chunks(['qualifier: <value: "D">'])[0]
+        cell = prd._new_cell(chunk)
+        self.assertEqual(cell.row_key, b'RK')
+        self.assertEqual(cell.family_name, u'A')
+        self.assertEqual(cell.qualifier, b'D')
 
     def test__save_row_no_cell(self):
         ROW_KEY = 'RK'
@@ -419,6 +566,97 @@ class TestPartialRowsData(unittest.TestCase):
             prd.consume_next()
 
 
+class Test__retry_read_rows_exception(unittest.TestCase):
+
+    def _call_fut(self, exc):
+        from google.cloud.bigtable.row_data import _retry_read_rows_exception
+
+        return _retry_read_rows_exception(exc)
+
+    def test_retryable(self):
+        import grpc
+
+        for code in (grpc.StatusCode.ABORTED,
+                     grpc.StatusCode.DEADLINE_EXCEEDED,
+                     grpc.StatusCode.UNAVAILABLE):
+            self.assertTrue(self._call_fut(_MockRpcError(code)))
+
+    def test_not_retryable(self):
+        import grpc
+
+        self.assertFalse(
+            self._call_fut(_MockRpcError(grpc.StatusCode.NOT_FOUND)))
+        self.assertFalse(self._call_fut(ValueError('oops')))
+
+
+class Test__resume_request(unittest.TestCase):
+
+    def _call_fut(self, request_pb, resume_key, rows_read):
+        from google.cloud.bigtable.row_data import _resume_request
+
+        return _resume_request(request_pb, resume_key, rows_read)
+
+    @staticmethod
+    def _make_request(**kw):
+        from google.cloud.bigtable._generated import (
+            bigtable_pb2 as messages_v2_pb2)
+
+        return messages_v2_pb2.ReadRowsRequest(table_name='t', **kw)
+
+    def test_nothing_read(self):
+        request_pb = self._make_request(rows_limit=10)
+
+        self.assertEqual(self._call_fut(request_pb, b'', 0), request_pb)
+
+    def test_full_table(self):
+        resumed = self._call_fut(self._make_request(), b'RK1', 1)
+
+        row_range, = resumed.rows.row_ranges
+        self.assertEqual(row_range.start_key_open, b'RK1')
+        self.assertFalse(row_range.end_key_open)
+
+    def test_rows_limit(self):
+        request_pb = self._make_request(rows_limit=10)
+
+        resumed = self._call_fut(request_pb, b'RK3', 3)
+
+        self.assertEqual(resumed.rows_limit, 7)
+        self.assertEqual(request_pb.rows_limit, 10)
+        self.assertIsNone(self._call_fut(request_pb, b'RK9', 10))
+
+    def test_row_ranges(self):
+        from google.cloud.bigtable._generated import data_pb2 as data_v2_pb2
+
+        request_pb = self._make_request()
+        request_pb.rows.row_ranges.extend([
+            data_v2_pb2.RowRange(start_key_closed=b'A', end_key_open=b'C'),
+            data_v2_pb2.RowRange(start_key_closed=b'D', end_key_closed=b'F'),
+            data_v2_pb2.RowRange(start_key_open=b'G'),
+        ])
+
+        resumed = self._call_fut(request_pb, b'E', 5)
+
+        self.assertEqual(list(resumed.rows.row_ranges), [
+            data_v2_pb2.RowRange(start_key_open=b'E', end_key_closed=b'F'),
+            data_v2_pb2.RowRange(start_key_open=b'G'),
+        ])
+        self.assertEqual(
+            list(self._call_fut(request_pb, b'Z', 9).rows.row_ranges),
+            [data_v2_pb2.RowRange(start_key_open=b'Z')])
+        del request_pb.rows.row_ranges[2]
+        self.assertIsNone(self._call_fut(request_pb, b'Z', 9))
+
+    def test_row_keys(self):
+        request_pb = self._make_request()
+        request_pb.rows.row_keys.extend([b'A', b'B', b'C'])
+
+        resumed = self._call_fut(request_pb, b'A', 1)
+
+        self.assertEqual(list(resumed.rows.row_keys), [b'B', b'C'])
+        self.assertFalse(resumed.rows.row_ranges)
+        self.assertIsNone(self._call_fut(request_pb, b'C', 3))
+
+
 class TestPartialRowsData_JSON_acceptance_tests(unittest.TestCase):
 
     _json_tests = None
@@ -668,12 +906,25 @@ class _MockCancellableIterator(object):
         self.cancel_calls += 1
 
     def next(self):
-        return next(self.iter_values)
+        value = next(self.iter_values)
+        if isinstance(value, Exception):
+            raise value
+        return value
 
     def __next__(self):  # pragma: NO COVER Py3k
         return self.next()
 
 
+class _MockRpcError(grpc.RpcError):
+
+    def __init__(self, code):
+        super(_MockRpcError, self).__init__()
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
 class _PartialCellData(object):
 
     row_key = ''
@@ -0,0 +1,160 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import unittest
+
+
+class TestRowSet(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.row_set import RowSet
+
+        return RowSet
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def test_constructor_defaults(self):
+        row_set = self._make_one()
+        self.assertEqual(row_set.row_keys, [])
+        self.assertEqual(row_set.row_ranges, [])
+
+    def test_constructor(self):
+        from google.cloud.bigtable.row_set import RowRange
+
+        row_range = RowRange(b'a', b'b')
+        row_set = self._make_one(
+            row_keys=(u'key1', b'key2'), row_ranges=(row_range,))
+        self.assertEqual(row_set.row_keys, [b'key1', b'key2'])
+        self.assertEqual(row_set.row_ranges, [row_range])
+
+    def test___eq__(self):
+        row_set1 = self._make_one(row_keys=[b'key'])
+        row_set2 = self._make_one(row_keys=[b'key'])
+        self.assertEqual(row_set1, row_set2)
+
+    def test___eq__type_differ(self):
+        row_set1 = self._make_one()
+        row_set2 = object()
+        self.assertNotEqual(row_set1, row_set2)
+
+    def test___ne__same_value(self):
+        row_set1 = self._make_one(row_keys=[b'key'])
+        row_set2 = self._make_one(row_keys=[b'key'])
+        comparison_val = (row_set1 != row_set2)
+        self.assertFalse(comparison_val)
+
+    def test_add_row_key(self):
+        row_set = self._make_one()
+        row_set.add_row_key(u'key')
+        self.assertEqual(row_set.row_keys, [b'key'])
+
+    def test_add_row_range(self):
+        from google.cloud.bigtable.row_set import RowRange
+
+        row_set = self._make_one()
+        row_range = RowRange(b'a', b'b')
+        row_set.add_row_range(row_range)
+        self.assertEqual(row_set.row_ranges, [row_range])
+
+    def test_add_row_range_from_keys(self):
+        from google.cloud.bigtable.row_set import RowRange
+
+        row_set = self._make_one()
+        row_set.add_row_range_from_keys(
+            start_key=b'a', end_key=b'b', start_inclusive=False,
+            end_inclusive=True)
+        self.assertEqual(
+            row_set.row_ranges,
+            [RowRange(b'a', b'b', start_inclusive=False, end_inclusive=True)])
+
+    def test_to_pb(self):
+        from google.cloud.bigtable.row_set import RowRange
+
+        row_set = self._make_one(
+            row_keys=[b'key1', b'key2'], row_ranges=[RowRange(b'a', b'b')])
+        pb_val = row_set.to_pb()
+        expected_pb = _RowSetPB(row_keys=[b'key1', b'key2'])
+        expected_pb.row_ranges.add(start_key_closed=b'a', end_key_open=b'b')
+        self.assertEqual(pb_val, expected_pb)
+
+
+class TestRowRange(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.row_set import RowRange
+
+        return RowRange
+
+    def _make_one(self, *args, **kwargs):
+        return self._get_target_class()(*args, **kwargs)
+
+    def test_constructor_defaults(self):
+        row_range = self._make_one()
+        self.assertIsNone(row_range.start_key)
+        self.assertIsNone(row_range.end_key)
+        self.assertTrue(row_range.start_inclusive)
+        self.assertFalse(row_range.end_inclusive)
+
+    def test_constructor_converts_keys(self):
+        row_range = self._make_one(u'a', u'b')
+        self.assertEqual(row_range.start_key, b'a')
+        self.assertEqual(row_range.end_key, b'b')
+
+    def test___eq__(self):
+        row_range1 = self._make_one(b'a', b'b', end_inclusive=True)
+        row_range2 = self._make_one(b'a', b'b', end_inclusive=True)
+        self.assertEqual(row_range1, row_range2)
+
+    def test___eq__type_differ(self):
+        row_range1 = self._make_one()
+        row_range2 = object()
+        self.assertNotEqual(row_range1, row_range2)
+
+    def test___ne__(self):
+        row_range1 = self._make_one(b'a', b'b')
+        row_range2 = self._make_one(b'a', b'b', start_inclusive=False)
+        self.assertNotEqual(row_range1, row_range2)
+
+    def test_to_pb_unbounded(self):
+        row_range = self._make_one()
+        self.assertEqual(row_range.to_pb(), _RowRangePB())
+
+    def test_to_pb_closed_open(self):
+        row_range = self._make_one(b'a', b'b')
+        expected_pb = _RowRangePB(start_key_closed=b'a', end_key_open=b'b')
+        self.assertEqual(row_range.to_pb(), expected_pb)
+
+    def test_to_pb_open_closed(self):
+        row_range = self._make_one(
+            b'a', b'b', start_inclusive=False, end_inclusive=True)
+        expected_pb = _RowRangePB(start_key_open=b'a', end_key_closed=b'b')
+        self.assertEqual(row_range.to_pb(), expected_pb)
+
+
+def _RowSetPB(*args, **kw):
+    from google.cloud.bigtable._generated import (
+        data_pb2 as data_v2_pb2)
+
+    return data_v2_pb2.RowSet(*args, **kw)
+
+
+def _RowRangePB(*args, **kw):
+    from google.cloud.bigtable._generated import (
+        data_pb2 as data_v2_pb2)
+
+    return data_v2_pb2.RowRange(*args, **kw)
@@ -13,8 +13,10 @@
 # limitations under the License.
 
 
+import time
 import unittest
 
+import grpc
 import mock
 
 
@@ -488,6 +490,20 @@ class TestTable(unittest.TestCase):
 
         self.assertEqual(result, expected_result)
 
+    def test_batcher(self):
+        from google.cloud.bigtable.table import MutationsBatcher
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        table = self._make_one(self.TABLE_ID, instance)
+
+        batcher = table.batcher(max_mutations=7, max_latency=None)
+
+        self.assertIsInstance(batcher, MutationsBatcher)
+        self.assertIs(batcher._table, table)
+        self.assertEqual(batcher._max_mutations, 7)
+        self.assertIsNone(batcher._max_latency)
+        batcher.close()
 
     def test_read_rows(self):
         from google.cloud._testing import _Monkey
@@ -538,8 +554,220 @@ class TestTable(unittest.TestCase):
             'filter_': filter_obj,
             'limit': limit,
             'end_inclusive': False,
+            'row_set': None,
         }
         self.assertEqual(mock_created, [(table.name, created_kwargs)])
+        self.assertIs(result._request_pb, request_pb)
+        self.assertIs(result._retry, MUT.DEFAULT_RETRY_READ_ROWS)
+
+    def test_read_rows_w_retry(self):
+        from tests.unit._testing import _FakeStub
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        table = self._make_one(self.TABLE_ID, instance)
+        response_iterator = object()
+        client._data_stub = _FakeStub(response_iterator)
+        retry = object()
+
+        result = table.read_rows(retry=retry)
+
+        self.assertIs(result._response_iterator, response_iterator)
+        self.assertIs(result._retry, retry)
+
+    def test_read_rows_w_empty_row_set(self):
+        from tests.unit._testing import _FakeStub
+        from google.cloud.bigtable.row_set import RowSet
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        table = self._make_one(self.TABLE_ID, instance)
+        client._data_stub = stub = _FakeStub()
+
+        with self.assertRaises(ValueError):
+            table.read_rows(row_set=RowSet())
+
+        self.assertEqual(stub.method_calls, [])
+
+    def _parallel_scan_helper(self, ranges_rows, **kwargs):
+        from google.cloud.bigtable.row_data import PartialRowData
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        table = self._make_one(self.TABLE_ID, instance)
+        sample_keys = [key_range[1] or b'' for key_range in ranges_rows]
+        read_calls = []
+        closed = []
+
+        def stream(row_keys):
+            try:
+                for row_key in row_keys:
+                    yield PartialRowData(row_key)
+            finally:
+                closed.append(row_keys)
+
+        def read_rows(**read_kwargs):
+            read_calls.append(read_kwargs)
+            key_range = (read_kwargs['start_key'], read_kwargs['end_key'])
+            row_keys = ranges_rows[key_range]
+            if isinstance(row_keys, Exception):
+                raise row_keys
+            return stream(row_keys)
+
+        table.sample_row_keys = mock.Mock(return_value=[
+            mock.Mock(row_key=key, spec=['row_key']) for key in sample_keys])
+        table.read_rows = read_rows
+        rows = table.parallel_scan(**kwargs)
+        return rows, read_calls, closed
+
+    def test_parallel_scan(self):
+        ranges_rows = {
+            (None, b'c'): [b'a', b'b'],
+            (b'c', b'f'): [b'c', b'd', b'e'],
+            (b'f', None): [b'g'],
+        }
+        filter_ = object()
+        retry = object()
+
+        rows, read_calls, _ = self._parallel_scan_helper(
+            ranges_rows, filter_=filter_, workers=2, max_queued_rows=1,
+            retry=retry)
+
+        self.assertEqual(sorted(row.row_key for row in rows),
+                         [b'a', b'b', b'c', b'd', b'e', b'g'])
+        self.assertEqual(
+            sorted((kw['start_key'] or b'', kw['end_key'] or b'~')
+                   for kw in read_calls),
+            [(b'', b'c'), (b'c', b'f'), (b'f', b'~')])
+        for read_kwargs in read_calls:
+            self.assertIs(read_kwargs['filter_'], filter_)
+            self.assertIs(read_kwargs['retry'], retry)
+
+    def test_parallel_scan_ordered(self):
+        ranges_rows = {
+            (None, b'c'): [b'a', b'b'],
+            (b'c', b'f'): [b'c', b'd', b'e'],
+            (b'f', None): [b'g', b'h'],
+        }
+
+        rows, _, _ = self._parallel_scan_helper(
+            ranges_rows, workers=3, ordered=True, max_queued_rows=1)
+
+        self.assertEqual([row.row_key for row in rows],
+                         [b'a', b'b', b'c', b'd', b'e', b'g', b'h'])
+
+    def test_parallel_scan_error(self):
+        ranges_rows = {
+            (None, b'c'): [b'a', b'b'],
+            (b'c', None): ValueError('Failed'),
+        }
+
+        rows, _, _ = self._parallel_scan_helper(ranges_rows, ordered=True)
+
+        with self.assertRaises(ValueError):
+            list(rows)
+
+    def test_parallel_scan_close_early(self):
+        ranges_rows = {
+            (None, None): [b'a', b'b', b'c', b'd'],
+        }
+
+        rows, _, closed = self._parallel_scan_helper(
+            ranges_rows, max_queued_rows=1)
+
+        self.assertEqual(next(rows).row_key, b'a')
+        rows.close()
+
+        _wait_for(lambda: closed)
+        self.assertEqual(closed, [ranges_rows[(None, None)]])
+
+    def test_parallel_scan_slow_consumer(self):
+        ranges_rows = {
+            (None, b'c'): [b'a', b'b'],
+            (b'c', None): [b'c', b'd', b'e'],
+        }
+
+        rows, _, _ = self._parallel_scan_helper(
+            ranges_rows, workers=2, ordered=True, max_queued_rows=1)
+
+        row_keys = []
+        with mock.patch(
+                'google.cloud.bigtable.table._QUEUE_POLL_INTERVAL',
+                new=0.001):
+            for row in rows:
+                row_keys.append(row.row_key)
+                # Let the streams time out on their full queues.
+                time.sleep(0.02)
+
+        self.assertEqual(row_keys, [b'a', b'b', b'c', b'd', b'e'])
+
+    def test_parallel_scan_close_before_queued_scans(self):
+        from concurrent import futures
+
+        ranges_rows = {
+            (None, b'c'): [b'a', b'b', b'c'],
+            (b'c', b'f'): [b'd'],
+            (b'f', None): [b'g'],
+        }
+        executor_class = futures.ThreadPoolExecutor
+        executors = []
+
+        def make_executor(workers):
+            executor = executor_class(workers)
+            executors.append(executor)
+            return executor
+
+        rows, read_calls, closed = self._parallel_scan_helper(
+            ranges_rows, workers=1, ordered=True, max_queued_rows=1)
+        patch_executor = mock.patch(
+            'google.cloud.bigtable.table.futures.ThreadPoolExecutor',
+            new=make_executor)
+        patch_interval = mock.patch(
+            'google.cloud.bigtable.table._QUEUE_POLL_INTERVAL', new=0.001)
+        with patch_interval:
+            with patch_executor:
+                self.assertEqual(next(rows).row_key, b'a')
+            rows.close()
+
+            executor, = executors
+            executor.shutdown(wait=True)
+
+        self.assertEqual(len(read_calls), 1)
+        self.assertEqual(closed, [ranges_rows[(None, b'c')]])
+
+    def test_read_rows_multi(self):
+        from google.cloud.bigtable.row_data import PartialRowData
+
+        client = _Client()
+        instance = _Instance(self.INSTANCE_NAME, client=client)
+        table = self._make_one(self.TABLE_ID, instance)
+        read_calls = []
+        filter_ = object()
+        retry = object()
+
+        def read_rows(**read_kwargs):
+            read_calls.append(read_kwargs)
+            return (PartialRowData(row_key)
+                    for row_key in read_kwargs['row_set'].row_keys
+                    if row_key != b'missing')
+
+        table.read_rows = read_rows
+        rows = table.read_rows_multi(
+            [b'd', u'a', b'missing', b'c', b'a', b'b'], filter_=filter_,
+            ordered=True, keys_per_request=2, retry=retry)
+
+        self.assertEqual([row.row_key for row in rows],
+                         [b'a', b'b', b'c', b'd'])
+        self.assertEqual(
+            sorted(kw['row_set'].row_keys for kw in read_calls),
+            [[b'a', b'b'], [b'c', b'd'], [b'missing']])
+        for read_kwargs in read_calls:
+            self.assertIs(read_kwargs['filter_'], filter_)
+            self.assertIs(read_kwargs['retry'], retry)
+
+    def test_read_rows_multi_no_keys(self):
+        table = self._make_one(self.TABLE_ID, None)
+        self.assertEqual(list(table.read_rows_multi([])), [])
 
     def test_sample_row_keys(self):
         from tests.unit._testing import _FakeStub
@@ -570,15 +798,321 @@ class TestTable(unittest.TestCase):
         )])
 
 
+class TestMutationsBatcher(unittest.TestCase):
+
+    TABLE_NAME = 'projects/project/instances/instance/tables/table'
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigtable.table import MutationsBatcher
+
+        return MutationsBatcher
+
+    def _make_one(self, *args, **kwargs):
+        kwargs.setdefault('max_latency', None)
+        kwargs.setdefault('max_concurrent', 1)
+        kwargs.setdefault('retry_delay', 0)
+        return self._get_target_class()(*args, **kwargs)
+
+    def _make_table(self, *responses):
+        from tests.unit._testing import _FakeStub
+
+        client = _Client()
+        client._data_stub = _FakeStub(*responses)
+        table = mock.Mock(spec=['name', '_instance'])
+        table.name = self.TABLE_NAME
+        table._instance = _Instance('instance', client=client)
+        return table
+
+    @staticmethod
+    def _make_row(table, key, num_cells=1):
+        from google.cloud.bigtable.row import DirectRow
+
+        row = DirectRow(row_key=key, table=table)
+        for index in range(num_cells):
+            row.set_cell('cf', b'col%d' % (index,), b'value')
+            row.delete_cell('cf', b'old%d' % (index,))
+        return row
+
+    @staticmethod
+    def _response(*codes):
+        from google.cloud.bigtable._generated.bigtable_pb2 import (
+            MutateRowsResponse)
+        from google.rpc.status_pb2 import Status
+
+        return [MutateRowsResponse(entries=[
+            MutateRowsResponse.Entry(index=index, status=Status(code=code))
+            for index, code in enumerate(codes)])]
+
+    def test_constructor_caps_max_mutations(self):
+        from google.cloud.bigtable.table import _MAX_BULK_MUTATIONS
+
+        batcher = self._make_one(self._make_table(), max_mutations=10 ** 9)
+        self.assertEqual(batcher._max_mutations, _MAX_BULK_MUTATIONS)
+        batcher.close()
+
+    def test_mutate_copies_mutations(self):
+        table = self._make_table(self._response(0))
+        batcher = self._make_one(table)
+        row = self._make_row(table, b'row_key')
+
+        batcher.mutate(row)
+        row.clear()
+        self.assertEqual(batcher.backlog, 1)
+        self.assertEqual(batcher.flush(), [])
+
+        stub = table._instance._client._data_stub
+        (name, (request_pb,), _), = stub.method_calls
+        self.assertEqual(name, 'MutateRows')
+        self.assertEqual(request_pb.table_name, self.TABLE_NAME)
+        self.assertEqual(len(request_pb.entries), 1)
+        self.assertEqual(request_pb.entries[0].row_key, b'row_key')
+        self.assertEqual(len(request_pb.entries[0].mutations), 2)
+        self.assertEqual(batcher.rows_mutated, 1)
+        self.assertEqual(batcher.backlog, 0)
+        batcher.close()
+
+    def test_mutate_sends_full_batches(self):
+        table = self._make_table(self._response(0, 0), self._response(0))
+        batcher = self._make_one(table, max_mutations=4)
+        rows = [self._make_row(table, b'row%d' % (index,))
+                for index in range(3)]
+
+        batcher.mutate_rows(rows)
+        self.assertEqual(batcher.close(), [])
+
+        stub = table._instance._client._data_stub
+        self.assertEqual(
+            [len(args[0].entries) for _, args, _ in stub.method_calls],
+            [2, 1])
+        self.assertEqual(batcher.rows_mutated, 3)
+
+    def test_mutate_splits_by_bytes(self):
+        table = self._make_table(self._response(0), self._response(0))
+        batcher = self._make_one(table, max_bytes=1)
+
+        batcher.mutate(self._make_row(table, b'row1'))
+        batcher.mutate(self._make_row(table, b'row2'))
+        batcher.close()
+
+        stub = table._instance._client._data_stub
+        self.assertEqual(len(stub.method_calls), 2)
+
+    def test_mutate_sends_buffer_before_overflowing(self):
+        table = self._make_table(self._response(0, 0), self._response(0))
+        batcher = self._make_one(table, max_mutations=5)
+        rows = [self._make_row(table, b'row%d' % (index,))
+                for index in range(3)]
+
+        batcher.mutate_rows(rows)
+        self.assertEqual(batcher.close(), [])
+
+        stub = table._instance._client._data_stub
+        self.assertEqual(
+            [len(args[0].entries) for _, args, _ in stub.method_calls],
+            [2, 1])
+
+    def test_mutate_send_failure(self):
+        table = self._make_table()
+        batcher = self._make_one(table, max_bytes=1)
+        batcher._slots = mock.Mock(spec=['acquire', 'release'])
+        batcher._executor = mock.Mock(spec=['submit', 'shutdown'])
+        batcher._executor.submit.side_effect = RuntimeError('shut down')
+
+        with self.assertRaises(RuntimeError):
+            batcher.mutate(self._make_row(table, b'row_key'))
+
+        batcher._slots.acquire.assert_called_once_with()
+        batcher._slots.release.assert_called_once_with()
+        self.assertEqual(batcher.backlog, 0)
+        self.assertEqual(batcher.flush(), [])
+        self.assertEqual(table._instance._client._data_stub.method_calls, [])
+
+    def test_mutate_too_many_mutations(self):
+        from google.cloud.bigtable.table import TooManyMutationsError
+
+        table = self._make_table()
+        batcher = self._make_one(table)
+        row = self._make_row(table, b'row_key', num_cells=2)
+
+        with mock.patch(
+                'google.cloud.bigtable.table._MAX_BULK_MUTATIONS', new=3):
+            with self.assertRaises(TooManyMutationsError):
+                batcher.mutate(row)
+        batcher.close()
+
+    def test_mutate_wrong_row_type(self):
+        from google.cloud.bigtable.row import ConditionalRow
+
+        table = self._make_table()
+        batcher = self._make_one(table)
+        row = ConditionalRow(b'row_key', table, filter_=object())
+
+        with self.assertRaises(TypeError):
+            batcher.mutate(row)
+        batcher.close()
+
+    def test_mutate_after_close(self):
+        table = self._make_table()
+        batcher = self._make_one(table)
+        batcher.close()
+
+        with self.assertRaises(ValueError):
+            batcher.mutate(self._make_row(table, b'row_key'))
+        self.assertEqual(batcher.close(), [])
+
+    def test_flush_retries_retryable_entries(self):
+        table = self._make_table(self._response(0, 14, 3),
+                                 self._response(0))
+        batcher = self._make_one(table)
+        rows = [self._make_row(table, b'row%d' % (index,))
+                for index in range(3)]
+
+        batcher.mutate_rows(rows)
+        errors = batcher.flush()
+
+        self.assertEqual([(row, status.code) for row, status in errors],
+                         [(rows[2], 3)])
+        stub = table._instance._client._data_stub
+        _, (retry_pb,), _ = stub.method_calls[1]
+        self.assertEqual([entry.row_key for entry in retry_pb.entries],
+                         [b'row1'])
+        self.assertEqual(batcher.rows_mutated, 2)
+        batcher.close()
+
+    def test_flush_gives_up_after_max_retries(self):
+        table = self._make_table(self._response(4), self._response(4))
+        batcher = self._make_one(table, max_retries=1)
+        row = self._make_row(table, b'row_key')
+
+        batcher.mutate(row)
+        errors = batcher.flush()
+
+        self.assertEqual([(row, status.code) for row, status in errors],
+                         [(row, 4)])
+        self.assertEqual(batcher.rows_mutated, 0)
+        batcher.close()
+
+    def test_flush_resends_entries_of_failed_stream(self):
+        from google.cloud.bigtable._generated.bigtable_pb2 import (
+            MutateRowsResponse)
+        from google.rpc.status_pb2 import Status
+
+        first = MutateRowsResponse(entries=[
+            MutateRowsResponse.Entry(index=0, status=Status(code=0))])
+        failing = _FailingStream(
+            [first], _MutateRowsError(grpc.StatusCode.UNAVAILABLE))
+        table = self._make_table(failing, self._response(0))
+        batcher = self._make_one(table)
+        rows = [self._make_row(table, b'row1'),
+                self._make_row(table, b'row2')]
+
+        batcher.mutate_rows(rows)
+
+        self.assertEqual(batcher.flush(), [])
+        stub = table._instance._client._data_stub
+        _, (retry_pb,), _ = stub.method_calls[1]
+        self.assertEqual([entry.row_key for entry in retry_pb.entries],
+                         [b'row2'])
+        self.assertEqual(batcher.rows_mutated, 2)
+        batcher.close()
+
+    def test_flush_non_retryable_stream_failure(self):
+        failing = _FailingStream(
+            [], _MutateRowsError(grpc.StatusCode.PERMISSION_DENIED))
+        table = self._make_table(failing)
+        batcher = self._make_one(table)
+        row = self._make_row(table, b'row_key')
+
+        batcher.mutate(row)
+        (failed_row, status), = batcher.flush()
+
+        self.assertIs(failed_row, row)
+        self.assertEqual(status.code,
+                         grpc.StatusCode.PERMISSION_DENIED.value[0])
+        self.assertEqual(status.message, 'Failed')
+        batcher.close()
+
+    def test_flush_non_grpc_stream_failure(self):
+        failing = _FailingStream([], RuntimeError('Broken'))
+        table = self._make_table(failing)
+        batcher = self._make_one(table)
+        row = self._make_row(table, b'row_key')
+
+        batcher.mutate(row)
+        (failed_row, status), = batcher.flush()
+
+        self.assertIs(failed_row, row)
+        self.assertEqual(status.code, grpc.StatusCode.UNKNOWN.value[0])
+        self.assertEqual(status.message, 'Broken')
+        batcher.close()
+
+    def test_max_latency(self):
+        table = self._make_table(self._response(0))
+        batcher = self._make_one(table, max_latency=0.01)
+
+        batcher.mutate(self._make_row(table, b'row_key'))
+        _wait_for(lambda: batcher.rows_mutated)
+
+        self.assertEqual(batcher.rows_mutated, 1)
+        batcher.close()
+
+    def test_max_latency_rearms_timer(self):
+        table = self._make_table(self._response(0), self._response(0))
+        batcher = self._make_one(table, max_latency=0.01)
+
+        for index in range(2):
+            batcher.mutate(self._make_row(table, b'row%d' % (index,)))
+            _wait_for(lambda: batcher.rows_mutated > index)
+            self.assertEqual(batcher.rows_mutated, index + 1)
+
+        timer = batcher._timer
+        self.assertEqual(batcher.close(), [])
+        timer.join(5)
+        self.assertFalse(timer.is_alive())
+        stub = table._instance._client._data_stub
+        self.assertEqual(len(stub.method_calls), 2)
+
+    def test_context_manager(self):
+        table = self._make_table(self._response(0))
+
+        with self._make_one(table) as batcher:
+            batcher.mutate(self._make_row(table, b'row_key'))
+
+        self.assertEqual(batcher.rows_mutated, 1)
+        self.assertTrue(batcher._closed)
+
+
+class Test__split_key_ranges(unittest.TestCase):
+
+    def _call_fut(self, split_keys):
+        from google.cloud.bigtable.table import _split_key_ranges
+
+        return _split_key_ranges(split_keys)
+
+    def test_no_keys(self):
+        self.assertEqual(self._call_fut([]), [(None, None)])
+
+    def test_end_of_table_key(self):
+        self.assertEqual(self._call_fut([b'']), [(None, None)])
+
+    def test_keys(self):
+        result = self._call_fut([b'b', b'a', b'b', b''])
+        self.assertEqual(result,
+                         [(None, b'a'), (b'a', b'b'), (b'b', None)])
+
+
 class Test__create_row_request(unittest.TestCase):
 
     def _call_fut(self, table_name, row_key=None, start_key=None, end_key=None,
-                  filter_=None, limit=None, end_inclusive=False):
+                  filter_=None, limit=None, end_inclusive=False,
+                  row_set=None):
         from google.cloud.bigtable.table import _create_row_request
 
         return _create_row_request(
             table_name, row_key=row_key, start_key=start_key, end_key=end_key,
-            filter_=filter_, limit=limit, end_inclusive=end_inclusive)
+            filter_=filter_, limit=limit, end_inclusive=end_inclusive,
+            row_set=row_set)
 
     def test_table_name_only(self):
         table_name = 'table_name'
@@ -639,6 +1173,37 @@ class Test__create_row_request(unittest.TestCase):
             start_key_closed=start_key, end_key_closed=end_key)
         self.assertEqual(result, expected_result)
 
+    def test_row_set_empty(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        with self.assertRaises(ValueError):
+            self._call_fut('table_name', row_set=RowSet())
+
+    def test_row_set(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        table_name = 'table_name'
+        row_set = RowSet(row_keys=[b'row_key'])
+        row_set.add_row_range_from_keys(b'a', b'b')
+        result = self._call_fut(table_name, row_set=row_set)
+        expected_result = _ReadRowsRequestPB(table_name=table_name)
+        expected_result.rows.row_keys.append(b'row_key')
+        expected_result.rows.row_ranges.add(
+            start_key_closed=b'a', end_key_open=b'b')
+        self.assertEqual(result, expected_result)
+
+    def test_row_set_row_key_conflict(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        with self.assertRaises(ValueError):
+            self._call_fut(None, row_key=b'row_key', row_set=RowSet())
+
+    def test_row_set_row_range_conflict(self):
+        from google.cloud.bigtable.row_set import RowSet
+
+        with self.assertRaises(ValueError):
+            self._call_fut(None, start_key=b'a', row_set=RowSet())
+
     def test_with_filter(self):
         from google.cloud.bigtable.row_filters import RowSampleFilter
 
@@ -744,6 +1309,38 @@ def _ColumnFamilyPB(*args, **kw):
     return table_v2_pb2.ColumnFamily(*args, **kw)
 
 
+def _wait_for(predicate, timeout=5):
+    deadline = time.time() + timeout
+    while not predicate():
+        assert time.time() < deadline, 'Timed out'
+        time.sleep(0.01)
+
+
+class _MutateRowsError(grpc.RpcError):
+
+    def __init__(self, code):
+        super(_MutateRowsError, self).__init__()
+        self._code = code
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return 'Failed'
+
+
+class _FailingStream(object):
+
+    def __init__(self, responses, exc):
+        self._responses = responses
+        self._exc = exc
+
+    def __iter__(self):
+        for response in self._responses:
+            yield response
+        raise self._exc
+
+
 class _Client(object):
 
     data_stub = None
@@ -0,0 +1,239 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asyncio iterators for paging through paged API methods.
+
+.. note::
+
+   This module requires Python 3.4.4 or later; ``async for`` requires
+   Python 3.5 or later.
+
+:class:`AsyncHTTPIterator` behaves like
+:class:`~google.api.core.page_iterator.HTTPIterator`, but is consumed with
+``async for`` and makes its requests through a function returning an
+awaitable, such as
+:meth:`google.cloud._async_http.AsyncJSONConnection.api_request`::
+
+    >>> iterator = AsyncHTTPIterator(
+    ...     client, connection.api_request, '/b/my-bucket/o', item_to_value)
+    >>> async for blob in iterator:
+    ...     print(blob.name)
+    >>> async for page in iterator.pages:
+    ...     print(page.num_items)
+"""
+
+import six
+
+from google.api.core import page_iterator
+from google.api.core.helpers import async_helpers
+
+
+class _AsyncPageIterator(object):
+    """Asynchronous iterator of the pages of an :class:`AsyncHTTPIterator`.
+
+    Args:
+        parent (AsyncHTTPIterator): The iterator that fetches the pages.
+        increment (bool): Flag indicating if the total number of results
+            should be incremented on each page.
+    """
+
+    def __init__(self, parent, increment):
+        self._parent = parent
+        self._increment = increment
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        """Fetch the next page.
+
+        Returns:
+            asyncio.Future: A future resolved with the next
+                :class:`~google.api.core.page_iterator.Page`, or failing with
+                :exc:`StopAsyncIteration` if there are no pages left.
+        """
+        return async_helpers.then(self._parent._next_page(), self._on_page)
+
+    def _on_page(self, page):
+        """Count a fetched page.
+
+        Args:
+            page (Optional[google.api.core.page_iterator.Page]): The page
+                fetched, or :data:`None` if there are no pages left.
+
+        Returns:
+            google.api.core.page_iterator.Page: The page.
+
+        Raises:
+            StopAsyncIteration: If there are no pages left.
+        """
+        if page is None:
+            raise async_helpers.StopAsyncIteration
+        self._parent.page_number += 1
+        if self._increment:
+            self._parent.num_results += page.num_items
+        return page
+
+
+class _AsyncItemIterator(object):
+    """Asynchronous iterator of the items of an :class:`AsyncHTTPIterator`.
+
+    Args:
+        parent (AsyncHTTPIterator): The iterator that fetches the pages.
+    """
+
+    def __init__(self, parent):
+        self._parent = parent
+        self._pages = _AsyncPageIterator(parent, increment=False)
+        self._page = None
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        """Get the next item, fetching the next page if needed.
+
+        Returns:
+            asyncio.Future: A future resolved with the next item, or failing
+                with :exc:`StopAsyncIteration` if there are no items left.
+        """
+        if self._page is not None:
+            try:
+                item = six.next(self._page)
+            except StopIteration:
+                self._page = None
+            else:
+                self._parent.num_results += 1
+                return async_helpers.resolved(item)
+        return async_helpers.then(self._pages.__anext__(), self._on_page)
+
+    def _on_page(self, page):
+        """Start on the items of a fetched page.
+
+        Args:
+            page (google.api.core.page_iterator.Page): The page fetched.
+
+        Returns:
+            asyncio.Future: A future resolved with the next item.
+        """
+        self._page = page
+        return self.__anext__()
+
+
+class AsyncHTTPIterator(page_iterator.HTTPIterator):
+    """A class for asynchronously iterating through HTTP/JSON list responses.
+
+    Takes the same arguments as
+    :class:`~google.api.core.page_iterator.HTTPIterator`, except that
+    ``api_request`` must return an awaitable and ``prefetch`` is ignored
+    (run several iterators concurrently instead).
+
+    Args:
+        client (google.cloud.client.Client): The API client.
+        api_request (Callable): The function to use to make API requests,
+            returning an awaitable. Generally, this will be
+            :meth:`google.cloud._async_http.AsyncJSONConnection.api_request`.
+        path (str): The method path to query for the list of items.
+        item_to_value (Callable[Iterator, Any]): Callable to convert an item
+            from the type in the JSON response into a native object.
+        kwargs (dict): Remaining keyword arguments passed to
+            :class:`~google.api.core.page_iterator.HTTPIterator`.
+
+    .. autoattribute:: pages
+    """
+
+    @property
+    def pages(self):
+        """Asynchronous iterator of pages in the response.
+
+        returns:
+            AsyncIterator[Page]: An iterator of :class:`Page` instances.
+
+        raises:
+            ValueError: If the iterator has already been started.
+        """
+        if self._started:
+            raise ValueError('Iterator has already started', self)
+        self._started = True
+        return _AsyncPageIterator(self, increment=True)
+
+    def __aiter__(self):
+        """Asynchronous iterator for each item returned.
+
+        Returns:
+            AsyncIterator[Any]: An iterator of items from the API.
+
+        Raises:
+            ValueError: If the iterator has already been started.
+        """
+        if self._started:
+            raise ValueError('Iterator has already started', self)
+        self._started = True
+        return _AsyncItemIterator(self)
+
+    def __iter__(self):
+        raise TypeError(
+            'AsyncHTTPIterator must be consumed with "async for".')
+
+    def _next_page(self):
+        """Get the next page in the iterator.
+
+        Returns:
+            asyncio.Future: A future resolved with the next page in the
+                iterator, or :data:`None` if there are no pages left.
+        """
+        if self._has_next_page():
+            return async_helpers.then(
+                self._get_next_page_response(), self._make_page)
+        else:
+            return async_helpers.resolved(None)
+
+    def _make_page(self, response):
+        """Create a page from the response to a page request.
+
+        Args:
+            response (dict): The parsed JSON response of the page.
+
+        Returns:
+            google.api.core.page_iterator.Page: The page.
+        """
+        items = response.get(self._items_key, ())
+        page = page_iterator.Page(self, items, self._item_to_value)
+        self._page_start(self, page, response)
+        self.next_page_token = response.get(self._next_token)
+        return page
+
+    def _get_next_page_response(self):
+        """Requests the next page from the path provided.
+
+        Returns:
+            Awaitable: The awaitable returned by ``api_request``, resolved
+                with the parsed JSON response of the next page's contents.
+
+        Raises:
+            ValueError: If the HTTP method is not ``GET`` or ``POST``.
+        """
+        params = self._get_query_params()
+        if self._HTTP_METHOD == 'GET':
+            return self.api_request(
+                method=self._HTTP_METHOD,
+                path=self.path,
+                query_params=params)
+        elif self._HTTP_METHOD == 'POST':
+            return self.api_request(
+                method=self._HTTP_METHOD,
+                path=self.path,
+                data=params)
+        else:
+            raise ValueError('Unexpected HTTP method', self._HTTP_METHOD)
@@ -28,6 +28,16 @@ class _OperationNotComplete(Exception):
     pass
 
 
+DEFAULT_RETRY = retry.Retry(
+    predicate=retry.if_exception_type(_OperationNotComplete))
+"""google.api.core.retry.Retry: The default polling schedule.
+
+Polling retries until :meth:`PollingFuture.done` returns True; the
+deadline is replaced by the ``timeout`` passed to
+:meth:`PollingFuture.result`.
+"""
+
+
 class PollingFuture(base.Future):
     """A Future that needs to poll some service to check its status.
 
@@ -36,9 +46,16 @@ class PollingFuture(base.Future):
 
     .. note: Privacy here is intended to prevent the final class from
     overexposing, not to prevent subclasses from accessing methods.
+
+    Args:
+        retry (google.api.core.retry.Retry): The retry configuration used
+            when polling. This can be used to control how often :meth:`done`
+            is polled. Its predicate must retry on ``_OperationNotComplete``
+            (as :data:`DEFAULT_RETRY` does).
     """
-    def __init__(self):
+    def __init__(self, retry=DEFAULT_RETRY):
         super(PollingFuture, self).__init__()
+        self._retry = retry
         self._result = None
         self._exception = None
         self._result_set = False
@@ -76,9 +93,7 @@ class PollingFuture(base.Future):
         if self._result_set:
             return
 
-        retry_ = retry.Retry(
-            predicate=retry.if_exception_type(_OperationNotComplete),
-            deadline=timeout)
+        retry_ = self._retry.with_deadline(timeout)
 
         try:
             retry_(self._done_or_raise)()
@@ -0,0 +1,178 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for chaining :mod:`asyncio` futures.
+
+The asynchronous modules of this library are written with callbacks on
+futures, rather than ``async def`` and ``await``, so that they still compile
+on Python 2.7 and 3.4. The futures they return can be awaited as usual::
+
+    >>> content = await then(response.read(), parse)
+"""
+
+import functools
+
+import six
+
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
+
+
+StopAsyncIteration = getattr(  # pylint: disable=redefined-builtin
+    six.moves.builtins, 'StopAsyncIteration', StopIteration)
+"""Exception: Raised by ``__anext__`` to end asynchronous iteration (falls
+back to :exc:`StopIteration` before Python 3.5)."""
+
+
+def _is_awaitable(value):
+    """Check if ``value`` can be awaited.
+
+    Args:
+        value (Any): The value to check.
+
+    Returns:
+        bool: True for coroutines, futures and other objects implementing
+            ``__await__``.
+    """
+    return (asyncio.iscoroutine(value) or
+            isinstance(value, asyncio.Future) or
+            hasattr(value, '__await__'))
+
+
+def _settle(future, value):
+    """Resolve ``future`` with ``value``, awaiting it first if needed.
+
+    Args:
+        future (asyncio.Future): The future to resolve.
+        value (Any): The result, or an awaitable resolving to the result.
+    """
+    if _is_awaitable(value):
+        asyncio.ensure_future(value).add_done_callback(
+            functools.partial(_copy_outcome, target=future))
+    else:
+        future.set_result(value)
+
+
+def _copy_outcome(source, target, callback=None):
+    """Resolve ``target`` with the outcome of the finished ``source``.
+
+    Args:
+        source (asyncio.Future): A finished future.
+        target (asyncio.Future): The future to resolve. Left alone if it
+            was cancelled in the meantime.
+        callback (Callable[[Any], Any]): (Optional) Called with the result
+            of ``source``, returning the result of ``target``. Not called if
+            ``source`` failed.
+    """
+    if target.done():
+        return
+    if source.cancelled():
+        target.cancel()
+        return
+    try:
+        value = source.result()
+        if callback is not None:
+            value = callback(value)
+    except Exception as exc:  # pylint: disable=broad-except
+        target.set_exception(exc)
+    else:
+        _settle(target, value)
+
+
+def _cancel_source(future, source):
+    """Cancel ``source`` if ``future``, which depends on it, was cancelled.
+
+    Args:
+        future (asyncio.Future): A finished future.
+        source (asyncio.Future): The future ``future`` waits on.
+    """
+    if future.cancelled():
+        source.cancel()
+
+
+def resolved(value):
+    """Create a future already resolved with ``value``.
+
+    Args:
+        value (Any): The result of the future.
+
+    Returns:
+        asyncio.Future: The resolved future.
+    """
+    future = asyncio.Future()
+    future.set_result(value)
+    return future
+
+
+def then(awaitable, callback):
+    """Call ``callback`` with the result of ``awaitable``.
+
+    Args:
+        awaitable (Awaitable): A coroutine or future.
+        callback (Callable[[Any], Any]): Called with the result of
+            ``awaitable``. May return another awaitable, which is awaited
+            in turn.
+
+    Returns:
+        asyncio.Future: A future resolved with the value returned by
+            ``callback``, or failing with the error raised by ``awaitable``
+            or ``callback``. Cancelling it cancels ``awaitable``.
+    """
+    future = asyncio.Future()
+    source = asyncio.ensure_future(awaitable)
+    source.add_done_callback(
+        functools.partial(_copy_outcome, target=future, callback=callback))
+    future.add_done_callback(functools.partial(_cancel_source, source=source))
+    return future
+
+
+def always(awaitable, callback):
+    """Call ``callback`` once ``awaitable`` finishes, whatever its outcome.
+
+    The asynchronous equivalent of a ``finally`` clause.
+
+    Args:
+        awaitable (Awaitable): A coroutine or future.
+        callback (Callable[[], Any]): Called without arguments once
+            ``awaitable`` finishes. May return another awaitable, which is
+            awaited in turn.
+
+    Returns:
+        asyncio.Future: A future with the outcome of ``awaitable``, unless
+            ``callback`` fails, in which case it fails with the error raised
+            by ``callback``.
+    """
+    future = asyncio.Future()
+
+    def _after_callback(cleanup, source):
+        if cleanup.cancelled() or cleanup.exception() is not None:
+            _copy_outcome(cleanup, future)
+        else:
+            _copy_outcome(source, future)
+
+    def _on_done(source):
+        cleanup = asyncio.Future()
+        try:
+            _settle(cleanup, callback())
+        except Exception as exc:  # pylint: disable=broad-except
+            cleanup.set_exception(exc)
+        cleanup.add_done_callback(
+            functools.partial(_after_callback, source=source))
+
+    source = asyncio.ensure_future(awaitable)
+    source.add_done_callback(_on_done)
+    future.add_done_callback(functools.partial(_cancel_source, source=source))
+    return future
@@ -77,11 +77,27 @@ through it or using :func:`list`::
         <MyItemClass at 0x7fd64a098ed0>,
         <MyItemClass at 0x7fd64a098e90>,
     ]
+
+Pages can also be requested ahead of time on a background thread, so that
+the network round trip for the next page overlaps with processing the
+current one. Set ``prefetch`` to the number of pages to keep in flight
+before starting to iterate::
+
+    >>> results_iterator = client.list_resources()
+    >>> results_iterator.prefetch = 2
+    >>> for resource in results_iterator:
+    ...     process(resource)
 """
 
 import abc
+import sys
+import threading
 
 import six
+from six.moves import queue
+
+
+_PREFETCH_POLL_INTERVAL = 0.1  # seconds
 
 
 class Page(object):
@@ -89,8 +105,10 @@ class Page(object):
 
     Args:
         parent (Iterator): The iterator that owns the current page.
-        items (Sequence[Any]): An iterable (that also defines __len__) of items
-            from a raw API response.
+        items (Iterable[Any]): The items from a raw API response. If ``items``
+            does not define ``__len__``, it is consumed lazily and only
+            counted (buffering the items not yet consumed) when
+            :attr:`num_items` or :attr:`remaining` is first used.
         item_to_value (Callable[Iterator, Any]): Callable to convert an item
             from the type in the raw API response into the native object. Will
             be called with the iterator and a single item.
@@ -98,19 +116,39 @@ class Page(object):
 
     def __init__(self, parent, items, item_to_value):
         self._parent = parent
-        self._num_items = len(items)
+        try:
+            self._num_items = len(items)
+        except TypeError:
+            # Items without a length (e.g. decoded while the response is
+            # still downloading) are counted only when asked for.
+            self._num_items = None
         self._remaining = self._num_items
         self._item_iter = iter(items)
         self._item_to_value = item_to_value
+        self._num_consumed = 0
+
+    def _count_items(self):
+        """Count the items of a page whose length was not known up front.
+
+        The remaining items are buffered so that they can still be iterated.
+        """
+        rest = list(self._item_iter)
+        self._item_iter = iter(rest)
+        self._remaining = len(rest)
+        self._num_items = self._num_consumed + self._remaining
 
     @property
     def num_items(self):
         """int: Total items in the page."""
+        if self._num_items is None:
+            self._count_items()
         return self._num_items
 
     @property
     def remaining(self):
         """int: Remaining items in the page."""
+        if self._remaining is None:
+            self._count_items()
         return self._remaining
 
     def __iter__(self):
@@ -123,7 +161,9 @@ class Page(object):
         result = self._item_to_value(self._parent, item)
         # Since we've successfully got the next value from the
         # iterator, we update the number of remaining.
-        self._remaining -= 1
+        self._num_consumed += 1
+        if self._remaining is not None:
+            self._remaining -= 1
         return result
 
     # Alias needed for Python 2/3 support.
@@ -149,18 +189,29 @@ class Iterator(object):
         page_token (str): A token identifying a page in a result set to start
             fetching results from.
         max_results (int): The maximum number of results to fetch.
+        prefetch (int): The number of pages to request ahead of the page
+            being consumed, on a background thread. At most ``prefetch``
+            pages are held beyond the current one. Defaults to ``0``, which
+            requests each page only once the previous one is used up. While
+            prefetching, ``next_page_token`` is the token of the last page
+            fetched rather than the last page consumed.
     """
 
     def __init__(self, client, item_to_value=_item_to_value_identity,
-                 page_token=None, max_results=None):
+                 page_token=None, max_results=None, prefetch=0):
         self._started = False
         self.client = client
         self._item_to_value = item_to_value
         self.max_results = max_results
+        self.prefetch = prefetch
         # The attributes below will change over the life of the iterator.
         self.page_number = 0
         self.next_page_token = page_token
         self.num_results = 0
+        # Pages and results already fetched by the prefetching thread, which
+        # may run ahead of ``page_number`` and ``num_results``.
+        self._pages_fetched = 0
+        self._results_fetched = 0
 
     @property
     def pages(self):
@@ -210,13 +261,108 @@ class Iterator(object):
         Yields:
             Page: each page of items from the API.
         """
-        page = self._next_page()
-        while page is not None:
-            self.page_number += 1
-            if increment:
-                self.num_results += page.num_items
-            yield page
-            page = self._next_page()
+        prefetching = self.prefetch > 0
+        if prefetching:
+            pages = self._prefetch_pages()
+        else:
+            pages = iter(self._next_page, None)
+
+        try:
+            for page in pages:
+                self.page_number += 1
+                if increment:
+                    self.num_results += page.num_items
+                yield page
+        finally:
+            if prefetching:
+                pages.close()
+
+    def _prefetch_pages(self):
+        """Generator of pages fetched on a background thread.
+
+        Stopping the generator (e.g. by breaking out of a loop over the
+        iterator) signals the background thread to stop; a request already
+        in flight is allowed to complete.
+
+        Yields:
+            Page: each page of items from the API.
+
+        Raises:
+            Exception: Any error raised while fetching a page, once the pages
+                fetched before it have been yielded.
+        """
+        fetched = queue.Queue()
+        # One token per page the background thread may fetch ahead of the
+        # page being consumed.
+        slots = queue.Queue()
+        for _ in range(self.prefetch):
+            slots.put(None)
+        done = threading.Event()
+
+        thread = threading.Thread(
+            target=self._fetch_pages, args=(fetched, slots, done))
+        thread.daemon = True
+        thread.start()
+
+        try:
+            while True:
+                page, exc_info = fetched.get()
+                if exc_info is not None:
+                    six.reraise(*exc_info)
+                if page is None:
+                    return
+                slots.put(None)
+                yield page
+        finally:
+            done.set()
+
+    def _fetch_pages(self, fetched, slots, done):
+        """Fetch pages until exhausted, failed or cancelled.
+
+        Runs on the background thread started by :meth:`_prefetch_pages`.
+
+        Args:
+            fetched (queue.Queue): Receives ``(page, exc_info)`` pairs. The
+                final pair has a :data:`None` page.
+            slots (queue.Queue): Holds a token for each page which may be
+                fetched ahead of the page being consumed.
+            done (threading.Event): Set when the consumer has stopped.
+        """
+        while not done.is_set():
+            try:
+                slots.get(timeout=_PREFETCH_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+            try:
+                page = self._next_page()
+            except Exception:  # pylint: disable=broad-except
+                fetched.put((None, sys.exc_info()))
+                return
+
+            if page is None:
+                fetched.put((None, None))
+                return
+
+            self._pages_fetched += 1
+            self._results_fetched += page.num_items
+            fetched.put((page, None))
+
+    def _pages_requested(self):
+        """Count the pages requested so far.
+
+        Returns:
+            int: The number of pages consumed or, when prefetching, fetched.
+        """
+        return max(self.page_number, self._pages_fetched)
+
+    def _results_requested(self):
+        """Count the results requested so far.
+
+        Returns:
+            int: The number of results consumed or, when prefetching, fetched.
+        """
+        return max(self.num_results, self._results_fetched)
 
     @abc.abstractmethod
     def _next_page(self):
@@ -277,6 +423,12 @@ class HTTPIterator(Iterator):
             the page response.
         next_token (str): The name of the field used in the response for page
             tokens.
+        prefetch (int): The number of pages to request ahead of the page
+            being consumed, on a background thread.
+        stream (bool): If True, ask ``api_request`` to decode each page's
+            items while the response downloads (see
+            :meth:`google.cloud._http.JSONConnection.api_request`), so that
+            the first items of a large page are available sooner.
 
     .. autoattribute:: pages
     """
@@ -291,16 +443,18 @@ class HTTPIterator(Iterator):
     def __init__(self, client, api_request, path, item_to_value,
                  items_key=_DEFAULT_ITEMS_KEY,
                  page_token=None, max_results=None, extra_params=None,
-                 page_start=_do_nothing_page_start, next_token=_NEXT_TOKEN):
+                 page_start=_do_nothing_page_start, next_token=_NEXT_TOKEN,
+                 prefetch=0, stream=False):
         super(HTTPIterator, self).__init__(
             client, item_to_value, page_token=page_token,
-            max_results=max_results)
+            max_results=max_results, prefetch=prefetch)
         self.api_request = api_request
         self.path = path
         self._items_key = items_key
         self.extra_params = extra_params
         self._page_start = page_start
         self._next_token = next_token
+        self._stream = stream
         # Verify inputs / provide defaults.
         if self.extra_params is None:
             self.extra_params = {}
@@ -341,11 +495,11 @@ class HTTPIterator(Iterator):
         Returns:
             bool: Whether the iterator has more pages.
         """
-        if self.page_number == 0:
+        if self._pages_requested() == 0:
             return True
 
         if self.max_results is not None:
-            if self.num_results >= self.max_results:
+            if self._results_requested() >= self.max_results:
                 return False
 
         return self.next_page_token is not None
@@ -360,7 +514,8 @@ class HTTPIterator(Iterator):
         if self.next_page_token is not None:
             result[self._PAGE_TOKEN] = self.next_page_token
         if self.max_results is not None:
-            result[self._MAX_RESULTS] = self.max_results - self.num_results
+            result[self._MAX_RESULTS] = (
+                self.max_results - self._results_requested())
         result.update(self.extra_params)
         return result
 
@@ -374,16 +529,21 @@ class HTTPIterator(Iterator):
             ValueError: If the HTTP method is not ``GET`` or ``POST``.
         """
         params = self._get_query_params()
+        kwargs = {}
+        if self._stream:
+            kwargs['stream_key'] = self._items_key
         if self._HTTP_METHOD == 'GET':
             return self.api_request(
                 method=self._HTTP_METHOD,
                 path=self.path,
-                query_params=params)
+                query_params=params,
+                **kwargs)
         elif self._HTTP_METHOD == 'POST':
             return self.api_request(
                 method=self._HTTP_METHOD,
                 path=self.path,
-                data=params)
+                data=params,
+                **kwargs)
         else:
             raise ValueError('Unexpected HTTP method', self._HTTP_METHOD)
 
@@ -399,14 +559,17 @@ class _GAXIterator(Iterator):
             from the the protobuf response into a native object. Will
             be called with the iterator and a single item.
         max_results (int): The maximum number of results to fetch.
+        prefetch (int): The number of pages to request ahead of the page
+            being consumed, on a background thread.
 
     .. autoattribute:: pages
     """
 
-    def __init__(self, client, page_iter, item_to_value, max_results=None):
+    def __init__(self, client, page_iter, item_to_value, max_results=None,
+                 prefetch=0):
         super(_GAXIterator, self).__init__(
             client, item_to_value, page_token=page_iter.page_token,
-            max_results=max_results)
+            max_results=max_results, prefetch=prefetch)
         self._gax_page_iter = page_iter
 
     def _next_page(self):
@@ -450,6 +613,8 @@ class GRPCIterator(Iterator):
         response_token_field (str): The field in the response message that has
             the token for the next page.
         max_results (int): The maximum number of results to fetch.
+        prefetch (int): The number of pages to request ahead of the page
+            being consumed, on a background thread.
 
     .. autoattribute:: pages
     """
@@ -466,9 +631,11 @@ class GRPCIterator(Iterator):
             item_to_value=_item_to_value_identity,
             request_token_field=_DEFAULT_REQUEST_TOKEN_FIELD,
             response_token_field=_DEFAULT_RESPONSE_TOKEN_FIELD,
-            max_results=None):
+            max_results=None,
+            prefetch=0):
         super(GRPCIterator, self).__init__(
-            client, item_to_value, max_results=max_results)
+            client, item_to_value, max_results=max_results,
+            prefetch=prefetch)
         self._method = method
         self._request = request
         self._items_field = items_field
@@ -503,11 +670,11 @@ class GRPCIterator(Iterator):
         Returns:
             bool: Whether the iterator has more pages.
         """
-        if self.page_number == 0:
+        if self._pages_requested() == 0:
             return True
 
         if self.max_results is not None:
-            if self.num_results >= self.max_results:
+            if self._results_requested() >= self.max_results:
                 return False
 
         # Note: intentionally a falsy check instead of a None check. The RPC
@@ -310,7 +310,8 @@ class Retry(object):
             predicate=self._predicate,
             initial=initial if initial is not None else self._initial,
             maximum=maximum if maximum is not None else self._maximum,
-            multiplier=multiplier if maximum is not None else self._multiplier,
+            multiplier=(
+                multiplier if multiplier is not None else self._multiplier),
             deadline=self._deadline)
 
     def __str__(self):
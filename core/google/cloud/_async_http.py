@@ -0,0 +1,369 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asyncio-based connections to JSON API servers.
+
+.. note::
+
+   This module requires Python 3.4.4 or later, and an :mod:`aiohttp`-style
+   HTTP session (``aiohttp`` is used by default, if installed: see the
+   ``async`` extra of ``google-cloud-core``).
+
+A connection for any JSON API is created from its synchronous counterpart,
+sharing its URL building and headers. Its methods return
+:class:`asyncio.Future` instances::
+
+    >>> from google.cloud._async_http import AsyncJSONConnection
+    >>> connection = AsyncJSONConnection.from_connection(client._connection)
+    >>> bucket = await connection.api_request('GET', '/b/my-bucket')
+"""
+
+import functools
+import json
+
+import google.auth.transport.requests
+import requests
+
+from google.api.core.helpers import async_helpers
+from google.cloud import _http
+from google.cloud import exceptions
+
+try:
+    import asyncio
+except ImportError:  # pragma: NO COVER
+    asyncio = None
+
+try:
+    import aiohttp
+except ImportError:  # pragma: NO COVER
+    aiohttp = None
+
+
+class AsyncJSONConnection(_http.JSONConnection):
+    """An asyncio connection to a Google JSON-based API.
+
+    Shares :meth:`build_api_url` and the request headers built by
+    :meth:`_make_request` with :class:`~google.cloud._http.JSONConnection`;
+    only sending the request differs. Combine it with an API's connection
+    class (e.g. via :meth:`from_connection`) to set the API's URL template.
+
+    :type client: :class:`~google.cloud.client.Client`
+    :param client: The client that owns the current connection.
+
+    :type session: :class:`aiohttp.ClientSession`
+    :param session: (Optional) The HTTP session used to send requests. Can
+                    be any object whose ``request(method, url, headers=...,
+                    data=...)`` awaitable returns a response with ``status``,
+                    ``headers`` and a ``read()`` awaitable. If not passed,
+                    an :class:`aiohttp.ClientSession` is created on first
+                    use.
+    """
+
+    def __init__(self, client, session=None):
+        super(AsyncJSONConnection, self).__init__(client)
+        self._session = session
+        self._refresh = None
+
+    @classmethod
+    def from_connection(cls, connection, session=None):
+        """Create an asyncio connection to the same API as ``connection``.
+
+        :type connection: :class:`~google.cloud._http.JSONConnection`
+        :param connection: A synchronous connection to the API.
+
+        :type session: :class:`aiohttp.ClientSession`
+        :param session: (Optional) The HTTP session used to send requests.
+
+        :rtype: :class:`AsyncJSONConnection`
+        :returns: A connection of a class deriving from both this class and
+                  the class of ``connection``.
+        """
+        connection_class = type(connection)
+        async_class = type(
+            'Async' + connection_class.__name__,
+            (cls, connection_class), {})
+        return async_class(connection._client, session=session)
+
+    @property
+    def session(self):
+        """The HTTP session used to send requests.
+
+        :rtype: :class:`aiohttp.ClientSession`
+        :returns: The session passed to the constructor, or one created on
+                  first use.
+        :raises: :class:`EnvironmentError` if no session was passed and
+                 ``aiohttp`` is not installed.
+        """
+        if self._session is None:
+            if aiohttp is None:
+                raise EnvironmentError(
+                    'aiohttp must be installed, or an HTTP session passed, '
+                    'to make asyncio requests.')
+            self._session = aiohttp.ClientSession()
+        return self._session
+
+    def close(self):
+        """Close the HTTP session.
+
+        :rtype: :class:`asyncio.Future`
+        :returns: A future resolved once the session is closed.
+        """
+        return async_helpers.then(
+            async_helpers.resolved(self._session), _close_session)
+
+    def _authorize(self, headers):
+        """Add an authorization header, refreshing credentials if needed.
+
+        The (blocking) refresh runs in the event loop's default executor;
+        concurrent requests wait for a single refresh.
+
+        :type headers: dict
+        :param headers: The headers of the request to authorize.
+
+        :rtype: :class:`asyncio.Future`
+        :returns: A future resolved once the header is added.
+        """
+        credentials = self.credentials
+        if credentials is None:
+            return async_helpers.resolved(None)
+
+        if credentials.valid:
+            credentials.apply(headers)
+            return async_helpers.resolved(None)
+
+        if self._refresh is None:
+            request = google.auth.transport.requests.Request()
+            loop = asyncio.get_event_loop()
+            self._refresh = loop.run_in_executor(
+                None, credentials.refresh, request)
+            self._refresh.add_done_callback(self._refresh_done)
+
+        # Shielded, so that a cancelled request doesn't cancel the refresh
+        # other requests are waiting for.
+        return async_helpers.then(
+            asyncio.shield(self._refresh),
+            lambda _: credentials.apply(headers))
+
+    def _refresh_done(self, _):
+        """Allow the next expired request to refresh the credentials."""
+        self._refresh = None
+
+    def _do_request(self, method, url, headers, data, target_object):
+        """Low-level helper:  perform the actual API request over HTTP.
+
+        :type method: str
+        :param method: The HTTP method to use in the request.
+
+        :type url: str
+        :param url: The URL to send the request to.
+
+        :type headers: dict
+        :param headers: A dictionary of HTTP headers to send with the request.
+
+        :type data: str
+        :param data: The data to send as the body of the request.
+
+        :type target_object: object
+        :param target_object:
+            (Optional) Unused ``target_object`` here but may be used by a
+            superclass.
+
+        :rtype: :class:`asyncio.Future`
+        :returns: A future resolved with the HTTP response, fully read, as
+                  a :class:`requests.Response`.
+        """
+        # pylint: disable=unused-argument
+        sent = async_helpers.then(
+            self._authorize(headers),
+            lambda _: self.session.request(
+                method, url, headers=headers, data=data))
+        return async_helpers.then(
+            sent, functools.partial(_read_response, method, url))
+
+    def api_request(self, method, path, query_params=None,
+                    data=None, content_type=None, headers=None,
+                    api_base_url=None, api_version=None,
+                    expect_json=True, _target_object=None):
+        """Make a request over the HTTP session to the API.
+
+        Takes the same arguments as
+        :meth:`google.cloud._http.JSONConnection.api_request`, and returns a
+        future resolved with the same values.
+
+        :type method: str
+        :param method: The HTTP method name (ie, ``GET``, ``POST``, etc).
+                       Required.
+
+        :type path: str
+        :param path: The path to the resource (ie, ``'/b/bucket-name'``).
+                     Required.
+
+        :type query_params: dict or list
+        :param query_params: A dictionary of keys and values (or list of
+                             key-value pairs) to insert into the query
+                             string of the URL.
+
+        :type data: str
+        :param data: The data to send as the body of the request.
+
+        :type content_type: str
+        :param content_type: The proper MIME type of the data provided.
+
+        :type headers: dict
+        :param headers: extra HTTP headers to be sent with the request.
+
+        :type api_base_url: str
+        :param api_base_url: The base URL for the API endpoint.
+
+        :type api_version: str
+        :param api_version: The version of the API to call.
+
+        :type expect_json: bool
+        :param expect_json: If True, this method will try to parse the
+                            response as JSON and raise an exception if
+                            that cannot be done.  Default is True.
+
+        :type _target_object: :class:`object`
+        :param _target_object:
+            (Optional) Protected argument to be used by library callers.
+
+        :rtype: :class:`asyncio.Future`
+        :returns: A future resolved with the API response payload, either as
+                  a raw string or a dictionary if the response is valid JSON.
+                  It fails with
+                  :class:`~google.cloud.exceptions.GoogleCloudError` if the
+                  response code is not 200 OK, or with :class:`ValueError`
+                  if the response content type is not JSON.
+        """
+        url = self.build_api_url(path=path, query_params=query_params,
+                                 api_base_url=api_base_url,
+                                 api_version=api_version)
+
+        if data and isinstance(data, dict):
+            data = json.dumps(data)
+            content_type = 'application/json'
+
+        response = self._make_request(
+            method=method, url=url, data=data, content_type=content_type,
+            headers=headers, target_object=_target_object)
+        return async_helpers.then(
+            response, functools.partial(_response_payload, expect_json))
+
+
+def _close_session(session):
+    """Close ``session``, if any.
+
+    :type session: :class:`aiohttp.ClientSession`
+    :param session: The session to close, or :data:`None`.
+
+    :rtype: object
+    :returns: The value returned by the session's ``close()``, possibly an
+              awaitable.
+    """
+    if session is not None:
+        return session.close()
+
+
+def _release(async_response):
+    """Release the connection of a response, if it supports it.
+
+    :type async_response: :class:`aiohttp.ClientResponse`
+    :param async_response: The response to release.
+
+    :rtype: object
+    :returns: The value returned by the response's ``release()``, possibly
+              an awaitable.
+    """
+    release = getattr(async_response, 'release', None)
+    if release is not None:
+        return release()
+
+
+def _read_response(method, url, async_response):
+    """Read the body of a response, then release it.
+
+    :type method: str
+    :param method: The HTTP method of the request.
+
+    :type url: str
+    :param url: The URL of the request.
+
+    :type async_response: :class:`aiohttp.ClientResponse`
+    :param async_response: The response to read.
+
+    :rtype: :class:`asyncio.Future`
+    :returns: A future resolved with the equivalent
+              :class:`requests.Response`.
+    """
+    content = async_helpers.always(
+        async_response.read(), functools.partial(_release, async_response))
+    return async_helpers.then(
+        content, lambda body: _make_requests_response(
+            method, url, async_response.status, async_response.headers,
+            body))
+
+
+def _response_payload(expect_json, response):
+    """Extract the payload of an API response.
+
+    :type expect_json: bool
+    :param expect_json: If True, parse the response as JSON.
+
+    :type response: :class:`requests.Response`
+    :param response: The response to the API request.
+
+    :raises ~google.cloud.exceptions.GoogleCloudError: if the response code
+        is not 200 OK.
+    :rtype: dict or str
+    :returns: The response payload.
+    """
+    if not 200 <= response.status_code < 300:
+        raise exceptions.from_http_response(response)
+
+    if expect_json and response.content:
+        return response.json()
+    else:
+        return response.content
+
+
+def _make_requests_response(method, url, status, headers, content):
+    """Wrap a fully-read response as a :class:`requests.Response`.
+
+    Lets error mapping and JSON decoding match the synchronous connection.
+
+    :type method: str
+    :param method: The HTTP method of the request.
+
+    :type url: str
+    :param url: The URL of the request.
+
+    :type status: int
+    :param status: The HTTP status code of the response.
+
+    :type headers: dict
+    :param headers: The headers of the response.
+
+    :type content: bytes
+    :param content: The body of the response.
+
+    :rtype: :class:`requests.Response`
+    :returns: The equivalent response.
+    """
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers)
+    response._content = content
+    response.url = url
+    response.request = requests.Request(method, url).prepare()
+    return response
@@ -14,11 +14,19 @@
 
 """Shared implementation of connections to API servers."""
 
+import codecs
+import collections
 import json
 import platform
+import socket
+import threading
 
 from pkg_resources import get_distribution
+import requests.adapters
+from six.moves import http_client
 from six.moves.urllib.parse import urlencode
+from urllib3.connection import HTTPConnection
+from urllib3.util import retry as urllib3_retry
 
 from google.cloud import exceptions
 
@@ -34,6 +42,361 @@ CLIENT_INFO_HEADER = 'X-Goog-API-Client'
 CLIENT_INFO_TEMPLATE = (
     'gl-python/' + platform.python_version() + ' gccl/{}')
 
+_STREAM_CHUNK_SIZE = 64 * 1024
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = ' \t\n\r'
+_JSON_DELIMITERS = _JSON_WHITESPACE + ',:]}'
+
+
+class TransportConfig(object):
+    """Connection pool settings for an HTTP transport.
+
+    The defaults match those of :class:`requests.Session`. Clients used
+    from many threads should raise ``pool_maxsize`` to the number of
+    threads (and usually set ``pool_block``), so that connections are
+    re-used rather than opened, used once and discarded.
+
+    Pass it as ``transport_config`` to a client (e.g. a storage or BigQuery
+    client). Clients created with the same instance share its connection
+    pools::
+
+        >>> from google.cloud import bigquery, storage
+        >>> from google.cloud.client import TransportConfig
+        >>> config = TransportConfig(pool_maxsize=50, pool_block=True)
+        >>> storage_client = storage.Client(transport_config=config)
+        >>> bigquery_client = bigquery.Client(transport_config=config)
+
+    :type pool_connections: int
+    :param pool_connections: The number of per-host connection pools to keep.
+
+    :type pool_maxsize: int
+    :param pool_maxsize: The maximum number of connections kept open to a
+                         single host.
+
+    :type pool_block: bool
+    :param pool_block: If True, requests wait for a pooled connection once
+                       ``pool_maxsize`` connections to a host are in use,
+                       rather than opening a connection which is closed
+                       after the request.
+
+    :type tcp_keepalive: bool
+    :param tcp_keepalive: If True, enable TCP keep-alive probes on pooled
+                          connections, so that idle connections are not
+                          silently dropped by proxies and load balancers.
+
+    :type connection_retries: int
+    :param connection_retries: The number of times to retry an idempotent
+                               request whose connection failed or was reset
+                               before a response was received.
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=10,
+                 pool_block=False, tcp_keepalive=False,
+                 connection_retries=0):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.tcp_keepalive = tcp_keepalive
+        self.connection_retries = connection_retries
+        self._adapter = None
+        self._adapter_lock = threading.Lock()
+
+    def make_adapter(self):
+        """Create a transport adapter using these settings.
+
+        :rtype: :class:`requests.adapters.HTTPAdapter`
+        :returns: The adapter.
+        """
+        max_retries = urllib3_retry.Retry(
+            total=self.connection_retries, status=0, redirect=False)
+        return _PoolAdapter(
+            tcp_keepalive=self.tcp_keepalive,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=max_retries)
+
+    def configure(self, session):
+        """Mount a pooling adapter for HTTP and HTTPS URLs on a session.
+
+        The adapter, and so its connection pools, is created on first use
+        and shared by all sessions configured by this instance.
+
+        :type session: :class:`requests.Session`
+        :param session: The session to configure.
+
+        :rtype: :class:`requests.Session`
+        :returns: The same ``session``.
+        """
+        with self._adapter_lock:
+            if self._adapter is None:
+                self._adapter = self.make_adapter()
+        adapter = self._adapter
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+
+class _PoolAdapter(requests.adapters.HTTPAdapter):
+    """HTTP adapter which can enable TCP keep-alive on its connections.
+
+    :type tcp_keepalive: bool
+    :param tcp_keepalive: If True, set ``SO_KEEPALIVE`` on new sockets.
+
+    :type kwargs: dict
+    :param kwargs: Remaining keyword arguments passed to
+                   :class:`requests.adapters.HTTPAdapter`.
+    """
+
+    __attrs__ = requests.adapters.HTTPAdapter.__attrs__ + ['_tcp_keepalive']
+
+    def __init__(self, tcp_keepalive=False, **kwargs):
+        # Must be set before the base class initializes the pool manager.
+        self._tcp_keepalive = tcp_keepalive
+        super(_PoolAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Create the pool manager, adding socket options if needed."""
+        if self._tcp_keepalive:
+            kwargs['socket_options'] = (
+                HTTPConnection.default_socket_options +
+                [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)])
+        super(_PoolAdapter, self).init_poolmanager(*args, **kwargs)
+
+
+class StreamedJSONResponse(object):
+    """A JSON object response whose list field is decoded while downloading.
+
+    Items of the list field named ``stream_key`` are decoded one at a time,
+    as the response body arrives, and handed out by the iterator returned
+    by ``get(stream_key)``. Other fields are available through :meth:`get`
+    and ``[]``; looking up a field which follows the list in the body
+    decodes the rest of the body, buffering the remaining items.
+
+    Returned by :meth:`JSONConnection.api_request` when passed a
+    ``stream_key``.
+
+    :type response: :class:`requests.Response`
+    :param response: A successful response, requested with ``stream=True``.
+
+    :type stream_key: str
+    :param stream_key: The name of the list field to stream.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The number of bytes read at a time.
+    """
+
+    _START = 'start'
+    _KEY = 'key'
+    _NEXT_FIELD = 'next-field'
+    _FIRST_ITEM = 'first-item'
+    _NEXT_ITEM = 'next-item'
+    _DONE = 'done'
+
+    def __init__(self, response, stream_key, chunk_size=_STREAM_CHUNK_SIZE):
+        self._response = response
+        self._stream_key = stream_key
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buffer = u''
+        self._position = 0
+        self._eof = False
+        self._state = self._START
+        self._fields = {}
+        self._pending_items = collections.deque()
+        self._items_started = False
+
+    def _fill(self):
+        """Read the next chunk of the body into the buffer.
+
+        :rtype: bool
+        :returns: False if the body was already exhausted.
+        """
+        if self._eof:
+            return False
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            text = self._text_decoder.decode(b'', final=True)
+            self._eof = True
+        else:
+            text = self._text_decoder.decode(chunk)
+        self._buffer = self._buffer[self._position:] + text
+        self._position = 0
+        return True
+
+    def _peek(self):
+        """Skip whitespace and return the next character.
+
+        :rtype: str
+        :returns: The next character, or an empty string at the end of the
+                  body.
+        """
+        while True:
+            while (self._position < len(self._buffer) and
+                    self._buffer[self._position] in _JSON_WHITESPACE):
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._fill():
+                return u''
+
+    def _expect(self, *characters):
+        """Consume the next character, which must be one of ``characters``.
+
+        :rtype: str
+        :returns: The character consumed.
+        :raises: :class:`ValueError` if another character (or the end of the
+                 body) is found.
+        """
+        found = self._peek()
+        if not found or found not in characters:
+            raise ValueError(
+                'Expected one of %r at position %d of the response, got %r' %
+                (characters, self._position, found))
+        self._position += 1
+        return found
+
+    def _decode_value(self):
+        """Decode the next complete JSON value.
+
+        A value is only accepted once a delimiter follows it (or the body
+        ends), so that e.g. a number split across chunks is not cut short.
+
+        :rtype: object
+        :returns: The decoded value.
+        :raises: :class:`ValueError` if the body is not valid JSON.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(
+                    self._buffer, self._position)
+            except ValueError:
+                if not self._fill():
+                    raise
+                continue
+            followed = (end < len(self._buffer) and
+                        self._buffer[end] in _JSON_DELIMITERS)
+            if followed or not self._fill():
+                self._position = end
+                return value
+
+    def _advance(self):
+        """Decode up to the next item of the streamed field.
+
+        The response is closed once the end of the object is reached.
+
+        :rtype: tuple
+        :returns: ``(True, item)`` if an item was decoded, else
+                  ``(False, None)`` (a field was decoded, or the end of the
+                  object was reached).
+        """
+        result = self._advance_state()
+        if self._state == self._DONE:
+            self._response.close()
+        return result
+
+    def _advance_state(self):
+        """Decode the next token(s) of the body, updating the parse state.
+
+        :rtype: tuple
+        :returns: ``(True, item)`` if an item was decoded, else
+                  ``(False, None)``.
+        """
+        state = self._state
+        if state == self._START:
+            if not self._peek():
+                # An empty body has no fields.
+                self._state = self._DONE
+            else:
+                self._expect(u'{')
+                self._state = self._KEY
+        elif state == self._KEY:
+            if self._peek() == u'}':
+                self._position += 1
+                self._state = self._DONE
+                return False, None
+            key = self._decode_value()
+            self._expect(u':')
+            if key == self._stream_key and self._peek() == u'[':
+                self._position += 1
+                self._state = self._FIRST_ITEM
+            else:
+                self._fields[key] = self._decode_value()
+                self._state = self._NEXT_FIELD
+        elif state == self._NEXT_FIELD:
+            if self._expect(u',', u'}') == u',':
+                self._state = self._KEY
+            else:
+                self._state = self._DONE
+        elif state in (self._FIRST_ITEM, self._NEXT_ITEM):
+            if self._peek() == u']':
+                self._position += 1
+                self._state = self._NEXT_FIELD
+                return False, None
+            if state == self._NEXT_ITEM:
+                self._expect(u',')
+            self._state = self._NEXT_ITEM
+            return True, self._decode_value()
+        return False, None
+
+    def _iter_items(self):
+        """Yield the items of the streamed field as they are decoded.
+
+        :rtype: iterator
+        :returns: The items, in order.
+        """
+        while True:
+            if self._pending_items:
+                yield self._pending_items.popleft()
+            elif self._state == self._DONE:
+                return
+            else:
+                found, item = self._advance()
+                if found:
+                    yield item
+
+    def get(self, key, default=None):
+        """Get a field of the response.
+
+        :type key: str
+        :param key: The name of the field.
+
+        :type default: object
+        :param default: (Optional) The value returned if the field is absent.
+
+        :rtype: object
+        :returns: The value of the field. For ``stream_key``, an iterator of
+                  its items, which can only be consumed once.
+        """
+        if key == self._stream_key and key not in self._fields:
+            if self._items_started:
+                raise ValueError('Items have already been requested', key)
+            self._items_started = True
+            return self._iter_items()
+
+        while key not in self._fields and self._state != self._DONE:
+            found, item = self._advance()
+            if found:
+                self._pending_items.append(item)
+        return self._fields.get(key, default)
+
+    def __getitem__(self, key):
+        value = self.get(key, default=self)
+        if value is self:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self.get(key, default=self) is not self
+
+    def close(self):
+        """Release the connection without reading the rest of the body."""
+        self._state = self._DONE
+        self._pending_items.clear()
+        self._response.close()
+
 
 class Connection(object):
     """A generic connection to Google Cloud Platform.
@@ -140,7 +503,7 @@ class JSONConnection(Connection):
         return url
 
     def _make_request(self, method, url, data=None, content_type=None,
-                      headers=None, target_object=None):
+                      headers=None, target_object=None, stream=False):
         """A low level method to send a request to the API.
 
         Typically, you shouldn't need to use this method.
@@ -168,6 +531,10 @@ class JSONConnection(Connection):
             custom behavior, for example, to defer an HTTP request and complete
             initialization of the object at a later time.
 
+        :type stream: bool
+        :param stream: (Optional) If True, do not read the response body
+                       before returning.
+
         :rtype: :class:`requests.Response`
         :returns: The HTTP response.
         """
@@ -180,10 +547,13 @@ class JSONConnection(Connection):
 
         headers['User-Agent'] = self.USER_AGENT
 
+        if stream:
+            return self._do_request(
+                method, url, headers, data, target_object, stream=True)
         return self._do_request(method, url, headers, data, target_object)
 
-    def _do_request(self, method, url, headers, data,
-                    target_object):  # pylint: disable=unused-argument
+    def _do_request(self, method, url, headers, data, target_object,
+                    stream=False):  # pylint: disable=unused-argument
         """Low-level helper:  perform the actual API request over HTTP.
 
         Allows batch context managers to override and defer a request.
@@ -205,16 +575,24 @@ class JSONConnection(Connection):
             (Optional) Unused ``target_object`` here but may be used by a
             superclass.
 
+        :type stream: bool
+        :param stream: (Optional) If True, do not read the response body
+                       before returning.
+
         :rtype: :class:`requests.Response`
         :returns: The HTTP response.
         """
+        if stream:
+            return self.http.request(
+                url=url, method=method, headers=headers, data=data,
+                stream=True)
         return self.http.request(
             url=url, method=method, headers=headers, data=data)
 
     def api_request(self, method, path, query_params=None,
                     data=None, content_type=None, headers=None,
                     api_base_url=None, api_version=None,
-                    expect_json=True, _target_object=None):
+                    expect_json=True, stream_key=None, _target_object=None):
         """Make a request over the HTTP transport to the API.
 
         You shouldn't need to use this method, but if you plan to
@@ -262,6 +640,15 @@ class JSONConnection(Connection):
                             response as JSON and raise an exception if
                             that cannot be done.  Default is True.
 
+        :type stream_key: str
+        :param stream_key: (Optional) The name of a list field in the JSON
+                           response (e.g. ``items``, ``rows`` or
+                           ``entries``). If passed, the response body is
+                           decoded incrementally and a
+                           :class:`StreamedJSONResponse` is returned, whose
+                           items are available before the whole body has
+                           downloaded.
+
         :type _target_object: :class:`object`
         :param _target_object:
             (Optional) Protected argument to be used by library callers. This
@@ -271,9 +658,10 @@ class JSONConnection(Connection):
         :raises ~google.cloud.exceptions.GoogleCloudError: if the response code
             is not 200 OK.
         :raises ValueError: if the response content type is not JSON.
-        :rtype: dict or str
+        :rtype: dict or str or :class:`StreamedJSONResponse`
         :returns: The API response payload, either as a raw string or
-                  a dictionary if the response is valid JSON.
+                  a dictionary if the response is valid JSON (or a
+                  :class:`StreamedJSONResponse` if ``stream_key`` is passed).
         """
         url = self.build_api_url(path=path, query_params=query_params,
                                  api_base_url=api_base_url,
@@ -285,13 +673,19 @@ class JSONConnection(Connection):
             data = json.dumps(data)
             content_type = 'application/json'
 
+        stream = stream_key is not None and expect_json
         response = self._make_request(
             method=method, url=url, data=data, content_type=content_type,
-            headers=headers, target_object=_target_object)
+            headers=headers, target_object=_target_object, stream=stream)
 
         if not 200 <= response.status_code < 300:
             raise exceptions.from_http_response(response)
 
+        # A response without content (e.g. that of a request deferred by a
+        # batch) has nothing to stream.
+        if stream and response.status_code != http_client.NO_CONTENT:
+            return StreamedJSONResponse(response, stream_key)
+
         if expect_json and response.content:
             return response.json()
         else:
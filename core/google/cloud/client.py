@@ -17,6 +17,7 @@
 import io
 import json
 from pickle import PicklingError
+import threading
 
 import six
 
@@ -24,6 +25,7 @@ import google.auth
 import google.auth.credentials
 import google.auth.transport.requests
 from google.cloud._helpers import _determine_default_project
+from google.cloud._http import TransportConfig
 from google.oauth2 import service_account
 
 
@@ -32,6 +34,56 @@ _GOOGLE_AUTH_CREDENTIALS_HELP = (
     'See https://google-cloud-python.readthedocs.io/en/latest/core/auth.html '
     'for help on authentication with this library.'
 )
+_CLOUD_PLATFORM_SCOPE = 'https://www.googleapis.com/auth/cloud-platform'
+_HTTP_LOCK = threading.Lock()
+
+
+def make_shared_http(credentials=None, transport_config=None,
+                     scopes=(_CLOUD_PLATFORM_SCOPE,)):
+    """Create a pooled, authorized HTTP transport to share between clients.
+
+    The returned session can be passed as ``_http`` to any number of
+    clients (e.g. storage, BigQuery, DNS and logging clients), which then
+    share its connection pools. It is safe to use from multiple threads.
+    Clients accepting ``transport_config`` can instead be given the same
+    :class:`~google.cloud._http.TransportConfig`, which also shares its
+    pools::
+
+        >>> from google.cloud.client import TransportConfig
+        >>> from google.cloud.client import make_shared_http
+        >>> config = TransportConfig(pool_maxsize=200, pool_block=True)
+        >>> http = make_shared_http(transport_config=config)
+        >>> storage_client = storage.Client(_http=http)
+        >>> bigquery_client = bigquery.Client(_http=http)
+
+    :type credentials: :class:`~google.auth.credentials.Credentials`
+    :param credentials: (Optional) The OAuth2 Credentials to use for the
+                        transport. If not passed, falls back to the default
+                        inferred from the environment.
+
+    :type transport_config: :class:`~google.cloud._http.TransportConfig`
+    :param transport_config: (Optional) Connection pool settings. Defaults
+                             to those of :class:`requests.Session`.
+
+    :type scopes: Sequence[str]
+    :param scopes: (Optional) The scopes to request if ``credentials``
+                   require them. Defaults to the ``cloud-platform`` scope,
+                   which covers all clients.
+
+    :rtype: :class:`~google.auth.transport.requests.AuthorizedSession`
+    :returns: The configured transport.
+    """
+    if (credentials is not None and
+            not isinstance(credentials, google.auth.credentials.Credentials)):
+        raise ValueError(_GOOGLE_AUTH_CREDENTIALS_HELP)
+    if credentials is None:
+        credentials, _ = google.auth.default()
+    credentials = google.auth.credentials.with_scopes_if_required(
+        credentials, scopes)
+    if transport_config is None:
+        transport_config = TransportConfig()
+    session = google.auth.transport.requests.AuthorizedSession(credentials)
+    return transport_config.configure(session)
 
 
 class _ClientFactoryMixin(object):
@@ -108,6 +160,15 @@ class Client(_ClientFactoryMixin):
                   ``credentials`` for the current object.
                   This parameter should be considered private, and could
                   change in the future.
+
+    :type transport_config: :class:`~google.cloud._http.TransportConfig`
+    :param transport_config: (Optional) Connection pool settings for the
+                             HTTP object created when ``_http`` is not
+                             passed. Clients given the same instance share
+                             its connection pools.
+
+    :raises: :class:`ValueError` if both ``_http`` and ``transport_config``
+             are passed.
     """
 
     SCOPE = None
@@ -116,16 +177,21 @@ class Client(_ClientFactoryMixin):
     Needs to be set by subclasses.
     """
 
-    def __init__(self, credentials=None, _http=None):
+    def __init__(self, credentials=None, _http=None, transport_config=None):
         if (credentials is not None and
                 not isinstance(
                     credentials, google.auth.credentials.Credentials)):
             raise ValueError(_GOOGLE_AUTH_CREDENTIALS_HELP)
+        if _http is not None and transport_config is not None:
+            raise ValueError(
+                'transport_config only configures the HTTP object created '
+                'by the client: it cannot be used with _http.')
         if credentials is None and _http is None:
             credentials, _ = google.auth.default()
         self._credentials = google.auth.credentials.with_scopes_if_required(
             credentials, self.SCOPE)
         self._http_internal = _http
+        self._transport_config = transport_config
 
     def __getstate__(self):
         """Explicitly state that clients are not pickleable."""
@@ -138,13 +204,20 @@ class Client(_ClientFactoryMixin):
     def _http(self):
         """Getter for object used for HTTP transport.
 
+        The object is created on first use; concurrent first uses from
+        several threads share a single object.
+
         :rtype: :class:`~requests.Session`
         :returns: An HTTP object.
         """
         if self._http_internal is None:
-            self._http_internal = (
-                google.auth.transport.requests.AuthorizedSession(
-                    self._credentials))
+            with _HTTP_LOCK:
+                if self._http_internal is None:
+                    http = google.auth.transport.requests.AuthorizedSession(
+                        self._credentials)
+                    if self._transport_config is not None:
+                        http = self._transport_config.configure(http)
+                    self._http_internal = http
         return self._http_internal
 
 
@@ -201,12 +274,21 @@ class ClientWithProject(Client, _ClientProjectMixin):
                   This parameter should be considered private, and could
                   change in the future.
 
+    :type transport_config: :class:`~google.cloud._http.TransportConfig`
+    :param transport_config: (Optional) Connection pool settings for the
+                             HTTP object created when ``_http`` is not
+                             passed. Clients given the same instance share
+                             its connection pools.
+
     :raises: :class:`ValueError` if the project is neither passed in nor
-             set in the environment.
+             set in the environment, or if both ``_http`` and
+             ``transport_config`` are passed.
     """
 
     _SET_PROJECT = True  # Used by from_service_account_json()
 
-    def __init__(self, project=None, credentials=None, _http=None):
+    def __init__(self, project=None, credentials=None, _http=None,
+                 transport_config=None):
         _ClientProjectMixin.__init__(self, project=project)
-        Client.__init__(self, credentials=credentials, _http=_http)
+        Client.__init__(self, credentials=credentials, _http=_http,
+                        transport_config=transport_config)
@@ -29,14 +29,15 @@ def unit_tests(session, python_version):
     # Set the virtualenv dirname.
     session.virtualenv_dirname = 'unit-' + python_version
 
-    # Install all test dependencies, then install this package in-place.
+    # Install all test dependencies, then install this package in-place,
+    # with aiohttp for the asyncio modules (on Python 3.5+ only).
     session.install(
         'mock',
         'pytest',
         'pytest-cov',
         'grpcio >= 1.0.2',
     )
-    session.install('-e', '.')
+    session.install('-e', '.[async]')
 
     # Run py.test against the unit tests.
     session.run(
@@ -61,6 +61,7 @@ REQUIREMENTS = [
 
 EXTRAS_REQUIREMENTS = {
     ':python_version<"3.2"': ['futures >= 3.0.0'],
+    'async:python_version>="3.5"': ['aiohttp >= 2.0.0'],
 }
 
 setup(
@@ -118,6 +118,32 @@ def test_result_timeout():
         future.result(timeout=1)
 
 
+class PollingFutureImplTransient(PollingFutureImplWithPoll):
+    def __init__(self, retry=polling.DEFAULT_RETRY):
+        super(PollingFutureImplWithPoll, self).__init__(retry=retry)
+        self.poll_count = 0
+
+    def done(self):
+        self.poll_count += 1
+        if self.poll_count < 3:
+            return False
+        self.set_result(42)
+        return True
+
+
+def test_result_with_custom_retry():
+    retry_ = polling.DEFAULT_RETRY.with_delay(initial=0.01, maximum=0.01)
+    future = PollingFutureImplTransient(retry=retry_)
+
+    with mock.patch('time.sleep') as sleep:
+        assert future.result() == 42
+
+    assert future.poll_count == 3
+    assert sleep.call_count == 2
+    for call in sleep.mock_calls:
+        assert call[1][0] <= 0.01
+
+
 def test_callback_background_thread():
     future = PollingFutureImplWithPoll()
     callback = mock.Mock()
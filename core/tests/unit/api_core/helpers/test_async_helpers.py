@@ -0,0 +1,222 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+
+import mock
+import pytest
+
+from google.api.core.helpers import async_helpers
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 5), reason='Requires Python 3.5+')
+
+
+@pytest.fixture
+def loop():
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
+def _spin(loop, iterations=5):
+    """Run a few iterations of ``loop``, calling the scheduled callbacks."""
+    for _ in range(iterations):
+        loop.call_soon(loop.stop)
+        loop.run_forever()
+
+
+class _Awaitable(object):
+    """An awaitable that is neither a coroutine nor a future."""
+
+    def __init__(self, future):
+        self._future = future
+
+    def __await__(self):
+        return self._future.__await__()
+
+
+def test_stop_async_iteration():
+    assert async_helpers.StopAsyncIteration is StopAsyncIteration  # noqa
+
+
+def test_resolved(loop):
+    future = async_helpers.resolved(42)
+
+    assert future.done()
+    assert loop.run_until_complete(future) == 42
+
+
+def test_then(loop):
+    callback = mock.Mock(return_value='result')
+
+    future = async_helpers.then(async_helpers.resolved(42), callback)
+
+    assert loop.run_until_complete(future) == 'result'
+    callback.assert_called_once_with(42)
+
+
+def test_then_w_awaitable_result(loop):
+    inner = async_helpers.resolved('inner')
+
+    future = async_helpers.then(
+        async_helpers.resolved(42), lambda _: _Awaitable(inner))
+
+    assert loop.run_until_complete(future) == 'inner'
+
+
+def test_then_w_failing_awaitable(loop):
+    import asyncio
+
+    source = asyncio.Future()
+    source.set_exception(ValueError('source'))
+    callback = mock.Mock()
+
+    future = async_helpers.then(source, callback)
+
+    with pytest.raises(ValueError):
+        loop.run_until_complete(future)
+    callback.assert_not_called()
+
+
+def test_then_w_failing_callback(loop):
+    callback = mock.Mock(side_effect=ValueError('callback'))
+
+    future = async_helpers.then(async_helpers.resolved(42), callback)
+
+    with pytest.raises(ValueError):
+        loop.run_until_complete(future)
+
+
+def test_then_w_failing_callback_result(loop):
+    import asyncio
+
+    inner = asyncio.Future()
+    inner.set_exception(ValueError('inner'))
+
+    future = async_helpers.then(async_helpers.resolved(42), lambda _: inner)
+
+    with pytest.raises(ValueError):
+        loop.run_until_complete(future)
+
+
+def test_then_cancelled_source(loop):
+    import asyncio
+
+    source = asyncio.Future()
+    callback = mock.Mock()
+
+    future = async_helpers.then(source, callback)
+    source.cancel()
+    _spin(loop)
+
+    assert future.cancelled()
+    callback.assert_not_called()
+
+
+def test_then_cancelled(loop):
+    import asyncio
+
+    source = asyncio.Future()
+    callback = mock.Mock()
+
+    future = async_helpers.then(source, callback)
+    future.cancel()
+    _spin(loop)
+
+    assert source.cancelled()
+    callback.assert_not_called()
+
+
+def test_always(loop):
+    callback = mock.Mock(return_value=None)
+
+    future = async_helpers.always(async_helpers.resolved(42), callback)
+
+    assert loop.run_until_complete(future) == 42
+    callback.assert_called_once_with()
+
+
+def test_always_w_failing_awaitable(loop):
+    import asyncio
+
+    source = asyncio.Future()
+    source.set_exception(ValueError('source'))
+    callback = mock.Mock(return_value=None)
+
+    future = async_helpers.always(source, callback)
+
+    with pytest.raises(ValueError):
+        loop.run_until_complete(future)
+    callback.assert_called_once_with()
+
+
+def test_always_w_awaitable_callback_result(loop):
+    import asyncio
+
+    cleanup = asyncio.Future()
+    source = asyncio.Future()
+    future = async_helpers.always(source, lambda: cleanup)
+    source.set_result(42)
+    _spin(loop)
+
+    assert not future.done()
+
+    cleanup.set_result(None)
+
+    assert loop.run_until_complete(future) == 42
+
+
+def test_always_w_failing_callback(loop):
+    import asyncio
+
+    source = asyncio.Future()
+    source.set_exception(ValueError('source'))
+    callback = mock.Mock(side_effect=KeyError('callback'))
+
+    future = async_helpers.always(source, callback)
+
+    with pytest.raises(KeyError):
+        loop.run_until_complete(future)
+
+
+def test_always_w_failing_callback_result(loop):
+    import asyncio
+
+    cleanup = asyncio.Future()
+    cleanup.set_exception(KeyError('cleanup'))
+
+    future = async_helpers.always(
+        async_helpers.resolved(42), lambda: cleanup)
+
+    with pytest.raises(KeyError):
+        loop.run_until_complete(future)
+
+
+def test_always_cancelled(loop):
+    import asyncio
+
+    source = asyncio.Future()
+    callback = mock.Mock(return_value=None)
+
+    future = async_helpers.always(source, callback)
+    future.cancel()
+    _spin(loop)
+
+    assert source.cancelled()
+    callback.assert_called_once_with()
@@ -0,0 +1,152 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+
+import mock
+import pytest
+
+from google.api.core import page_iterator
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 5), reason='Requires Python 3.5+')
+
+
+@pytest.fixture(autouse=True)
+def loop():
+    import asyncio
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
+def _done(value):
+    import asyncio
+
+    future = asyncio.Future()
+    future.set_result(value)
+    return future
+
+
+def _collect(async_iterator):
+    """Consume an asynchronous iterator without ``async for`` syntax."""
+    import asyncio
+
+    loop = asyncio.get_event_loop()
+    results = []
+    while True:
+        try:
+            results.append(loop.run_until_complete(async_iterator.__anext__()))
+        except StopAsyncIteration:  # noqa: F821
+            return results
+
+
+def _make_iterator(responses, **kw):
+    from google.api.core.async_page_iterator import AsyncHTTPIterator
+
+    api_request = mock.Mock(
+        side_effect=[_done(response) for response in responses])
+    iterator = AsyncHTTPIterator(
+        mock.sentinel.client, api_request, '/foo',
+        page_iterator._item_to_value_identity, **kw)
+    return iterator, api_request
+
+
+class TestAsyncHTTPIterator(object):
+
+    def test_iterate_items(self):
+        iterator, api_request = _make_iterator([
+            {'items': [1, 2], 'nextPageToken': 'a'},
+            {'items': [3]},
+        ])
+
+        assert _collect(iterator.__aiter__()) == [1, 2, 3]
+        assert iterator.num_results == 3
+        assert iterator.page_number == 2
+        api_request.assert_has_calls([
+            mock.call(method='GET', path='/foo', query_params={}),
+            mock.call(
+                method='GET', path='/foo', query_params={'pageToken': 'a'}),
+        ])
+
+    def test_iterate_pages(self):
+        iterator, _ = _make_iterator([
+            {'items': [1, 2], 'nextPageToken': 'a'},
+            {'items': [3]},
+        ])
+
+        pages = _collect(iterator.pages)
+
+        assert [list(page) for page in pages] == [[1, 2], [3]]
+        assert iterator.num_results == 3
+
+    def test_iterate_items_w_empty_page(self):
+        iterator, api_request = _make_iterator([
+            {'items': [1], 'nextPageToken': 'a'},
+            {'nextPageToken': 'b'},
+            {'items': [2]},
+        ])
+
+        assert _collect(iterator.__aiter__()) == [1, 2]
+        assert iterator.page_number == 3
+        assert api_request.call_count == 3
+
+    def test_iterate_async_iterators(self):
+        iterator, _ = _make_iterator([])
+        items = iterator.__aiter__()
+        pages = _make_iterator([])[0].pages
+
+        assert items.__aiter__() is items
+        assert pages.__aiter__() is pages
+
+    def test_iterate_w_max_results(self):
+        iterator, api_request = _make_iterator(
+            [{'items': [1, 2], 'nextPageToken': 'a'}], max_results=2)
+
+        assert _collect(iterator.__aiter__()) == [1, 2]
+        api_request.assert_called_once_with(
+            method='GET', path='/foo', query_params={'maxResults': 2})
+
+    def test_iterate_w_post(self):
+        iterator, api_request = _make_iterator([{'items': [1]}])
+        iterator._HTTP_METHOD = 'POST'
+
+        assert _collect(iterator.__aiter__()) == [1]
+        api_request.assert_called_once_with(
+            method='POST', path='/foo', data={})
+
+    def test_bad_http_method(self):
+        iterator, _ = _make_iterator([])
+        iterator._HTTP_METHOD = 'NOT-A-VERB'
+
+        with pytest.raises(ValueError):
+            _collect(iterator.__aiter__())
+
+    def test_restart(self):
+        iterator, _ = _make_iterator([])
+        iterator.__aiter__()
+
+        with pytest.raises(ValueError):
+            iterator.__aiter__()
+        with pytest.raises(ValueError):
+            iterator.pages
+
+    def test_sync_iteration(self):
+        iterator, _ = _make_iterator([])
+
+        with pytest.raises(TypeError):
+            iter(iterator)
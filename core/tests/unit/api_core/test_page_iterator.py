@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 import types
 
 import mock
@@ -38,6 +39,25 @@ class TestPage(object):
         assert page._parent is parent
         assert page._item_to_value is item_to_value
 
+    def test_constructor_wo_len(self):
+        page = page_iterator.Page(
+            None, iter((1, 2, 3)), page_iterator._item_to_value_identity)
+
+        assert page._num_items is None
+        assert six.next(page) == 1
+        assert page.num_items == 3
+        assert page.remaining == 2
+        assert list(page) == [2, 3]
+        assert page.remaining == 0
+
+    def test_remaining_wo_len(self):
+        page = page_iterator.Page(
+            None, iter((1, 2)), page_iterator._item_to_value_identity)
+
+        assert page.remaining == 2
+        assert page.num_items == 2
+        assert list(page) == [1, 2]
+
     def test___iter__(self):
         page = page_iterator.Page(None, (), None)
         assert iter(page) is page
@@ -90,6 +110,7 @@ class TestIterator(object):
         assert iterator.client is client
         assert iterator._item_to_value == item_to_value
         assert iterator.max_results == max_results
+        assert iterator.prefetch == 0
         # Changing attributes.
         assert iterator.page_number == 0
         assert iterator.next_page_token == token
@@ -201,6 +222,81 @@ class TestIterator(object):
         with pytest.raises(ValueError):
             iter(iterator)
 
+    def test___iter___w_prefetch(self):
+        parent = mock.sentinel.parent
+        pages = [
+            page_iterator.Page(
+                parent, items, page_iterator._item_to_value_identity)
+            for items in ((1, 2), (3,), ())]
+        iterator = PageIteratorImpl(None, None, prefetch=2)
+        iterator._next_page = mock.Mock(side_effect=pages + [None])
+
+        assert list(iterator) == [1, 2, 3]
+        assert iterator.page_number == 3
+        assert iterator.num_results == 3
+        assert iterator._pages_fetched == 3
+        assert iterator._results_fetched == 3
+
+    def test__page_iter_w_prefetch_bounded(self):
+        parent = mock.sentinel.parent
+        fetching = threading.Semaphore(0)
+
+        def next_page():
+            fetching.release()
+            return page_iterator.Page(
+                parent, ('item',), page_iterator._item_to_value_identity)
+
+        iterator = PageIteratorImpl(None, None, prefetch=2)
+        iterator._next_page = mock.Mock(side_effect=next_page)
+        pages = iterator._page_iter(increment=True)
+
+        six.next(pages)
+        # The current page plus two pages ahead of it, and no more.
+        fetching.acquire()
+        fetching.acquire()
+        fetching.acquire()
+        assert not fetching.acquire(False)
+        assert iterator._pages_fetched >= 1
+        assert iterator.page_number == 1
+
+        six.next(pages)
+        fetching.acquire()
+        assert iterator.page_number == 2
+
+        pages.close()
+        assert iterator._next_page.call_count <= 4
+
+    def test__page_iter_w_prefetch_error(self):
+        parent = mock.sentinel.parent
+        page = page_iterator.Page(
+            parent, (1,), page_iterator._item_to_value_identity)
+        iterator = PageIteratorImpl(None, None, prefetch=1)
+        iterator._next_page = mock.Mock(side_effect=[page, ValueError()])
+
+        pages = iterator._page_iter(increment=True)
+
+        assert six.next(pages) is page
+        with pytest.raises(ValueError):
+            six.next(pages)
+
+    def test__pages_requested(self):
+        iterator = PageIteratorImpl(None, None)
+
+        assert iterator._pages_requested() == 0
+        iterator.page_number = 2
+        assert iterator._pages_requested() == 2
+        iterator._pages_fetched = 4
+        assert iterator._pages_requested() == 4
+
+    def test__results_requested(self):
+        iterator = PageIteratorImpl(None, None)
+
+        assert iterator._results_requested() == 0
+        iterator.num_results = 2
+        assert iterator._results_requested() == 2
+        iterator._results_fetched = 7
+        assert iterator._results_requested() == 7
+
 
 class TestHTTPIterator(object):
 
@@ -262,6 +358,54 @@ class TestHTTPIterator(object):
         api_request.assert_called_once_with(
             method='GET', path=path, query_params={})
 
+    def test_iterate_w_prefetch_and_max_results(self):
+        path = '/foo'
+        responses = [
+            {'items': [{'name': '1'}, {'name': '2'}], 'nextPageToken': 'a'},
+            {'items': [{'name': '3'}], 'nextPageToken': 'b'},
+        ]
+        api_request = mock.Mock(side_effect=responses)
+        iterator = page_iterator.HTTPIterator(
+            mock.sentinel.client, api_request, path=path,
+            item_to_value=page_iterator._item_to_value_identity,
+            max_results=3, prefetch=2)
+
+        items = list(iterator)
+
+        assert [item['name'] for item in items] == ['1', '2', '3']
+        assert iterator.num_results == 3
+        api_request.assert_has_calls([
+            mock.call(method='GET', path=path, query_params={
+                'maxResults': 3}),
+            mock.call(method='GET', path=path, query_params={
+                'pageToken': 'a', 'maxResults': 1}),
+        ])
+        assert api_request.call_count == 2
+
+    def test_iterate_w_stream(self):
+        path = '/foo'
+        api_request = mock.Mock(return_value={'items': iter([{'name': '1'}])})
+        iterator = page_iterator.HTTPIterator(
+            mock.sentinel.client, api_request, path=path,
+            item_to_value=page_iterator._item_to_value_identity, stream=True)
+
+        assert list(iterator) == [{'name': '1'}]
+        api_request.assert_called_once_with(
+            method='GET', path=path, query_params={}, stream_key='items')
+
+    def test__get_next_page_response_with_post_w_stream(self):
+        path = '/foo'
+        api_request = mock.Mock(return_value={})
+        iterator = page_iterator.HTTPIterator(
+            mock.sentinel.client, api_request, path=path,
+            item_to_value=page_iterator._item_to_value_identity,
+            items_key='rows', stream=True)
+        iterator._HTTP_METHOD = 'POST'
+
+        assert iterator._get_next_page_response() == {}
+        api_request.assert_called_once_with(
+            method='POST', path=path, data={}, stream_key='rows')
+
     def test__has_next_page_new(self):
         iterator = page_iterator.HTTPIterator(
             mock.sentinel.client,
@@ -491,6 +635,19 @@ class TestGRPCIterator(object):
         assert method.call_count == 2
         assert request.page_token is '1'
 
+    def test_iterate_w_prefetch(self):
+        request = mock.Mock(spec=['page_token'], page_token=None)
+        response1 = mock.Mock(items=['a', 'b'], next_page_token='1')
+        response2 = mock.Mock(items=['c'], next_page_token='')
+        method = mock.Mock(side_effect=[response1, response2])
+        iterator = page_iterator.GRPCIterator(
+            mock.sentinel.client, method, request, 'items', prefetch=1)
+
+        assert iterator.prefetch == 1
+        assert list(iterator) == ['a', 'b', 'c']
+        assert method.call_count == 2
+        assert request.page_token == '1'
+
 
 class GAXPageIterator(object):
     """Fake object that matches gax.PageIterator"""
@@ -524,6 +681,16 @@ class TestGAXIterator(object):
         assert iterator.page_number == 0
         assert iterator.next_page_token == token
         assert iterator.num_results == 0
+        assert iterator.prefetch == 0
+
+    def test_constructor_w_prefetch(self):
+        page_iter = GAXPageIterator([(1, 2), (3,)], page_token='a')
+        iterator = page_iterator._GAXIterator(
+            mock.sentinel.client, page_iter,
+            page_iterator._item_to_value_identity, prefetch=2)
+
+        assert iterator.prefetch == 2
+        assert list(iterator) == [1, 2, 3]
 
     def test__next_page(self):
         page_items = (29, 31)
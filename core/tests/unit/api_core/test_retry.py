@@ -204,6 +204,13 @@ class TestRetry(object):
         assert new_retry._maximum == 2
         assert new_retry._multiplier == 3
 
+    def test_with_delay_partial(self):
+        retry_ = retry.Retry()
+        new_retry = retry_.with_delay(initial=1)
+        assert new_retry._initial == 1
+        assert new_retry._maximum == retry_._maximum
+        assert new_retry._multiplier == retry_._multiplier
+
     def test___str__(self):
         retry_ = retry.Retry()
         assert re.match((
@@ -0,0 +1,312 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import sys
+import unittest
+
+import mock
+
+
+def _done(value):
+    import asyncio
+
+    future = asyncio.Future()
+    future.set_result(value)
+    return future
+
+
+def _failed(exc):
+    import asyncio
+
+    future = asyncio.Future()
+    future.set_exception(exc)
+    return future
+
+
+def _make_session(status=200, content=b'{}', headers=None):
+    response = mock.Mock(
+        status=status, headers=headers or {}, spec=['status', 'headers'])
+    response.read = mock.Mock(side_effect=lambda: _done(content))
+    response.release = mock.Mock(return_value=None)
+    session = mock.Mock(spec=['request', 'close'])
+    session.request.side_effect = lambda *args, **kw: _done(response)
+    session.close.return_value = None
+    session.response = response
+    return session
+
+
+def _make_credentials(valid=True):
+    import google.auth.credentials
+
+    credentials = mock.Mock(spec=google.auth.credentials.Credentials)
+    credentials.valid = valid
+
+    def apply(headers):
+        headers['authorization'] = 'Bearer token'
+
+    credentials.apply.side_effect = apply
+    return credentials
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'Requires Python 3.5+')
+class TestAsyncJSONConnection(unittest.TestCase):
+
+    def setUp(self):
+        import asyncio
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        import asyncio
+
+        asyncio.set_event_loop(None)
+        self.loop.close()
+
+    def _run(self, awaitable):
+        return self.loop.run_until_complete(awaitable)
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud._async_http import AsyncJSONConnection
+
+        return AsyncJSONConnection
+
+    def _make_mock_one(self, *args, **kw):
+        class MockConnection(self._get_target_class()):
+            API_URL_TEMPLATE = '{api_base_url}/mock/{api_version}{path}'
+            API_BASE_URL = 'http://mock'
+            API_VERSION = 'vMOCK'
+
+        return MockConnection(*args, **kw)
+
+    def test_from_connection(self):
+        from google.cloud import _http
+
+        class Connection(_http.JSONConnection):
+            API_URL_TEMPLATE = '{api_base_url}/mock/{api_version}{path}'
+            API_BASE_URL = 'http://mock'
+            API_VERSION = 'vMOCK'
+            _EXTRA_HEADERS = {'X-Extra': 'yes'}
+
+        client = mock.Mock(_credentials=None, spec=['_credentials'])
+        session = _make_session()
+        sync_connection = Connection(client)
+
+        conn = self._get_target_class().from_connection(
+            sync_connection, session=session)
+
+        self.assertIsInstance(conn, self._get_target_class())
+        self.assertIsInstance(conn, Connection)
+        self.assertEqual(type(conn).__name__, 'AsyncConnection')
+        self.assertIs(conn._client, client)
+        self.assertIs(conn.session, session)
+
+        self._run(conn.api_request('GET', '/foo'))
+
+        args, kwargs = session.request.call_args
+        self.assertEqual(args, ('GET', 'http://mock/mock/vMOCK/foo'))
+        self.assertEqual(kwargs['headers']['X-Extra'], 'yes')
+
+    def test_session_default(self):
+        from google.cloud import _async_http
+
+        conn = self._make_mock_one(mock.sentinel.client)
+        aiohttp = mock.Mock(spec=['ClientSession'])
+
+        with mock.patch.object(_async_http, 'aiohttp', new=aiohttp):
+            session = conn.session
+            self.assertIs(conn.session, session)
+
+        self.assertIs(session, aiohttp.ClientSession.return_value)
+        aiohttp.ClientSession.assert_called_once_with()
+
+    def test_session_wo_aiohttp(self):
+        from google.cloud import _async_http
+
+        conn = self._make_mock_one(mock.sentinel.client)
+
+        with mock.patch.object(_async_http, 'aiohttp', new=None):
+            with self.assertRaises(EnvironmentError):
+                conn.session
+
+    def test_close(self):
+        session = _make_session()
+        conn = self._make_mock_one(mock.sentinel.client, session=session)
+
+        self._run(conn.close())
+
+        session.close.assert_called_once_with()
+
+    def test_close_wo_session(self):
+        from google.cloud import _async_http
+
+        conn = self._make_mock_one(mock.sentinel.client)
+
+        with mock.patch.object(_async_http, 'aiohttp', new=None):
+            self.assertIsNone(self._run(conn.close()))
+
+    def test_close_w_awaitable(self):
+        session = _make_session()
+        session.close.return_value = _done('closed')
+        conn = self._make_mock_one(mock.sentinel.client, session=session)
+
+        self.assertEqual(self._run(conn.close()), 'closed')
+
+    def test_api_request_defaults(self):
+        credentials = _make_credentials()
+        client = mock.Mock(_credentials=credentials, spec=['_credentials'])
+        session = _make_session(
+            content=b'{"name": "foo"}',
+            headers={'Content-Type': 'application/json'})
+        conn = self._make_mock_one(client, session=session)
+
+        result = self._run(
+            conn.api_request('GET', '/foo', query_params={'a': 1}))
+
+        self.assertEqual(result, {'name': 'foo'})
+        credentials.refresh.assert_not_called()
+        session.request.assert_called_once_with(
+            'GET', 'http://mock/mock/vMOCK/foo?a=1', data=None, headers={
+                'Accept-Encoding': 'gzip',
+                'User-Agent': conn.USER_AGENT,
+                'authorization': 'Bearer token',
+            })
+
+    def test_api_request_w_data_refreshes_credentials(self):
+        credentials = _make_credentials(valid=False)
+        client = mock.Mock(_credentials=credentials, spec=['_credentials'])
+        session = _make_session(content=b'')
+        conn = self._make_mock_one(client, session=session)
+        data = {'name': 'foo'}
+
+        result = self._run(conn.api_request('POST', '/foo', data=data))
+
+        self.assertEqual(result, b'')
+        self.assertEqual(credentials.refresh.call_count, 1)
+        _, kwargs = session.request.call_args
+        self.assertEqual(json.loads(kwargs['data']), data)
+        self.assertEqual(
+            kwargs['headers']['Content-Type'], 'application/json')
+
+    def test_api_request_concurrent_share_refresh(self):
+        import asyncio
+
+        credentials = _make_credentials(valid=False)
+        client = mock.Mock(_credentials=credentials, spec=['_credentials'])
+        session = _make_session()
+        conn = self._make_mock_one(client, session=session)
+
+        results = self._run(asyncio.gather(
+            conn.api_request('GET', '/foo'),
+            conn.api_request('GET', '/bar')))
+
+        self.assertEqual(results, [{}, {}])
+        self.assertEqual(credentials.refresh.call_count, 1)
+        self.assertIsNone(conn._refresh)
+        for _, kwargs in session.request.call_args_list:
+            self.assertEqual(
+                kwargs['headers']['authorization'], 'Bearer token')
+
+    def test_api_request_w_refresh_error(self):
+        credentials = _make_credentials(valid=False)
+        credentials.refresh.side_effect = ValueError('refresh')
+        client = mock.Mock(_credentials=credentials, spec=['_credentials'])
+        session = _make_session()
+        conn = self._make_mock_one(client, session=session)
+
+        with self.assertRaises(ValueError):
+            self._run(conn.api_request('GET', '/foo'))
+
+        self.assertIsNone(conn._refresh)
+        session.request.assert_not_called()
+
+    def test_api_request_w_read_error(self):
+        client = mock.Mock(_credentials=None, spec=['_credentials'])
+        session = _make_session()
+        session.response.read.side_effect = lambda: _failed(
+            ValueError('read'))
+        conn = self._make_mock_one(client, session=session)
+
+        with self.assertRaises(ValueError):
+            self._run(conn.api_request('GET', '/foo'))
+
+        session.response.release.assert_called_once_with()
+
+    def test_api_request_w_awaitable_release(self):
+        client = mock.Mock(_credentials=None, spec=['_credentials'])
+        session = _make_session(content=b'{"a": 1}')
+        session.response.release.return_value = _done(None)
+        conn = self._make_mock_one(client, session=session)
+
+        result = self._run(conn.api_request('GET', '/foo'))
+
+        self.assertEqual(result, {'a': 1})
+        session.response.release.assert_called_once_with()
+
+    def test_api_request_wo_release(self):
+        client = mock.Mock(_credentials=None, spec=['_credentials'])
+        session = _make_session(content=b'{"a": 1}')
+        del session.response.release
+        conn = self._make_mock_one(client, session=session)
+
+        result = self._run(conn.api_request('GET', '/foo'))
+
+        self.assertEqual(result, {'a': 1})
+
+    def test_api_request_wo_json_expected(self):
+        client = mock.Mock(_credentials=None, spec=['_credentials'])
+        session = _make_session(content=b'CONTENT')
+        conn = self._make_mock_one(client, session=session)
+
+        result = self._run(conn.api_request('GET', '/', expect_json=False))
+
+        self.assertEqual(result, b'CONTENT')
+
+    def test_api_request_w_error(self):
+        from google.cloud import exceptions
+
+        client = mock.Mock(_credentials=None, spec=['_credentials'])
+        session = _make_session(
+            status=404, content=b'{"error": {"message": "Gone"}}')
+        conn = self._make_mock_one(client, session=session)
+
+        with self.assertRaises(exceptions.NotFound) as exc_info:
+            self._run(conn.api_request('GET', '/foo'))
+
+        self.assertEqual(
+            exc_info.exception.message,
+            'GET http://mock/mock/vMOCK/foo: Gone')
+        session.response.release.assert_called_once_with()
+
+
+class Test__make_requests_response(unittest.TestCase):
+
+    def _call_fut(self, *args, **kw):
+        from google.cloud._async_http import _make_requests_response
+
+        return _make_requests_response(*args, **kw)
+
+    @unittest.skipIf(sys.version_info < (3, 5), 'Requires Python 3.5+')
+    def test_it(self):
+        response = self._call_fut(
+            'GET', 'http://example.com/', 200,
+            {'Content-Type': 'application/json'}, b'{"a": 1}')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['content-type'], 'application/json')
+        self.assertEqual(response.json(), {'a': 1})
+        self.assertEqual(response.request.method, 'GET')
+        self.assertEqual(response.request.url, 'http://example.com/')
@@ -20,6 +20,83 @@ import requests
 from six.moves import http_client
 
 
+class TestTransportConfig(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud._http import TransportConfig
+
+        return TransportConfig
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_constructor_defaults(self):
+        config = self._make_one()
+
+        self.assertEqual(config.pool_connections, 10)
+        self.assertEqual(config.pool_maxsize, 10)
+        self.assertFalse(config.pool_block)
+        self.assertFalse(config.tcp_keepalive)
+        self.assertEqual(config.connection_retries, 0)
+
+    def test_make_adapter(self):
+        config = self._make_one(
+            pool_connections=4, pool_maxsize=200, pool_block=True,
+            connection_retries=3)
+
+        adapter = config.make_adapter()
+
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 200)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertFalse(adapter.max_retries.redirect)
+        self.assertNotIn(
+            'socket_options', adapter.poolmanager.connection_pool_kw)
+
+    def test_make_adapter_w_tcp_keepalive(self):
+        import socket
+
+        adapter = self._make_one(tcp_keepalive=True).make_adapter()
+
+        socket_options = adapter.poolmanager.connection_pool_kw[
+            'socket_options']
+        self.assertIn(
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), socket_options)
+
+    def test_make_adapter_pickle(self):
+        import pickle
+
+        adapter = self._make_one(tcp_keepalive=True).make_adapter()
+
+        restored = pickle.loads(pickle.dumps(adapter))
+
+        self.assertTrue(restored._tcp_keepalive)
+        self.assertIn(
+            'socket_options', restored.poolmanager.connection_pool_kw)
+
+    def test_configure(self):
+        config = self._make_one(pool_maxsize=50)
+        session = requests.Session()
+
+        self.assertIs(config.configure(session), session)
+
+        https_adapter = session.get_adapter('https://www.googleapis.com/')
+        http_adapter = session.get_adapter('http://localhost/')
+        self.assertIs(https_adapter, http_adapter)
+        self.assertEqual(https_adapter._pool_maxsize, 50)
+
+    def test_configure_shares_adapter(self):
+        config = self._make_one()
+        first = config.configure(requests.Session())
+        second = config.configure(requests.Session())
+
+        self.assertIs(
+            first.get_adapter('https://www.googleapis.com/'),
+            second.get_adapter('https://www.googleapis.com/'))
+
+
 class TestConnection(unittest.TestCase):
 
     @staticmethod
@@ -64,6 +141,17 @@ def make_response(status=http_client.OK, content=b'', headers={}):
     return response
 
 
+def make_streamed_response(payload, chunk_size=3,
+                           status=http_client.OK):
+    response = mock.Mock(status_code=status, spec=[
+        'status_code', 'iter_content', 'close'])
+    chunks = [
+        payload[index:index + chunk_size]
+        for index in range(0, len(payload), chunk_size)]
+    response.iter_content.return_value = iter(chunks)
+    return response
+
+
 def make_requests_session(responses):
     session = mock.create_autospec(requests.Session, instance=True)
     session.request.side_effect = responses
@@ -349,3 +437,169 @@ class TestJSONConnection(unittest.TestCase):
 
         with self.assertRaises(exceptions.InternalServerError):
             conn.api_request('GET', '/')
+
+    def test_api_request_w_stream_key(self):
+        from google.cloud._http import StreamedJSONResponse
+
+        payload = b'{"nextPageToken": "abc", "items": [{"a": 1}, {"a": 2}]}'
+        response = make_streamed_response(payload)
+        http = make_requests_session([response])
+        client = mock.Mock(_http=http, spec=['_http'])
+        conn = self._make_mock_one(client)
+
+        result = conn.api_request('GET', '/', stream_key='items')
+
+        self.assertIsInstance(result, StreamedJSONResponse)
+        self.assertEqual(result.get('nextPageToken'), 'abc')
+        self.assertEqual(list(result.get('items')), [{'a': 1}, {'a': 2}])
+        http.request.assert_called_once_with(
+            method='GET', url=mock.ANY, headers=mock.ANY, data=None,
+            stream=True)
+        response.close.assert_called_once_with()
+
+    def test_api_request_w_stream_key_w_404(self):
+        from google.cloud import exceptions
+
+        response = make_response(http_client.NOT_FOUND)
+        http = make_requests_session([response])
+        client = mock.Mock(_http=http, spec=['_http'])
+        conn = self._make_mock_one(client)
+
+        with self.assertRaises(exceptions.NotFound):
+            conn.api_request('GET', '/', stream_key='items')
+
+    def test_api_request_w_stream_key_w_no_content(self):
+        response = make_response(http_client.NO_CONTENT, content=b'')
+        http = make_requests_session([response])
+        client = mock.Mock(_http=http, spec=['_http'])
+        conn = self._make_mock_one(client)
+
+        result = conn.api_request('GET', '/', stream_key='items')
+
+        self.assertEqual(result, b'')
+        http.request.assert_called_once_with(
+            method='GET', url=mock.ANY, headers=mock.ANY, data=None,
+            stream=True)
+
+    def test_api_request_w_stream_key_wo_json_expected(self):
+        http = make_requests_session([make_response(content=b'CONTENT')])
+        client = mock.Mock(_http=http, spec=['_http'])
+        conn = self._make_mock_one(client)
+
+        result = conn.api_request(
+            'GET', '/', expect_json=False, stream_key='items')
+
+        self.assertEqual(result, b'CONTENT')
+        http.request.assert_called_once_with(
+            method='GET', url=mock.ANY, headers=mock.ANY, data=None)
+
+
+class TestStreamedJSONResponse(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud._http import StreamedJSONResponse
+
+        return StreamedJSONResponse
+
+    def _make_one(self, payload, stream_key='items', chunk_size=3):
+        response = make_streamed_response(payload, chunk_size=chunk_size)
+        return self._get_target_class()(response, stream_key), response
+
+    def test_items_decoded_incrementally(self):
+        payload = b'{"items": [{"name": "first"}, {"name": "second"}]}'
+        streamed, response = self._make_one(payload)
+
+        items = streamed.get('items')
+        self.assertEqual(next(items), {'name': 'first'})
+        # Only the chunks needed for the first item have been read.
+        chunks = response.iter_content.return_value
+        self.assertGreater(len(list(chunks)), 0)
+        response.close.assert_not_called()
+
+    def test_fields_before_and_after_items(self):
+        payload = (
+            b' {"kind": "list", "totalRows": 1234, "rows": [\n'
+            b'  {"f": [{"v": "1"}]}, {"f": [{"v": "2"}]} ],\n'
+            b'  "pageToken": null, "done": true} ')
+        streamed, response = self._make_one(payload, stream_key='rows')
+
+        self.assertEqual(streamed['kind'], 'list')
+        self.assertEqual(streamed.get('totalRows'), 1234)
+        rows = streamed.get('rows')
+        # Looking up a field after the list buffers the remaining items.
+        self.assertIn('done', streamed)
+        self.assertIsNone(streamed['pageToken'])
+        self.assertEqual(list(rows), [
+            {'f': [{'v': '1'}]}, {'f': [{'v': '2'}]}])
+        response.close.assert_called_once_with()
+        self.assertNotIn('missing', streamed)
+        with self.assertRaises(KeyError):
+            streamed['missing']
+
+    def test_number_split_across_chunks(self):
+        streamed, _ = self._make_one(
+            b'{"items": [12345, 6789, 1.5e3]}', chunk_size=2)
+
+        self.assertEqual(list(streamed.get('items')), [12345, 6789, 1500.0])
+
+    def test_multibyte_split_across_chunks(self):
+        payload = u'{"items": ["\u00e9t\u00e9", "\u2603"]}'.encode('utf-8')
+        streamed, _ = self._make_one(payload, chunk_size=1)
+
+        self.assertEqual(
+            list(streamed.get('items')), [u'\u00e9t\u00e9', u'\u2603'])
+
+    def test_empty_items(self):
+        streamed, _ = self._make_one(b'{"items": [], "next": "a"}')
+
+        self.assertEqual(list(streamed.get('items')), [])
+        self.assertEqual(streamed.get('next'), 'a')
+
+    def test_empty_object(self):
+        streamed, _ = self._make_one(b'{}')
+
+        self.assertEqual(list(streamed.get('items')), [])
+        self.assertIsNone(streamed.get('next'))
+
+    def test_empty_body(self):
+        streamed, _ = self._make_one(b'')
+
+        self.assertEqual(streamed.get('next', 'default'), 'default')
+        self.assertEqual(list(streamed.get('items')), [])
+
+    def test_items_requested_twice(self):
+        streamed, _ = self._make_one(b'{"items": [1]}')
+        streamed.get('items')
+
+        with self.assertRaises(ValueError):
+            streamed.get('items')
+
+    def test_invalid_json(self):
+        streamed, _ = self._make_one(b'{"items": [1, }')
+
+        with self.assertRaises(ValueError):
+            list(streamed.get('items'))
+
+    def test_not_an_object(self):
+        streamed, _ = self._make_one(b'[1, 2]')
+
+        with self.assertRaises(ValueError):
+            streamed.get('next')
+
+    def test_truncated(self):
+        streamed, _ = self._make_one(b'{"items": [1, 2')
+
+        with self.assertRaises(ValueError):
+            list(streamed.get('items'))
+
+    def test_close(self):
+        streamed, response = self._make_one(b'{"items": [1, 2], "a": 1}')
+        items = streamed.get('items')
+        self.assertEqual(next(items), 1)
+
+        streamed.close()
+
+        response.close.assert_called_once_with()
+        self.assertEqual(list(items), [])
+        self.assertIsNone(streamed.get('a'))
@@ -25,6 +25,55 @@ def _make_credentials():
     return mock.Mock(spec=google.auth.credentials.Credentials)
 
 
+class Test_make_shared_http(unittest.TestCase):
+
+    def _call_fut(self, *args, **kw):
+        from google.cloud.client import make_shared_http
+
+        return make_shared_http(*args, **kw)
+
+    def test_defaults(self):
+        import requests
+        from google.auth.transport.requests import AuthorizedSession
+        from google.cloud.client import _CLOUD_PLATFORM_SCOPE
+
+        credentials = _make_credentials()
+        patch = mock.patch(
+            'google.auth.default', return_value=(credentials, None))
+        scoped = 'google.auth.credentials.with_scopes_if_required'
+        with patch as default:
+            with mock.patch(scoped, return_value=credentials) as with_scopes:
+                http = self._call_fut()
+
+        default.assert_called_once_with()
+        with_scopes.assert_called_once_with(
+            credentials, (_CLOUD_PLATFORM_SCOPE,))
+        self.assertIsInstance(http, AuthorizedSession)
+        self.assertIs(http.credentials, credentials)
+        adapter = http.get_adapter('https://www.googleapis.com/')
+        self.assertIsInstance(adapter, requests.adapters.HTTPAdapter)
+        self.assertEqual(adapter._pool_maxsize, 10)
+
+    def test_explicit(self):
+        from google.cloud._http import TransportConfig
+
+        credentials = _make_credentials()
+        config = TransportConfig(pool_maxsize=200, pool_block=True)
+
+        http = self._call_fut(
+            credentials=credentials, transport_config=config,
+            scopes=['scope'])
+
+        self.assertIs(http.credentials, credentials)
+        adapter = http.get_adapter('https://www.googleapis.com/')
+        self.assertEqual(adapter._pool_maxsize, 200)
+        self.assertTrue(adapter._pool_block)
+
+    def test_bad_credentials(self):
+        with self.assertRaises(ValueError):
+            self._call_fut(credentials=mock.sentinel.credentials)
+
+
 class Test_ClientFactoryMixin(unittest.TestCase):
 
     @staticmethod
@@ -85,6 +134,14 @@ class TestClient(unittest.TestCase):
         with self.assertRaises(ValueError):
             self._make_one(credentials=credentials)
 
+    def test_constructor_w_transport_config_and_http(self):
+        from google.cloud._http import TransportConfig
+
+        with self.assertRaises(ValueError):
+            self._make_one(
+                credentials=_make_credentials(), _http=mock.sentinel.http,
+                transport_config=TransportConfig())
+
     def test_from_service_account_json(self):
         from google.cloud import _helpers
 
@@ -144,6 +201,23 @@ class TestClient(unittest.TestCase):
             self.assertIs(client._http, mock.sentinel.http)
             self.assertEqual(AuthorizedSession.call_count, 1)
 
+    def test__http_property_new_w_transport_config(self):
+        from google.cloud._http import TransportConfig
+
+        credentials = _make_credentials()
+        config = TransportConfig(pool_maxsize=50)
+        client = self._make_one(
+            credentials=credentials, transport_config=config)
+        other = self._make_one(
+            credentials=credentials, transport_config=config)
+
+        adapter = client._http.get_adapter('https://www.googleapis.com/')
+
+        self.assertEqual(adapter._pool_maxsize, 50)
+        self.assertIs(
+            other._http.get_adapter('https://www.googleapis.com/'), adapter)
+        self.assertIsNot(other._http, client._http)
+
 
 class TestClientWithProject(unittest.TestCase):
 
@@ -222,6 +296,16 @@ class TestClientWithProject(unittest.TestCase):
         PROJECT = u'PROJECT'
         self._explicit_ctor_helper(PROJECT)
 
+    def test_constructor_w_transport_config(self):
+        from google.cloud._http import TransportConfig
+
+        config = TransportConfig()
+        client_obj = self._make_one(
+            project='PROJECT', credentials=_make_credentials(),
+            transport_config=config)
+
+        self.assertIs(client_obj._transport_config, config)
+
     def _from_service_account_json_helper(self, project=None):
         from google.cloud import _helpers
 
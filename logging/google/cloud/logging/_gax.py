@@ -59,7 +59,7 @@ class _LoggingAPI(object):
         self._client = client
 
     def list_entries(self, projects, filter_='', order_by='',
-                     page_size=0, page_token=None):
+                     page_size=0, page_token=None, prefetch=0):
         """Return a page of log entry resources.
 
         :type projects: list of strings
@@ -84,6 +84,12 @@ class _LoggingAPI(object):
                            passed, the API will return the first page of
                            entries.
 
+        :type prefetch: int
+        :param prefetch: (Optional) The number of pages to request ahead of
+                         the page being consumed, on a background thread.
+                         Defaults to 0 (each page is requested once the
+                         previous one is used up).
+
         :rtype: :class:`~google.api.core.page_iterator.Iterator`
         :returns: Iterator of :class:`~google.cloud.logging.entries._BaseEntry`
                   accessible to the current API.
@@ -102,7 +108,7 @@ class _LoggingAPI(object):
         item_to_value = functools.partial(
             _item_to_entry, loggers=loggers)
         return page_iterator._GAXIterator(
-            self._client, page_iter, item_to_value)
+            self._client, page_iter, item_to_value, prefetch=prefetch)
 
     def write_entries(self, entries, logger_name=None, resource=None,
                       labels=None):
@@ -65,7 +65,7 @@ class _LoggingAPI(object):
         self.api_request = client._connection.api_request
 
     def list_entries(self, projects, filter_=None, order_by=None,
-                     page_size=None, page_token=None):
+                     page_size=None, page_token=None, prefetch=0):
         """Return a page of log entry resources.
 
         See
@@ -93,6 +93,12 @@ class _LoggingAPI(object):
                            passed, the API will return the first page of
                            entries.
 
+        :type prefetch: int
+        :param prefetch: (Optional) The number of pages to request ahead of
+                         the page being consumed, on a background thread.
+                         Defaults to 0 (each page is requested once the
+                         previous one is used up).
+
         :rtype: :class:`~google.api.core.page_iterator.Iterator`
         :returns: Iterator of :class:`~google.cloud.logging.entries._BaseEntry`
                   accessible to the current API.
@@ -122,7 +128,8 @@ class _LoggingAPI(object):
             item_to_value=item_to_value,
             items_key='entries',
             page_token=page_token,
-            extra_params=extra_params)
+            extra_params=extra_params,
+            prefetch=prefetch)
         # This method uses POST to make a read-only request.
         iterator._HTTP_METHOD = 'POST'
         return iterator
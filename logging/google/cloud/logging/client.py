@@ -167,7 +167,7 @@ class Client(ClientWithProject):
         return Logger(name, client=self)
 
     def list_entries(self, projects=None, filter_=None, order_by=None,
-                     page_size=None, page_token=None):
+                     page_size=None, page_token=None, prefetch=0):
         """Return a page of log entries.
 
         See
@@ -195,6 +195,12 @@ class Client(ClientWithProject):
                            passed, the API will return the first page of
                            entries.
 
+        :type prefetch: int
+        :param prefetch: (Optional) The number of pages to request ahead of
+                         the page being consumed, on a background thread.
+                         Defaults to 0 (each page is requested once the
+                         previous one is used up).
+
         :rtype: :class:`~google.api.core.page_iterator.Iterator`
         :returns: Iterator of :class:`~google.cloud.logging.entries._BaseEntry`
                   accessible to the current client.
@@ -204,7 +210,7 @@ class Client(ClientWithProject):
 
         return self.logging_api.list_entries(
             projects=projects, filter_=filter_, order_by=order_by,
-            page_size=page_size, page_token=page_token)
+            page_size=page_size, page_token=page_token, prefetch=prefetch)
 
     def sink(self, name, filter_=None, destination=None):
         """Creates a sink bound to the current client.
@@ -316,7 +316,7 @@ class Logger(object):
         client.logging_api.logger_delete(self.project, self.name)
 
     def list_entries(self, projects=None, filter_=None, order_by=None,
-                     page_size=None, page_token=None):
+                     page_size=None, page_token=None, prefetch=0):
         """Return a page of log entries.
 
         See
@@ -344,6 +344,12 @@ class Logger(object):
                            passed, the API will return the first page of
                            entries.
 
+        :type prefetch: int
+        :param prefetch: (Optional) The number of pages to request ahead of
+                         the page being consumed, on a background thread.
+                         Defaults to 0 (each page is requested once the
+                         previous one is used up).
+
         :rtype: :class:`~google.api.core.page_iterator.Iterator`
         :returns: Iterator of :class:`~google.cloud.logging.entries._BaseEntry`
                   accessible to the current logger.
@@ -355,7 +361,7 @@ class Logger(object):
             filter_ = log_filter
         return self.client.list_entries(
             projects=projects, filter_=filter_, order_by=order_by,
-            page_size=page_size, page_token=page_token)
+            page_size=page_size, page_token=page_token, prefetch=prefetch)
 
 
 class Batch(object):
@@ -122,6 +122,22 @@ class Test_LoggingAPI(_Base, unittest.TestCase):
         self.assertEqual(page_size, 0)
         self.assertIs(options.page_token, INITIAL_PAGE)
 
+    def test_list_entries_w_prefetch(self):
+        from google.cloud._testing import _GAXPageIterator
+        from google.cloud.logging.client import Client
+
+        response = _GAXPageIterator([])
+        gax_api = _GAXLoggingAPI(_list_log_entries_response=response)
+        client = Client(project=self.PROJECT, credentials=_make_credentials(),
+                        _use_grpc=True)
+        api = self._make_one(gax_api, client)
+
+        iterator = api.list_entries([self.PROJECT], prefetch=2)
+        entries = list(iterator)
+
+        self.assertEqual(iterator.prefetch, 2)
+        self.assertEqual(entries, [])
+
     def _list_entries_with_paging_helper(self, payload, struct_pb):
         import datetime
 
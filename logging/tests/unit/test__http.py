@@ -167,6 +167,25 @@ class Test_LoggingAPI(unittest.TestCase):
             'data': SENT,
         })
 
+    def test_list_entries_w_prefetch(self):
+        from google.cloud.logging.client import Client
+
+        client = Client(project=self.PROJECT, credentials=_make_credentials(),
+                        _use_grpc=False)
+        client._connection = _Connection({})
+        api = self._make_one(client)
+
+        iterator = api.list_entries([self.PROJECT], prefetch=2)
+        entries = list(iterator)
+
+        self.assertEqual(iterator.prefetch, 2)
+        self.assertEqual(entries, [])
+        self.assertEqual(client._connection._called_with, {
+            'method': 'POST',
+            'path': '/entries:list',
+            'data': {'projectIds': [self.PROJECT]},
+        })
+
     def test_list_entries_w_paging(self):
         from google.cloud.logging import DESCENDING
         from google.cloud.logging.client import Client
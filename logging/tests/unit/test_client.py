@@ -241,6 +241,17 @@ class TestClient(unittest.TestCase):
             'data': {'projectIds': [self.PROJECT]},
         })
 
+    def test_list_entries_w_prefetch(self):
+        client = self._make_one(self.PROJECT, credentials=_make_credentials(),
+                                _use_grpc=False)
+        client._connection = _Connection({})
+
+        iterator = client.list_entries(prefetch=2)
+        entries = list(iterator)
+
+        self.assertEqual(iterator.prefetch, 2)
+        self.assertEqual(entries, [])
+
     def test_list_entries_explicit(self):
         from google.cloud.logging import DESCENDING
         from google.cloud.logging.entries import ProtobufEntry
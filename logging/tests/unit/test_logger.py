@@ -481,6 +481,21 @@ class TestLogger(unittest.TestCase):
             },
         })
 
+    def test_list_entries_w_prefetch(self):
+        from google.cloud.logging.client import Client
+
+        client = Client(project=self.PROJECT,
+                        credentials=_make_credentials(),
+                        _use_grpc=False)
+        client._connection = _Connection({})
+        logger = self._make_one(self.LOGGER_NAME, client=client)
+
+        iterator = logger.list_entries(prefetch=2)
+        entries = list(iterator)
+
+        self.assertEqual(iterator.prefetch, 2)
+        self.assertEqual(entries, [])
+
     def test_list_entries_explicit(self):
         from google.cloud.logging import DESCENDING
         from google.cloud.logging.client import Client
@@ -15,13 +15,14 @@
 
 See https://cloud.google.com/storage/docs/json_api/v1/how-tos/batch
 """
+from concurrent import futures
 from email.encoders import encode_noop
 from email.generator import Generator
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
-from email.parser import Parser
 import io
 import json
+import re
 
 import requests
 import six
@@ -31,6 +32,10 @@ from google.cloud import exceptions
 from google.cloud.storage._http import Connection
 
 
+_BOUNDARY_RE = re.compile(br'boundary="?([^";]+)"?')
+_BATCH_READ_SIZE = 64 * 1024
+
+
 class MIMEApplicationHTTP(MIMEApplication):
     """MIME type for ``application/http``.
 
@@ -137,17 +142,35 @@ class _FutureResponse(requests.Response):
 class Batch(Connection):
     """Proxy an underlying connection, batching up change operations.
 
+    Deferred requests are sent in ``multipart/mixed`` requests of at most
+    ``_MAX_CALLS_PER_REQUEST`` calls each (the limit enforced by the
+    back-end), optionally several of them at once.
+
     :type client: :class:`google.cloud.storage.client.Client`
     :param client: The client to use for making connections.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of batch requests to send
+                        concurrently when the deferred requests do not fit
+                        in a single batch request.
+
+    :type raise_exception: bool
+    :param raise_exception: (Optional) If False, :meth:`finish` does not
+                            raise when a deferred request fails; callers
+                            inspect the returned responses instead.
     """
     _MAX_BATCH_SIZE = 1000
+    _MAX_CALLS_PER_REQUEST = 100
 
-    def __init__(self, client):
+    def __init__(self, client, max_workers=1, raise_exception=True):
         super(Batch, self).__init__(client)
+        self._max_workers = max_workers
+        self._raise_exception = raise_exception
         self._requests = []
         self._target_objects = []
 
-    def _do_request(self, method, url, headers, data, target_object):
+    def _do_request(self, method, url, headers, data, target_object,
+                    stream=False):  # pylint: disable=unused-argument
         """Override Connection:  defer actual HTTP request.
 
         Only allow up to ``_MAX_BATCH_SIZE`` requests to be deferred.
@@ -170,6 +193,11 @@ class Batch(Connection):
             connection. Here we defer an HTTP request and complete
             initialization of the object at a later time.
 
+        :type stream: bool
+        :param stream: (Optional) Unused: the response to a deferred request
+                       is only available, fully read, once the batch is
+                       finished.
+
         :rtype: tuple of ``response`` (a dictionary of sorts)
                 and ``content`` (a string).
         :returns: The HTTP response object and the content of the response.
@@ -184,19 +212,27 @@ class Batch(Connection):
             target_object._properties = result
         return _FutureResponse(result)
 
-    def _prepare_batch_request(self):
+    def _prepare_batch_request(self, deferred=None):
         """Prepares headers and body for a batch request.
 
+        :type deferred: list of tuples
+        :param deferred: (Optional) The ``(method, uri, headers, body)``
+                         requests to include. Defaults to all deferred
+                         requests.
+
         :rtype: tuple (dict, str)
         :returns: The pair of headers and body of the batch request to be sent.
         :raises: :class:`ValueError` if no requests have been deferred.
         """
-        if len(self._requests) == 0:
+        if deferred is None:
+            deferred = self._requests
+
+        if len(deferred) == 0:
             raise ValueError("No deferred requests")
 
         multi = MIMEMultipart()
 
-        for method, uri, headers, body in self._requests:
+        for method, uri, headers, body in deferred:
             subrequest = MIMEApplicationHTTP(method, uri, headers, body)
             multi.attach(subrequest)
 
@@ -239,16 +275,20 @@ class Batch(Connection):
                 except ValueError:
                     target_object._properties = subresponse.content
 
-        if exception_args is not None:
+        if exception_args is not None and self._raise_exception:
             raise exceptions.from_http_response(exception_args)
 
-    def finish(self):
-        """Submit a single `multipart/mixed` request with deferred requests.
+    def _send_batch_request(self, deferred):
+        """Send one `multipart/mixed` request for some deferred requests.
 
-        :rtype: list of tuples
-        :returns: one ``(headers, payload)`` tuple per deferred request.
+        :type deferred: list of tuples
+        :param deferred: The ``(method, uri, headers, body)`` requests to
+                         include.
+
+        :rtype: list of :class:`requests.Response`
+        :returns: one response per request in ``deferred``.
         """
-        headers, body = self._prepare_batch_request()
+        headers, body = self._prepare_batch_request(deferred)
 
         url = '%s/batch' % self.API_BASE_URL
 
@@ -256,8 +296,43 @@ class Batch(Connection):
         # ``_connection``, since the property may be this
         # current batch.
         response = self._client._base_connection._make_request(
-            'POST', url, data=body, headers=headers)
-        responses = list(_unpack_batch_response(response))
+            'POST', url, data=body, headers=headers, stream=True)
+        try:
+            return list(_unpack_batch_response(response))
+        finally:
+            response.close()
+
+    def finish(self):
+        """Submit the deferred requests as `multipart/mixed` requests.
+
+        The deferred requests are split into batch requests of at most
+        ``_MAX_CALLS_PER_REQUEST`` calls, which are sent concurrently if
+        ``max_workers`` is greater than one.
+
+        :rtype: list of tuples
+        :returns: one ``(headers, payload)`` tuple per deferred request.
+        :raises: :class:`ValueError` if no requests have been deferred.
+        """
+        if len(self._requests) == 0:
+            raise ValueError("No deferred requests")
+
+        step = self._MAX_CALLS_PER_REQUEST
+        chunks = [
+            self._requests[index:index + step]
+            for index in range(0, len(self._requests), step)]
+
+        if self._max_workers > 1 and len(chunks) > 1:
+            with futures.ThreadPoolExecutor(self._max_workers) as executor:
+                chunk_responses = list(
+                    executor.map(self._send_batch_request, chunks))
+        else:
+            chunk_responses = [
+                self._send_batch_request(chunk) for chunk in chunks]
+
+        responses = [
+            response
+            for chunk in chunk_responses
+            for response in chunk]
         self._finish_futures(responses)
         return responses
 
@@ -277,59 +352,181 @@ class Batch(Connection):
             self._client._pop_batch()
 
 
-def _generate_faux_mime_message(parser, response):
-    """Convert response, content -> (multipart) email.message.
+def _iter_lines(chunks):
+    """Split chunks of bytes into lines, as the chunks are received.
+
+    Helper for :func:`_iter_multipart_parts`.
+
+    :type chunks: iterable
+    :param chunks: The chunks (bytes) of a response body.
 
-    Helper for _unpack_batch_response.
+    :rtype: iterator
+    :returns: Each line (bytes), with its trailing ``\n`` (if any).
     """
-    # We coerce to bytes to get consistent concat across
-    # Py2 and Py3. Percent formatting is insufficient since
-    # it includes the b in Py3.
-    content_type = _helpers._to_bytes(
-        response.headers.get('content-type', ''))
+    pending = []
+    for chunk in chunks:
+        start = 0
+        end = chunk.find(b'\n')
+        while end != -1:
+            pending.append(chunk[start:end + 1])
+            yield b''.join(pending)
+            pending = []
+            start = end + 1
+            end = chunk.find(b'\n', start)
+        if start < len(chunk):
+            pending.append(chunk[start:])
+
+    if pending:
+        yield b''.join(pending)
+
+
+def _iter_multipart_parts(lines, boundary):
+    """Yield the body parts of a ``multipart`` body, as each one ends.
+
+    Helper for :func:`_unpack_batch_response`.
+
+    :type lines: iterable
+    :param lines: The lines (bytes) of the body.
+
+    :type boundary: bytes
+    :param boundary: The boundary of the body's parts.
+
+    :rtype: iterator
+    :returns: The bytes of each part, between the line ending its opening
+              delimiter and the line break before its closing delimiter.
+    :raises: :class:`ValueError` if the body ends in the middle of a part.
+    """
+    delimiter = b'--' + boundary
+    part = None
+    for line in lines:
+        if line.startswith(delimiter):
+            rest = line[len(delimiter):].rstrip()
+            if rest in (b'', b'--'):
+                if part is not None:
+                    yield _strip_line_break(b''.join(part))
+                if rest == b'--':
+                    return
+                part = []
+                continue
+
+        if part is not None:
+            part.append(line)
+
+    if part is not None:
+        raise ValueError('Bad response:  unterminated part')
+
+
+def _strip_line_break(data):
+    """Remove the trailing ``\r\n`` or ``\n`` of a part.
+
+    :type data: bytes
+    :param data: The lines of a part, each ending with a line break.
+
+    :rtype: bytes
+    :returns: ``data`` without its final line break, which belongs to
+              the delimiter following the part.
+    """
+    if data.endswith(b'\r\n'):
+        return data[:-2]
+    return data[:-1]
+
+
+def _split_header_lines(data):
+    """Split a block of header lines, ended by a blank line, from the rest.
+
+    Lines of the block may end with ``\r\n`` or ``\n``; the data after the
+    block is returned untouched.
+
+    Helper for :func:`_parse_subresponse`.
+
+    :type data: bytes
+    :param data: The header lines, followed by other data.
 
-    faux_message = b''.join([
-        b'Content-Type: ',
-        content_type,
-        b'\nMIME-Version: 1.0\n\n',
-        response.content,
-    ])
+    :rtype: tuple
+    :returns: The list of header lines (bytes, without line breaks) and
+              the data after the blank line.
+    """
+    lines = []
+    position = 0
+    while position < len(data):
+        end = data.find(b'\n', position)
+        if end == -1:
+            end = len(data)
+        line = data[position:end].rstrip(b'\r')
+        position = end + 1
+        if not line:
+            break
+        lines.append(line)
+    return lines, data[position:]
+
+
+def _parse_headers(lines):
+    """Parse ``Name: value`` header lines.
+
+    Helper for :func:`_parse_subresponse`.
+
+    :type lines: list of bytes
+    :param lines: The header lines.
+
+    :rtype: dict
+    :returns: The headers, keyed by (native string) header name.
+    """
+    headers = {}
+    for line in lines:
+        name, sep, value = line.partition(b':')
+        if sep:
+            headers[_helpers._bytes_to_unicode(name.strip())] = (
+                _helpers._bytes_to_unicode(value.strip()))
+    return headers
+
+
+def _parse_subresponse(part):
+    """Convert one part of a ``multipart/mixed`` body -> requests.Response.
 
-    if six.PY2:
-        return parser.parsestr(faux_message)
-    else:  # pragma: NO COVER  Python3
-        return parser.parsestr(faux_message.decode('utf-8'))
+    Helper for :func:`_unpack_batch_response`.
+
+    :type part: bytes
+    :param part: The part, as yielded by :func:`_iter_multipart_parts`.
+
+    :rtype: :class:`requests.Response`
+    :returns: The response for the part's (nested) HTTP response.
+    """
+    part_headers, http_response = _split_header_lines(part)
+    content_id = _parse_headers(part_headers).get('Content-ID')
+    response_lines, payload = _split_header_lines(http_response)
+    _, status, _ = response_lines[0].split(b' ', 2)
+
+    subresponse = requests.Response()
+    subresponse.request = requests.Request(
+        method='BATCH',
+        url='contentid://{}'.format(content_id)).prepare()
+    subresponse.status_code = int(status)
+    subresponse.headers.update(_parse_headers(response_lines[1:]))
+    subresponse._content = payload
+
+    return subresponse
 
 
 def _unpack_batch_response(response):
     """Convert requests.Response -> [(headers, payload)].
 
     Creates a generator of tuples of emulating the responses to
-    :meth:`requests.Session.request`.
+    :meth:`requests.Session.request`. The ``multipart/mixed`` body is
+    read in chunks of ``_BATCH_READ_SIZE`` bytes, and each part is
+    converted as soon as it has been received, so that the body is never
+    held in memory as a whole.
 
     :type response: :class:`requests.Response`
     :param response: HTTP response / headers from a request.
-    """
-    parser = Parser()
-    message = _generate_faux_mime_message(parser, response)
 
-    if not isinstance(message._payload, list):
+    :raises: :class:`ValueError` if the response is not ``multipart``.
+    """
+    content_type = _helpers._to_bytes(
+        response.headers.get('content-type', ''))
+    match = _BOUNDARY_RE.search(content_type)
+    if not content_type.startswith(b'multipart/') or match is None:
         raise ValueError('Bad response:  not multi-part')
 
-    for subrequest in message._payload:
-        status_line, rest = subrequest._payload.split('\n', 1)
-        _, status, _ = status_line.split(' ', 2)
-        sub_message = parser.parsestr(rest)
-        payload = sub_message._payload
-        msg_headers = dict(sub_message._headers)
-        content_id = msg_headers.get('Content-ID')
-
-        subresponse = requests.Response()
-        subresponse.request = requests.Request(
-            method='BATCH',
-            url='contentid://{}'.format(content_id)).prepare()
-        subresponse.status_code = int(status)
-        subresponse.headers.update(msg_headers)
-        subresponse._content = payload.encode('utf-8')
-
-        yield subresponse
+    lines = _iter_lines(response.iter_content(_BATCH_READ_SIZE))
+    for part in _iter_multipart_parts(lines, match.group(1)):
+        yield _parse_subresponse(part)
@@ -26,12 +26,15 @@
 """
 
 import base64
+from concurrent import futures
 import copy
 import hashlib
 from io import BytesIO
+import logging
 import mimetypes
 import os
 import time
+import uuid
 import warnings
 
 from six.moves.urllib.parse import quote
@@ -42,6 +45,7 @@ from google.resumable_media.requests import Download
 from google.resumable_media.requests import MultipartUpload
 from google.resumable_media.requests import ResumableUpload
 
+from google.api.core import retry
 from google.cloud import exceptions
 from google.cloud._helpers import _rfc3339_to_datetime
 from google.cloud._helpers import _to_bytes
@@ -53,6 +57,13 @@ from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage._signing import generate_signed_url
 from google.cloud.storage.acl import ObjectACL
 
+try:
+    import crcmod.predefined
+except ImportError:  # pragma: NO COVER
+    crcmod = None
+
+
+_LOGGER = logging.getLogger(__name__)
 
 _API_ACCESS_ENDPOINT = 'https://storage.googleapis.com'
 _DEFAULT_CONTENT_TYPE = u'application/octet-stream'
@@ -88,6 +99,16 @@ _NUM_RETRIES_MESSAGE = (
 _READ_LESS_THAN_SIZE = (
     'Size {:d} was specified but the file-like object only had '
     '{:d} bytes remaining.')
+_CHECKSUM_MISMATCH = (
+    'Checksum mismatch while downloading {}: expected {} {}, '
+    'computed {}.')
+_DEFAULT_MAX_WORKERS = 8
+_MAX_SLICE_ATTEMPTS = 3
+_SLICE_RETRY_INITIAL_DELAY = 1.0  # seconds
+_SLICE_RETRY_MAXIMUM_DELAY = 32.0  # seconds
+_HASH_READ_SIZE = 1024 * 1024
+_MAX_COMPOSE_COMPONENTS = 32
+_COMPOSITE_PART_TEMPLATE = u'{name}.composite-{token}-{index:d}'
 
 
 class Blob(_PropertyMixin):
@@ -423,6 +444,133 @@ class Blob(_PropertyMixin):
             while not download.finished:
                 download.consume_next_chunk(transport)
 
+    def _download_slice(self, transport, filename, download_url, headers,
+                        start, end):
+        """Download a single byte range into a preallocated file.
+
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: The transport (with credentials) that will
+                          make authenticated requests.
+
+        :type filename: str
+        :param filename: The (already preallocated) file to write into.
+
+        :type download_url: str
+        :param download_url: The URL where the media can be accessed.
+
+        :type headers: dict
+        :param headers: Optional headers to be sent with the request.
+
+        :type start: int
+        :param start: The first byte of the slice.
+
+        :type end: int
+        :param end: The last byte of the slice (inclusive).
+        """
+        with open(filename, 'r+b') as file_obj:
+            file_obj.seek(start)
+            download = Download(
+                download_url, stream=file_obj, start=start, end=end,
+                headers=dict(headers))
+            download.consume(transport)
+
+    def _do_sliced_download(self, transport, filename, download_url,
+                            headers, size, slice_size, max_workers):
+        """Perform a sliced download without any error handling.
+
+        The object is split into byte ranges of ``slice_size`` which are
+        fetched concurrently and written into ``filename`` at their offsets.
+        Slices which fail are retried (up to ``_MAX_SLICE_ATTEMPTS`` attempts
+        in total, with exponential backoff between attempts) without
+        re-fetching the slices which succeeded.
+
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: The transport (with credentials) that will
+                          make authenticated requests.
+
+        :type filename: str
+        :param filename: A filename to be passed to ``open``.
+
+        :type download_url: str
+        :param download_url: The URL where the media can be accessed.
+
+        :type headers: dict
+        :param headers: Optional headers to be sent with the request(s).
+
+        :type size: int
+        :param size: The size of the object, in bytes.
+
+        :type slice_size: int
+        :param slice_size: The number of bytes fetched by each request.
+
+        :type max_workers: int
+        :param max_workers: The number of slices fetched concurrently.
+
+        :raises: The last exception raised for a slice, if some slices
+                 still fail after ``_MAX_SLICE_ATTEMPTS`` attempts.
+        """
+        with open(filename, 'wb') as file_obj:
+            file_obj.truncate(size)
+
+        pending = [
+            (start, min(start + slice_size, size) - 1)
+            for start in range(0, size, slice_size)]
+
+        delays = retry.exponential_sleep_generator(
+            _SLICE_RETRY_INITIAL_DELAY, _SLICE_RETRY_MAXIMUM_DELAY)
+        for attempt in range(_MAX_SLICE_ATTEMPTS):
+            if attempt:
+                time.sleep(next(delays))
+
+            with futures.ThreadPoolExecutor(max_workers) as executor:
+                slice_futures = [
+                    (executor.submit(
+                        self._download_slice, transport, filename,
+                        download_url, headers, start, end), (start, end))
+                    for start, end in pending]
+
+            pending = []
+            for future, byte_range in slice_futures:
+                error = future.exception()
+                if error is not None:
+                    pending.append(byte_range)
+                    last_error = error
+            if not pending:
+                return
+
+        raise last_error
+
+    def _verify_download(self, filename):
+        """Check a downloaded file against the blob's stored checksums.
+
+        Uses ``md5Hash`` when present; otherwise uses ``crc32c`` (composite
+        objects have no MD5), provided ``crcmod`` is installed.
+
+        :type filename: str
+        :param filename: The downloaded file.
+
+        :raises: :exc:`ValueError` if the computed checksum does not match.
+        """
+        if self.md5_hash is not None:
+            name, expected = 'md5Hash', self.md5_hash
+            hasher = hashlib.md5()
+        elif self.crc32c is not None and crcmod is not None:
+            name, expected = 'crc32c', self.crc32c
+            hasher = crcmod.predefined.Crc('crc-32c')
+        else:
+            return
+
+        with open(filename, 'rb') as file_obj:
+            for chunk in iter(lambda: file_obj.read(_HASH_READ_SIZE), b''):
+                hasher.update(chunk)
+
+        actual = _bytes_to_unicode(base64.b64encode(hasher.digest()))
+        if actual != expected:
+            raise ValueError(
+                _CHECKSUM_MISMATCH.format(self.name, name, expected, actual))
+
     def download_to_file(self, file_obj, client=None):
         """Download the contents of this blob into a file-like object.
 
@@ -465,9 +613,22 @@ class Blob(_PropertyMixin):
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
-    def download_to_filename(self, filename, client=None):
+    def download_to_filename(self, filename, client=None, slice_size=None,
+                             max_workers=_DEFAULT_MAX_WORKERS):
         """Download the contents of this blob into a named file.
 
+        If ``slice_size`` is passed, the object is downloaded as a series of
+        byte ranges fetched concurrently on a thread pool and written into
+        the (preallocated) file at their offsets. Only slices which fail are
+        retried, and the completed file is checked against the object's
+        MD5 hash (or CRC32C, if ``crcmod`` is installed).
+
+        .. note::
+
+           A sliced download needs the object's size and checksums, so if
+           :attr:`size` is not yet loaded, makes an additional API request
+           to load the object's metadata.
+
         :type filename: str
         :param filename: A filename to be passed to ``open``.
 
@@ -476,15 +637,67 @@ class Blob(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
 
+        :type slice_size: int
+        :param slice_size: (Optional) The number of bytes fetched by each
+                           request of a sliced download. If not passed, the
+                           blob is downloaded in a single stream.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of slices fetched
+                            concurrently in a sliced download.
+
         :raises: :class:`google.cloud.exceptions.NotFound`
         """
-        with open(filename, 'wb') as file_obj:
-            self.download_to_file(file_obj, client=client)
+        if slice_size is None:
+            with open(filename, 'wb') as file_obj:
+                self.download_to_file(file_obj, client=client)
+        else:
+            self._download_sliced_to_filename(
+                filename, client, slice_size, max_workers)
 
         updated = self.updated
         if updated is not None:
             mtime = time.mktime(updated.timetuple())
-            os.utime(file_obj.name, (mtime, mtime))
+            os.utime(filename, (mtime, mtime))
+
+    def _download_sliced_to_filename(self, filename, client, slice_size,
+                                     max_workers):
+        """Download the blob into a named file using concurrent slices.
+
+        :type filename: str
+        :param filename: A filename to be passed to ``open``.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: The client to use.  If :data:`None`, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type slice_size: int
+        :param slice_size: The number of bytes fetched by each request.
+
+        :type max_workers: int
+        :param max_workers: The number of slices fetched concurrently.
+
+        :raises: :exc:`ValueError` if ``slice_size`` is not positive.
+        """
+        if slice_size <= 0:
+            raise ValueError('Slice size must be positive.')
+
+        if self.size is None:
+            self.reload(client=client)
+
+        download_url = self._get_download_url()
+        headers = _get_encryption_headers(self._encryption_key)
+        transport = self._get_transport(client)
+
+        try:
+            self._do_sliced_download(
+                transport, filename, download_url, headers, self.size,
+                slice_size, max_workers)
+        except resumable_media.InvalidResponse as exc:
+            _raise_from_invalid_response(exc)
+
+        self._verify_download(filename)
 
     def download_as_string(self, client=None):
         """Download the contents of this blob as a string.
@@ -502,6 +715,63 @@ class Blob(_PropertyMixin):
         self.download_to_file(string_buffer, client=client)
         return string_buffer.getvalue()
 
+    def open(self, mode='rb', client=None, chunk_size=None, read_ahead=1,
+             content_type=None):
+        """Open the blob as a streaming file-like object.
+
+        In ``'rb'`` mode, returns a seekable
+        :class:`~google.cloud.storage.fileio.BlobReader` which fetches the
+        blob in ranged requests, reading ahead on a background thread.
+
+        In ``'wb'`` mode, returns a
+        :class:`~google.cloud.storage.fileio.BlobWriter` which sends the
+        bytes written over a resumable upload session, uploading chunks on a
+        background thread. The upload is finalized when the writer is
+        closed.
+
+        Both use a constant amount of memory, so the objects can be passed
+        to modules like ``tarfile``, ``csv`` (wrapped in
+        :class:`io.TextIOWrapper`) or ``pickle``.
+
+        :type mode: str
+        :param mode: (Optional) Either ``'rb'`` or ``'wb'``.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: Optional. The client to use.  If not passed, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type chunk_size: int
+        :param chunk_size: (Optional) The number of bytes sent / fetched by
+                           each request. Defaults to the blob's
+                           :attr:`chunk_size`, or 10 MB if that is not set.
+
+        :type read_ahead: int
+        :param read_ahead: (Optional) In ``'rb'`` mode, the number of chunks
+                           fetched ahead of the current position.
+
+        :type content_type: str
+        :param content_type: (Optional) In ``'wb'`` mode, the type of content
+                             being uploaded.
+
+        :rtype: :class:`~google.cloud.storage.fileio.BlobReader` or
+                :class:`~google.cloud.storage.fileio.BlobWriter`
+        :returns: A file-like object for the blob.
+        :raises: :exc:`ValueError` if ``mode`` is not supported.
+        """
+        from google.cloud.storage import fileio
+
+        if mode == 'rb':
+            return fileio.BlobReader(
+                self, client=client, chunk_size=chunk_size,
+                read_ahead=read_ahead)
+        elif mode == 'wb':
+            return fileio.BlobWriter(
+                self, client=client, content_type=content_type,
+                chunk_size=chunk_size)
+        else:
+            raise ValueError('Unsupported mode: %r' % (mode,))
+
     def _get_content_type(self, content_type, filename=None):
         """Determine the content type from the current object.
 
@@ -888,7 +1158,8 @@ class Blob(_PropertyMixin):
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
-    def upload_from_filename(self, filename, content_type=None, client=None):
+    def upload_from_filename(self, filename, content_type=None, client=None,
+                             parts=None, max_workers=_DEFAULT_MAX_WORKERS):
         """Upload this blob's contents from the content of a named file.
 
         The content type of the upload will be determined in order
@@ -919,15 +1190,190 @@ class Blob(_PropertyMixin):
         :type client: :class:`~google.cloud.storage.client.Client`
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the blob's bucket.
+
+        :type parts: int
+        :param parts: (Optional) If passed, the file is split into this many
+                      parts which are uploaded concurrently as temporary
+                      objects and then combined with :meth:`compose`. The
+                      temporary objects are deleted afterwards.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of parts uploaded (or
+                            intermediate objects composed) concurrently.
         """
         content_type = self._get_content_type(content_type, filename=filename)
 
+        if parts is not None:
+            self._upload_composite_from_filename(
+                filename, content_type, client, parts, max_workers)
+            return
+
         with open(filename, 'rb') as file_obj:
             total_bytes = os.fstat(file_obj.fileno()).st_size
             self.upload_from_file(
                 file_obj, content_type=content_type, client=client,
                 size=total_bytes)
 
+    def _make_composite_part(self, token, index, content_type):
+        """Create a temporary blob used by a composite upload.
+
+        :type token: str
+        :param token: A value unique to the current composite upload.
+
+        :type index: int
+        :param index: The index of the temporary blob within the upload.
+
+        :type content_type: str
+        :param content_type: The content type of the temporary blob.
+
+        :rtype: :class:`Blob`
+        :returns: The (not yet created) temporary blob.
+        """
+        name = _COMPOSITE_PART_TEMPLATE.format(
+            name=self.name, token=token, index=index)
+        part = Blob(
+            name, bucket=self.bucket, chunk_size=self.chunk_size,
+            encryption_key=self._encryption_key)
+        part.content_type = content_type
+        return part
+
+    def _upload_composite_part(self, part, filename, start, size, client):
+        """Upload one byte range of a local file as a temporary blob.
+
+        :type part: :class:`Blob`
+        :param part: The temporary blob to upload.
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type start: int
+        :param start: The offset of the first byte of the part.
+
+        :type size: int
+        :param size: The number of bytes in the part.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+        """
+        with open(filename, 'rb') as file_obj:
+            file_obj.seek(start)
+            part.upload_from_file(
+                file_obj, size=size, content_type=part.content_type,
+                client=client)
+
+    def _upload_composite_from_filename(self, filename, content_type, client,
+                                        parts, max_workers):
+        """Upload a named file as concurrently uploaded, composed parts.
+
+        Parts share the blob's :attr:`chunk_size`: if it is set, each part
+        is sent in a resumable upload of that many bytes per request;
+        otherwise each part is read into memory and sent in a single
+        multipart upload.  At most ``max_workers`` parts are uploaded at a
+        time.
+
+        Parts, intermediate blobs and the composed blob are all encrypted
+        with the blob's ``encryption_key``, if any.
+
+        When there are more than ``_MAX_COMPOSE_COMPONENTS`` parts, they are
+        first composed into intermediate temporary blobs (a tree of
+        composes) so that each :meth:`compose` call stays within the
+        API's component limit.
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type content_type: str
+        :param content_type: Type of content being uploaded.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.  If :data:`None`, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type parts: int
+        :param parts: The number of parts to split the file into.
+
+        :type max_workers: int
+        :param max_workers: The number of concurrent uploads / composes.
+
+        :raises: :exc:`ValueError` if ``parts`` is not positive.
+        """
+        if parts <= 0:
+            raise ValueError('Number of parts must be positive.')
+
+        total_bytes = os.path.getsize(filename)
+        part_size = max(-(-total_bytes // parts), 1)
+        token = uuid.uuid4().hex
+        temporaries = []
+
+        try:
+            with futures.ThreadPoolExecutor(max_workers) as executor:
+                components = []
+                upload_futures = []
+                for start in range(0, max(total_bytes, 1), part_size):
+                    part = self._make_composite_part(
+                        token, len(temporaries), content_type)
+                    temporaries.append(part)
+                    components.append(part)
+                    upload_futures.append(executor.submit(
+                        self._upload_composite_part, part, filename, start,
+                        min(part_size, total_bytes - start), client))
+
+                for future in upload_futures:
+                    future.result()
+
+                while len(components) > _MAX_COMPOSE_COMPONENTS:
+                    compose_futures = []
+                    intermediates = []
+                    for index in range(
+                            0, len(components), _MAX_COMPOSE_COMPONENTS):
+                        group = components[
+                            index:index + _MAX_COMPOSE_COMPONENTS]
+                        intermediate = self._make_composite_part(
+                            token, len(temporaries), content_type)
+                        temporaries.append(intermediate)
+                        intermediates.append(intermediate)
+                        compose_futures.append(executor.submit(
+                            intermediate.compose, group, client=client))
+
+                    for future in compose_futures:
+                        future.result()
+                    components = intermediates
+
+            self.content_type = content_type
+            self.compose(components, client=client)
+        finally:
+            self._delete_composite_parts(temporaries, client, max_workers)
+
+    def _delete_composite_parts(self, parts, client, max_workers):
+        """Delete the temporary blobs of a composite upload.
+
+        The deletes are sent in concurrent batch requests.  Failures are
+        logged rather than raised, so that they never mask the outcome (or
+        the error) of the upload.
+
+        :type parts: list of :class:`Blob`
+        :param parts: The temporary blobs, some of which may not exist.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.  If :data:`None`, falls back
+                       to the ``client`` stored on the blob's bucket.
+
+        :type max_workers: int
+        :param max_workers: The number of concurrent batch requests.
+        """
+        try:
+            report = self.bucket.bulk_delete_blobs(
+                parts, max_workers=max_workers, client=client)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception(
+                'Failed to delete the temporary parts of %s', self.name)
+            return
+
+        for name, error in sorted(report.items()):
+            if error is not None and not isinstance(error, NotFound):
+                _LOGGER.warning(
+                    'Failed to delete temporary part %s: %s', name, error)
+
     def upload_from_string(self, data, content_type='text/plain', client=None):
         """Upload contents of this blob from the provided string.
 
@@ -1139,6 +1585,10 @@ class Blob(_PropertyMixin):
     def compose(self, sources, client=None):
         """Concatenate source blobs into this one.
 
+        If this blob has an ``encryption_key``, it is used to decrypt the
+        sources (which must all be encrypted with it) and to encrypt this
+        blob.
+
         :type sources: list of :class:`Blob`
         :param sources: blobs whose contents will be composed into this blob.
 
@@ -1157,9 +1607,10 @@ class Blob(_PropertyMixin):
             'sourceObjects': [{'name': source.name} for source in sources],
             'destination': self._properties.copy(),
         }
+        headers = _get_encryption_headers(self._encryption_key)
         api_response = client._connection.api_request(
             method='POST', path=self.path + '/compose', data=request,
-            _target_object=self)
+            headers=headers, _target_object=self)
         self._set_properties(api_response)
 
     def rewrite(self, source, token=None, client=None):
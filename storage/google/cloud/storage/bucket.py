@@ -15,8 +15,10 @@
 """Create / interact with Google Cloud Storage buckets."""
 
 import base64
+from concurrent import futures
 import copy
 import datetime
+import functools
 import json
 
 import six
@@ -25,6 +27,7 @@ from google.api.core import page_iterator
 from google.cloud._helpers import _datetime_to_rfc3339
 from google.cloud._helpers import _NOW
 from google.cloud._helpers import _rfc3339_to_datetime
+from google.cloud import exceptions
 from google.cloud.exceptions import NotFound
 from google.cloud.iam import Policy
 from google.cloud.storage import _signing
@@ -33,6 +36,7 @@ from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage._helpers import _validate_name
 from google.cloud.storage.acl import BucketACL
 from google.cloud.storage.acl import DefaultObjectACL
+from google.cloud.storage.batch import Batch
 from google.cloud.storage.blob import Blob
 from google.cloud.storage.blob import _get_encryption_headers
 
@@ -76,6 +80,86 @@ def _item_to_blob(iterator, item):
     return blob
 
 
+def _iter_chunks(items, size):
+    """Group an iterable into lists of at most ``size`` items.
+
+    :type items: iterable
+    :param items: The items to group. Consumed lazily.
+
+    :type size: int
+    :param size: The maximum number of items in each group.
+
+    :rtype: iterable
+    :returns: Iterator of lists of items.
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def _make_blob_public(blob, client):
+    """Grant read access to all users on a blob.
+
+    Helper for :meth:`Bucket.make_public`.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to update.
+
+    :type client: :class:`~google.cloud.storage.client.Client` or
+                  ``NoneType``
+    :param client: The client to use.
+
+    :rtype: tuple
+    :returns: ``(blob_name, error)``, where ``error`` is :data:`None` if
+              the ACL was saved.
+    """
+    try:
+        blob.acl.all().grant_read()
+        blob.acl.save(client=client)
+    except exceptions.GoogleCloudError as exc:
+        return blob.name, exc
+    return blob.name, None
+
+
+def _bounded_map(func, items, max_workers):
+    """Apply ``func`` to each item on a thread pool, in completion order.
+
+    At most ``2 * max_workers`` calls are queued at once, so ``items``
+    (e.g. a listing of millions of blobs) is consumed only as fast as
+    the calls complete.
+
+    :type func: callable
+    :param func: Takes a single item.
+
+    :type items: iterable
+    :param items: The items to pass to ``func``.
+
+    :type max_workers: int
+    :param max_workers: The number of concurrent calls.
+
+    :rtype: iterable
+    :returns: Iterator of the values returned by ``func``.
+    """
+    with futures.ThreadPoolExecutor(max_workers) as executor:
+        pending = set()
+        for item in items:
+            pending.add(executor.submit(func, item))
+            if len(pending) >= 2 * max_workers:
+                done, pending = futures.wait(
+                    pending, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        for future in futures.as_completed(pending):
+            yield future.result()
+
+
 class Bucket(_PropertyMixin):
     """A class representing a Bucket on Cloud Storage.
 
@@ -309,7 +393,8 @@ class Bucket(_PropertyMixin):
 
     def list_blobs(self, max_results=None, page_token=None, prefix=None,
                    delimiter=None, versions=None,
-                   projection='noAcl', fields=None, client=None):
+                   projection='noAcl', fields=None, client=None,
+                   prefetch=0, stream=False):
         """Return an iterator used to find blobs in the bucket.
 
         :type max_results: int
@@ -347,6 +432,17 @@ class Bucket(_PropertyMixin):
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type prefetch: int
+        :param prefetch: (Optional) The number of pages to request ahead of
+                         the page being consumed, on a background thread.
+                         Defaults to 0 (each page is requested once the
+                         previous one is used up).
+
+        :type stream: bool
+        :param stream: (Optional) If True, decode each page's blobs while the
+                       response downloads, so that the first blobs of a large
+                       page are available sooner.
+
         :rtype: :class:`~google.api.core.page_iterator.Iterator`
         :returns: Iterator of all :class:`~google.cloud.storage.blob.Blob`
                   in this bucket matching the arguments.
@@ -377,12 +473,14 @@ class Bucket(_PropertyMixin):
             page_token=page_token,
             max_results=max_results,
             extra_params=extra_params,
-            page_start=_blobs_page_start)
+            page_start=_blobs_page_start,
+            prefetch=prefetch,
+            stream=stream)
         iterator.bucket = self
         iterator.prefixes = set()
         return iterator
 
-    def delete(self, force=False, client=None):
+    def delete(self, force=False, client=None, bulk=False):
         """Delete this bucket.
 
         The bucket **must** be empty in order to submit a delete request. If
@@ -397,7 +495,8 @@ class Bucket(_PropertyMixin):
         If ``force=True`` and the bucket contains more than 256 objects / blobs
         this will cowardly refuse to delete the objects (or the bucket). This
         is to prevent accidental bucket deletion and to prevent extremely long
-        runtime of this method.
+        runtime of this method. Pass ``bulk=True`` as well to empty the
+        bucket with :meth:`bulk_delete_blobs` instead, which has no limit.
 
         :type force: bool
         :param force: If True, empties the bucket's objects then deletes it.
@@ -407,11 +506,23 @@ class Bucket(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type bulk: bool
+        :param bulk: If True (and ``force`` is True), empties the bucket
+                     using :meth:`bulk_delete_blobs`, regardless of how many
+                     objects it contains.
+
         :raises: :class:`ValueError` if ``force`` is ``True`` and the bucket
-                 contains more than 256 objects / blobs.
+                 contains more than 256 objects / blobs (and ``bulk`` is
+                 ``False``).
         """
         client = self._require_client(client)
-        if force:
+        if force and bulk:
+            report = self.bulk_delete_blobs(client=client)
+            for error in six.itervalues(report):
+                # Ignore 404 errors on delete.
+                if error is not None and not isinstance(error, NotFound):
+                    raise error
+        elif force:
             blobs = list(self.list_blobs(
                 max_results=self._MAX_OBJECTS_FOR_ITERATION + 1,
                 client=client))
@@ -505,6 +616,88 @@ class Bucket(_PropertyMixin):
                 else:
                     raise
 
+    def _delete_blobs_batch(self, blob_names, client):
+        """Delete some blobs in a single batch request.
+
+        :type blob_names: list of str
+        :param blob_names: The names of the blobs to delete (at most
+                           ``Batch._MAX_CALLS_PER_REQUEST``).
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+
+        :rtype: list of tuples
+        :returns: ``(blob_name, error)`` pairs, where ``error`` is
+                  :data:`None` if the blob was deleted.
+        """
+        batch = Batch(client, raise_exception=False)
+        for blob_name in blob_names:
+            # We intentionally pass `_target_object=None` since a DELETE
+            # request has no response value.
+            batch.api_request(
+                method='DELETE',
+                path=Blob.path_helper(self.path, blob_name),
+                _target_object=None)
+
+        results = []
+        for blob_name, response in zip(blob_names, batch.finish()):
+            error = None
+            if not 200 <= response.status_code < 300:
+                error = exceptions.from_http_response(response)
+            results.append((blob_name, error))
+        return results
+
+    def bulk_delete_blobs(self, blobs=None, prefix=None, max_workers=4,
+                          client=None):
+        """Delete many blobs using concurrent batch requests.
+
+        Unlike :meth:`delete_blobs`, the deletes are grouped into batch
+        requests of ``Batch._MAX_CALLS_PER_REQUEST`` calls, with up to
+        ``max_workers`` batch requests in flight. If ``blobs`` is not
+        passed, the blobs are listed (one page at a time) from the bucket,
+        so there is no limit on the number of blobs deleted.
+
+        :type blobs: iterable
+        :param blobs: (Optional) The :class:`~google.cloud.storage.blob.Blob`-s
+                      or blob names to delete. If not passed, deletes every
+                      blob in the bucket matching ``prefix``.
+
+        :type prefix: str
+        :param prefix: (Optional) When ``blobs`` is not passed, only delete
+                       blobs whose names start with this prefix.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of batch requests sent
+                            concurrently.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :rtype: dict
+        :returns: Mapping of each blob name to :data:`None` if the blob was
+                  deleted, or to the
+                  :class:`~google.cloud.exceptions.GoogleCloudError` that
+                  the delete request failed with.
+        """
+        client = self._require_client(client)
+        if blobs is None:
+            blobs = self.list_blobs(
+                prefix=prefix, fields='items/name,nextPageToken',
+                client=client)
+
+        blob_names = (
+            blob if isinstance(blob, six.string_types) else blob.name
+            for blob in blobs)
+
+        report = {}
+        chunks = _iter_chunks(blob_names, Batch._MAX_CALLS_PER_REQUEST)
+        delete_chunk = functools.partial(
+            self._delete_blobs_batch, client=client)
+        for results in _bounded_map(delete_chunk, chunks, max_workers):
+            report.update(results)
+        return report
+
     def copy_blob(self, blob, destination_bucket, new_name=None,
                   client=None, preserve_acl=True):
         """Copy the given blob to the given bucket, optionally with a new name.
@@ -1027,12 +1220,15 @@ class Bucket(_PropertyMixin):
             query_params=query)
         return resp.get('permissions', [])
 
-    def make_public(self, recursive=False, future=False, client=None):
+    def make_public(self, recursive=False, future=False, client=None,
+                    bulk=False, max_workers=4):
         """Make a bucket public.
 
         If ``recursive=True`` and the bucket contains more than 256
         objects / blobs this will cowardly refuse to make the objects public.
-        This is to prevent extremely long runtime of this method.
+        This is to prevent extremely long runtime of this method. Pass
+        ``bulk=True`` as well to update the objects' ACLs concurrently, with
+        no limit on the number of objects.
 
         :type recursive: bool
         :param recursive: If True, this will make all blobs inside the bucket
@@ -1046,6 +1242,20 @@ class Bucket(_PropertyMixin):
                       ``NoneType``
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
+
+        :type bulk: bool
+        :param bulk: If True (and ``recursive`` is True), the blobs are listed
+                     one page at a time and their ACLs saved concurrently.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of concurrent ACL updates
+                            when ``bulk`` is True.
+
+        :rtype: dict or ``NoneType``
+        :returns: If ``recursive`` and ``bulk`` are True, a mapping of each
+                  blob name to :data:`None` if the blob was made public, or
+                  to the :class:`~google.cloud.exceptions.GoogleCloudError`
+                  that the ACL update failed with.
         """
         self.acl.all().grant_read()
         self.acl.save(client=client)
@@ -1057,7 +1267,11 @@ class Bucket(_PropertyMixin):
             doa.all().grant_read()
             doa.save(client=client)
 
-        if recursive:
+        if recursive and bulk:
+            blobs = self.list_blobs(projection='full', client=client)
+            make_public = functools.partial(_make_blob_public, client=client)
+            return dict(_bounded_map(make_public, blobs, max_workers))
+        elif recursive:
             blobs = list(self.list_blobs(
                 projection='full',
                 max_results=self._MAX_OBJECTS_FOR_ITERATION + 1,
@@ -46,6 +46,12 @@ class Client(ClientWithProject):
                   ``credentials`` for the current object.
                   This parameter should be considered private, and could
                   change in the future.
+
+    :type transport_config: :class:`~google.cloud._http.TransportConfig`
+    :param transport_config: (Optional) Connection pool settings for the
+                             HTTP object created when ``_http`` is not
+                             passed. Clients given the same instance share
+                             its connection pools.
     """
 
     SCOPE = ('https://www.googleapis.com/auth/devstorage.full_control',
@@ -53,10 +59,12 @@ class Client(ClientWithProject):
              'https://www.googleapis.com/auth/devstorage.read_write')
     """The scopes required for authenticating as a Cloud Storage consumer."""
 
-    def __init__(self, project=None, credentials=None, _http=None):
+    def __init__(self, project=None, credentials=None, _http=None,
+                 transport_config=None):
         self._base_connection = None
         super(Client, self).__init__(project=project, credentials=credentials,
-                                     _http=_http)
+                                     _http=_http,
+                                     transport_config=transport_config)
         self._connection = Connection(self)
         self._batch_stack = _LocalStack()
 
@@ -136,17 +144,22 @@ class Client(ClientWithProject):
         """
         return Bucket(client=self, name=bucket_name)
 
-    def batch(self):
+    def batch(self, max_workers=1):
         """Factory constructor for batch object.
 
         .. note::
           This will not make an HTTP request; it simply instantiates
           a batch object owned by this client.
 
+        :type max_workers: int
+        :param max_workers: (Optional) The number of batch requests to send
+                            concurrently when the deferred requests do not
+                            fit in a single batch request.
+
         :rtype: :class:`google.cloud.storage.batch.Batch`
         :returns: The batch object created.
         """
-        return Batch(client=self)
+        return Batch(client=self, max_workers=max_workers)
 
     def get_bucket(self, bucket_name):
         """Get a bucket by name.
@@ -0,0 +1,419 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""File-like objects streaming to / from Cloud Storage blobs.
+
+Returned by :meth:`google.cloud.storage.blob.Blob.open`.
+"""
+
+from concurrent import futures
+import io
+import threading
+
+from six.moves import queue
+
+from google import resumable_media
+from google.resumable_media.requests import Download
+
+from google.cloud.storage.blob import _get_encryption_headers
+from google.cloud.storage.blob import _raise_from_invalid_response
+
+
+_DEFAULT_CHUNK_SIZE = 40 * 256 * 1024  # 10 MB
+_FINISHED = object()
+
+
+class BlobReader(io.RawIOBase):
+    """A read-only, seekable file-like object backed by a blob.
+
+    The blob is fetched in ranged requests of ``chunk_size`` bytes. While
+    the caller consumes one chunk, the following ``read_ahead`` chunks are
+    fetched on a background thread, so at most ``read_ahead + 1`` chunks
+    are held in memory.
+
+    .. note::
+
+       If the blob's :attr:`~google.cloud.storage.blob.Blob.size` is not
+       yet loaded, makes an API request to load the blob's metadata.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to read.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The number of bytes fetched by each
+                       request. Defaults to the blob's ``chunk_size``, or
+                       10 MB if that is not set.
+
+    :type read_ahead: int
+    :param read_ahead: (Optional) The number of chunks to fetch ahead of
+                       the current position.
+    """
+
+    def __init__(self, blob, client=None, chunk_size=None, read_ahead=1):
+        super(BlobReader, self).__init__()
+        if blob.size is None:
+            blob.reload(client=client)
+
+        self._blob = blob
+        self._size = blob.size
+        self._chunk_size = chunk_size or blob.chunk_size or _DEFAULT_CHUNK_SIZE
+        self._read_ahead = read_ahead
+        self._transport = blob._get_transport(client)
+        self._download_url = blob._get_download_url()
+        self._headers = _get_encryption_headers(blob._encryption_key)
+        self._position = 0
+        self._chunks = {}
+        self._executor = futures.ThreadPoolExecutor(max_workers=1)
+
+    def readable(self):
+        """Indicate that the object can be read.
+
+        :rtype: bool
+        :returns: Always :data:`True`.
+        """
+        return True
+
+    def seekable(self):
+        """Indicate that the object supports random access.
+
+        :rtype: bool
+        :returns: Always :data:`True`.
+        """
+        return True
+
+    def _fetch_chunk(self, index):
+        """Download one chunk of the blob.
+
+        :type index: int
+        :param index: The index of the chunk.
+
+        :rtype: bytes
+        :returns: The contents of the chunk.
+        """
+        start = index * self._chunk_size
+        end = min(start + self._chunk_size, self._size) - 1
+        buffer_ = io.BytesIO()
+        download = Download(
+            self._download_url, stream=buffer_, start=start, end=end,
+            headers=dict(self._headers))
+        try:
+            download.consume(self._transport)
+        except resumable_media.InvalidResponse as exc:
+            _raise_from_invalid_response(exc)
+        return buffer_.getvalue()
+
+    def _get_chunk(self, index):
+        """Get a chunk, scheduling the chunks which follow it.
+
+        Chunks outside of the read-ahead window are discarded.
+
+        :type index: int
+        :param index: The index of the chunk.
+
+        :rtype: bytes
+        :returns: The contents of the chunk.
+        """
+        num_chunks = -(-self._size // self._chunk_size)
+        wanted = range(index, min(index + 1 + self._read_ahead, num_chunks))
+
+        for stale in set(self._chunks).difference(wanted):
+            self._chunks.pop(stale).cancel()
+
+        for chunk_index in wanted:
+            if chunk_index not in self._chunks:
+                self._chunks[chunk_index] = self._executor.submit(
+                    self._fetch_chunk, chunk_index)
+
+        return self._chunks[index].result()
+
+    def readinto(self, buffer_):
+        """Read bytes from the current position into a writable buffer.
+
+        Reads at most to the end of the current chunk.
+
+        :type buffer_: bytearray or memoryview
+        :param buffer_: The buffer to fill.
+
+        :rtype: int
+        :returns: The number of bytes read (``0`` at the end of the blob).
+        """
+        self._checkClosed()
+        if self._position >= self._size or len(buffer_) == 0:
+            return 0
+
+        index, offset = divmod(self._position, self._chunk_size)
+        data = self._get_chunk(index)[offset:offset + len(buffer_)]
+        num_bytes = len(data)
+        buffer_[:num_bytes] = data
+        self._position += num_bytes
+        return num_bytes
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Change the current position.
+
+        :type offset: int
+        :param offset: The offset, relative to ``whence``.
+
+        :type whence: int
+        :param whence: One of :data:`io.SEEK_SET`, :data:`io.SEEK_CUR` or
+                       :data:`io.SEEK_END`.
+
+        :rtype: int
+        :returns: The new absolute position.
+        :raises: :exc:`ValueError` if ``whence`` is invalid or the new
+                 position would be negative.
+        """
+        self._checkClosed()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError('Invalid whence: %r' % (whence,))
+
+        if position < 0:
+            raise ValueError('Negative seek position %d' % (position,))
+
+        self._position = position
+        return position
+
+    def close(self):
+        """Close the reader, discarding any read-ahead chunks."""
+        if not self.closed:
+            for chunk in self._chunks.values():
+                chunk.cancel()
+            self._chunks.clear()
+            self._executor.shutdown(wait=False)
+        super(BlobReader, self).close()
+
+
+class _ChunkStream(object):
+    """Stream fed one chunk at a time, read by a resumable upload.
+
+    Positions are absolute (i.e. relative to the start of the upload),
+    which is what :class:`~google.resumable_media.requests.ResumableUpload`
+    expects from :meth:`tell`.
+    """
+
+    def __init__(self):
+        self._offset = 0
+        self._chunk = b''
+        self._position = 0
+
+    def feed(self, chunk):
+        """Replace the (fully read) current chunk with the next one.
+
+        :type chunk: bytes
+        :param chunk: The next chunk of the upload.
+        """
+        self._offset += len(self._chunk)
+        self._chunk = chunk
+        self._position = 0
+
+    def tell(self):
+        """Get the absolute position in the upload.
+
+        :rtype: int
+        :returns: The number of bytes read so far.
+        """
+        return self._offset + self._position
+
+    def read(self, size=-1):
+        """Read from the current chunk.
+
+        :type size: int
+        :param size: The maximum number of bytes to read.
+
+        :rtype: bytes
+        :returns: Up to ``size`` bytes of the current chunk.
+        """
+        if size < 0:
+            end = len(self._chunk)
+        else:
+            end = self._position + size
+        data = self._chunk[self._position:end]
+        self._position += len(data)
+        return data
+
+
+class BlobWriter(io.RawIOBase):
+    """A write-only file-like object uploading to a blob.
+
+    Bytes written are uploaded in chunks of ``chunk_size`` over a
+    resumable upload session. Chunks are sent on a background thread
+    while the caller keeps writing; at most ``max_pending`` full chunks
+    wait to be sent before :meth:`write` blocks. The upload is finalized
+    (and the blob's properties set) by :meth:`close`.
+
+    When used as a context manager, an exception raised in the ``with``
+    block abandons the upload rather than finalizing a partial object.
+
+    :type blob: :class:`~google.cloud.storage.blob.Blob`
+    :param blob: The blob to write.
+
+    :type client: :class:`~google.cloud.storage.client.Client`
+    :param client: (Optional) The client to use.  If not passed, falls back
+                   to the ``client`` stored on the blob's bucket.
+
+    :type content_type: str
+    :param content_type: (Optional) Type of content being uploaded.
+
+    :type chunk_size: int
+    :param chunk_size: (Optional) The number of bytes sent by each request.
+                       Must be a multiple of 256 KB. Defaults to the blob's
+                       ``chunk_size``, or 10 MB if that is not set.
+
+    :type max_pending: int
+    :param max_pending: (Optional) The number of full chunks buffered
+                        while waiting to be sent.
+
+    :raises: :exc:`ValueError` if ``chunk_size`` is not a multiple of
+             256 KB.
+    """
+
+    def __init__(self, blob, client=None, content_type=None,
+                 chunk_size=None, max_pending=1):
+        super(BlobWriter, self).__init__()
+        chunk_size = chunk_size or blob.chunk_size or _DEFAULT_CHUNK_SIZE
+        if chunk_size % blob._CHUNK_SIZE_MULTIPLE != 0:
+            raise ValueError('Chunk size must be a multiple of %d.' % (
+                blob._CHUNK_SIZE_MULTIPLE,))
+
+        self._blob = blob
+        self._client = client
+        self._content_type = content_type
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._stream = _ChunkStream()
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._upload = None
+        self._transport = None
+        self._thread = None
+        self._response = None
+        self._error = None
+
+    def writable(self):
+        """Indicate that the object can be written.
+
+        :rtype: bool
+        :returns: Always :data:`True`.
+        """
+        return True
+
+    def _upload_chunks(self):
+        """Send queued chunks until the final chunk or the upload is abandoned.
+
+        Runs on the background thread. After a failure, chunks are still
+        taken from the queue (and dropped) so that writers do not block.
+        """
+        while True:
+            chunk = self._queue.get()
+            if chunk is _FINISHED:
+                return
+
+            if self._error is None:
+                self._stream.feed(chunk)
+                try:
+                    self._response = self._upload.transmit_next_chunk(
+                        self._transport)
+                except Exception as exc:  # pylint: disable=broad-except
+                    self._error = exc
+
+            if len(chunk) < self._chunk_size:
+                return
+
+    def _send(self, chunk):
+        """Queue a chunk, starting the upload session if needed.
+
+        :type chunk: bytes
+        :param chunk: The chunk to send. A chunk shorter than
+                      ``chunk_size`` finalizes the upload.
+        """
+        if self._upload is None:
+            try:
+                self._upload, self._transport = (
+                    self._blob._initiate_resumable_upload(
+                        self._client, self._stream, self._content_type,
+                        None, None, chunk_size=self._chunk_size))
+            except resumable_media.InvalidResponse as exc:
+                _raise_from_invalid_response(exc)
+            self._thread = threading.Thread(target=self._upload_chunks)
+            self._thread.daemon = True
+            self._thread.start()
+
+        self._queue.put(chunk)
+
+    def _raise_error(self):
+        """Re-raise a failure from the background thread, if any."""
+        if self._error is not None:
+            if isinstance(self._error, resumable_media.InvalidResponse):
+                _raise_from_invalid_response(self._error)
+            raise self._error
+
+    def write(self, data):
+        """Write bytes, sending each full chunk in the background.
+
+        :type data: bytes
+        :param data: The bytes to write.
+
+        :rtype: int
+        :returns: The number of bytes written (always all of ``data``).
+        """
+        self._checkClosed()
+        self._raise_error()
+        self._buffer.extend(data)
+        while len(self._buffer) >= self._chunk_size:
+            chunk = bytes(self._buffer[:self._chunk_size])
+            del self._buffer[:self._chunk_size]
+            self._send(chunk)
+        return len(data)
+
+    def close(self):
+        """Send the remaining bytes and finalize the upload.
+
+        :raises: :class:`~google.cloud.exceptions.GoogleCloudError` if the
+                 upload failed.
+        """
+        if self.closed:
+            return
+
+        try:
+            # A short (possibly empty) chunk tells the upload that the
+            # stream is exhausted.
+            self._send(bytes(self._buffer))
+            self._buffer = bytearray()
+            self._thread.join()
+            self._raise_error()
+            self._blob._set_properties(self._response.json())
+        finally:
+            super(BlobWriter, self).close()
+
+    def _abandon(self):
+        """Stop sending chunks without finalizing the upload."""
+        if self._thread is not None:
+            self._queue.put(_FINISHED)
+            self._thread.join()
+        super(BlobWriter, self).close()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._abandon()
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import unittest
 
 import mock
@@ -28,7 +29,7 @@ def _make_credentials():
 def _make_response(status=http_client.OK, content=b'', headers={}):
     response = requests.Response()
     response.status_code = status
-    response._content = content
+    response.raw = io.BytesIO(content)
     response.headers = headers
     response.request = requests.Request()
     return response
@@ -157,6 +158,36 @@ class TestBatch(unittest.TestCase):
         self.assertEqual(request_url, url)
         self.assertIsNone(request_data)
 
+    def test__make_request_GET_stream(self):
+        from google.cloud.storage.batch import _FutureDict
+
+        url = 'http://example.com/api'
+        http = _make_requests_session([])
+        connection = _Connection(http=http)
+        batch = self._make_one(connection)
+
+        response = batch._make_request('GET', url, stream=True)
+
+        self.assertEqual(response.status_code, 204)
+        self.assertIsInstance(response.content, _FutureDict)
+        http.request.assert_not_called()
+        self.assertEqual(len(batch._requests), 1)
+
+    def test_api_request_w_stream_key(self):
+        from google.cloud.storage.batch import _FutureDict
+
+        http = _make_requests_session([])
+        connection = _Connection(http=http)
+        batch = self._make_one(connection)
+
+        result = batch.api_request('GET', '/b/name/o', stream_key='items')
+
+        self.assertIsInstance(result, _FutureDict)
+        http.request.assert_not_called()
+        request_method, request_url, _, _ = batch._requests[0]
+        self.assertEqual(request_method, 'GET')
+        self.assertTrue(request_url.endswith('/b/name/o'))
+
     def test__make_request_POST_normal(self):
         from google.cloud.storage.batch import _FutureDict
 
@@ -256,6 +287,27 @@ class TestBatch(unittest.TestCase):
         with self.assertRaises(ValueError):
             batch.finish()
 
+    def test__prepare_batch_request_empty(self):
+        http = _make_requests_session([])
+        connection = _Connection(http=http)
+        batch = self._make_one(connection)
+
+        with self.assertRaises(ValueError):
+            batch._prepare_batch_request()
+
+    def test__prepare_batch_request_defaults_to_deferred(self):
+        url = 'http://api.example.com/other_api'
+        http = _make_requests_session([])
+        connection = _Connection(http=http)
+        batch = self._make_one(connection)
+        batch._do_request('DELETE', url, {}, None, None)
+        batch._do_request('DELETE', url, {}, None, None)
+
+        headers, body = batch._prepare_batch_request()
+
+        self.assertTrue(headers['Content-Type'].startswith('multipart/mixed'))
+        self.assertEqual(body.count('DELETE %s' % url), 2)
+
     def _get_payload_chunks(self, boundary, payload):
         divider = '--' + boundary[len('boundary="'):-1]
         chunks = payload.split(divider)[1:-1]  # discard prolog / epilog
@@ -322,6 +374,7 @@ class TestBatch(unittest.TestCase):
         result = batch.finish()
 
         self.assertEqual(len(result), len(batch._requests))
+        self.assertTrue(expected_response.raw.closed)
 
         response1, response2, response3 = result
 
@@ -342,7 +395,8 @@ class TestBatch(unittest.TestCase):
 
         expected_url = '{}/batch'.format(batch.API_BASE_URL)
         http.request.assert_called_once_with(
-            method='POST', url=expected_url, headers=mock.ANY, data=mock.ANY)
+            method='POST', url=expected_url, headers=mock.ANY, data=mock.ANY,
+            stream=True)
 
         request_info = self._get_mutlipart_request(http)
         request_headers, request_body, content_type, boundary = request_info
@@ -359,6 +413,44 @@ class TestBatch(unittest.TestCase):
         self._check_subrequest_payload(chunks[1], 'PATCH', url, {'bar': 3})
         self._check_subrequest_no_payload(chunks[2], 'DELETE', url)
 
+    def _finish_chunked_helper(self, max_workers):
+        url = 'http://api.example.com/other_api'
+
+        def respond(method, url, headers, data, stream):
+            return _make_response(
+                content=_THREE_PART_MIME_RESPONSE,
+                headers={
+                    'content-type': 'multipart/mixed; boundary="DEADBEEF="'})
+
+        http = _make_requests_session([])
+        http.request.side_effect = respond
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client, max_workers=max_workers)
+        batch._MAX_CALLS_PER_REQUEST = 3
+        batch.API_BASE_URL = 'http://api.example.com'
+
+        for _ in range(9):
+            batch._do_request('DELETE', url, {}, None, None)
+        result = batch.finish()
+
+        self.assertEqual(len(result), 9)
+        self.assertEqual(
+            [response.status_code for response in result],
+            [http_client.OK, http_client.OK, http_client.NO_CONTENT] * 3)
+        self.assertEqual(http.request.call_count, 3)
+        for call in http.request.mock_calls:
+            request_call = call[2]
+            _, boundary = request_call['headers']['Content-Type'].split('; ')
+            chunks = self._get_payload_chunks(boundary, request_call['data'])
+            self.assertEqual(len(chunks), 3)
+
+    def test_finish_chunked(self):
+        self._finish_chunked_helper(max_workers=1)
+
+    def test_finish_chunked_concurrent(self):
+        self._finish_chunked_helper(max_workers=3)
+
     def test_finish_responses_mismatch(self):
         url = 'http://api.example.com/other_api'
         expected_response = _make_response(
@@ -405,7 +497,8 @@ class TestBatch(unittest.TestCase):
 
         expected_url = '{}/batch'.format(batch.API_BASE_URL)
         http.request.assert_called_once_with(
-            method='POST', url=expected_url, headers=mock.ANY, data=mock.ANY)
+            method='POST', url=expected_url, headers=mock.ANY, data=mock.ANY,
+            stream=True)
 
         _, request_body, _, boundary = self._get_mutlipart_request(http)
 
@@ -414,6 +507,30 @@ class TestBatch(unittest.TestCase):
         self._check_subrequest_payload(chunks[0], 'GET', url, {})
         self._check_subrequest_payload(chunks[1], 'GET', url, {})
 
+    def test_finish_nonempty_with_status_failure_wo_raise(self):
+        url = 'http://api.example.com/other_api'
+        expected_response = _make_response(
+            content=_TWO_PART_MIME_RESPONSE_WITH_FAIL,
+            headers={'content-type': 'multipart/mixed; boundary="DEADBEEF="'})
+        http = _make_requests_session([expected_response])
+        connection = _Connection(http=http)
+        client = _Client(connection)
+        batch = self._make_one(client, raise_exception=False)
+        batch.API_BASE_URL = 'http://api.example.com'
+        target1 = _MockObject()
+        target2 = _MockObject()
+
+        batch._do_request('GET', url, {}, None, target1)
+        batch._do_request('GET', url, {}, None, target2)
+        target2_future_before = target2._properties
+
+        response1, response2 = batch.finish()
+
+        self.assertEqual(response1.status_code, http_client.OK)
+        self.assertEqual(response2.status_code, http_client.NOT_FOUND)
+        self.assertEqual(target1._properties, {'foo': 1, 'bar': 2})
+        self.assertIs(target2._properties, target2_future_before)
+
     def test_finish_nonempty_non_multipart_response(self):
         url = 'http://api.example.com/other_api'
         http = _make_requests_session([_make_response()])
@@ -533,6 +650,79 @@ class Test__unpack_batch_response(unittest.TestCase):
         CONTENT = _THREE_PART_MIME_RESPONSE
         self._unpack_helper(RESPONSE, CONTENT)
 
+    def test_crlf_line_endings(self):
+        RESPONSE = {'content-type': 'multipart/mixed; boundary=DEADBEEF='}
+        CONTENT = _THREE_PART_MIME_RESPONSE.replace(b'\n', b'\r\n')
+        self._unpack_helper(RESPONSE, CONTENT)
+
+    def test_content_id(self):
+        RESPONSE = {'content-type': 'multipart/mixed; boundary="DEADBEEF="'}
+        result = list(self._call_fut(RESPONSE, _THREE_PART_MIME_RESPONSE))
+
+        self.assertEqual(
+            result[0].request.url,
+            'contentid://<response-8a09ca85-8d1d-4f45-9eb0-da8e8b07ec83+1>')
+
+    def test_not_multipart(self):
+        RESPONSE = {'content-type': 'application/json'}
+        with self.assertRaises(ValueError):
+            list(self._call_fut(RESPONSE, b'{}'))
+
+    def test_small_chunks(self):
+        RESPONSE = {'content-type': 'multipart/mixed; boundary="DEADBEEF="'}
+        CONTENT = _THREE_PART_MIME_RESPONSE.replace(b'\n', b'\r\n')
+        with mock.patch('google.cloud.storage.batch._BATCH_READ_SIZE', new=7):
+            self._unpack_helper(RESPONSE, CONTENT)
+
+    def test_payload_line_endings_kept(self):
+        RESPONSE = {'content-type': 'multipart/mixed; boundary=DEADBEEF='}
+        CONTENT = (
+            b'preamble\r\n'
+            b'--DEADBEEF=\r\n'
+            b'Content-Type: application/http\r\n'
+            b'Content-ID: <response-1>\r\n'
+            b'\r\n'
+            b'HTTP/1.1 200 OK\r\n'
+            b'Content-Type: text/plain\r\n'
+            b'\r\n'
+            b'one\r\ntwo\nthree\r\n'
+            b'--DEADBEEF=  \r\n'
+            b'\r\n'
+            b'HTTP/1.1 204 No Content\r\n'
+            b'--DEADBEEF=--\r\n'
+            b'epilogue\r\n')
+        first, second = self._call_fut(RESPONSE, CONTENT)
+
+        self.assertEqual(first.request.url, 'contentid://<response-1>')
+        self.assertEqual(first.headers, {'Content-Type': 'text/plain'})
+        self.assertEqual(first.content, b'one\r\ntwo\nthree')
+        self.assertEqual(second.request.url, 'contentid://None')
+        self.assertEqual(second.status_code, http_client.NO_CONTENT)
+        self.assertEqual(second.content, b'')
+
+    def test_boundary_prefix_in_payload(self):
+        RESPONSE = {'content-type': 'multipart/mixed; boundary=DEADBEEF='}
+        CONTENT = (
+            b'--DEADBEEF=\n'
+            b'\n'
+            b'HTTP/1.1 200 OK\n'
+            b'\n'
+            b'--DEADBEEF=not-a-delimiter\n'
+            b'--DEADBEEF=--')
+        response, = self._call_fut(RESPONSE, CONTENT)
+
+        self.assertEqual(response.content, b'--DEADBEEF=not-a-delimiter')
+
+    def test_unterminated_part(self):
+        RESPONSE = {'content-type': 'multipart/mixed; boundary="DEADBEEF="'}
+        CONTENT = _THREE_PART_MIME_RESPONSE[:-len(b'--DEADBEEF=--\n')]
+        result = self._call_fut(RESPONSE, CONTENT)
+
+        self.assertEqual(next(result).status_code, http_client.OK)
+        self.assertEqual(next(result).status_code, http_client.OK)
+        with self.assertRaises(ValueError):
+            next(result)
+
 
 _TWO_PART_MIME_RESPONSE_WITH_FAIL = b"""\
 --DEADBEEF=
@@ -621,9 +811,10 @@ class _Connection(object):
     def __init__(self, **kw):
         self.__dict__.update(kw)
 
-    def _make_request(self, method, url, data=None, headers=None):
+    def _make_request(self, method, url, data=None, headers=None,
+                      stream=False):
         return self.http.request(url=url, method=method,
-                                 headers=headers, data=data)
+                                 headers=headers, data=data, stream=stream)
 
 
 class _MockObject(object):
@@ -647,6 +647,222 @@ class Test_Blob(unittest.TestCase):
         self._check_session_mocks(
             client, transport, media_link, headers=key_headers)
 
+    def _mock_sliced_transport(self, data, fail_ranges=()):
+        import requests
+
+        payload = data
+        failures = set(fail_ranges)
+        transport = mock.Mock(spec=['request'])
+
+        def request(method, url, data=None, headers=None, stream=False):
+            byte_range = headers['range']
+            if byte_range in failures:
+                failures.remove(byte_range)
+                raise requests.exceptions.ConnectionError('reset')
+            start, end = [
+                int(value) for value in byte_range[6:].split('-')]
+            return self._mock_requests_response(
+                http_client.PARTIAL_CONTENT,
+                {'content-length': str(end - start + 1),
+                 'content-range': 'bytes %d-%d/%d' % (
+                     start, end, len(payload))},
+                content=payload[start:end + 1],
+                stream=True)
+
+        transport.request.side_effect = request
+        return transport
+
+    def _download_sliced_helper(self, properties, fail_ranges=(),
+                                reload_properties=None):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        data = b'abcdefghij'
+        transport = self._mock_sliced_transport(data, fail_ranges)
+        client = mock.Mock(_http=transport, spec=['_http'])
+        bucket = _Bucket(client)
+        blob = self._make_one(
+            'blob-name', bucket=bucket, properties=properties)
+        if reload_properties is not None:
+            blob.reload = mock.Mock(
+                side_effect=lambda client=None: blob._properties.update(
+                    reload_properties))
+
+        with _NamedTemporaryFile() as temp:
+            blob.download_to_filename(
+                temp.name, slice_size=4, max_workers=2)
+            with open(temp.name, 'rb') as file_obj:
+                wrote = file_obj.read()
+
+        self.assertEqual(wrote, data)
+        return blob, transport
+
+    def test_download_to_filename_sliced(self):
+        import base64
+        import hashlib
+
+        md5_hash = base64.b64encode(
+            hashlib.md5(b'abcdefghij').digest()).decode('ascii')
+        properties = {
+            'mediaLink': 'http://example.com/media/',
+            'size': '10',
+            'md5Hash': md5_hash,
+        }
+        _, transport = self._download_sliced_helper(properties)
+
+        ranges = sorted(
+            call[2]['headers']['range']
+            for call in transport.request.mock_calls)
+        self.assertEqual(
+            ranges, ['bytes=0-3', 'bytes=4-7', 'bytes=8-9'])
+
+    def test_download_to_filename_sliced_retries_failed_slice(self):
+        properties = {
+            'mediaLink': 'http://example.com/media/',
+            'size': '10',
+        }
+        with mock.patch('time.sleep') as sleep:
+            _, transport = self._download_sliced_helper(
+                properties, fail_ranges=['bytes=4-7'])
+
+        sleep.assert_called_once()
+        self.assertLessEqual(sleep.call_args[0][0], 2.0)
+        ranges = sorted(
+            call[2]['headers']['range']
+            for call in transport.request.mock_calls)
+        self.assertEqual(
+            ranges, ['bytes=0-3', 'bytes=4-7', 'bytes=4-7', 'bytes=8-9'])
+
+    def test_download_to_filename_sliced_wo_size(self):
+        properties = {'mediaLink': 'http://example.com/media/'}
+        blob, _ = self._download_sliced_helper(
+            properties, reload_properties={'size': '10'})
+
+        blob.reload.assert_called_once_with(client=None)
+
+    def test_download_to_filename_sliced_gives_up(self):
+        import requests
+        from google.cloud._testing import _NamedTemporaryFile
+
+        transport = mock.Mock(spec=['request'])
+        transport.request.side_effect = requests.exceptions.ConnectionError
+        client = mock.Mock(_http=transport, spec=['_http'])
+        bucket = _Bucket(client)
+        properties = {'mediaLink': 'http://example.com/media/', 'size': '6'}
+        blob = self._make_one(
+            'blob-name', bucket=bucket, properties=properties)
+
+        with _NamedTemporaryFile() as temp:
+            with mock.patch(
+                    'google.api.core.retry.random.uniform',
+                    side_effect=lambda low, high: high):
+                with mock.patch('time.sleep') as sleep:
+                    with self.assertRaises(
+                            requests.exceptions.ConnectionError):
+                        blob.download_to_filename(temp.name, slice_size=3)
+
+        self.assertEqual(transport.request.call_count, 6)
+        # Exponential backoff between the three attempts.
+        self.assertEqual(
+            sleep.mock_calls, [mock.call(2.0), mock.call(4.0)])
+
+    def test_download_to_filename_sliced_invalid_response(self):
+        from google.cloud.exceptions import NotFound
+        from google.cloud._testing import _NamedTemporaryFile
+
+        transport = mock.Mock(spec=['request'])
+        transport.request.return_value = self._mock_requests_response(
+            http_client.NOT_FOUND, {}, content=b'Not found')
+        client = mock.Mock(_http=transport, spec=['_http'])
+        bucket = _Bucket(client)
+        properties = {'mediaLink': 'http://example.com/media/', 'size': '6'}
+        blob = self._make_one(
+            'blob-name', bucket=bucket, properties=properties)
+
+        with _NamedTemporaryFile() as temp:
+            with mock.patch('time.sleep'):
+                with self.assertRaises(NotFound):
+                    blob.download_to_filename(temp.name, slice_size=6)
+
+    def test_download_to_filename_sliced_w_crc32c(self):
+        import base64
+        import hashlib
+
+        # Stands in for ``crcmod``: the "CRC" is an MD5 hash.
+        crcmod = mock.Mock(spec=['predefined'])
+        crcmod.predefined.Crc.side_effect = lambda name: hashlib.md5()
+        checksum = base64.b64encode(
+            hashlib.md5(b'abcdefghij').digest()).decode('ascii')
+        properties = {
+            'mediaLink': 'http://example.com/media/',
+            'size': '10',
+            'crc32c': checksum,
+        }
+        with mock.patch('google.cloud.storage.blob.crcmod', new=crcmod):
+            self._download_sliced_helper(properties)
+
+        crcmod.predefined.Crc.assert_called_once_with('crc-32c')
+
+    def test_download_to_filename_sliced_w_crc32c_mismatch(self):
+        import hashlib
+
+        crcmod = mock.Mock(spec=['predefined'])
+        crcmod.predefined.Crc.side_effect = lambda name: hashlib.md5()
+        properties = {
+            'mediaLink': 'http://example.com/media/',
+            'size': '10',
+            'crc32c': 'bad-crc',
+        }
+        with mock.patch('google.cloud.storage.blob.crcmod', new=crcmod):
+            with self.assertRaises(ValueError):
+                self._download_sliced_helper(properties)
+
+    def test_download_to_filename_sliced_checksum_mismatch(self):
+        properties = {
+            'mediaLink': 'http://example.com/media/',
+            'size': '10',
+            'md5Hash': 'bad-hash',
+        }
+        with self.assertRaises(ValueError):
+            self._download_sliced_helper(properties)
+
+    def test_download_to_filename_sliced_bad_slice_size(self):
+        blob = self._make_one('blob-name', bucket=_Bucket())
+
+        with self.assertRaises(ValueError):
+            blob.download_to_filename('unused', slice_size=0)
+
+    def test_open_read(self):
+        from google.cloud.storage.fileio import BlobReader
+
+        client = mock.Mock(_http=mock.sentinel.transport, spec=['_http'])
+        blob = self._make_one(
+            'blob-name', bucket=_Bucket(client), properties={'size': '10'})
+        reader = blob.open('rb', chunk_size=4, read_ahead=3)
+
+        self.assertIsInstance(reader, BlobReader)
+        self.assertIs(reader._blob, blob)
+        self.assertEqual(reader._chunk_size, 4)
+        self.assertEqual(reader._read_ahead, 3)
+
+    def test_open_write(self):
+        from google.cloud.storage.fileio import BlobWriter
+
+        blob = self._make_one('blob-name', bucket=_Bucket())
+        client = mock.sentinel.client
+        writer = blob.open('wb', client=client, content_type='text/csv')
+
+        self.assertIsInstance(writer, BlobWriter)
+        self.assertIs(writer._blob, blob)
+        self.assertIs(writer._client, client)
+        self.assertEqual(writer._content_type, 'text/csv')
+        writer._abandon()
+
+    def test_open_bad_mode(self):
+        blob = self._make_one('blob-name', bucket=_Bucket())
+
+        with self.assertRaises(ValueError):
+            blob.open('r+')
+
     def test_download_as_string(self):
         blob_name = 'blob-name'
         transport = self._mock_download_transport()
@@ -1210,6 +1426,143 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(stream.mode, 'rb')
         self.assertEqual(stream.name, temp.name)
 
+    def _upload_composite_helper(self, data, parts, upload_error=None,
+                                 delete_result=None, **blob_kwargs):
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.storage.blob import Blob
+
+        bucket = mock.Mock(
+            spec=['bulk_delete_blobs', 'path'], path='/b/name')
+        if isinstance(delete_result, Exception):
+            bucket.bulk_delete_blobs.side_effect = delete_result
+        else:
+            bucket.bulk_delete_blobs.return_value = delete_result or {}
+        blob = self._make_one('blob-name', bucket=bucket, **blob_kwargs)
+        client = mock.sentinel.client
+        uploaded = {}
+        composed = []
+        self._composite_blobs = []
+
+        def upload_from_file(part, file_obj, size=None, content_type=None,
+                             client=None):
+            if upload_error is not None:
+                raise upload_error
+            self._composite_blobs.append(part)
+            uploaded[part.name] = file_obj.read(size)
+
+        def compose(destination, sources, client=None):
+            self._composite_blobs.append(destination)
+            composed.append((destination.name, [
+                source.name for source in sources]))
+
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, 'wb') as file_obj:
+                file_obj.write(data)
+
+            with mock.patch.object(
+                    Blob, 'upload_from_file', autospec=True,
+                    side_effect=upload_from_file):
+                with mock.patch.object(
+                        Blob, 'compose', autospec=True, side_effect=compose):
+                    blob.upload_from_filename(
+                        temp.name, content_type='text/plain', client=client,
+                        parts=parts, max_workers=2)
+
+        return blob, bucket, uploaded, composed
+
+    def test_upload_from_filename_composite(self):
+        blob, bucket, uploaded, composed = self._upload_composite_helper(
+            b'0123456789', 3)
+
+        parts = sorted(uploaded)
+        self.assertEqual(len(parts), 3)
+        for name in parts:
+            self.assertTrue(name.startswith('blob-name.composite-'))
+        self.assertEqual(
+            b''.join(uploaded[name] for name in parts), b'0123456789')
+        self.assertEqual(composed, [('blob-name', parts)])
+        self.assertEqual(blob.content_type, 'text/plain')
+
+        deleted, = bucket.bulk_delete_blobs.call_args[0]
+        self.assertEqual(sorted(part.name for part in deleted), parts)
+        self.assertEqual(bucket.bulk_delete_blobs.call_args[1], {
+            'client': mock.sentinel.client, 'max_workers': 2})
+
+    def test_upload_from_filename_composite_tree(self):
+        with mock.patch(
+                'google.cloud.storage.blob._MAX_COMPOSE_COMPONENTS', new=2):
+            _, bucket, uploaded, composed = self._upload_composite_helper(
+                b'abcde', 5)
+
+        self.assertEqual(len(uploaded), 5)
+        # 5 parts -> 3 intermediates -> 2 intermediates -> destination.
+        self.assertEqual(len(composed), 6)
+        for _, sources in composed:
+            self.assertLessEqual(len(sources), 2)
+        self.assertEqual(composed[-1][0], 'blob-name')
+
+        deleted, = bucket.bulk_delete_blobs.call_args[0]
+        self.assertEqual(len(deleted), 10)
+
+    def test_upload_from_filename_composite_w_encryption_key(self):
+        key = b'01234567890123456789012345678901'  # 32 bytes
+        with mock.patch(
+                'google.cloud.storage.blob._MAX_COMPOSE_COMPONENTS', new=2):
+            _, _, uploaded, composed = self._upload_composite_helper(
+                b'abcde', 3, encryption_key=key, chunk_size=256 * 1024)
+
+        self.assertEqual(len(uploaded), 3)
+        self.assertEqual(len(composed), 3)
+        # 3 parts + 2 intermediates + destination.
+        self.assertEqual(len(self._composite_blobs), 6)
+        for blob in self._composite_blobs:
+            self.assertEqual(blob._encryption_key, key)
+            self.assertEqual(blob.chunk_size, 256 * 1024)
+
+    def test_upload_from_filename_composite_failure(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        error = ServiceUnavailable('oops')
+        with self.assertRaises(ServiceUnavailable):
+            self._upload_composite_helper(b'abcdef', 2, upload_error=error)
+
+    def test_upload_from_filename_composite_failure_cleanup_fails(self):
+        from google.cloud.exceptions import Forbidden
+        from google.cloud.exceptions import ServiceUnavailable
+
+        error = ServiceUnavailable('oops')
+        with mock.patch('google.cloud.storage.blob._LOGGER') as logger:
+            with self.assertRaises(ServiceUnavailable):
+                self._upload_composite_helper(
+                    b'abcdef', 2, upload_error=error,
+                    delete_result=Forbidden('nope'))
+
+        logger.exception.assert_called_once()
+
+    def test_upload_from_filename_composite_cleanup_errors_logged(self):
+        from google.cloud.exceptions import Forbidden
+        from google.cloud.exceptions import NotFound
+
+        forbidden = Forbidden('nope')
+        delete_result = {
+            'blob-name.composite-part-0': None,
+            'blob-name.composite-part-1': NotFound('gone'),
+            'blob-name.composite-part-2': forbidden,
+        }
+        with mock.patch('google.cloud.storage.blob._LOGGER') as logger:
+            self._upload_composite_helper(
+                b'abcdef', 2, delete_result=delete_result)
+
+        logger.warning.assert_called_once_with(
+            'Failed to delete temporary part %s: %s',
+            'blob-name.composite-part-2', forbidden)
+
+    def test_upload_from_filename_composite_bad_parts(self):
+        blob = self._make_one('blob-name', bucket=None)
+
+        with self.assertRaises(ValueError):
+            blob.upload_from_filename('unused', parts=0)
+
     def _upload_from_string_helper(self, data, **kwargs):
         from google.cloud._helpers import _to_bytes
 
@@ -1513,6 +1866,37 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(kw[0]['method'], 'POST')
         self.assertEqual(kw[0]['path'], '/b/name/o/%s/compose' % DESTINATION)
         self.assertEqual(kw[0]['data'], SENT)
+        self.assertEqual(kw[0]['headers'], {})
+
+    def test_compose_w_encryption_key(self):
+        import base64
+        import hashlib
+
+        KEY = b'01234567890123456789012345678901'  # 32 bytes
+        KEY_B64 = base64.b64encode(KEY).rstrip().decode('ascii')
+        KEY_HASH = hashlib.sha256(KEY).digest()
+        KEY_HASH_B64 = base64.b64encode(KEY_HASH).rstrip().decode('ascii')
+        after = ({'status': http_client.OK}, {'etag': 'DEADBEEF'})
+        connection = _Connection(after)
+        client = _Client(connection)
+        bucket = _Bucket(client=client)
+        source_1 = self._make_one(
+            'source-1', bucket=bucket, encryption_key=KEY)
+        source_2 = self._make_one(
+            'source-2', bucket=bucket, encryption_key=KEY)
+        destination = self._make_one(
+            'destination', bucket=bucket, encryption_key=KEY)
+        destination.content_type = 'text/plain'
+
+        destination.compose(sources=[source_1, source_2])
+
+        kw = connection._requested
+        self.assertEqual(len(kw), 1)
+        self.assertEqual(kw[0]['headers'], {
+            'X-Goog-Encryption-Algorithm': 'AES256',
+            'X-Goog-Encryption-Key': KEY_B64,
+            'X-Goog-Encryption-Key-Sha256': KEY_HASH_B64,
+        })
 
     def test_compose_w_additional_property_changes(self):
         SOURCE_1 = 'source-1'
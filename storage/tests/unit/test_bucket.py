@@ -281,6 +281,30 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw['path'], '/b/%s/o' % NAME)
         self.assertEqual(kw['query_params'], {'projection': 'noAcl'})
 
+    def test_list_blobs_w_prefetch(self):
+        NAME = 'name'
+        connection = _Connection({'items': [{'name': 'blob-name'}]})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        iterator = bucket.list_blobs(prefetch=2)
+        blobs = list(iterator)
+        self.assertEqual(iterator.prefetch, 2)
+        self.assertEqual([blob.name for blob in blobs], ['blob-name'])
+        kw, = connection._requested
+        self.assertEqual(kw['path'], '/b/%s/o' % NAME)
+
+    def test_list_blobs_w_stream(self):
+        NAME = 'name'
+        connection = _Connection({'items': [{'name': 'blob-name'}]})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        iterator = bucket.list_blobs(stream=True)
+        blobs = list(iterator)
+        self.assertEqual([blob.name for blob in blobs], ['blob-name'])
+        kw, = connection._requested
+        self.assertEqual(kw['path'], '/b/%s/o' % NAME)
+        self.assertEqual(kw['stream_key'], 'items')
+
     def test_list_blobs_w_all_arguments(self):
         NAME = 'name'
         MAX_RESULTS = 10
@@ -406,6 +430,43 @@ class Test_Bucket(unittest.TestCase):
         }]
         self.assertEqual(connection._deleted_buckets, expected_cw)
 
+    def test_delete_force_bulk(self):
+        from google.cloud.exceptions import NotFound
+
+        NAME = 'name'
+        connection = _Connection()
+        connection._delete_bucket = True
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        bucket.bulk_delete_blobs = mock.Mock(
+            return_value={'a': None, 'b': NotFound('miss')})
+
+        result = bucket.delete(force=True, bulk=True)
+
+        self.assertIsNone(result)
+        bucket.bulk_delete_blobs.assert_called_once_with(client=client)
+        expected_cw = [{
+            'method': 'DELETE',
+            'path': bucket.path,
+            '_target_object': None,
+        }]
+        self.assertEqual(connection._deleted_buckets, expected_cw)
+
+    def test_delete_force_bulk_w_error(self):
+        from google.cloud.exceptions import Forbidden
+
+        connection = _Connection()
+        connection._delete_bucket = True
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+        error = Forbidden('denied')
+        bucket.bulk_delete_blobs = mock.Mock(return_value={'a': error})
+
+        with self.assertRaises(Forbidden):
+            bucket.delete(force=True, bulk=True)
+
+        self.assertEqual(connection._deleted_buckets, [])
+
     def test_delete_too_many(self):
         NAME = 'name'
         BLOB_NAME1 = 'blob-name1'
@@ -505,6 +566,82 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw[1]['method'], 'DELETE')
         self.assertEqual(kw[1]['path'], '/b/%s/o/%s' % (NAME, NONESUCH))
 
+    def test__delete_blobs_batch(self):
+        from six.moves import http_client
+        from google.cloud.exceptions import NotFound
+
+        NAME = 'name'
+        client = _Client(_Connection())
+        bucket = self._make_one(client=client, name=NAME)
+        batch = mock.Mock(spec=['api_request', 'finish'])
+        batch.finish.return_value = [
+            _make_response(http_client.NO_CONTENT),
+            _make_response(http_client.NOT_FOUND),
+        ]
+
+        patch = mock.patch(
+            'google.cloud.storage.bucket.Batch', return_value=batch)
+        with patch as batch_class:
+            results = bucket._delete_blobs_batch(['a', 'b/c'], client)
+
+        batch_class.assert_called_once_with(client, raise_exception=False)
+        self.assertEqual(batch.api_request.mock_calls, [
+            mock.call(method='DELETE', path='/b/name/o/a',
+                      _target_object=None),
+            mock.call(method='DELETE', path='/b/name/o/b%2Fc',
+                      _target_object=None),
+        ])
+        (name1, error1), (name2, error2) = results
+        self.assertEqual((name1, error1), ('a', None))
+        self.assertEqual(name2, 'b/c')
+        self.assertIsInstance(error2, NotFound)
+
+    def test_bulk_delete_blobs_w_blobs(self):
+        from google.cloud.storage.blob import Blob
+
+        client = _Client(_Connection())
+        bucket = self._make_one(client=client, name='name')
+        names = ['blob-%d' % (index,) for index in range(250)]
+        blobs = [Blob(name, bucket=bucket) for name in names[:10]]
+        blobs.extend(names[10:])
+        bucket._delete_blobs_batch = mock.Mock(
+            side_effect=lambda chunk, client: [
+                (name, None) for name in chunk])
+
+        report = bucket.bulk_delete_blobs(blobs=blobs, max_workers=2)
+
+        self.assertEqual(report, {name: None for name in names})
+        chunks = sorted(
+            call[1][0] for call in bucket._delete_blobs_batch.mock_calls)
+        self.assertEqual(
+            sorted(len(chunk) for chunk in chunks), [50, 100, 100])
+        self.assertEqual(
+            sorted(name for chunk in chunks for name in chunk),
+            sorted(names))
+
+    def test_bulk_delete_blobs_w_prefix(self):
+        connection = _Connection(
+            {'items': [{'name': 'a/1'}], 'nextPageToken': 'token'},
+            {'items': [{'name': 'a/2'}]})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+        bucket._delete_blobs_batch = mock.Mock(
+            side_effect=lambda chunk, client: [
+                (name, None) for name in chunk])
+
+        report = bucket.bulk_delete_blobs(prefix='a/')
+
+        self.assertEqual(report, {'a/1': None, 'a/2': None})
+        kw = connection._requested
+        self.assertEqual(len(kw), 2)
+        self.assertEqual(kw[0]['path'], '/b/name/o')
+        self.assertEqual(kw[0]['query_params'], {
+            'prefix': 'a/',
+            'projection': 'noAcl',
+            'fields': 'items/name,nextPageToken',
+        })
+        self.assertEqual(kw[1]['query_params']['pageToken'], 'token')
+
     def test_copy_blobs_wo_name(self):
         SOURCE = 'source'
         DEST = 'dest'
@@ -1191,6 +1328,60 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw[1]['query_params'],
                          {'maxResults': max_results, 'projection': 'full'})
 
+    def test_make_public_recursive_bulk(self):
+        from google.cloud.exceptions import Forbidden
+        from google.cloud.storage.acl import _ACLEntity
+
+        _saved = []
+        error = Forbidden('denied')
+
+        class _Blob(object):
+
+            def __init__(self, name):
+                self.name = name
+
+            @property
+            def acl(self):
+                return self
+
+            # Faux ACL methods
+            def all(self):
+                return self
+
+            def grant_read(self):
+                pass
+
+            def save(self, client=None):
+                if self.name == 'blob-1':
+                    raise error
+                _saved.append((self.name, client))
+
+        def item_to_blob(self, item):
+            return _Blob(item['name'])
+
+        permissive = [{'entity': 'allUsers', 'role': _ACLEntity.READER_ROLE}]
+        after = {'acl': permissive, 'defaultObjectAcl': []}
+        items = [{'name': 'blob-%d' % (index,)} for index in range(20)]
+        connection = _Connection(after, {'items': items})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name='name')
+        bucket.acl.loaded = True
+        bucket.default_object_acl.loaded = True
+
+        with mock.patch('google.cloud.storage.bucket._item_to_blob',
+                        new=item_to_blob):
+            report = bucket.make_public(
+                recursive=True, bulk=True, max_workers=3, client=client)
+
+        self.assertEqual(len(report), 20)
+        self.assertIs(report.pop('blob-1'), error)
+        self.assertEqual(set(report.values()), set([None]))
+        self.assertEqual(len(_saved), 19)
+        kw = connection._requested
+        self.assertEqual(len(kw), 2)
+        self.assertEqual(kw[1]['method'], 'GET')
+        self.assertEqual(kw[1]['query_params'], {'projection': 'full'})
+
     def test_make_public_recursive_too_many(self):
         from google.cloud.storage.acl import _ACLEntity
 
@@ -1375,6 +1566,17 @@ class Test_Bucket(unittest.TestCase):
             bucket.generate_upload_policy([])
 
 
+def _make_response(status_code):
+    import requests
+
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b''
+    response.request = requests.Request(
+        method='BATCH', url='contentid://None').prepare()
+    return response
+
+
 class _Connection(object):
     _delete_bucket = False
 
@@ -74,6 +74,18 @@ class TestClient(unittest.TestCase):
         self.assertIsNone(client.current_batch)
         self.assertEqual(list(client._batch_stack), [])
 
+    def test_ctor_w_transport_config(self):
+        from google.cloud.client import TransportConfig
+
+        config = TransportConfig(pool_maxsize=50)
+        client = self._make_one(
+            project='PROJECT', credentials=_make_credentials(),
+            transport_config=config)
+
+        adapter = client._connection.http.get_adapter(
+            'https://www.googleapis.com/')
+        self.assertEqual(adapter._pool_maxsize, 50)
+
     def test__push_batch_and__pop_batch(self):
         from google.cloud.storage.batch import Batch
 
@@ -151,6 +163,15 @@ class TestClient(unittest.TestCase):
         batch = client.batch()
         self.assertIsInstance(batch, Batch)
         self.assertIs(batch._client, client)
+        self.assertEqual(batch._max_workers, 1)
+
+    def test_batch_w_max_workers(self):
+        PROJECT = 'PROJECT'
+        CREDENTIALS = _make_credentials()
+
+        client = self._make_one(project=PROJECT, credentials=CREDENTIALS)
+        batch = client.batch(max_workers=4)
+        self.assertEqual(batch._max_workers, 4)
 
     def test_get_bucket_miss(self):
         from google.cloud.exceptions import NotFound
@@ -0,0 +1,392 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import unittest
+
+import mock
+from six.moves import http_client
+
+
+_DATA = b'abcdefghij'
+
+
+def _make_response(status_code, content=b'', headers=None):
+    import requests
+
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response.raw = io.BytesIO(content)
+    response._content = False
+    response.request = requests.Request(
+        'GET', 'http://example.com').prepare()
+    return response
+
+
+def _make_transport(data=_DATA):
+    transport = mock.Mock(spec=['request'])
+
+    def request(method, url, data=None, headers=None, stream=False):
+        start, end = [
+            int(value) for value in headers['range'][6:].split('-')]
+        return _make_response(
+            http_client.PARTIAL_CONTENT,
+            content=payload[start:end + 1],
+            headers={
+                'content-length': str(end - start + 1),
+                'content-range': 'bytes %d-%d/%d' % (
+                    start, end, len(payload)),
+            })
+
+    payload = data
+    transport.request.side_effect = request
+    return transport
+
+
+def _make_blob(transport=None, properties=None, chunk_size=None):
+    from google.cloud.storage.blob import Blob
+
+    client = mock.Mock(_http=transport, spec=['_http'])
+    bucket = mock.Mock(client=client, path='/b/name', spec=['client', 'path'])
+    blob = Blob('blob-name', bucket=bucket, chunk_size=chunk_size)
+    if properties is None:
+        properties = {
+            'mediaLink': 'http://example.com/media/',
+            'size': str(len(_DATA)),
+        }
+    blob._properties = properties
+    return blob
+
+
+def _requested_ranges(transport):
+    return [
+        call[2]['headers']['range'] for call in transport.request.mock_calls]
+
+
+class TestBlobReader(unittest.TestCase):
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobReader
+
+        return BlobReader
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_ctor_defaults(self):
+        from google.cloud.storage.fileio import _DEFAULT_CHUNK_SIZE
+
+        transport = _make_transport()
+        reader = self._make_one(_make_blob(transport))
+
+        self.assertTrue(reader.readable())
+        self.assertTrue(reader.seekable())
+        self.assertFalse(reader.writable())
+        self.assertEqual(reader._chunk_size, _DEFAULT_CHUNK_SIZE)
+        self.assertEqual(reader._read_ahead, 1)
+        self.assertEqual(reader.tell(), 0)
+        transport.request.assert_not_called()
+
+    def test_ctor_wo_size(self):
+        blob = _make_blob(
+            _make_transport(),
+            properties={'mediaLink': 'http://example.com/media/'})
+        blob.reload = mock.Mock(
+            side_effect=lambda client=None: blob._properties.update(
+                size='10'))
+        client = mock.Mock(_http=_make_transport(), spec=['_http'])
+
+        reader = self._make_one(blob, client=client)
+
+        blob.reload.assert_called_once_with(client=client)
+        self.assertEqual(reader._size, 10)
+
+    def test_read_all(self):
+        transport = _make_transport()
+        reader = self._make_one(
+            _make_blob(transport), chunk_size=4, read_ahead=2)
+
+        self.assertEqual(reader.read(), _DATA)
+        self.assertEqual(reader.read(), b'')
+        self.assertEqual(
+            sorted(_requested_ranges(transport)),
+            ['bytes=0-3', 'bytes=4-7', 'bytes=8-9'])
+
+    def test_read_across_chunks(self):
+        reader = self._make_one(
+            _make_blob(_make_transport()), chunk_size=4, read_ahead=0)
+
+        self.assertEqual(reader.read(3), b'abc')
+        # Raw reads stop at the end of the current chunk.
+        self.assertEqual(reader.read(3), b'd')
+        self.assertEqual(reader.read(3), b'efg')
+        self.assertEqual(reader.tell(), 7)
+
+    def test_read_ahead_window(self):
+        transport = _make_transport()
+        reader = self._make_one(
+            _make_blob(transport), chunk_size=4, read_ahead=1)
+
+        self.assertEqual(reader.read(1), b'a')
+        reader._chunks[1].result()
+        self.assertEqual(sorted(reader._chunks), [0, 1])
+
+        reader.seek(8)
+        self.assertEqual(reader.read(), b'ij')
+        self.assertEqual(sorted(reader._chunks), [2])
+
+    def test_seek(self):
+        reader = self._make_one(
+            _make_blob(_make_transport()), chunk_size=4)
+
+        self.assertEqual(reader.seek(5), 5)
+        self.assertEqual(reader.read(2), b'fg')
+        self.assertEqual(reader.seek(-3, io.SEEK_CUR), 4)
+        self.assertEqual(reader.read(1), b'e')
+        self.assertEqual(reader.seek(-2, io.SEEK_END), 8)
+        self.assertEqual(reader.read(), b'ij')
+        self.assertEqual(reader.seek(20), 20)
+        self.assertEqual(reader.read(), b'')
+
+    def test_seek_invalid(self):
+        reader = self._make_one(_make_blob(_make_transport()))
+
+        with self.assertRaises(ValueError):
+            reader.seek(-1)
+        with self.assertRaises(ValueError):
+            reader.seek(0, 42)
+
+    def test_read_failure(self):
+        from google.cloud.exceptions import NotFound
+
+        transport = mock.Mock(spec=['request'])
+        transport.request.return_value = _make_response(
+            http_client.NOT_FOUND, content=b'Not found')
+        reader = self._make_one(_make_blob(transport))
+
+        with self.assertRaises(NotFound):
+            reader.read()
+
+    def test_close(self):
+        reader = self._make_one(_make_blob(_make_transport()), chunk_size=4)
+        reader.read(1)
+
+        reader.close()
+
+        self.assertTrue(reader.closed)
+        self.assertEqual(reader._chunks, {})
+        with self.assertRaises(ValueError):
+            reader.read()
+
+
+class Test_ChunkStream(unittest.TestCase):
+
+    @staticmethod
+    def _make_one():
+        from google.cloud.storage.fileio import _ChunkStream
+
+        return _ChunkStream()
+
+    def test_feed_and_read(self):
+        stream = self._make_one()
+        self.assertEqual(stream.tell(), 0)
+
+        stream.feed(b'abcd')
+        self.assertEqual(stream.read(3), b'abc')
+        self.assertEqual(stream.tell(), 3)
+        self.assertEqual(stream.read(3), b'd')
+        self.assertEqual(stream.tell(), 4)
+
+        stream.feed(b'ef')
+        self.assertEqual(stream.tell(), 4)
+        self.assertEqual(stream.read(), b'ef')
+        self.assertEqual(stream.tell(), 6)
+
+
+class _FakeUpload(object):
+
+    def __init__(self, stream, chunk_size, error=None):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._error = error
+        self.chunks = []
+        self.finished = False
+
+    def transmit_next_chunk(self, transport):
+        if self._error is not None:
+            raise self._error
+        start = self._stream.tell()
+        chunk = self._stream.read(self._chunk_size)
+        self.chunks.append((start, chunk))
+        response = mock.Mock(spec=['json'])
+        if len(chunk) < self._chunk_size:
+            self.finished = True
+            response.json.return_value = {'name': 'blob-name', 'size': '5'}
+        return response
+
+
+class TestBlobWriter(unittest.TestCase):
+
+    CHUNK_SIZE = 256 * 1024
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.fileio import BlobWriter
+
+        return BlobWriter
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _make_blob(self, error=None):
+        blob = _make_blob()
+        uploads = []
+
+        def initiate(client, stream, content_type, size, num_retries,
+                     chunk_size=None):
+            upload = _FakeUpload(stream, chunk_size, error=error)
+            uploads.append(upload)
+            return upload, mock.sentinel.transport
+
+        blob._initiate_resumable_upload = mock.Mock(side_effect=initiate)
+        return blob, uploads
+
+    def test_ctor_bad_chunk_size(self):
+        with self.assertRaises(ValueError):
+            self._make_one(_make_blob(), chunk_size=1000)
+
+    def test_ctor_defaults(self):
+        from google.cloud.storage.fileio import _DEFAULT_CHUNK_SIZE
+
+        writer = self._make_one(_make_blob())
+
+        self.assertTrue(writer.writable())
+        self.assertFalse(writer.readable())
+        self.assertEqual(writer._chunk_size, _DEFAULT_CHUNK_SIZE)
+
+    def test_write_and_close(self):
+        blob, uploads = self._make_blob()
+        client = mock.sentinel.client
+        writer = self._make_one(
+            blob, client=client, content_type='text/csv',
+            chunk_size=self.CHUNK_SIZE)
+
+        data = b'x' * self.CHUNK_SIZE + b'y' * 100
+        writer.write(data[:10])
+        blob._initiate_resumable_upload.assert_not_called()
+        writer.write(data[10:])
+        writer.close()
+
+        self.assertTrue(writer.closed)
+        blob._initiate_resumable_upload.assert_called_once_with(
+            client, writer._stream, 'text/csv', None, None,
+            chunk_size=self.CHUNK_SIZE)
+        upload, = uploads
+        self.assertEqual(upload.chunks, [
+            (0, b'x' * self.CHUNK_SIZE),
+            (self.CHUNK_SIZE, b'y' * 100),
+        ])
+        self.assertEqual(blob.size, 5)
+
+    def test_close_exact_multiple(self):
+        blob, uploads = self._make_blob()
+        writer = self._make_one(blob, chunk_size=self.CHUNK_SIZE)
+
+        writer.write(b'x' * self.CHUNK_SIZE)
+        writer.close()
+
+        upload, = uploads
+        self.assertEqual(upload.chunks, [
+            (0, b'x' * self.CHUNK_SIZE),
+            (self.CHUNK_SIZE, b''),
+        ])
+
+    def test_close_twice(self):
+        blob, uploads = self._make_blob()
+        writer = self._make_one(blob, chunk_size=self.CHUNK_SIZE)
+
+        writer.close()
+        writer.close()
+
+        upload, = uploads
+        self.assertEqual(upload.chunks, [(0, b'')])
+
+    def test_upload_failure(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        error = ServiceUnavailable('oops')
+        blob, _ = self._make_blob(error=error)
+        writer = self._make_one(blob, chunk_size=self.CHUNK_SIZE)
+        writer.write(b'x' * (3 * self.CHUNK_SIZE))
+
+        with self.assertRaises(ServiceUnavailable):
+            writer.close()
+
+        self.assertTrue(writer.closed)
+
+    def test_upload_invalid_response(self):
+        from google import resumable_media
+        from google.cloud.exceptions import NotFound
+
+        response = _make_response(http_client.NOT_FOUND)
+        error = resumable_media.InvalidResponse(response)
+        blob, _ = self._make_blob(error=error)
+        writer = self._make_one(blob, chunk_size=self.CHUNK_SIZE)
+
+        with self.assertRaises(NotFound):
+            writer.close()
+
+    def test_initiate_invalid_response(self):
+        from google import resumable_media
+        from google.cloud.exceptions import Forbidden
+
+        response = _make_response(http_client.FORBIDDEN)
+        blob = _make_blob()
+        blob._initiate_resumable_upload = mock.Mock(
+            side_effect=resumable_media.InvalidResponse(response))
+        writer = self._make_one(blob, chunk_size=self.CHUNK_SIZE)
+
+        with self.assertRaises(Forbidden):
+            writer.write(b'x' * self.CHUNK_SIZE)
+
+        self.assertIsNone(writer._thread)
+        writer._abandon()
+        self.assertTrue(writer.closed)
+
+    def test_context_manager_w_error(self):
+        blob, uploads = self._make_blob()
+
+        with self.assertRaises(RuntimeError):
+            with self._make_one(blob, chunk_size=self.CHUNK_SIZE) as writer:
+                writer.write(b'x' * (self.CHUNK_SIZE + 1))
+                raise RuntimeError()
+
+        self.assertTrue(writer.closed)
+        upload, = uploads
+        # The partial chunk was never sent, so the upload is not finalized.
+        self.assertEqual(upload.chunks, [(0, b'x' * self.CHUNK_SIZE)])
+        self.assertFalse(upload.finished)
+        self.assertEqual(blob.size, len(_DATA))
+
+    def test_context_manager_wo_error(self):
+        blob, uploads = self._make_blob()
+
+        with self._make_one(blob, chunk_size=self.CHUNK_SIZE) as writer:
+            writer.write(b'abcde')
+
+        upload, = uploads
+        self.assertEqual(upload.chunks, [(0, b'abcde')])
+        self.assertEqual(blob.size, 5)